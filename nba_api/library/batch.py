@@ -0,0 +1,80 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+# Sends the requests of many endpoints that were created with get_request=False.
+# Keep max_workers at or below the pool size of the session used by the endpoints (see NBAHTTP.configure_session),
+# otherwise extra connections are opened and thrown away.
+class EndpointBatch:
+
+    def __init__(self, endpoints, max_workers=DEFAULT_MAX_WORKERS):
+        if max_workers < 1:
+            raise Exception('InvalidArgument: max_workers must be at least 1.')
+        self.endpoints = list(endpoints)
+        self.max_workers = max_workers
+        self.errors = {}
+
+    def _iter_completed(self, raise_exception_on_error):
+        self.errors = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {executor.submit(endpoint.get_request): index for index, endpoint in enumerate(self.endpoints)}
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                exception = future.exception()
+                if exception is not None:
+                    if raise_exception_on_error:
+                        raise exception
+                    self.errors[index] = exception
+                    continue
+                yield index
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def as_completed(self, raise_exception_on_error=True):
+        # Yields each endpoint as soon as its response is loaded. Failed endpoints are skipped and recorded in errors.
+        for index in self._iter_completed(raise_exception_on_error=raise_exception_on_error):
+            yield self.endpoints[index]
+
+    def get_requests(self, raise_exception_on_error=True):
+        # Returns the endpoints in the order they were given. Failed endpoints keep nba_response set to None.
+        for _ in self._iter_completed(raise_exception_on_error=raise_exception_on_error):
+            pass
+        return self.endpoints
+
+    async def get_requests_async(self, raise_exception_on_error=True, session=None):
+        self.errors = {}
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def get_request(index, endpoint):
+            async with semaphore:
+                try:
+                    await endpoint.get_request_async(session=session)
+                except Exception as exception:
+                    if raise_exception_on_error:
+                        raise
+                    self.errors[index] = exception
+
+        tasks = [asyncio.ensure_future(get_request(index, endpoint)) for index, endpoint in enumerate(self.endpoints)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self.endpoints
+
+
+def get_requests(endpoints, max_workers=DEFAULT_MAX_WORKERS, raise_exception_on_error=True):
+    return EndpointBatch(endpoints=endpoints, max_workers=max_workers).get_requests(
+        raise_exception_on_error=raise_exception_on_error)
+
+
+async def get_requests_async(endpoints, max_workers=DEFAULT_MAX_WORKERS, raise_exception_on_error=True, session=None):
+    return await EndpointBatch(endpoints=endpoints, max_workers=max_workers).get_requests_async(
+        raise_exception_on_error=raise_exception_on_error, session=session)
@@ -0,0 +1,204 @@
+import os
+import time
+import threading
+
+from collections import OrderedDict
+from hashlib import md5
+from urllib.parse import quote_plus
+
+from nba_api.library import jsoncodec
+
+
+# Passed as ttl to use the default ttl of the cache.
+DEFAULT_TTL = object()
+
+
+def get_cache_key(url, parameters):
+    # parameters is the list of (key, value) pairs sorted by key, as sent by NBAHTTP.
+    parameter_string = '&'.join('{}={}'.format(key, '' if value is None else quote_plus(str(value)))
+                                for key, value in parameters)
+    return '{}?{}'.format(url, parameter_string)
+
+
+class CachePolicy:
+    # Decides how long a response is cached. A ttl of None never expires and a ttl of 0 is not cached.
+
+    def get_ttl(self, endpoint, parameters, nba_response):
+        return DEFAULT_TTL
+
+
+class BaseCache:
+    ttl = None
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def _get_expires_at(self, ttl, now):
+        if ttl is DEFAULT_TTL:
+            ttl = self.ttl
+        if ttl is None:
+            return None
+        return now + ttl
+
+
+class LRUCache(BaseCache):
+    # In memory cache. Values are (url, status_code, contents) tuples and their size is the length of contents.
+    # The least recently used entries are evicted once max_entries or max_size is exceeded.
+
+    def __init__(self, max_entries=1024, max_size=None, ttl=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        size = len(value[2])
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_size is not None and size > self.max_size:
+                return
+            self._entries[key] = (self._get_expires_at(ttl, time.monotonic()), value, size)
+            self.size += size
+            while ((self.max_entries is not None and len(self._entries) > self.max_entries)
+                   or (self.max_size is not None and self.size > self.max_size)):
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key)[2]
+
+
+class FileCache(BaseCache):
+    # On disk cache, one json file per entry named after the md5 of the key. The modification time of a file is its
+    # last use, the least recently used files are removed once max_entries or max_size (in bytes) is exceeded.
+
+    file_extension = '.json'
+    entry_keys = ('key', 'expires_at', 'url', 'status_code', 'contents')
+
+    def __init__(self, directory, max_entries=None, max_size=None, ttl=None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _get_file_path(self, key):
+        return os.path.join(self.directory, md5(key.encode('utf-8')).hexdigest() + self.file_extension)
+
+    def get(self, key):
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                contents = f.read()
+        except (IOError, OSError):
+            return None
+        try:
+            entry = jsoncodec.loads(contents)
+        except ValueError:
+            entry = None
+        if not isinstance(entry, dict) or any(entry_key not in entry for entry_key in self.entry_keys):
+            # A corrupt or foreign file is a miss, and is removed so it is not read again.
+            self._remove(file_path)
+            return None
+        if entry['key'] != key:
+            return None
+        if entry['expires_at'] is not None and entry['expires_at'] <= time.time():
+            self._remove(file_path)
+            return None
+        try:
+            os.utime(file_path, None)
+        except OSError:
+            pass
+        return entry['url'], entry['status_code'], entry['contents']
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        url, status_code, contents = value
+        entry = {
+            'key': key,
+            'expires_at': self._get_expires_at(ttl, time.time()),
+            'url': url,
+            'status_code': status_code,
+            'contents': contents,
+        }
+        file_path = self._get_file_path(key)
+        temporary_file_path = '{}.{}.{}.tmp'.format(file_path, os.getpid(), threading.get_ident())
+        with open(temporary_file_path, 'w', encoding='utf-8') as f:
+            f.write(jsoncodec.dumps(entry))
+        os.replace(temporary_file_path, file_path)
+        if self.max_entries is not None or self.max_size is not None:
+            self._evict()
+
+    def delete(self, key):
+        self._remove(self._get_file_path(key))
+
+    def clear(self):
+        for file_path, _, _ in self._get_files():
+            self._remove(file_path)
+
+    def _get_files(self):
+        files = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(self.file_extension):
+                continue
+            file_path = os.path.join(self.directory, file_name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            files.append((file_path, stat.st_mtime, stat.st_size))
+        return files
+
+    def _evict(self):
+        files = sorted(self._get_files(), key=lambda file: file[1])
+        entries = len(files)
+        size = sum(file[2] for file in files)
+        for file_path, _, file_size in files:
+            if ((self.max_entries is None or entries <= self.max_entries)
+                    and (self.max_size is None or size <= self.max_size)):
+                break
+            self._remove(file_path)
+            entries -= 1
+            size -= file_size
+
+    def _remove(self, file_path):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
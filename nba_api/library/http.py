@@ -1,8 +1,14 @@
 import os
-import json
+import time
+import asyncio
+import threading
 import requests
 
-from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+
+from nba_api.library import jsoncodec
+from nba_api.library.cache import DEFAULT_TTL, FileCache, get_cache_key
 
 try:
     from nba_api.library.debug.debug import DEBUG
@@ -23,24 +29,94 @@ except ImportError:
 
 
 if DEBUG:
-    from hashlib import md5
     print('DEBUG MODE')
 
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_ASYNC_LIMIT = 100
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False):
+    # pool_connections is the number of hosts kept in the pool, pool_maxsize the number of connections kept per host.
+    # With pool_block, callers wait for a free connection instead of opening (and discarding) extra ones.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _import_aiohttp():
+    # aiohttp is optional and slow to import, so it is only loaded once an async request is made.
+    try:
+        import aiohttp
+    except ImportError:
+        raise Exception('Import Missing - Failed to import aiohttp.')
+    return aiohttp
+
+
+def create_async_session(limit=DEFAULT_ASYNC_LIMIT, limit_per_host=DEFAULT_POOL_MAXSIZE):
+    # limit caps the total number of open connections, limit_per_host the number of connections to a single host.
+    aiohttp = _import_aiohttp()
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def discard_async_session(session, loop):
+    # A session is closed on the event loop it was created on. When that loop no longer runs, nothing can await its
+    # close(), so the session is only detached from its connector, which is dropped with the connections of the old
+    # loop.
+    if session is None or session.closed:
+        return
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    session.detach()
+
+
 class NBAResponse:
+    # The response is decoded once, on first use, and every method works from the same decoded dictionary.
+    # Do not modify the returned dictionaries in place, they are shared.
+
     def __init__(self, response, status_code, url):
         self._response = response
         self._status_code = status_code
         self._url = url
+        self._dict = None
+        self._decode_error = None
+        self._released = False
 
     def get_response(self):
         return self._response
 
+    def get_released(self, keep_response=False):
+        # Returns a copy without the decoded response, which decodes the response again if it is kept.
+        released = self.__class__(response=self._response if keep_response else None, status_code=self._status_code,
+                                  url=self._url)
+        released._released = not keep_response
+        return released
+
+    def is_released(self):
+        return self._released
+
     def get_dict(self):
-        return json.loads(self._response)
+        if self._dict is None:
+            if self._released:
+                raise Exception('ResponseReleased: The response was released once its data sets were built.')
+            if self._decode_error is not None:
+                raise self._decode_error
+            try:
+                self._dict = jsoncodec.loads(self._response)
+            except ValueError as error:
+                self._decode_error = error
+                raise
+        return self._dict
 
     def get_json(self):
-        return json.dumps(self.get_dict())
+        # The response already is a json string once it decodes.
+        self.get_dict()
+        return self._response
 
     def valid_json(self):
         try:
@@ -63,14 +139,126 @@ class NBAHTTP:
 
     headers = None
 
+    # Shared connection pool used by every instance that is not handed its own session.
+    _session = None
+    _session_lock = threading.Lock()
+
+    # Optional ratelimit.RateLimiter applied before every request that goes over the network.
+    rate_limiter = None
+
+    # Optional retry.RetryPolicy and retry.CircuitBreaker. Without a retry policy every request is sent once.
+    retry_policy = None
+    circuit_breaker = None
+
+    # Optional cache.BaseCache serving repeated requests, and cache.CachePolicy deciding how long responses are kept.
+    # DEBUG_STORAGE keeps every response in a FileCache in the debug directory.
+    cache = None
+    if DEBUG and DEBUG_STORAGE:
+        cache = FileCache(directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug', 'debug_storage'))
+    cache_policy = None
+
+    # Optional singleflight.SingleFlight sharing one request and response between concurrent identical requests.
+    single_flight = None
+
+    def __init__(self, session=None, rate_limiter=None, retry_policy=None, circuit_breaker=None, cache=None,
+                 cache_policy=None, single_flight=None):
+        self.session = session
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        if circuit_breaker is not None:
+            self.circuit_breaker = circuit_breaker
+        if cache is not None:
+            self.cache = cache
+        if cache_policy is not None:
+            self.cache_policy = cache_policy
+        if single_flight is not None:
+            self.single_flight = single_flight
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    @classmethod
+    def get_session(cls):
+        with NBAHTTP._session_lock:
+            if cls._session is None:
+                cls._session = create_session()
+            return cls._session
+
+    @classmethod
+    def set_session(cls, session):
+        # The previous session is not closed here, as other threads may still be sending requests on it. Use
+        # close_session() to close it.
+        with NBAHTTP._session_lock:
+            cls._session = session
+
+    @classmethod
+    def configure_session(cls, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                          pool_block=False):
+        session = create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        cls.set_session(session)
+        return session
+
+    @classmethod
+    def close_session(cls):
+        with NBAHTTP._session_lock:
+            session = cls.__dict__.get('_session')
+            cls._session = None
+        if session is not None:
+            session.close()
+
     def clean_contents(self, contents):
         return contents
 
-    def send_api_request(self, endpoint, parameters, referer=None, proxy=None, headers=None, timeout=None, raise_exception_on_error=False):
+    def get_retryable_exceptions(self):
+        # ChunkedEncodingError and ContentDecodingError are raised when the connection is reset mid-body.
+        return (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+    def is_retryable_response(self, status_code, contents):
+        # contents have already been through clean_contents.
+        if self.retry_policy is None:
+            return False
+        return self.retry_policy.is_retryable_status(status_code)
+
+    def before_attempt(self, host):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(host)
+
+    def after_attempt(self, host, failed, attempt):
+        # Records the outcome of an attempt and returns whether the request should be sent again.
+        if self.circuit_breaker is not None:
+            if failed:
+                self.circuit_breaker.record_failure(host)
+            else:
+                self.circuit_breaker.record_success(host)
+        return failed and self.retry_policy is not None and self.retry_policy.can_retry(attempt)
+
+    def cancel_attempt(self, host):
+        # Any other exception, cancellations included, is not counted against the host but frees its trial request.
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release_trial(host)
+
+    def get_request_proxy(self, proxy):
+        if proxy is None:
+            return PROXY
+        elif not proxy:
+            return None
+        return proxy
+
+    def prepare_request(self, endpoint, parameters, referer=None, headers=None):
         if not self.base_url:
             raise Exception('Cannot use send_api_request from _HTTP class.')
         base_url = self.base_url.format(endpoint=endpoint)
-        endpoint = endpoint.lower()
         self.parameters = parameters
 
         if headers is None:
@@ -81,60 +269,230 @@ class NBAHTTP:
         if referer:
             request_headers['Referer'] = referer
 
-        if proxy is None:
-            request_proxy = PROXY
-        elif not proxy:
-            request_proxy = None
-        else:
-            request_proxy = proxy
-        proxies = None
-        if request_proxy:
-            proxies = {
-                "http": request_proxy,
-                "https": request_proxy,
-            }
-
-        url = None
-        status_code = None
-        contents = None
-
         # Sort parameters by key... for some reason this matters for some requests...
         parameters = sorted(parameters.items(), key=lambda kv: kv[0])
 
-        if DEBUG and DEBUG_STORAGE:
-            print(endpoint, parameters)
-            directory_name = 'debug_storage'
-            parameter_string = '&'.join('{}={}'.format(key, '' if val is None else quote_plus(str(val))) for key, val in parameters)
-            url = "{}?{}".format(base_url, parameter_string)
-            print(url)
-            file_name = "{}-{}.txt".format(endpoint, md5(parameter_string.encode('utf-8')).hexdigest())
-            file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug', directory_name)
-            if not os.path.exists(file_path):
-                os.makedirs(file_path)
-            file_path = os.path.join(file_path, file_name)
-            print(file_name, os.path.isfile(file_path))
-            if os.path.isfile(file_path):
-                f = open(file_path, 'r')
-                contents = f.read()
-                f.close()
-                print('loading from file...')
-
-        if not contents:
-            response = requests.get(url=base_url, params=parameters, headers=request_headers, proxies=proxies, timeout=timeout)
-            url = response.url
-            status_code = response.status_code
-            contents = response.text
-
+        return base_url, parameters, request_headers
+
+    def get_cached_response(self, cache_key):
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        url, status_code, contents = cached
+        return self.get_nba_response(contents=contents, status_code=status_code, url=url)
+
+    def cache_response(self, cache_key, endpoint, parameters, nba_response, status_code):
+        # Only valid responses are cached, errors are always requested again.
+        if self.cache is None or not nba_response.valid_json():
+            return
+        ttl = DEFAULT_TTL
+        if self.cache_policy is not None:
+            ttl = self.cache_policy.get_ttl(endpoint=endpoint, parameters=dict(parameters), nba_response=nba_response)
+        if ttl is not DEFAULT_TTL and ttl is not None and ttl <= 0:
+            return
+        self.cache.set(cache_key, (nba_response.get_url(), status_code, nba_response.get_response()), ttl=ttl)
+
+    def get_nba_response(self, contents, status_code, url):
         contents = self.clean_contents(contents)
-        if DEBUG and DEBUG_STORAGE:
-            f = open(file_path, 'w')
-            f.write(contents)
-            f.close()
-            print(url)
-
-        data = self.nba_response(response=contents, status_code=status_code, url=url)
+        return self.nba_response(response=contents, status_code=status_code, url=url)
 
+    def check_nba_response(self, data, raise_exception_on_error=False):
         if raise_exception_on_error and not data.valid_json():
             raise Exception('InvalidResponse: Response is not in a valid JSON format.')
-
         return data
+
+    def send_request(self, endpoint, base_url, parameters, headers, proxies, timeout):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        session = self.session if self.session is not None else self.get_session()
+        response = session.get(url=base_url, params=parameters, headers=headers, proxies=proxies, timeout=timeout)
+        return response.url, response.status_code, response.text
+
+    def send_with_retries(self, endpoint, base_url, parameters, headers, proxies, timeout):
+        host = urlparse(base_url).netloc
+        attempt = 0
+        while True:
+            attempt += 1
+            self.before_attempt(host)
+            try:
+                url, status_code, contents = self.send_request(endpoint=endpoint, base_url=base_url,
+                                                               parameters=parameters, headers=headers,
+                                                               proxies=proxies, timeout=timeout)
+                failed = self.is_retryable_response(status_code, self.clean_contents(contents))
+            except self.get_retryable_exceptions():
+                if not self.after_attempt(host, failed=True, attempt=attempt):
+                    raise
+            except BaseException:
+                self.cancel_attempt(host)
+                raise
+            else:
+                if not self.after_attempt(host, failed=failed, attempt=attempt):
+                    return url, status_code, contents
+            time.sleep(self.retry_policy.get_backoff(attempt))
+
+    def send_api_request(self, endpoint, parameters, referer=None, proxy=None, headers=None, timeout=None,
+                         raise_exception_on_error=False):
+        base_url, parameters, request_headers = self.prepare_request(
+            endpoint=endpoint,
+            parameters=parameters,
+            referer=referer,
+            headers=headers,
+        )
+
+        request_proxy = self.get_request_proxy(proxy)
+        proxies = None
+        if request_proxy:
+            proxies = {
+                "http": request_proxy,
+                "https": request_proxy,
+            }
+
+        request_key = get_cache_key(url=base_url, parameters=parameters)
+        data = self.get_cached_response(cache_key=request_key)
+        if data is None:
+            def fetch():
+                url, status_code, contents = self.send_with_retries(
+                    endpoint=endpoint,
+                    base_url=base_url,
+                    parameters=parameters,
+                    headers=request_headers,
+                    proxies=proxies,
+                    timeout=timeout,
+                )
+                nba_response = self.get_nba_response(contents=contents, status_code=status_code, url=url)
+                self.cache_response(cache_key=request_key, endpoint=endpoint, parameters=parameters,
+                                    nba_response=nba_response, status_code=status_code)
+                return nba_response
+
+            if self.single_flight is not None:
+                data = self.single_flight.do(request_key, fetch)
+            else:
+                data = fetch()
+
+        return self.check_nba_response(data=data, raise_exception_on_error=raise_exception_on_error)
+
+
+class AsyncNBAHTTP(NBAHTTP):
+
+    # Shared aiohttp session, bound to the event loop it was created on.
+    _session = None
+    _session_loop = None
+
+    def __enter__(self):
+        raise Exception('Use "async with" with {}.'.format(self.__class__.__name__))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @classmethod
+    def get_session(cls):
+        loop = asyncio.get_event_loop()
+        if cls._session is not None and cls._session_loop is None:
+            cls._session_loop = loop
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            discard_async_session(cls._session, cls._session_loop)
+            cls._session = create_async_session()
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    def set_session(cls, session):
+        # The previous session is not closed here, use close_session() to close it.
+        cls._session = session
+        cls._session_loop = None
+
+    @classmethod
+    def configure_session(cls, limit=DEFAULT_ASYNC_LIMIT, limit_per_host=DEFAULT_POOL_MAXSIZE):
+        session = create_async_session(limit=limit, limit_per_host=limit_per_host)
+        cls.set_session(session)
+        return session
+
+    @classmethod
+    async def close_session(cls):
+        session = cls.__dict__.get('_session')
+        cls.set_session(None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def get_retryable_exceptions(self):
+        return asyncio.TimeoutError, _import_aiohttp().ClientError
+
+    async def send_request(self, endpoint, base_url, parameters, headers, proxies, timeout):
+        # proxies is the proxy url, aiohttp takes a single proxy for every scheme.
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+        session = self.session if self.session is not None else self.get_session()
+        request_timeout = _import_aiohttp().ClientTimeout(total=timeout)
+        async with session.get(base_url, params=parameters, headers=headers, proxy=proxies,
+                               timeout=request_timeout) as response:
+            return str(response.url), response.status, await response.text()
+
+    async def send_with_retries(self, endpoint, base_url, parameters, headers, proxies, timeout):
+        host = urlparse(base_url).netloc
+        attempt = 0
+        while True:
+            attempt += 1
+            self.before_attempt(host)
+            try:
+                url, status_code, contents = await self.send_request(endpoint=endpoint, base_url=base_url,
+                                                                     parameters=parameters, headers=headers,
+                                                                     proxies=proxies, timeout=timeout)
+                failed = self.is_retryable_response(status_code, self.clean_contents(contents))
+            except self.get_retryable_exceptions():
+                if not self.after_attempt(host, failed=True, attempt=attempt):
+                    raise
+            except BaseException:
+                self.cancel_attempt(host)
+                raise
+            else:
+                if not self.after_attempt(host, failed=failed, attempt=attempt):
+                    return url, status_code, contents
+            await asyncio.sleep(self.retry_policy.get_backoff(attempt))
+
+    async def send_api_request(self, endpoint, parameters, referer=None, proxy=None, headers=None, timeout=None,
+                               raise_exception_on_error=False):
+        base_url, parameters, request_headers = self.prepare_request(
+            endpoint=endpoint,
+            parameters=parameters,
+            referer=referer,
+            headers=headers,
+        )
+
+        request_proxy = self.get_request_proxy(proxy)
+        if request_proxy and '://' not in request_proxy:
+            request_proxy = 'http://{}'.format(request_proxy)
+
+        request_key = get_cache_key(url=base_url, parameters=parameters)
+        data = self.get_cached_response(cache_key=request_key)
+        if data is None:
+            async def fetch():
+                url, status_code, contents = await self.send_with_retries(
+                    endpoint=endpoint,
+                    base_url=base_url,
+                    # aiohttp only accepts string values and does not drop empty ones the way requests does.
+                    parameters=[(key, str(value)) for key, value in parameters if value is not None],
+                    headers=request_headers,
+                    proxies=request_proxy or None,
+                    timeout=timeout,
+                )
+                nba_response = self.get_nba_response(contents=contents, status_code=status_code, url=url)
+                self.cache_response(cache_key=request_key, endpoint=endpoint, parameters=parameters,
+                                    nba_response=nba_response, status_code=status_code)
+                return nba_response
+
+            if self.single_flight is not None:
+                data = await self.single_flight.do_async(request_key, fetch)
+            else:
+                data = await fetch()
+
+        return self.check_nba_response(data=data, raise_exception_on_error=raise_exception_on_error)
@@ -0,0 +1,72 @@
+import json
+
+
+# Decoding backends in order of preference. The first one that can be imported is used unless set_backend is called.
+backend_preference = ['orjson', 'ujson', 'simdjson', 'json']
+
+
+class JSONBackend:
+    def __init__(self, name, loads):
+        self.name = name
+        self.loads = loads
+
+
+def _load_backend(name):
+    # Every backend raises a ValueError subclass on invalid json, which NBAResponse.valid_json relies on.
+    if name == 'json':
+        return JSONBackend(name=name, loads=json.loads)
+    if name == 'orjson':
+        import orjson
+        return JSONBackend(name=name, loads=orjson.loads)
+    if name == 'ujson':
+        import ujson
+        return JSONBackend(name=name, loads=ujson.loads)
+    if name == 'simdjson':
+        import simdjson
+        return JSONBackend(name=name, loads=simdjson.loads)
+    raise Exception('InvalidBackend: Unknown json backend {}.'.format(name))
+
+
+def get_available_backends():
+    backends = []
+    for name in backend_preference:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+def set_backend(name=None):
+    # Without a name, the first available backend of backend_preference is used.
+    global _backend
+    if name is not None:
+        try:
+            _backend = _load_backend(name)
+        except ImportError:
+            raise Exception('Import Missing - Failed to import json backend {}.'.format(name))
+        return _backend.name
+    for backend_name in backend_preference:
+        try:
+            _backend = _load_backend(backend_name)
+        except ImportError:
+            continue
+        return _backend.name
+
+
+def get_backend():
+    return _backend.name
+
+
+def loads(s):
+    return _backend.loads(s)
+
+
+def dumps(obj):
+    # Encoding always goes through the standard library, so the output does not depend on the installed backends.
+    return json.dumps(obj)
+
+
+_backend = None
+set_backend()
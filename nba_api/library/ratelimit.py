@@ -0,0 +1,122 @@
+import os
+import time
+import struct
+import asyncio
+import threading
+
+try:
+    import fcntl
+    FCNTL = True
+except ImportError:
+    FCNTL = False
+
+
+class TokenBucket:
+    # rate is the sustained number of requests per second, burst the number of requests that can be sent at once.
+    # Tokens are reserved up front: when the bucket is empty the balance goes negative and the caller is told how
+    # long to wait, so waiting callers are served in the order they arrived without polling.
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0 or burst < 1:
+            raise Exception('InvalidArgument: rate must be positive and burst at least 1.')
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._timestamp) * self.rate)
+            self._timestamp = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+
+    async def reserve_async(self, tokens=1):
+        return self.reserve(tokens)
+
+    async def acquire_async(self, tokens=1):
+        wait = await self.reserve_async(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    # Same as TokenBucket but the state is kept in a file locked with flock, so every thread and process on the host
+    # using the same file_path shares one bucket.
+
+    _state = struct.Struct('<dd')
+
+    def __init__(self, file_path, rate, burst=1):
+        if not FCNTL:
+            raise Exception('Import Missing - FileTokenBucket requires fcntl.')
+        super().__init__(rate=rate, burst=burst)
+        self.file_path = file_path
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def reserve(self, tokens=1):
+        fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            state = os.read(fd, self._state.size)
+            now = time.time()
+            if len(state) == self._state.size:
+                available, timestamp = self._state.unpack(state)
+                available = min(self.burst, available + max(0.0, now - timestamp) * self.rate)
+            else:
+                available = self.burst
+            available -= tokens
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, self._state.pack(available, now))
+            return max(0.0, -available / self.rate)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    async def reserve_async(self, tokens=1):
+        # flock blocks until other threads and processes release the file, so it is taken on an executor thread
+        # instead of the event loop.
+        return await asyncio.get_event_loop().run_in_executor(None, self.reserve, tokens)
+
+
+class RateLimiter:
+    # Applies a bucket shared by every request and, optionally, a bucket per endpoint. A request has to get a token
+    # from both before it is sent.
+
+    def __init__(self, bucket=None, endpoint_buckets=None):
+        self.bucket = bucket
+        self.endpoint_buckets = {endpoint.lower(): endpoint_bucket
+                                 for endpoint, endpoint_bucket in (endpoint_buckets or {}).items()}
+
+    def _get_buckets(self, endpoint):
+        buckets = []
+        if self.bucket is not None:
+            buckets.append(self.bucket)
+        if endpoint is not None and endpoint.lower() in self.endpoint_buckets:
+            buckets.append(self.endpoint_buckets[endpoint.lower()])
+        return buckets
+
+    def reserve(self, endpoint=None):
+        # Reserves a token from every bucket and returns the longest wait.
+        return max([bucket.reserve() for bucket in self._get_buckets(endpoint)] or [0.0])
+
+    def acquire(self, endpoint=None):
+        wait = self.reserve(endpoint)
+        if wait:
+            time.sleep(wait)
+
+    async def reserve_async(self, endpoint=None):
+        return max([await bucket.reserve_async() for bucket in self._get_buckets(endpoint)] or [0.0])
+
+    async def acquire_async(self, endpoint=None):
+        wait = await self.reserve_async(endpoint)
+        if wait:
+            await asyncio.sleep(wait)
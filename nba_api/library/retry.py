@@ -0,0 +1,81 @@
+import time
+import random
+import threading
+
+
+class CircuitBreakerOpen(Exception):
+    pass
+
+
+class RetryPolicy:
+    # Exponential backoff: the n-th retry waits up to backoff_factor * 2 ** (n - 1) seconds, capped at max_backoff.
+    # With jitter, the wait is drawn uniformly between 0 and that value so that many clients do not retry in step.
+
+    def __init__(self, max_attempts=3, backoff_factor=1.0, max_backoff=60.0, jitter=True,
+                 retry_status_codes=(429, 500, 502, 503, 504)):
+        if max_attempts < 1:
+            raise Exception('InvalidArgument: max_attempts must be at least 1.')
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+
+    def is_retryable_status(self, status_code):
+        return status_code in self.retry_status_codes
+
+    def can_retry(self, attempt):
+        return attempt < self.max_attempts
+
+    def get_backoff(self, attempt):
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+
+class CircuitBreaker:
+    # Tracks consecutive transient failures per host. Once failure_threshold is reached the circuit opens and requests
+    # to that host fail fast with CircuitBreakerOpen. After recovery_timeout a single trial request is let through: the
+    # circuit closes again if it succeeds and re-opens if it fails.
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._trial_in_progress = set()
+        self._lock = threading.Lock()
+
+    def is_open(self, host):
+        with self._lock:
+            return host in self._opened_at
+
+    def before_request(self, host):
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at >= self.recovery_timeout and host not in self._trial_in_progress:
+                self._trial_in_progress.add(host)
+                return
+        raise CircuitBreakerOpen('CircuitBreakerOpen: Requests to {} are failing, not sending request.'.format(host))
+
+    def record_success(self, host):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_in_progress.discard(host)
+
+    def record_failure(self, host):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if host in self._trial_in_progress or failures >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+            self._trial_in_progress.discard(host)
+
+    def release_trial(self, host):
+        # Lets another trial request through when the trial ends without a success or failure being recorded.
+        with self._lock:
+            self._trial_in_progress.discard(host)
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+    # Runs a single call per key at a time. Callers asking for a key that is already in flight wait for that call and
+    # get its result (or exception) instead of making their own. Threads use do() and coroutines use do_async().
+
+    def __init__(self):
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, coroutine_function):
+        # Futures belong to an event loop, calls are only shared between coroutines of the same loop.
+        future_key = (asyncio.get_event_loop(), key)
+        future = self._futures.get(future_key)
+        if future is None:
+            future = asyncio.ensure_future(coroutine_function())
+            self._futures[future_key] = future
+            future.add_done_callback(lambda done_future: self._futures.pop(future_key, None))
+        # Shielded so that a cancelled caller does not cancel the call for everyone else.
+        return await asyncio.shield(future)
+
+    def in_flight(self):
+        return len(self._calls) + len(self._futures)
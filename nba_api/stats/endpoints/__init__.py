@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 __all__ = [
     'assistleaders',
     'assisttracker',
@@ -32,6 +35,7 @@ __all__ = [
     'infographicfanduelplayer',
     'leaderstiles',
     'leaguedashlineups',
+    'leaguedashoppptshot',
     'leaguedashplayerbiostats',
     'leaguedashplayerclutch',
     'leaguedashplayerptshot',
@@ -109,111 +113,136 @@ __all__ = [
     'winprobabilitypbp',
 ]
 
-from .assistleaders import AssistLeaders
-from .assisttracker import AssistTracker
-from .boxscoreadvancedv2 import BoxScoreAdvancedV2
-from .boxscoredefensive import BoxScoreDefensive
-from .boxscorefourfactorsv2 import BoxScoreFourFactorsV2
-from .boxscorematchups import BoxScoreMatchups
-from .boxscoremiscv2 import BoxScoreMiscV2
-from .boxscoreplayertrackv2 import BoxScorePlayerTrackV2
-from .boxscorescoringv2 import BoxScoreScoringV2
-from .boxscoresummaryv2 import BoxScoreSummaryV2
-from .boxscoretraditionalv2 import BoxScoreTraditionalV2
-from .boxscoreusagev2 import BoxScoreUsageV2
-from .commonallplayers import CommonAllPlayers
-from .commonplayerinfo import CommonPlayerInfo
-from .commonplayoffseries import CommonPlayoffSeries
-from .commonteamroster import CommonTeamRoster
-from .commonteamyears import CommonTeamYears
-from .defensehub import DefenseHub
-from .draftcombinedrillresults import DraftCombineDrillResults
-from .draftcombinenonstationaryshooting import DraftCombineNonStationaryShooting
-from .draftcombineplayeranthro import DraftCombinePlayerAnthro
-from .draftcombinespotshooting import DraftCombineSpotShooting
-from .draftcombinestats import DraftCombineStats
-from .drafthistory import DraftHistory
-from .fantasywidget import FantasyWidget
-from .franchisehistory import FranchiseHistory
-from .franchiseleaders import FranchiseLeaders
-from .franchiseplayers import FranchisePlayers
-from .homepageleaders import HomePageLeaders
-from .homepagev2 import HomePageV2
-from .infographicfanduelplayer import InfographicFanDuelPlayer
-from .leaderstiles import LeadersTiles
-from .leaguedashlineups import LeagueDashLineups
-from .leaguedashplayerbiostats import LeagueDashPlayerBioStats
-from .leaguedashplayerclutch import LeagueDashPlayerClutch
-from .leaguedashplayerptshot import LeagueDashPlayerPtShot
-from .leaguedashplayershotlocations import LeagueDashPlayerShotLocations
-from .leaguedashplayerstats import LeagueDashPlayerStats
-from .leaguedashptdefend import LeagueDashPtDefend
-from .leaguedashptstats import LeagueDashPtStats
-from .leaguedashptteamdefend import LeagueDashPtTeamDefend
-from .leaguedashteamclutch import LeagueDashTeamClutch
-from .leaguedashteamptshot import LeagueDashTeamPtShot
-from .leaguedashteamshotlocations import LeagueDashTeamShotLocations
-from .leaguedashteamstats import LeagueDashTeamStats
-from .leaguegamefinder import LeagueGameFinder
-from .leaguegamelog import LeagueGameLog
-from .leagueleaders import LeagueLeaders
-from .leagueplayerondetails import LeaguePlayerOnDetails
-from .leagueseasonmatchups import LeagueSeasonMatchups
-from .leaguestandings import LeagueStandings
-from .playbyplay import PlayByPlay
-from .playbyplayv2 import PlayByPlayV2
-from .playerawards import PlayerAwards
-from .playercareerstats import PlayerCareerStats
-from .playercompare import PlayerCompare
-from .playerdashptpass import PlayerDashPtPass
-from .playerdashptreb import PlayerDashPtReb
-from .playerdashptshotdefend import PlayerDashPtShotDefend
-from .playerdashptshots import PlayerDashPtShots
-from .playerdashboardbyclutch import PlayerDashboardByClutch
-from .playerdashboardbygamesplits import PlayerDashboardByGameSplits
-from .playerdashboardbygeneralsplits import PlayerDashboardByGeneralSplits
-from .playerdashboardbylastngames import PlayerDashboardByLastNGames
-from .playerdashboardbyopponent import PlayerDashboardByOpponent
-from .playerdashboardbyshootingsplits import PlayerDashboardByShootingSplits
-from .playerdashboardbyteamperformance import PlayerDashboardByTeamPerformance
-from .playerdashboardbyyearoveryear import PlayerDashboardByYearOverYear
-from .playerfantasyprofile import PlayerFantasyProfile
-from .playerfantasyprofilebargraph import PlayerFantasyProfileBarGraph
-from .playergamelog import PlayerGameLog
-from .playergamestreakfinder import PlayerGameStreakFinder
-from .playernextngames import PlayerNextNGames
-from .playerprofilev2 import PlayerProfileV2
-from .playervsplayer import PlayerVsPlayer
-from .playoffpicture import PlayoffPicture
-from .scoreboard import Scoreboard
-from .scoreboardv2 import ScoreboardV2
-from .shotchartdetail import ShotChartDetail
-from .shotchartlineupdetail import ShotChartLineupDetail
-from .synergyplaytypes import SynergyPlayTypes
-from .teamandplayersvsplayers import TeamAndPlayersVsPlayers
-from .teamdashlineups import TeamDashLineups
-from .teamdashptpass import TeamDashPtPass
-from .teamdashptreb import TeamDashPtReb
-from .teamdashptshots import TeamDashPtShots
-from .teamdashboardbyclutch import TeamDashboardByClutch
-from .teamdashboardbygamesplits import TeamDashboardByGameSplits
-from .teamdashboardbygeneralsplits import TeamDashboardByGeneralSplits
-from .teamdashboardbylastngames import TeamDashboardByLastNGames
-from .teamdashboardbyopponent import TeamDashboardByOpponent
-from .teamdashboardbyshootingsplits import TeamDashboardByShootingSplits
-from .teamdashboardbyteamperformance import TeamDashboardByTeamPerformance
-from .teamdashboardbyyearoveryear import TeamDashboardByYearOverYear
-from .teamdetails import TeamDetails
-from .teamgamelog import TeamGameLog
-from .teamgamestreakfinder import TeamGameStreakFinder
-from .teamhistoricalleaders import TeamHistoricalLeaders
-from .teaminfocommon import TeamInfoCommon
-from .teamplayerdashboard import TeamPlayerDashboard
-from .teamplayeronoffdetails import TeamPlayerOnOffDetails
-from .teamplayeronoffsummary import TeamPlayerOnOffSummary
-from .teamvsplayer import TeamVsPlayer
-from .teamyearbyyearstats import TeamYearByYearStats
-from .videodetails import VideoDetails
-from .videoevents import VideoEvents
-from .videostatus import VideoStatus
-from .winprobabilitypbp import WinProbabilityPBP
+# Endpoint classes and the modules that define them. Modules are imported the first time one of their names is used.
+endpoint_classes = {
+    'AssistLeaders': 'assistleaders',
+    'AssistTracker': 'assisttracker',
+    'BoxScoreAdvancedV2': 'boxscoreadvancedv2',
+    'BoxScoreDefensive': 'boxscoredefensive',
+    'BoxScoreFourFactorsV2': 'boxscorefourfactorsv2',
+    'BoxScoreMatchups': 'boxscorematchups',
+    'BoxScoreMiscV2': 'boxscoremiscv2',
+    'BoxScorePlayerTrackV2': 'boxscoreplayertrackv2',
+    'BoxScoreScoringV2': 'boxscorescoringv2',
+    'BoxScoreSummaryV2': 'boxscoresummaryv2',
+    'BoxScoreTraditionalV2': 'boxscoretraditionalv2',
+    'BoxScoreUsageV2': 'boxscoreusagev2',
+    'CommonAllPlayers': 'commonallplayers',
+    'CommonPlayerInfo': 'commonplayerinfo',
+    'CommonPlayoffSeries': 'commonplayoffseries',
+    'CommonTeamRoster': 'commonteamroster',
+    'CommonTeamYears': 'commonteamyears',
+    'DefenseHub': 'defensehub',
+    'DraftCombineDrillResults': 'draftcombinedrillresults',
+    'DraftCombineNonStationaryShooting': 'draftcombinenonstationaryshooting',
+    'DraftCombinePlayerAnthro': 'draftcombineplayeranthro',
+    'DraftCombineSpotShooting': 'draftcombinespotshooting',
+    'DraftCombineStats': 'draftcombinestats',
+    'DraftHistory': 'drafthistory',
+    'FantasyWidget': 'fantasywidget',
+    'FranchiseHistory': 'franchisehistory',
+    'FranchiseLeaders': 'franchiseleaders',
+    'FranchisePlayers': 'franchiseplayers',
+    'HomePageLeaders': 'homepageleaders',
+    'HomePageV2': 'homepagev2',
+    'InfographicFanDuelPlayer': 'infographicfanduelplayer',
+    'LeadersTiles': 'leaderstiles',
+    'LeagueDashLineups': 'leaguedashlineups',
+    'LeagueDashOppPtShot': 'leaguedashoppptshot',
+    'LeagueDashPlayerBioStats': 'leaguedashplayerbiostats',
+    'LeagueDashPlayerClutch': 'leaguedashplayerclutch',
+    'LeagueDashPlayerPtShot': 'leaguedashplayerptshot',
+    'LeagueDashPlayerShotLocations': 'leaguedashplayershotlocations',
+    'LeagueDashPlayerStats': 'leaguedashplayerstats',
+    'LeagueDashPtDefend': 'leaguedashptdefend',
+    'LeagueDashPtStats': 'leaguedashptstats',
+    'LeagueDashPtTeamDefend': 'leaguedashptteamdefend',
+    'LeagueDashTeamClutch': 'leaguedashteamclutch',
+    'LeagueDashTeamPtShot': 'leaguedashteamptshot',
+    'LeagueDashTeamShotLocations': 'leaguedashteamshotlocations',
+    'LeagueDashTeamStats': 'leaguedashteamstats',
+    'LeagueGameFinder': 'leaguegamefinder',
+    'LeagueGameLog': 'leaguegamelog',
+    'LeagueLeaders': 'leagueleaders',
+    'LeaguePlayerOnDetails': 'leagueplayerondetails',
+    'LeagueSeasonMatchups': 'leagueseasonmatchups',
+    'LeagueStandings': 'leaguestandings',
+    'PlayByPlay': 'playbyplay',
+    'PlayByPlayV2': 'playbyplayv2',
+    'PlayerAwards': 'playerawards',
+    'PlayerCareerStats': 'playercareerstats',
+    'PlayerCompare': 'playercompare',
+    'PlayerDashPtPass': 'playerdashptpass',
+    'PlayerDashPtReb': 'playerdashptreb',
+    'PlayerDashPtShotDefend': 'playerdashptshotdefend',
+    'PlayerDashPtShots': 'playerdashptshots',
+    'PlayerDashboardByClutch': 'playerdashboardbyclutch',
+    'PlayerDashboardByGameSplits': 'playerdashboardbygamesplits',
+    'PlayerDashboardByGeneralSplits': 'playerdashboardbygeneralsplits',
+    'PlayerDashboardByLastNGames': 'playerdashboardbylastngames',
+    'PlayerDashboardByOpponent': 'playerdashboardbyopponent',
+    'PlayerDashboardByShootingSplits': 'playerdashboardbyshootingsplits',
+    'PlayerDashboardByTeamPerformance': 'playerdashboardbyteamperformance',
+    'PlayerDashboardByYearOverYear': 'playerdashboardbyyearoveryear',
+    'PlayerFantasyProfile': 'playerfantasyprofile',
+    'PlayerFantasyProfileBarGraph': 'playerfantasyprofilebargraph',
+    'PlayerGameLog': 'playergamelog',
+    'PlayerGameStreakFinder': 'playergamestreakfinder',
+    'PlayerNextNGames': 'playernextngames',
+    'PlayerProfileV2': 'playerprofilev2',
+    'PlayerVsPlayer': 'playervsplayer',
+    'PlayoffPicture': 'playoffpicture',
+    'Scoreboard': 'scoreboard',
+    'ScoreboardV2': 'scoreboardv2',
+    'ShotChartDetail': 'shotchartdetail',
+    'ShotChartLineupDetail': 'shotchartlineupdetail',
+    'SynergyPlayTypes': 'synergyplaytypes',
+    'TeamAndPlayersVsPlayers': 'teamandplayersvsplayers',
+    'TeamDashLineups': 'teamdashlineups',
+    'TeamDashPtPass': 'teamdashptpass',
+    'TeamDashPtReb': 'teamdashptreb',
+    'TeamDashPtShots': 'teamdashptshots',
+    'TeamDashboardByClutch': 'teamdashboardbyclutch',
+    'TeamDashboardByGameSplits': 'teamdashboardbygamesplits',
+    'TeamDashboardByGeneralSplits': 'teamdashboardbygeneralsplits',
+    'TeamDashboardByLastNGames': 'teamdashboardbylastngames',
+    'TeamDashboardByOpponent': 'teamdashboardbyopponent',
+    'TeamDashboardByShootingSplits': 'teamdashboardbyshootingsplits',
+    'TeamDashboardByTeamPerformance': 'teamdashboardbyteamperformance',
+    'TeamDashboardByYearOverYear': 'teamdashboardbyyearoveryear',
+    'TeamDetails': 'teamdetails',
+    'TeamGameLog': 'teamgamelog',
+    'TeamGameStreakFinder': 'teamgamestreakfinder',
+    'TeamHistoricalLeaders': 'teamhistoricalleaders',
+    'TeamInfoCommon': 'teaminfocommon',
+    'TeamPlayerDashboard': 'teamplayerdashboard',
+    'TeamPlayerOnOffDetails': 'teamplayeronoffdetails',
+    'TeamPlayerOnOffSummary': 'teamplayeronoffsummary',
+    'TeamVsPlayer': 'teamvsplayer',
+    'TeamYearByYearStats': 'teamyearbyyearstats',
+    'VideoDetails': 'videodetails',
+    'VideoEvents': 'videoevents',
+    'VideoStatus': 'videostatus',
+    'WinProbabilityPBP': 'winprobabilitypbp',
+}
+
+
+def __getattr__(name):
+    if name in endpoint_classes:
+        value = getattr(importlib.import_module('.' + endpoint_classes[name], __name__), name)
+    elif name in __all__:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(endpoint_classes) | set(__all__))
+
+
+# Module level __getattr__ needs Python 3.7, older versions import every endpoint up front.
+if sys.version_info < (3, 7):
+    for _name in endpoint_classes:
+        __getattr__(_name)
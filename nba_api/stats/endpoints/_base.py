@@ -1,10 +1,204 @@
-import json
+import sys
 
-try:
-    from pandas import DataFrame
-    PANDAS = True
-except ImportError:
-    PANDAS = False
+from array import array
+from collections import OrderedDict
+
+from nba_api.library import jsoncodec
+from nba_api.stats.library.http import iter_rows
+
+
+def _import_pandas():
+    # pandas and numpy are optional and slow to import, so they are only loaded once they are needed.
+    try:
+        import pandas
+    except ImportError:
+        raise Exception('Import Missing - Failed to import DataFrame from pandas.')
+    return pandas
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise Exception('Import Missing - Failed to import numpy.')
+    return numpy
+
+
+def _import_pyarrow():
+    # pyarrow is optional and slow to import, so it is only loaded once a table is requested.
+    try:
+        import pyarrow
+    except ImportError:
+        raise Exception('Import Missing - Failed to import pyarrow.')
+    return pyarrow
+
+
+def __getattr__(name):
+    # PANDAS tells whether pandas is installed. It is only checked when it is read, as importing pandas is slow.
+    if name == 'PANDAS':
+        try:
+            _import_pandas()
+            value = True
+        except Exception:
+            value = False
+        globals()[name] = value
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+# Module level __getattr__ needs Python 3.7, older versions check for pandas on import.
+if sys.version_info < (3, 7):
+    __getattr__('PANDAS')
+
+
+def _get_arrow_array(pyarrow, values, data_type=None):
+    # Values that do not convert keep the type pyarrow inferred. Strings are never converted to numbers.
+    if data_type == 'category':
+        array = pyarrow.array(values)
+        if pyarrow.types.is_string(array.type):
+            return array.dictionary_encode()
+        return array
+    try:
+        array = pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return pyarrow.array([None if value is None else str(value) for value in values])
+    arrow_types = {'int': pyarrow.int64(), 'float32': pyarrow.float32(), 'datetime': pyarrow.timestamp('s')}
+    if data_type not in arrow_types:
+        return array
+    is_numeric = pyarrow.types.is_integer(array.type) or pyarrow.types.is_floating(array.type)
+    if data_type != 'datetime' and not is_numeric and not pyarrow.types.is_null(array.type):
+        return array
+    try:
+        return array.cast(arrow_types[data_type])
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+        return array
+
+
+class _Column:
+    # A column stored as one typed array:
+    #   int       int64 values, with a mask marking the nulls if there are any
+    #   float     float64 values, with a mask marking the nulls if there are any
+    #   category  int32 codes into categories (interned strings), -1 for nulls
+    #   null      only nulls
+    #   object    anything else, kept as a list
+    __slots__ = ('kind', 'values', 'mask', 'categories', 'length')
+
+    def __init__(self, values):
+        self.length = len(values)
+        self.mask = None
+        self.categories = None
+        self.kind = self._get_kind(values)
+        if self.kind in ('int', 'float'):
+            try:
+                self._set_numbers(values)
+            except OverflowError:
+                self.kind = 'object'
+        if self.kind == 'category':
+            self._set_categories(values)
+        elif self.kind == 'null':
+            self.values = None
+        elif self.kind == 'object':
+            self.values = list(values)
+
+    @staticmethod
+    def _get_kind(values):
+        types = set(map(type, values))
+        types.discard(type(None))
+        if not types:
+            return 'null'
+        if types == {int}:
+            return 'int'
+        if types <= {int, float}:
+            return 'float'
+        if types == {str}:
+            return 'category'
+        return 'object'
+
+    def _set_numbers(self, values):
+        typecode = 'q' if self.kind == 'int' else 'd'
+        if None not in values:
+            self.values = array(typecode, values)
+            return
+        default = 0 if self.kind == 'int' else 0.0
+        self.values = array(typecode, [default if value is None else value for value in values])
+        self.mask = array('b', [value is None for value in values])
+
+    def _set_categories(self, values):
+        # Categories are numbered in the order they first appear.
+        categories = list(OrderedDict.fromkeys(values))
+        if None in categories:
+            categories.remove(None)
+        codes = {value: code for code, value in enumerate(categories)}
+        codes[None] = -1
+        self.values = array('i', list(map(codes.__getitem__, values)))
+        self.categories = [sys.intern(category) for category in categories]
+
+    def to_list(self):
+        if self.kind == 'null':
+            return [None] * self.length
+        if self.kind == 'category':
+            categories = self.categories
+            return [None if code < 0 else categories[code] for code in self.values]
+        if self.kind == 'object':
+            return list(self.values)
+        values = self.values.tolist()
+        if self.mask is not None:
+            values = [None if is_null else value for value, is_null in zip(values, self.mask)]
+        return values
+
+    def to_array(self):
+        # Numbers without nulls are returned as a view on the stored values. Nulls become nan in a float64 copy.
+        if self.kind in ('int', 'float'):
+            numpy = _import_numpy()
+            values = numpy.frombuffer(self.values, dtype=numpy.int64 if self.kind == 'int' else numpy.float64)
+            if self.mask is not None:
+                values = values.astype(numpy.float64)
+                values[numpy.frombuffer(self.mask, dtype=numpy.int8).astype(bool)] = numpy.nan
+            return values
+        return _import_numpy().array(self.to_list(), dtype=object)
+
+    def to_arrow_array(self, pyarrow, data_type=None):
+        # Numbers and category codes without nulls are handed to pyarrow without a copy.
+        if self.kind in ('int', 'float') and self.mask is None:
+            arrow_type = pyarrow.int64() if self.kind == 'int' else pyarrow.float64()
+            array = pyarrow.Array.from_buffers(arrow_type, self.length, [None, pyarrow.py_buffer(self.values)])
+            if data_type == 'float32':
+                return array.cast(pyarrow.float32(), safe=False)
+            return array
+        if self.kind == 'category' and data_type == 'category':
+            if -1 in self.values:
+                indices = pyarrow.array([None if code < 0 else code for code in self.values], type=pyarrow.int32())
+            else:
+                indices = pyarrow.Array.from_buffers(pyarrow.int32(), self.length, [None, pyarrow.py_buffer(self.values)])
+            return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(self.categories, type=pyarrow.string()))
+        return _get_arrow_array(pyarrow, self.to_list(), data_type)
+
+
+pandas_data_types = {'int': 'Int64', 'float32': 'float32', 'category': 'category'}
+
+
+def _apply_data_types(data_frame, data_types):
+    # Columns whose values do not convert keep the type pandas inferred. Strings are never converted to numbers.
+    from pandas import to_datetime
+    from pandas.api.types import is_numeric_dtype
+    columns = list(data_frame.columns)
+    for header, data_type in data_types.items():
+        if columns.count(header) != 1:
+            continue
+        column = data_frame[header]
+        try:
+            if data_type == 'datetime':
+                converted = to_datetime(column, errors='coerce')
+                if converted.isna().sum() > column.isna().sum():
+                    continue
+            elif data_type != 'category' and not is_numeric_dtype(column):
+                continue
+            else:
+                converted = column.astype(pandas_data_types[data_type])
+        except (TypeError, ValueError, OverflowError):
+            continue
+        data_frame[header] = converted
+    return data_frame
 
 
 class Endpoint:
@@ -13,24 +207,171 @@ class Endpoint:
         key = None
         data = {}
 
-        def __init__(self, data):
+        def __init__(self, data, data_types=None, record_type=None):
             self.data = data
+            self.data_types = data_types or {}
+            self.record_type = record_type
 
         def get_json(self):
-            return json.dumps(self.data)
+            return jsoncodec.dumps(self.data)
 
         def get_dict(self):
             return self.data
 
-        def get_data_frame(self):
-            if not PANDAS:
-                raise Exception('Import Missing - Failed to import DataFrame from pandas.')
-            return DataFrame(self.data['data'], columns=self.data['headers'])
+        def iter_rows(self, row_type='tuple'):
+            return iter_rows(self.data['headers'], self.data['data'], row_type=row_type, record_type=self.record_type)
+
+        def get_records(self):
+            return list(self.iter_rows(row_type='record'))
+
+        def get_data_frame(self, apply_data_types=True):
+            pandas = _import_pandas()
+            data_frame = pandas.DataFrame(self.data['data'], columns=self.data['headers'])
+            if apply_data_types and self.data_types:
+                data_frame = _apply_data_types(data_frame, self.data_types)
+            return data_frame
+
+        def get_arrow_table(self, apply_data_types=True):
+            pyarrow = _import_pyarrow()
+            headers = self.data['headers']
+            rows = self.data['data']
+            data_types = self.data_types if apply_data_types else {}
+            arrays = [_get_arrow_array(pyarrow, [row[index] for row in rows], data_types.get(header))
+                      for index, header in enumerate(headers)]
+            return pyarrow.Table.from_arrays(arrays, names=list(headers))
+
+    class ColumnarDataSet(DataSet):
+        # Stores one typed array per column instead of a list of rows. get_dict() rebuilds the rows on every call.
+
+        def __init__(self, data, data_types=None, record_type=None):
+            self.data_types = data_types or {}
+            self.record_type = record_type
+            headers = list(data['headers'])
+            rows = data['data']
+            self.headers = headers
+            self.row_count = len(rows)
+            self.columns = {header: _Column([row[index] for row in rows]) for index, header in enumerate(headers)}
+
+        @classmethod
+        def from_columns(cls, headers, columns, data_types=None, record_type=None):
+            # Builds a data set from one list of values per header, without going through rows.
+            data_set = cls({'headers': headers, 'data': []}, data_types=data_types, record_type=record_type)
+            data_set.row_count = len(columns[0]) if columns else 0
+            data_set.columns = {header: _Column(column) for header, column in zip(headers, columns)}
+            return data_set
+
+        @property
+        def data(self):
+            return self.get_dict()
+
+        def get_dict(self):
+            columns = [self.columns[header].to_list() for header in self.headers]
+            return {'headers': list(self.headers), 'data': [list(row) for row in zip(*columns)]}
+
+        def iter_rows(self, row_type='tuple'):
+            columns = [self.columns[header].to_list() for header in self.headers]
+            return iter_rows(self.headers, zip(*columns), row_type=row_type, record_type=self.record_type)
+
+        def get_column(self, header):
+            return self.columns[header].to_list()
+
+        def get_array(self, header):
+            return self.columns[header].to_array()
+
+        def get_categories(self, header):
+            # Returns the int32 codes and the categories of a string column.
+            column = self.columns[header]
+            if column.kind != 'category':
+                raise Exception('InvalidColumn: {} is not a string column.'.format(header))
+            return column.values, column.categories
+
+        def get_data_frame(self, apply_data_types=True):
+            pandas = _import_pandas()
+            numpy = _import_numpy()
+            data = {}
+            for header in self.headers:
+                column = self.columns[header]
+                if column.kind == 'category':
+                    codes = numpy.frombuffer(column.values, dtype=numpy.int32)
+                    data[header] = pandas.Categorical.from_codes(codes, categories=column.categories)
+                elif column.kind in ('int', 'float'):
+                    data[header] = column.to_array()
+                else:
+                    data[header] = column.to_list()
+            data_frame = pandas.DataFrame(data, columns=self.headers, index=range(self.row_count))
+            if apply_data_types and self.data_types:
+                data_frame = _apply_data_types(data_frame, self.data_types)
+            return data_frame
+
+        def get_arrow_table(self, apply_data_types=True):
+            pyarrow = _import_pyarrow()
+            data_types = self.data_types if apply_data_types else {}
+            arrays = [self.columns[header].to_arrow_array(pyarrow, data_types.get(header)) for header in self.headers]
+            return pyarrow.Table.from_arrays(arrays, names=list(self.headers))
+
+    class LazyDataSet:
+        # Builds the data set of a result set the first time the attribute is read.
+
+        def __init__(self, name):
+            self.name = name
+
+        def __get__(self, endpoint, owner):
+            if endpoint is None:
+                return self
+            return endpoint.get_data_set(self.name)
+
+    expected_data_types = {}
+    record_types = {}
+
+    # Build ColumnarDataSet instead of DataSet when loading responses.
+    columnar = False
+    # Keep the response text of columnar endpoints once their data sets are built.
+    keep_response = False
+
+    def create_data_set(self, data, name=None):
+        data_types = self.expected_data_types.get(name)
+        record_type = self.record_types.get(name)
+        if self.columnar:
+            return Endpoint.ColumnarDataSet(data=data, data_types=data_types, record_type=record_type)
+        return Endpoint.DataSet(data=data, data_types=data_types, record_type=record_type)
+
+    @property
+    def data_sets(self):
+        if self.nba_response is None:
+            return None
+        return [self.get_data_set(name) for name in self.nba_response.get_headers_from_data_sets()]
+
+    def get_data_set(self, name):
+        if self.nba_response is None:
+            return None
+        loaded_data_sets = self.__dict__.setdefault('_loaded_data_sets', {})
+        if name not in loaded_data_sets:
+            if not self.columnar:
+                loaded_data_sets[name] = self.create_data_set(data=self.nba_response.get_data_sets()[name], name=name)
+            elif not loaded_data_sets:
+                self._load_columnar_data_sets(loaded_data_sets)
+        return loaded_data_sets[name]
+
+    def _load_columnar_data_sets(self, loaded_data_sets):
+        # Builds every data set at once and keeps a released copy of the response, so the decoded rows are freed as
+        # their columns are built instead of being kept next to them.
+        data_sets = dict(self.nba_response.get_data_sets())
+        self.nba_response = self.nba_response.get_released(keep_response=self.keep_response)
+        for name in list(data_sets):
+            loaded_data_sets[name] = self.create_data_set(data=data_sets.pop(name), name=name)
+
+    def iter_rows(self, name, row_type='tuple'):
+        return self.get_data_set(name).iter_rows(row_type=row_type)
+
+    def load_response(self):
+        self._loaded_data_sets = {}
 
     def get_request_url(self):
         return self.nba_response.get_url()
 
     def get_available_data(self):
+        if self.nba_response.is_released():
+            return self.nba_response.get_headers_from_data_sets().keys()
         return self.get_normalized_dict().keys()
 
     def get_response(self):
@@ -43,10 +384,24 @@ class Endpoint:
         return self.nba_response.get_json()
 
     def get_normalized_dict(self):
+        if self.nba_response.is_released():
+            # Built from the columns, as the decoded response is gone.
+            return {name: list(self.iter_rows(name, row_type='dict'))
+                    for name in self.nba_response.get_headers_from_data_sets()}
         return self.nba_response.get_normalized_dict()
 
     def get_normalized_json(self):
+        if self.nba_response.is_released():
+            return jsoncodec.dumps(self.get_normalized_dict())
         return self.nba_response.get_normalized_json()
 
-    def get_data_frames(self):
-        return [data_set.get_data_frame() for data_set in self.data_sets]
+    def get_normalized_records(self):
+        if self.nba_response is None:
+            return None
+        return {name: self.get_data_set(name).get_records() for name in self.nba_response.get_headers_from_data_sets()}
+
+    def get_data_frames(self, apply_data_types=True):
+        return [data_set.get_data_frame(apply_data_types=apply_data_types) for data_set in self.data_sets]
+
+    def get_arrow_tables(self, apply_data_types=True):
+        return [data_set.get_arrow_table(apply_data_types=apply_data_types) for data_set in self.data_sets]
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, PerModeSimple, PlayerOrTeam, Season, SeasonType
 
 
+AssistLeadersRow = namedtuple('AssistLeadersRow', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'AST'])
+
+
 class AssistLeaders(Endpoint):
     endpoint = 'assistleaders'
     expected_data = {'AssistLeaders': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'AST']}
+    expected_data_types = {'AssistLeaders': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}}
+    record_types = {'AssistLeaders': AssistLeadersRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assist_leaders = Endpoint.LazyDataSet('AssistLeaders')
+
     def __init__(self,
                  league_id=LeagueID.default,
                  per_mode_simple=PerModeSimple.default,
@@ -22,11 +30,13 @@ class AssistLeaders(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'LeagueID': league_id,
                 'PerMode': per_mode_simple,
@@ -38,7 +48,17 @@ class AssistLeaders(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -46,8 +66,3 @@ class AssistLeaders(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.assist_leaders = Endpoint.DataSet(data=data_sets['AssistLeaders'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import ConferenceNullable, DivisionSimpleNullable, GameScopeSimpleNullable, LastNGamesNullable, LeagueIDNullable, LocationNullable, MonthNullable, OutcomeNullable, PerModeSimpleNullable, PlayerExperienceNullable, PlayerPositionAbbreviationNullable, SeasonNullable, SeasonSegmentNullable, SeasonTypeAllStarNullable, StarterBenchNullable, DivisionNullable
 
 
+AssistTrackerRow = namedtuple('AssistTrackerRow', ['ASSISTS'])
+
+
 class AssistTracker(Endpoint):
     endpoint = 'assisttracker'
     expected_data = {'AssistTracker': ['ASSISTS']}
+    expected_data_types = {}
+    record_types = {'AssistTracker': AssistTrackerRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assist_tracker = Endpoint.LazyDataSet('AssistTracker')
+
     def __init__(self,
                  college_nullable='',
                  conference_nullable=ConferenceNullable.default,
@@ -45,11 +53,13 @@ class AssistTracker(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'College': college_nullable,
                 'Conference': conference_nullable,
@@ -84,7 +94,17 @@ class AssistTracker(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -92,8 +112,3 @@ class AssistTracker(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.assist_tracker = Endpoint.DataSet(data=data_sets['AssistTracker'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import EndPeriod, EndRange, RangeType, StartPeriod, StartRange
 
 
+PlayerStatsRow = namedtuple('PlayerStatsRow', ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'E_OFF_RATING', 'OFF_RATING', 'E_DEF_RATING', 'DEF_RATING', 'E_NET_RATING', 'NET_RATING', 'AST_PCT', 'AST_TOV', 'AST_RATIO', 'OREB_PCT', 'DREB_PCT', 'REB_PCT', 'TM_TOV_PCT', 'EFG_PCT', 'TS_PCT', 'USG_PCT', 'E_USG_PCT', 'E_PACE', 'PACE', 'PIE'])
+TeamStatsRow = namedtuple('TeamStatsRow', ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'E_OFF_RATING', 'OFF_RATING', 'E_DEF_RATING', 'DEF_RATING', 'E_NET_RATING', 'NET_RATING', 'AST_PCT', 'AST_TOV', 'AST_RATIO', 'OREB_PCT', 'DREB_PCT', 'REB_PCT', 'E_TM_TOV_PCT', 'TM_TOV_PCT', 'EFG_PCT', 'TS_PCT', 'USG_PCT', 'E_USG_PCT', 'E_PACE', 'PACE', 'PIE'])
+
+
 class BoxScoreAdvancedV2(Endpoint):
     endpoint = 'boxscoreadvancedv2'
     expected_data = {'PlayerStats': ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'E_OFF_RATING', 'OFF_RATING', 'E_DEF_RATING', 'DEF_RATING', 'E_NET_RATING', 'NET_RATING', 'AST_PCT', 'AST_TOV', 'AST_RATIO', 'OREB_PCT', 'DREB_PCT', 'REB_PCT', 'TM_TOV_PCT', 'EFG_PCT', 'TS_PCT', 'USG_PCT', 'E_USG_PCT', 'E_PACE', 'PACE', 'PIE'], 'TeamStats': ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'E_OFF_RATING', 'OFF_RATING', 'E_DEF_RATING', 'DEF_RATING', 'E_NET_RATING', 'NET_RATING', 'AST_PCT', 'AST_TOV', 'AST_RATIO', 'OREB_PCT', 'DREB_PCT', 'REB_PCT', 'E_TM_TOV_PCT', 'TM_TOV_PCT', 'EFG_PCT', 'TS_PCT', 'USG_PCT', 'E_USG_PCT', 'E_PACE', 'PACE', 'PIE']}
+    expected_data_types = {'PlayerStats': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PLAYER_ID': 'int', 'AST_PCT': 'float32', 'OREB_PCT': 'float32', 'DREB_PCT': 'float32', 'REB_PCT': 'float32', 'TM_TOV_PCT': 'float32', 'EFG_PCT': 'float32', 'TS_PCT': 'float32', 'USG_PCT': 'float32', 'E_USG_PCT': 'float32'}, 'TeamStats': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'AST_PCT': 'float32', 'OREB_PCT': 'float32', 'DREB_PCT': 'float32', 'REB_PCT': 'float32', 'E_TM_TOV_PCT': 'float32', 'TM_TOV_PCT': 'float32', 'EFG_PCT': 'float32', 'TS_PCT': 'float32', 'USG_PCT': 'float32', 'E_USG_PCT': 'float32'}}
+    record_types = {'PlayerStats': PlayerStatsRow, 'TeamStats': TeamStatsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_stats = Endpoint.LazyDataSet('PlayerStats')
+    team_stats = Endpoint.LazyDataSet('TeamStats')
+
     def __init__(self,
                  game_id,
                  end_period=EndPeriod.default,
@@ -23,11 +33,13 @@ class BoxScoreAdvancedV2(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id,
                 'EndPeriod': end_period,
@@ -40,7 +52,17 @@ class BoxScoreAdvancedV2(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -48,9 +70,3 @@ class BoxScoreAdvancedV2(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.player_stats = Endpoint.DataSet(data=data_sets['PlayerStats'])
-        self.team_stats = Endpoint.DataSet(data=data_sets['TeamStats'])
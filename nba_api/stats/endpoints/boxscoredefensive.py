@@ -1,27 +1,37 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
+
+
+PlayerDefensiveStatsRow = namedtuple('PlayerDefensiveStatsRow', ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'TEAM_NICKNAME', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'POSS', 'PLAYER_PTS', 'TEAM_PTS', 'DREB', 'AST', 'TOV', 'STL', 'BLK', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FLS', 'CFGM', 'CFGA', 'CFG_PCT', 'CFG3M', 'CFG3A', 'CFG3_PCT'])
 
 
 class BoxScoreDefensive(Endpoint):
     endpoint = 'boxscoredefensive'
     expected_data = {'PlayerDefensiveStats': ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'TEAM_NICKNAME', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'POSS', 'PLAYER_PTS', 'TEAM_PTS', 'DREB', 'AST', 'TOV', 'STL', 'BLK', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FLS', 'CFGM', 'CFGA', 'CFG_PCT', 'CFG3M', 'CFG3A', 'CFG3_PCT']}
+    expected_data_types = {'PlayerDefensiveStats': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'CFG_PCT': 'float32', 'CFG3_PCT': 'float32'}}
+    record_types = {'PlayerDefensiveStats': PlayerDefensiveStatsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_defensive_stats = Endpoint.LazyDataSet('PlayerDefensiveStats')
+
     def __init__(self,
                  game_id,
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id
         }
@@ -29,7 +39,17 @@ class BoxScoreDefensive(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -37,8 +57,3 @@ class BoxScoreDefensive(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.player_defensive_stats = Endpoint.DataSet(data=data_sets['PlayerDefensiveStats'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import EndPeriod, EndRange, RangeType, StartPeriod, StartRange
 
 
+SqlPlayersFourFactorsRow = namedtuple('SqlPlayersFourFactorsRow', ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'EFG_PCT', 'FTA_RATE', 'TM_TOV_PCT', 'OREB_PCT', 'OPP_EFG_PCT', 'OPP_FTA_RATE', 'OPP_TOV_PCT', 'OPP_OREB_PCT'])
+SqlTeamsFourFactorsRow = namedtuple('SqlTeamsFourFactorsRow', ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'EFG_PCT', 'FTA_RATE', 'TM_TOV_PCT', 'OREB_PCT', 'OPP_EFG_PCT', 'OPP_FTA_RATE', 'OPP_TOV_PCT', 'OPP_OREB_PCT'])
+
+
 class BoxScoreFourFactorsV2(Endpoint):
     endpoint = 'boxscorefourfactorsv2'
     expected_data = {'sqlPlayersFourFactors': ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'EFG_PCT', 'FTA_RATE', 'TM_TOV_PCT', 'OREB_PCT', 'OPP_EFG_PCT', 'OPP_FTA_RATE', 'OPP_TOV_PCT', 'OPP_OREB_PCT'], 'sqlTeamsFourFactors': ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'EFG_PCT', 'FTA_RATE', 'TM_TOV_PCT', 'OREB_PCT', 'OPP_EFG_PCT', 'OPP_FTA_RATE', 'OPP_TOV_PCT', 'OPP_OREB_PCT']}
+    expected_data_types = {'sqlPlayersFourFactors': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PLAYER_ID': 'int', 'EFG_PCT': 'float32', 'TM_TOV_PCT': 'float32', 'OREB_PCT': 'float32', 'OPP_EFG_PCT': 'float32', 'OPP_TOV_PCT': 'float32', 'OPP_OREB_PCT': 'float32'}, 'sqlTeamsFourFactors': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'EFG_PCT': 'float32', 'TM_TOV_PCT': 'float32', 'OREB_PCT': 'float32', 'OPP_EFG_PCT': 'float32', 'OPP_TOV_PCT': 'float32', 'OPP_OREB_PCT': 'float32'}}
+    record_types = {'sqlPlayersFourFactors': SqlPlayersFourFactorsRow, 'sqlTeamsFourFactors': SqlTeamsFourFactorsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_four_factors = Endpoint.LazyDataSet('sqlPlayersFourFactors')
+    sql_teams_four_factors = Endpoint.LazyDataSet('sqlTeamsFourFactors')
+
     def __init__(self,
                  game_id,
                  end_period=EndPeriod.default,
@@ -23,11 +33,13 @@ class BoxScoreFourFactorsV2(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id,
                 'EndPeriod': end_period,
@@ -40,7 +52,17 @@ class BoxScoreFourFactorsV2(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -48,9 +70,3 @@ class BoxScoreFourFactorsV2(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.sql_players_four_factors = Endpoint.DataSet(data=data_sets['sqlPlayersFourFactors'])
-        self.sql_teams_four_factors = Endpoint.DataSet(data=data_sets['sqlTeamsFourFactors'])
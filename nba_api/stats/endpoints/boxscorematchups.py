@@ -1,27 +1,37 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
+
+
+PlayerMatchupsStatsRow = namedtuple('PlayerMatchupsStatsRow', ['GAME_ID', 'OFF_TEAM_ID', 'OFF_TEAM_ABBREVIATION', 'OFF_TEAM_CITY', 'OFF_TEAM_NICKNAME', 'OFF_PLAYER_ID', 'OFF_PLAYER_NAME', 'DEF_TEAM_ID', 'DEF_TEAM_ABBREVIATION', 'DEF_TEAM_CITY', 'DEF_TEAM_NICKNAME', 'DEF_PLAYER_ID', 'DEF_PLAYER_NAME', 'POSS', 'OFF_MATCHUP_PCT', 'PLAYER_PTS', 'TEAM_PTS', 'AST', 'TOV', 'BLK', 'HELP_BLK', 'HELP_BLK_REC', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FOULS', 'OFF_FOULS'])
 
 
 class BoxScoreMatchups(Endpoint):
     endpoint = 'boxscorematchups'
     expected_data = {'PlayerMatchupsStats': ['GAME_ID', 'OFF_TEAM_ID', 'OFF_TEAM_ABBREVIATION', 'OFF_TEAM_CITY', 'OFF_TEAM_NICKNAME', 'OFF_PLAYER_ID', 'OFF_PLAYER_NAME', 'DEF_TEAM_ID', 'DEF_TEAM_ABBREVIATION', 'DEF_TEAM_CITY', 'DEF_TEAM_NICKNAME', 'DEF_PLAYER_ID', 'DEF_PLAYER_NAME', 'POSS', 'OFF_MATCHUP_PCT', 'PLAYER_PTS', 'TEAM_PTS', 'AST', 'TOV', 'BLK', 'HELP_BLK', 'HELP_BLK_REC', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FOULS', 'OFF_FOULS']}
+    expected_data_types = {'PlayerMatchupsStats': {'OFF_TEAM_ID': 'int', 'OFF_TEAM_ABBREVIATION': 'category', 'OFF_PLAYER_ID': 'int', 'DEF_TEAM_ID': 'int', 'DEF_TEAM_ABBREVIATION': 'category', 'DEF_PLAYER_ID': 'int', 'OFF_MATCHUP_PCT': 'float32', 'FG_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'PlayerMatchupsStats': PlayerMatchupsStatsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_matchups_stats = Endpoint.LazyDataSet('PlayerMatchupsStats')
+
     def __init__(self,
                  game_id,
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id
         }
@@ -29,7 +39,17 @@ class BoxScoreMatchups(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -37,8 +57,3 @@ class BoxScoreMatchups(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.player_matchups_stats = Endpoint.DataSet(data=data_sets['PlayerMatchupsStats'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import EndPeriod, EndRange, RangeType, StartPeriod, StartRange
 
 
+SqlPlayersScoringRow = namedtuple('SqlPlayersScoringRow', ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'PCT_FGA_2PT', 'PCT_FGA_3PT', 'PCT_PTS_2PT', 'PCT_PTS_2PT_MR', 'PCT_PTS_3PT', 'PCT_PTS_FB', 'PCT_PTS_FT', 'PCT_PTS_OFF_TOV', 'PCT_PTS_PAINT', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM'])
+SqlTeamsScoringRow = namedtuple('SqlTeamsScoringRow', ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'PCT_FGA_2PT', 'PCT_FGA_3PT', 'PCT_PTS_2PT', 'PCT_PTS_2PT_MR', 'PCT_PTS_3PT', 'PCT_PTS_FB', 'PCT_PTS_FT', 'PCT_PTS_OFF_TOV', 'PCT_PTS_PAINT', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM'])
+
+
 class BoxScoreScoringV2(Endpoint):
     endpoint = 'boxscorescoringv2'
     expected_data = {'sqlPlayersScoring': ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'PCT_FGA_2PT', 'PCT_FGA_3PT', 'PCT_PTS_2PT', 'PCT_PTS_2PT_MR', 'PCT_PTS_3PT', 'PCT_PTS_FB', 'PCT_PTS_FT', 'PCT_PTS_OFF_TOV', 'PCT_PTS_PAINT', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM'], 'sqlTeamsScoring': ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'PCT_FGA_2PT', 'PCT_FGA_3PT', 'PCT_PTS_2PT', 'PCT_PTS_2PT_MR', 'PCT_PTS_3PT', 'PCT_PTS_FB', 'PCT_PTS_FT', 'PCT_PTS_OFF_TOV', 'PCT_PTS_PAINT', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM']}
+    expected_data_types = {'sqlPlayersScoring': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PLAYER_ID': 'int', 'PCT_FGA_2PT': 'float32', 'PCT_FGA_3PT': 'float32', 'PCT_PTS_2PT': 'float32', 'PCT_PTS_2PT_MR': 'float32', 'PCT_PTS_3PT': 'float32', 'PCT_PTS_FB': 'float32', 'PCT_PTS_FT': 'float32', 'PCT_PTS_OFF_TOV': 'float32', 'PCT_PTS_PAINT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32'}, 'sqlTeamsScoring': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PCT_FGA_2PT': 'float32', 'PCT_FGA_3PT': 'float32', 'PCT_PTS_2PT': 'float32', 'PCT_PTS_2PT_MR': 'float32', 'PCT_PTS_3PT': 'float32', 'PCT_PTS_FB': 'float32', 'PCT_PTS_FT': 'float32', 'PCT_PTS_OFF_TOV': 'float32', 'PCT_PTS_PAINT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32'}}
+    record_types = {'sqlPlayersScoring': SqlPlayersScoringRow, 'sqlTeamsScoring': SqlTeamsScoringRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_scoring = Endpoint.LazyDataSet('sqlPlayersScoring')
+    sql_teams_scoring = Endpoint.LazyDataSet('sqlTeamsScoring')
+
     def __init__(self,
                  game_id,
                  end_period=EndPeriod.default,
@@ -23,11 +33,13 @@ class BoxScoreScoringV2(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id,
                 'EndPeriod': end_period,
@@ -40,7 +52,17 @@ class BoxScoreScoringV2(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -48,9 +70,3 @@ class BoxScoreScoringV2(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.sql_players_scoring = Endpoint.DataSet(data=data_sets['sqlPlayersScoring'])
-        self.sql_teams_scoring = Endpoint.DataSet(data=data_sets['sqlTeamsScoring'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import EndPeriod, EndRange, RangeType, StartPeriod, StartRange
 
 
+SqlPlayersUsageRow = namedtuple('SqlPlayersUsageRow', ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'USG_PCT', 'PCT_FGM', 'PCT_FGA', 'PCT_FG3M', 'PCT_FG3A', 'PCT_FTM', 'PCT_FTA', 'PCT_OREB', 'PCT_DREB', 'PCT_REB', 'PCT_AST', 'PCT_TOV', 'PCT_STL', 'PCT_BLK', 'PCT_BLKA', 'PCT_PF', 'PCT_PFD', 'PCT_PTS'])
+SqlTeamsUsageRow = namedtuple('SqlTeamsUsageRow', ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'USG_PCT', 'PCT_FGM', 'PCT_FGA', 'PCT_FG3M', 'PCT_FG3A', 'PCT_FTM', 'PCT_FTA', 'PCT_OREB', 'PCT_DREB', 'PCT_REB', 'PCT_AST', 'PCT_TOV', 'PCT_STL', 'PCT_BLK', 'PCT_BLKA', 'PCT_PF', 'PCT_PFD', 'PCT_PTS'])
+
+
 class BoxScoreUsageV2(Endpoint):
     endpoint = 'boxscoreusagev2'
     expected_data = {'sqlPlayersUsage': ['GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'PLAYER_ID', 'PLAYER_NAME', 'START_POSITION', 'COMMENT', 'MIN', 'USG_PCT', 'PCT_FGM', 'PCT_FGA', 'PCT_FG3M', 'PCT_FG3A', 'PCT_FTM', 'PCT_FTA', 'PCT_OREB', 'PCT_DREB', 'PCT_REB', 'PCT_AST', 'PCT_TOV', 'PCT_STL', 'PCT_BLK', 'PCT_BLKA', 'PCT_PF', 'PCT_PFD', 'PCT_PTS'], 'sqlTeamsUsage': ['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CITY', 'MIN', 'USG_PCT', 'PCT_FGM', 'PCT_FGA', 'PCT_FG3M', 'PCT_FG3A', 'PCT_FTM', 'PCT_FTA', 'PCT_OREB', 'PCT_DREB', 'PCT_REB', 'PCT_AST', 'PCT_TOV', 'PCT_STL', 'PCT_BLK', 'PCT_BLKA', 'PCT_PF', 'PCT_PFD', 'PCT_PTS']}
+    expected_data_types = {'sqlPlayersUsage': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PLAYER_ID': 'int', 'USG_PCT': 'float32', 'PCT_FGM': 'float32', 'PCT_FGA': 'float32', 'PCT_FG3M': 'float32', 'PCT_FG3A': 'float32', 'PCT_FTM': 'float32', 'PCT_FTA': 'float32', 'PCT_OREB': 'float32', 'PCT_DREB': 'float32', 'PCT_REB': 'float32', 'PCT_AST': 'float32', 'PCT_TOV': 'float32', 'PCT_STL': 'float32', 'PCT_BLK': 'float32', 'PCT_BLKA': 'float32', 'PCT_PF': 'float32', 'PCT_PFD': 'float32', 'PCT_PTS': 'float32'}, 'sqlTeamsUsage': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'USG_PCT': 'float32', 'PCT_FGM': 'float32', 'PCT_FGA': 'float32', 'PCT_FG3M': 'float32', 'PCT_FG3A': 'float32', 'PCT_FTM': 'float32', 'PCT_FTA': 'float32', 'PCT_OREB': 'float32', 'PCT_DREB': 'float32', 'PCT_REB': 'float32', 'PCT_AST': 'float32', 'PCT_TOV': 'float32', 'PCT_STL': 'float32', 'PCT_BLK': 'float32', 'PCT_BLKA': 'float32', 'PCT_PF': 'float32', 'PCT_PFD': 'float32', 'PCT_PTS': 'float32'}}
+    record_types = {'sqlPlayersUsage': SqlPlayersUsageRow, 'sqlTeamsUsage': SqlTeamsUsageRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_usage = Endpoint.LazyDataSet('sqlPlayersUsage')
+    sql_teams_usage = Endpoint.LazyDataSet('sqlTeamsUsage')
+
     def __init__(self,
                  game_id,
                  end_period=EndPeriod.default,
@@ -23,11 +33,13 @@ class BoxScoreUsageV2(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id,
                 'EndPeriod': end_period,
@@ -40,7 +52,17 @@ class BoxScoreUsageV2(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -48,9 +70,3 @@ class BoxScoreUsageV2(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.sql_players_usage = Endpoint.DataSet(data=data_sets['sqlPlayersUsage'])
-        self.sql_teams_usage = Endpoint.DataSet(data=data_sets['sqlTeamsUsage'])
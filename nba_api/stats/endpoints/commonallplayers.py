@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, Season
 
 
+CommonAllPlayersRow = namedtuple('CommonAllPlayersRow', ['PERSON_ID', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FIRST_LAST', 'ROSTERSTATUS', 'FROM_YEAR', 'TO_YEAR', 'PLAYERCODE', 'TEAM_ID', 'TEAM_CITY', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CODE', 'GAMES_PLAYED_FLAG'])
+
+
 class CommonAllPlayers(Endpoint):
     endpoint = 'commonallplayers'
     expected_data = {'CommonAllPlayers': ['PERSON_ID', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FIRST_LAST', 'ROSTERSTATUS', 'FROM_YEAR', 'TO_YEAR', 'PLAYERCODE', 'TEAM_ID', 'TEAM_CITY', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CODE', 'GAMES_PLAYED_FLAG']}
+    expected_data_types = {'CommonAllPlayers': {'PERSON_ID': 'int', 'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}}
+    record_types = {'CommonAllPlayers': CommonAllPlayersRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    common_all_players = Endpoint.LazyDataSet('CommonAllPlayers')
+
     def __init__(self,
                  is_only_current_season=0,
                  league_id=LeagueID.default,
@@ -20,11 +28,13 @@ class CommonAllPlayers(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'IsOnlyCurrentSeason': is_only_current_season,
                 'LeagueID': league_id,
@@ -34,7 +44,17 @@ class CommonAllPlayers(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -42,8 +62,3 @@ class CommonAllPlayers(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.common_all_players = Endpoint.DataSet(data=data_sets['CommonAllPlayers'])
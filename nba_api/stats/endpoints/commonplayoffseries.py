@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, Season
 
 
+PlayoffSeriesRow = namedtuple('PlayoffSeriesRow', ['GAME_ID', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'SERIES_ID', 'GAME_NUM'])
+
+
 class CommonPlayoffSeries(Endpoint):
     endpoint = 'commonplayoffseries'
     expected_data = {'PlayoffSeries': ['GAME_ID', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'SERIES_ID', 'GAME_NUM']}
+    expected_data_types = {'PlayoffSeries': {'HOME_TEAM_ID': 'int', 'VISITOR_TEAM_ID': 'int'}}
+    record_types = {'PlayoffSeries': PlayoffSeriesRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    playoff_series = Endpoint.LazyDataSet('PlayoffSeries')
+
     def __init__(self,
                  league_id=LeagueID.default,
                  season=Season.default,
@@ -20,11 +28,13 @@ class CommonPlayoffSeries(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'LeagueID': league_id,
                 'Season': season,
@@ -34,7 +44,17 @@ class CommonPlayoffSeries(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -42,8 +62,3 @@ class CommonPlayoffSeries(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.playoff_series = Endpoint.DataSet(data=data_sets['PlayoffSeries'])
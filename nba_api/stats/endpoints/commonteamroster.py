@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import Season, LeagueIDNullable
 
 
+CoachesRow = namedtuple('CoachesRow', ['TEAM_ID', 'SEASON', 'COACH_ID', 'FIRST_NAME', 'LAST_NAME', 'COACH_NAME', 'COACH_CODE', 'IS_ASSISTANT', 'COACH_TYPE', 'SCHOOL', 'SORT_SEQUENCE'])
+CommonTeamRosterRow = namedtuple('CommonTeamRosterRow', ['TeamID', 'SEASON', 'LeagueID', 'PLAYER', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT', 'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL', 'PLAYER_ID'])
+
+
 class CommonTeamRoster(Endpoint):
     endpoint = 'commonteamroster'
     expected_data = {'Coaches': ['TEAM_ID', 'SEASON', 'COACH_ID', 'FIRST_NAME', 'LAST_NAME', 'COACH_NAME', 'COACH_CODE', 'IS_ASSISTANT', 'COACH_TYPE', 'SCHOOL', 'SORT_SEQUENCE'], 'CommonTeamRoster': ['TeamID', 'SEASON', 'LeagueID', 'PLAYER', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT', 'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL', 'PLAYER_ID']}
+    expected_data_types = {'Coaches': {'TEAM_ID': 'int', 'COACH_ID': 'int'}, 'CommonTeamRoster': {'TeamID': 'int', 'BIRTH_DATE': 'datetime', 'PLAYER_ID': 'int'}}
+    record_types = {'Coaches': CoachesRow, 'CommonTeamRoster': CommonTeamRosterRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    coaches = Endpoint.LazyDataSet('Coaches')
+    common_team_roster = Endpoint.LazyDataSet('CommonTeamRoster')
+
     def __init__(self,
                  team_id,
                  season=Season.default,
@@ -20,11 +30,13 @@ class CommonTeamRoster(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'Season': season,
@@ -34,7 +46,17 @@ class CommonTeamRoster(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -42,9 +64,3 @@ class CommonTeamRoster(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.coaches = Endpoint.DataSet(data=data_sets['Coaches'])
-        self.common_team_roster = Endpoint.DataSet(data=data_sets['CommonTeamRoster'])
@@ -1,18 +1,43 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import GameScopeDetailed, LeagueID, PlayerOrTeam, PlayerScope, Season, SeasonType
 
 
+DefenseHubStat1Row = namedtuple('DefenseHubStat1Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'DREB'])
+DefenseHubStat2Row = namedtuple('DefenseHubStat2Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'STL'])
+DefenseHubStat3Row = namedtuple('DefenseHubStat3Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'BLK'])
+DefenseHubStat4Row = namedtuple('DefenseHubStat4Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'TM_DEF_RATING'])
+DefenseHubStat5Row = namedtuple('DefenseHubStat5Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'OVERALL_PM'])
+DefenseHubStat6Row = namedtuple('DefenseHubStat6Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'THREEP_DFGPCT'])
+DefenseHubStat7Row = namedtuple('DefenseHubStat7Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'TWOP_DFGPCT'])
+DefenseHubStat8Row = namedtuple('DefenseHubStat8Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FIFETEENF_DFGPCT'])
+DefenseHubStat9Row = namedtuple('DefenseHubStat9Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'DEF_RIM_PCT'])
+
+
 class DefenseHub(Endpoint):
     endpoint = 'defensehub'
     expected_data = {'DefenseHubStat1': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'DREB'], 'DefenseHubStat10': [], 'DefenseHubStat2': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'STL'], 'DefenseHubStat3': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'BLK'], 'DefenseHubStat4': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'TM_DEF_RATING'], 'DefenseHubStat5': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'OVERALL_PM'], 'DefenseHubStat6': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'THREEP_DFGPCT'], 'DefenseHubStat7': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'TWOP_DFGPCT'], 'DefenseHubStat8': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FIFETEENF_DFGPCT'], 'DefenseHubStat9': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'DEF_RIM_PCT']}
+    expected_data_types = {'DefenseHubStat1': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'DefenseHubStat2': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'DefenseHubStat3': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'DefenseHubStat4': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'DefenseHubStat5': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'DefenseHubStat6': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'THREEP_DFGPCT': 'float32'}, 'DefenseHubStat7': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'TWOP_DFGPCT': 'float32'}, 'DefenseHubStat8': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FIFETEENF_DFGPCT': 'float32'}, 'DefenseHubStat9': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'DEF_RIM_PCT': 'float32'}}
+    record_types = {'DefenseHubStat1': DefenseHubStat1Row, 'DefenseHubStat2': DefenseHubStat2Row, 'DefenseHubStat3': DefenseHubStat3Row, 'DefenseHubStat4': DefenseHubStat4Row, 'DefenseHubStat5': DefenseHubStat5Row, 'DefenseHubStat6': DefenseHubStat6Row, 'DefenseHubStat7': DefenseHubStat7Row, 'DefenseHubStat8': DefenseHubStat8Row, 'DefenseHubStat9': DefenseHubStat9Row}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    defense_hub_stat1 = Endpoint.LazyDataSet('DefenseHubStat1')
+    defense_hub_stat10 = Endpoint.LazyDataSet('DefenseHubStat10')
+    defense_hub_stat2 = Endpoint.LazyDataSet('DefenseHubStat2')
+    defense_hub_stat3 = Endpoint.LazyDataSet('DefenseHubStat3')
+    defense_hub_stat4 = Endpoint.LazyDataSet('DefenseHubStat4')
+    defense_hub_stat5 = Endpoint.LazyDataSet('DefenseHubStat5')
+    defense_hub_stat6 = Endpoint.LazyDataSet('DefenseHubStat6')
+    defense_hub_stat7 = Endpoint.LazyDataSet('DefenseHubStat7')
+    defense_hub_stat8 = Endpoint.LazyDataSet('DefenseHubStat8')
+    defense_hub_stat9 = Endpoint.LazyDataSet('DefenseHubStat9')
+
     def __init__(self,
                  game_scope_detailed=GameScopeDetailed.default,
                  league_id=LeagueID.default,
@@ -23,11 +48,13 @@ class DefenseHub(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameScope': game_scope_detailed,
                 'LeagueID': league_id,
@@ -40,7 +67,17 @@ class DefenseHub(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -48,17 +85,3 @@ class DefenseHub(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.defense_hub_stat1 = Endpoint.DataSet(data=data_sets['DefenseHubStat1'])
-        self.defense_hub_stat10 = Endpoint.DataSet(data=data_sets['DefenseHubStat10'])
-        self.defense_hub_stat2 = Endpoint.DataSet(data=data_sets['DefenseHubStat2'])
-        self.defense_hub_stat3 = Endpoint.DataSet(data=data_sets['DefenseHubStat3'])
-        self.defense_hub_stat4 = Endpoint.DataSet(data=data_sets['DefenseHubStat4'])
-        self.defense_hub_stat5 = Endpoint.DataSet(data=data_sets['DefenseHubStat5'])
-        self.defense_hub_stat6 = Endpoint.DataSet(data=data_sets['DefenseHubStat6'])
-        self.defense_hub_stat7 = Endpoint.DataSet(data=data_sets['DefenseHubStat7'])
-        self.defense_hub_stat8 = Endpoint.DataSet(data=data_sets['DefenseHubStat8'])
-        self.defense_hub_stat9 = Endpoint.DataSet(data=data_sets['DefenseHubStat9'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import ActivePlayers, LastNGames, LeagueID, Season, SeasonTypeAllStar, TodaysPlayers, LocationNullable, MonthNullable, PositionNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+FantasyWidgetResultRow = namedtuple('FantasyWidgetResultRow', ['PLAYER_ID', 'PLAYER_NAME', 'PLAYER_POSITION', 'TEAM_ID', 'TEAM_ABBREVIATION', 'GP', 'MIN', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'BLK', 'STL', 'TOV', 'FG3M', 'FGA', 'FG_PCT', 'FTA', 'FT_PCT'])
+
+
 class FantasyWidget(Endpoint):
     endpoint = 'fantasywidget'
     expected_data = {'FantasyWidgetResult': ['PLAYER_ID', 'PLAYER_NAME', 'PLAYER_POSITION', 'TEAM_ID', 'TEAM_ABBREVIATION', 'GP', 'MIN', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'BLK', 'STL', 'TOV', 'FG3M', 'FGA', 'FG_PCT', 'FTA', 'FT_PCT']}
+    expected_data_types = {'FantasyWidgetResult': {'PLAYER_ID': 'int', 'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32', 'FT_PCT': 'float32'}}
+    record_types = {'FantasyWidgetResult': FantasyWidgetResultRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    fantasy_widget_result = Endpoint.LazyDataSet('FantasyWidgetResult')
+
     def __init__(self,
                  active_players=ActivePlayers.default,
                  last_n_games=LastNGames.default,
@@ -36,11 +44,13 @@ class FantasyWidget(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'ActivePlayers': active_players,
                 'LastNGames': last_n_games,
@@ -66,7 +76,17 @@ class FantasyWidget(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -74,8 +94,3 @@ class FantasyWidget(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.fantasy_widget_result = Endpoint.DataSet(data=data_sets['FantasyWidgetResult'])
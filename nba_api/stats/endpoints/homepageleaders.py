@@ -1,18 +1,30 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import GameScopeDetailed, LeagueID, PlayerOrTeam, PlayerScope, Season, SeasonType, StatCategory
 
 
+HomePageLeadersRow = namedtuple('HomePageLeadersRow', ['RANK', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48'])
+LeagueAverageRow = namedtuple('LeagueAverageRow', ['PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48'])
+LeagueMaxRow = namedtuple('LeagueMaxRow', ['PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48'])
+
+
 class HomePageLeaders(Endpoint):
     endpoint = 'homepageleaders'
     expected_data = {'HomePageLeaders': ['RANK', 'TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48'], 'LeagueAverage': ['PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48'], 'LeagueMax': ['PTS', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'EFG_PCT', 'TS_PCT', 'PTS_PER48']}
+    expected_data_types = {'HomePageLeaders': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32', 'EFG_PCT': 'float32', 'TS_PCT': 'float32'}, 'LeagueAverage': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32', 'EFG_PCT': 'float32', 'TS_PCT': 'float32'}, 'LeagueMax': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32', 'EFG_PCT': 'float32', 'TS_PCT': 'float32'}}
+    record_types = {'HomePageLeaders': HomePageLeadersRow, 'LeagueAverage': LeagueAverageRow, 'LeagueMax': LeagueMaxRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    home_page_leaders = Endpoint.LazyDataSet('HomePageLeaders')
+    league_average = Endpoint.LazyDataSet('LeagueAverage')
+    league_max = Endpoint.LazyDataSet('LeagueMax')
+
     def __init__(self,
                  game_scope_detailed=GameScopeDetailed.default,
                  league_id=LeagueID.default,
@@ -24,11 +36,13 @@ class HomePageLeaders(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameScope': game_scope_detailed,
                 'LeagueID': league_id,
@@ -42,7 +56,17 @@ class HomePageLeaders(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -50,10 +74,3 @@ class HomePageLeaders(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.home_page_leaders = Endpoint.DataSet(data=data_sets['HomePageLeaders'])
-        self.league_average = Endpoint.DataSet(data=data_sets['LeagueAverage'])
-        self.league_max = Endpoint.DataSet(data=data_sets['LeagueMax'])
@@ -1,18 +1,40 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import GameScopeDetailed, LeagueID, PlayerOrTeam, PlayerScope, Season, SeasonType, StatType
 
 
+HomePageStat1Row = namedtuple('HomePageStat1Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'])
+HomePageStat2Row = namedtuple('HomePageStat2Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'REB'])
+HomePageStat3Row = namedtuple('HomePageStat3Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'AST'])
+HomePageStat4Row = namedtuple('HomePageStat4Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'STL'])
+HomePageStat5Row = namedtuple('HomePageStat5Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FG_PCT'])
+HomePageStat6Row = namedtuple('HomePageStat6Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FT_PCT'])
+HomePageStat7Row = namedtuple('HomePageStat7Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FG3_PCT'])
+HomePageStat8Row = namedtuple('HomePageStat8Row', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'BLK'])
+
+
 class HomePageV2(Endpoint):
     endpoint = 'homepagev2'
     expected_data = {'HomePageStat1': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'], 'HomePageStat2': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'REB'], 'HomePageStat3': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'AST'], 'HomePageStat4': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'STL'], 'HomePageStat5': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FG_PCT'], 'HomePageStat6': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FT_PCT'], 'HomePageStat7': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'FG3_PCT'], 'HomePageStat8': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'BLK']}
+    expected_data_types = {'HomePageStat1': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'HomePageStat2': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'HomePageStat3': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'HomePageStat4': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'HomePageStat5': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32'}, 'HomePageStat6': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FT_PCT': 'float32'}, 'HomePageStat7': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG3_PCT': 'float32'}, 'HomePageStat8': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}}
+    record_types = {'HomePageStat1': HomePageStat1Row, 'HomePageStat2': HomePageStat2Row, 'HomePageStat3': HomePageStat3Row, 'HomePageStat4': HomePageStat4Row, 'HomePageStat5': HomePageStat5Row, 'HomePageStat6': HomePageStat6Row, 'HomePageStat7': HomePageStat7Row, 'HomePageStat8': HomePageStat8Row}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    home_page_stat1 = Endpoint.LazyDataSet('HomePageStat1')
+    home_page_stat2 = Endpoint.LazyDataSet('HomePageStat2')
+    home_page_stat3 = Endpoint.LazyDataSet('HomePageStat3')
+    home_page_stat4 = Endpoint.LazyDataSet('HomePageStat4')
+    home_page_stat5 = Endpoint.LazyDataSet('HomePageStat5')
+    home_page_stat6 = Endpoint.LazyDataSet('HomePageStat6')
+    home_page_stat7 = Endpoint.LazyDataSet('HomePageStat7')
+    home_page_stat8 = Endpoint.LazyDataSet('HomePageStat8')
+
     def __init__(self,
                  game_scope_detailed=GameScopeDetailed.default,
                  league_id=LeagueID.default,
@@ -24,11 +46,13 @@ class HomePageV2(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameScope': game_scope_detailed,
                 'LeagueID': league_id,
@@ -42,7 +66,17 @@ class HomePageV2(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -50,15 +84,3 @@ class HomePageV2(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.home_page_stat1 = Endpoint.DataSet(data=data_sets['HomePageStat1'])
-        self.home_page_stat2 = Endpoint.DataSet(data=data_sets['HomePageStat2'])
-        self.home_page_stat3 = Endpoint.DataSet(data=data_sets['HomePageStat3'])
-        self.home_page_stat4 = Endpoint.DataSet(data=data_sets['HomePageStat4'])
-        self.home_page_stat5 = Endpoint.DataSet(data=data_sets['HomePageStat5'])
-        self.home_page_stat6 = Endpoint.DataSet(data=data_sets['HomePageStat6'])
-        self.home_page_stat7 = Endpoint.DataSet(data=data_sets['HomePageStat7'])
-        self.home_page_stat8 = Endpoint.DataSet(data=data_sets['HomePageStat8'])
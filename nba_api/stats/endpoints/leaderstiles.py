@@ -1,18 +1,32 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import GameScopeDetailed, LeagueID, PlayerOrTeam, PlayerScope, Season, SeasonType, Stat
 
 
+AllTimeSeasonHighRow = namedtuple('AllTimeSeasonHighRow', ['TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'SEASON_YEAR', 'PTS'])
+LastSeasonHighRow = namedtuple('LastSeasonHighRow', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'])
+LeadersTilesRow = namedtuple('LeadersTilesRow', ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'])
+LowSeasonHighRow = namedtuple('LowSeasonHighRow', ['TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'SEASON_YEAR', 'PTS'])
+
+
 class LeadersTiles(Endpoint):
     endpoint = 'leaderstiles'
     expected_data = {'AllTimeSeasonHigh': ['TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'SEASON_YEAR', 'PTS'], 'LastSeasonHigh': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'], 'LeadersTiles': ['RANK', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'PTS'], 'LowSeasonHigh': ['TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'SEASON_YEAR', 'PTS']}
+    expected_data_types = {'AllTimeSeasonHigh': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'LastSeasonHigh': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'LeadersTiles': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}, 'LowSeasonHigh': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category'}}
+    record_types = {'AllTimeSeasonHigh': AllTimeSeasonHighRow, 'LastSeasonHigh': LastSeasonHighRow, 'LeadersTiles': LeadersTilesRow, 'LowSeasonHigh': LowSeasonHighRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    all_time_season_high = Endpoint.LazyDataSet('AllTimeSeasonHigh')
+    last_season_high = Endpoint.LazyDataSet('LastSeasonHigh')
+    leaders_tiles = Endpoint.LazyDataSet('LeadersTiles')
+    low_season_high = Endpoint.LazyDataSet('LowSeasonHigh')
+
     def __init__(self,
                  game_scope_detailed=GameScopeDetailed.default,
                  league_id=LeagueID.default,
@@ -24,11 +38,13 @@ class LeadersTiles(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameScope': game_scope_detailed,
                 'LeagueID': league_id,
@@ -42,7 +58,17 @@ class LeadersTiles(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -50,11 +76,3 @@ class LeadersTiles(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.all_time_season_high = Endpoint.DataSet(data=data_sets['AllTimeSeasonHigh'])
-        self.last_season_high = Endpoint.DataSet(data=data_sets['LastSeasonHigh'])
-        self.leaders_tiles = Endpoint.DataSet(data=data_sets['LeadersTiles'])
-        self.low_season_high = Endpoint.DataSet(data=data_sets['LowSeasonHigh'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, PerModeSimple, Season, SeasonTypeAllStar, ConferenceNullable, DivisionNullable, GameSegmentNullable, LastNGamesNullable, LocationNullable, MonthNullable, OutcomeNullable, PeriodNullable, PlayerExperienceNullable, PlayerPositionNullable, SeasonSegmentNullable, ShotClockRangeNullable, StarterBenchNullable
 
 
+LeagueDashPTShotsRow = namedtuple('LeagueDashPTShotsRow', ['PLAYER_ID', 'PLAYER_NAME', 'PLAYER_LAST_TEAM_ID', 'PLAYER_LAST_TEAM_ABBREVIATION', 'AGE', 'GP', 'G', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+
+
 class LeagueDashPlayerPtShot(Endpoint):
     endpoint = 'leaguedashplayerptshot'
     expected_data = {'LeagueDashPTShots': ['PLAYER_ID', 'PLAYER_NAME', 'PLAYER_LAST_TEAM_ID', 'PLAYER_LAST_TEAM_ABBREVIATION', 'AGE', 'GP', 'G', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT']}
+    expected_data_types = {'LeagueDashPTShots': {'PLAYER_ID': 'int', 'PLAYER_LAST_TEAM_ID': 'int', 'PLAYER_LAST_TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'LeagueDashPTShots': LeagueDashPTShotsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_ptshots = Endpoint.LazyDataSet('LeagueDashPTShots')
+
     def __init__(self,
                  league_id=LeagueID.default,
                  per_mode_simple=PerModeSimple.default,
@@ -52,11 +60,13 @@ class LeagueDashPlayerPtShot(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'LeagueID': league_id,
                 'PerMode': per_mode_simple,
@@ -98,7 +108,17 @@ class LeagueDashPlayerPtShot(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -106,8 +126,3 @@ class LeagueDashPlayerPtShot(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.league_dash_ptshots = Endpoint.DataSet(data=data_sets['LeagueDashPTShots'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import DefenseCategory, LeagueID, PerModeSimple, Season, SeasonTypeAllStar, ConferenceNullable, DivisionNullable, GameSegmentNullable, LastNGamesNullable, LocationNullable, MonthNullable, OutcomeNullable, PeriodNullable, PlayerExperienceNullable, PlayerPositionNullable, SeasonSegmentNullable, StarterBenchNullable
 
 
+LeagueDashPTDefendRow = namedtuple('LeagueDashPTDefendRow', ['CLOSE_DEF_PERSON_ID', 'PLAYER_NAME', 'PLAYER_LAST_TEAM_ID', 'PLAYER_LAST_TEAM_ABBREVIATION', 'PLAYER_POSITION', 'AGE', 'GP', 'G', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS'])
+
+
 class LeagueDashPtDefend(Endpoint):
     endpoint = 'leaguedashptdefend'
     expected_data = {'LeagueDashPTDefend': ['CLOSE_DEF_PERSON_ID', 'PLAYER_NAME', 'PLAYER_LAST_TEAM_ID', 'PLAYER_LAST_TEAM_ABBREVIATION', 'PLAYER_POSITION', 'AGE', 'GP', 'G', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS']}
+    expected_data_types = {'LeagueDashPTDefend': {'CLOSE_DEF_PERSON_ID': 'int', 'PLAYER_LAST_TEAM_ID': 'int', 'PLAYER_LAST_TEAM_ABBREVIATION': 'category', 'D_FG_PCT': 'float32', 'NORMAL_FG_PCT': 'float32', 'PCT_PLUSMINUS': 'float32'}}
+    record_types = {'LeagueDashPTDefend': LeagueDashPTDefendRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_p_tdefend = Endpoint.LazyDataSet('LeagueDashPTDefend')
+
     def __init__(self,
                  defense_category=DefenseCategory.default,
                  league_id=LeagueID.default,
@@ -48,11 +56,13 @@ class LeagueDashPtDefend(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'DefenseCategory': defense_category,
                 'LeagueID': league_id,
@@ -90,7 +100,17 @@ class LeagueDashPtDefend(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -98,8 +118,3 @@ class LeagueDashPtDefend(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.league_dash_p_tdefend = Endpoint.DataSet(data=data_sets['LeagueDashPTDefend'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import DefenseCategory, LeagueID, PerModeSimple, Season, SeasonTypeAllStar, ConferenceNullable, DivisionNullable, GameSegmentNullable, LastNGamesNullable, LocationNullable, MonthNullable, OutcomeNullable, PeriodNullable, SeasonSegmentNullable
 
 
+LeagueDashPtTeamDefendRow = namedtuple('LeagueDashPtTeamDefendRow', ['TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'GP', 'G', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS'])
+
+
 class LeagueDashPtTeamDefend(Endpoint):
     endpoint = 'leaguedashptteamdefend'
     expected_data = {'LeagueDashPtTeamDefend': ['TEAM_ID', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'GP', 'G', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS']}
+    expected_data_types = {'LeagueDashPtTeamDefend': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'D_FG_PCT': 'float32', 'NORMAL_FG_PCT': 'float32', 'PCT_PLUSMINUS': 'float32'}}
+    record_types = {'LeagueDashPtTeamDefend': LeagueDashPtTeamDefendRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_pt_team_defend = Endpoint.LazyDataSet('LeagueDashPtTeamDefend')
+
     def __init__(self,
                  defense_category=DefenseCategory.default,
                  league_id=LeagueID.default,
@@ -38,11 +46,13 @@ class LeagueDashPtTeamDefend(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'DefenseCategory': defense_category,
                 'LeagueID': league_id,
@@ -70,7 +80,17 @@ class LeagueDashPtTeamDefend(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -78,8 +98,3 @@ class LeagueDashPtTeamDefend(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.league_dash_pt_team_defend = Endpoint.DataSet(data=data_sets['LeagueDashPtTeamDefend'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import PlayerOrTeamAbbreviation, ConferenceNullable, DivisionSimpleNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonNullable, SeasonSegmentNullable, SeasonTypeNullable, StarterBenchNullable, DivisionNullable
 
 
+LeagueGameFinderResultsRow = namedtuple('LeagueGameFinderResultsRow', ['SEASON_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GAME_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'MIN', 'PTS', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PLUS_MINUS'])
+
+
 class LeagueGameFinder(Endpoint):
     endpoint = 'leaguegamefinder'
     expected_data = {'LeagueGameFinderResults': ['SEASON_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GAME_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'MIN', 'PTS', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PLUS_MINUS']}
+    expected_data_types = {'LeagueGameFinderResults': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'GAME_DATE': 'datetime', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}}
+    record_types = {'LeagueGameFinderResults': LeagueGameFinderResultsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_game_finder_results = Endpoint.LazyDataSet('LeagueGameFinderResults')
+
     def __init__(self,
                  player_or_team_abbreviation=PlayerOrTeamAbbreviation.default,
                  conference_nullable=ConferenceNullable.default,
@@ -105,11 +113,13 @@ class LeagueGameFinder(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'PlayerOrTeam': player_or_team_abbreviation,
                 'Conference': conference_nullable,
@@ -204,7 +214,17 @@ class LeagueGameFinder(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -212,8 +232,3 @@ class LeagueGameFinder(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.league_game_finder_results = Endpoint.DataSet(data=data_sets['LeagueGameFinderResults'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, Season, SeasonType, OutcomeNullable, PerModeSimpleNullable
 
 
+SeasonMatchupsRow = namedtuple('SeasonMatchupsRow', ['OFF_TEAM_ID', 'OFF_TEAM_ABBREVIATION', 'OFF_TEAM_CITY', 'OFF_TEAM_NICKNAME', 'OFF_PLAYER_ID', 'OFF_PLAYER_NAME', 'DEF_TEAM_ID', 'DEF_TEAM_ABBREVIATION', 'DEF_TEAM_CITY', 'DEF_TEAM_NICKNAME', 'DEF_PLAYER_ID', 'DEF_PLAYER_NAME', 'GP', 'POSS', 'OFF_MATCHUP_PCT', 'PLAYER_PTS', 'PLAYER_PTS_DIFF', 'TEAM_PTS', 'TEAM_PTS_DIFF', 'AST', 'TOV', 'BLK', 'HELP_BLK', 'HELP_BLK_REC', 'FGM', 'FGA', 'FGA_DIFF', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FOULS', 'OFF_FOULS'])
+
+
 class LeagueSeasonMatchups(Endpoint):
     endpoint = 'leagueseasonmatchups'
     expected_data = {'SeasonMatchups': ['OFF_TEAM_ID', 'OFF_TEAM_ABBREVIATION', 'OFF_TEAM_CITY', 'OFF_TEAM_NICKNAME', 'OFF_PLAYER_ID', 'OFF_PLAYER_NAME', 'DEF_TEAM_ID', 'DEF_TEAM_ABBREVIATION', 'DEF_TEAM_CITY', 'DEF_TEAM_NICKNAME', 'DEF_PLAYER_ID', 'DEF_PLAYER_NAME', 'GP', 'POSS', 'OFF_MATCHUP_PCT', 'PLAYER_PTS', 'PLAYER_PTS_DIFF', 'TEAM_PTS', 'TEAM_PTS_DIFF', 'AST', 'TOV', 'BLK', 'HELP_BLK', 'HELP_BLK_REC', 'FGM', 'FGA', 'FGA_DIFF', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'SFL', 'DEF_FOULS', 'OFF_FOULS']}
+    expected_data_types = {'SeasonMatchups': {'OFF_TEAM_ID': 'int', 'OFF_TEAM_ABBREVIATION': 'category', 'OFF_PLAYER_ID': 'int', 'DEF_TEAM_ID': 'int', 'DEF_TEAM_ABBREVIATION': 'category', 'DEF_PLAYER_ID': 'int', 'OFF_MATCHUP_PCT': 'float32', 'FG_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'SeasonMatchups': SeasonMatchupsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    season_matchups = Endpoint.LazyDataSet('SeasonMatchups')
+
     def __init__(self,
                  league_id=LeagueID.default,
                  season=Season.default,
@@ -29,11 +37,13 @@ class LeagueSeasonMatchups(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'LeagueID': league_id,
                 'Season': season,
@@ -52,7 +62,17 @@ class LeagueSeasonMatchups(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -60,8 +80,3 @@ class LeagueSeasonMatchups(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.season_matchups = Endpoint.DataSet(data=data_sets['SeasonMatchups'])
@@ -1,18 +1,40 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, MeasureTypeDetailed, Month, PaceAdjust, PerModeDetailed, Period, PlusMinus, Rank, Season, SeasonType, GameSegmentNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ShotClockRangeNullable, ConferenceNullable, DivisionNullable
 
 
+AssistedByRow = namedtuple('AssistedByRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+AssitedShotPlayerDashboardRow = namedtuple('AssitedShotPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+OverallPlayerDashboardRow = namedtuple('OverallPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+Shot5FTPlayerDashboardRow = namedtuple('Shot5FTPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+Shot8FTPlayerDashboardRow = namedtuple('Shot8FTPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+ShotAreaPlayerDashboardRow = namedtuple('ShotAreaPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+ShotTypePlayerDashboardRow = namedtuple('ShotTypePlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'])
+ShotTypeSummaryPlayerDashboardRow = namedtuple('ShotTypeSummaryPlayerDashboardRow', ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'CFID', 'CFPARAMS'])
+
+
 class PlayerDashboardByShootingSplits(Endpoint):
     endpoint = 'playerdashboardbyshootingsplits'
     expected_data = {'AssistedBy': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'AssitedShotPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'OverallPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'Shot5FTPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'Shot8FTPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'ShotAreaPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'ShotTypePlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'EFG_PCT_RANK', 'BLKA_RANK', 'PCT_AST_2PM_RANK', 'PCT_UAST_2PM_RANK', 'PCT_AST_3PM_RANK', 'PCT_UAST_3PM_RANK', 'PCT_AST_FGM_RANK', 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS'], 'ShotTypeSummaryPlayerDashboard': ['GROUP_SET', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'EFG_PCT', 'BLKA', 'PCT_AST_2PM', 'PCT_UAST_2PM', 'PCT_AST_3PM', 'PCT_UAST_3PM', 'PCT_AST_FGM', 'PCT_UAST_FGM', 'CFID', 'CFPARAMS']}
+    expected_data_types = {'AssistedBy': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'AssitedShotPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'OverallPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'Shot5FTPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'Shot8FTPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'ShotAreaPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'ShotTypePlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}, 'ShotTypeSummaryPlayerDashboard': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'EFG_PCT': 'float32', 'PCT_AST_2PM': 'float32', 'PCT_UAST_2PM': 'float32', 'PCT_AST_3PM': 'float32', 'PCT_UAST_3PM': 'float32', 'PCT_AST_FGM': 'float32', 'PCT_UAST_FGM': 'float32', 'CFID': 'int'}}
+    record_types = {'AssistedBy': AssistedByRow, 'AssitedShotPlayerDashboard': AssitedShotPlayerDashboardRow, 'OverallPlayerDashboard': OverallPlayerDashboardRow, 'Shot5FTPlayerDashboard': Shot5FTPlayerDashboardRow, 'Shot8FTPlayerDashboard': Shot8FTPlayerDashboardRow, 'ShotAreaPlayerDashboard': ShotAreaPlayerDashboardRow, 'ShotTypePlayerDashboard': ShotTypePlayerDashboardRow, 'ShotTypeSummaryPlayerDashboard': ShotTypeSummaryPlayerDashboardRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assisted_by = Endpoint.LazyDataSet('AssistedBy')
+    assited_shot_player_dashboard = Endpoint.LazyDataSet('AssitedShotPlayerDashboard')
+    overall_player_dashboard = Endpoint.LazyDataSet('OverallPlayerDashboard')
+    shot5_ft_player_dashboard = Endpoint.LazyDataSet('Shot5FTPlayerDashboard')
+    shot8_ft_player_dashboard = Endpoint.LazyDataSet('Shot8FTPlayerDashboard')
+    shot_area_player_dashboard = Endpoint.LazyDataSet('ShotAreaPlayerDashboard')
+    shot_type_player_dashboard = Endpoint.LazyDataSet('ShotTypePlayerDashboard')
+    shot_type_summary_player_dashboard = Endpoint.LazyDataSet('ShotTypeSummaryPlayerDashboard')
+
     def __init__(self,
                  player_id,
                  last_n_games=LastNGames.default,
@@ -40,11 +62,13 @@ class PlayerDashboardByShootingSplits(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'PlayerID': player_id,
                 'LastNGames': last_n_games,
@@ -74,7 +98,17 @@ class PlayerDashboardByShootingSplits(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -82,15 +116,3 @@ class PlayerDashboardByShootingSplits(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.assisted_by = Endpoint.DataSet(data=data_sets['AssistedBy'])
-        self.assited_shot_player_dashboard = Endpoint.DataSet(data=data_sets['AssitedShotPlayerDashboard'])
-        self.overall_player_dashboard = Endpoint.DataSet(data=data_sets['OverallPlayerDashboard'])
-        self.shot5_ft_player_dashboard = Endpoint.DataSet(data=data_sets['Shot5FTPlayerDashboard'])
-        self.shot8_ft_player_dashboard = Endpoint.DataSet(data=data_sets['Shot8FTPlayerDashboard'])
-        self.shot_area_player_dashboard = Endpoint.DataSet(data=data_sets['ShotAreaPlayerDashboard'])
-        self.shot_type_player_dashboard = Endpoint.DataSet(data=data_sets['ShotTypePlayerDashboard'])
-        self.shot_type_summary_player_dashboard = Endpoint.DataSet(data=data_sets['ShotTypeSummaryPlayerDashboard'])
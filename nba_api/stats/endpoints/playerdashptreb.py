@@ -1,18 +1,34 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+NumContestedReboundingRow = namedtuple('NumContestedReboundingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'REB_NUM_CONTESTING_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+OverallReboundingRow = namedtuple('OverallReboundingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'G', 'OVERALL', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+RebDistanceReboundingRow = namedtuple('RebDistanceReboundingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'REB_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+ShotDistanceReboundingRow = namedtuple('ShotDistanceReboundingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'SHOT_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+ShotTypeReboundingRow = namedtuple('ShotTypeReboundingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'SHOT_TYPE_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+
+
 class PlayerDashPtReb(Endpoint):
     endpoint = 'playerdashptreb'
     expected_data = {'NumContestedRebounding': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'REB_NUM_CONTESTING_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'OverallRebounding': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'G', 'OVERALL', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'RebDistanceRebounding': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'REB_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'ShotDistanceRebounding': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'SHOT_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'ShotTypeRebounding': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'G', 'SHOT_TYPE_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT']}
+    expected_data_types = {'NumContestedRebounding': {'PLAYER_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'OverallRebounding': {'PLAYER_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'RebDistanceRebounding': {'PLAYER_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'ShotDistanceRebounding': {'PLAYER_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'ShotTypeRebounding': {'PLAYER_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}}
+    record_types = {'NumContestedRebounding': NumContestedReboundingRow, 'OverallRebounding': OverallReboundingRow, 'RebDistanceRebounding': RebDistanceReboundingRow, 'ShotDistanceRebounding': ShotDistanceReboundingRow, 'ShotTypeRebounding': ShotTypeReboundingRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    num_contested_rebounding = Endpoint.LazyDataSet('NumContestedRebounding')
+    overall_rebounding = Endpoint.LazyDataSet('OverallRebounding')
+    reb_distance_rebounding = Endpoint.LazyDataSet('RebDistanceRebounding')
+    shot_distance_rebounding = Endpoint.LazyDataSet('ShotDistanceRebounding')
+    shot_type_rebounding = Endpoint.LazyDataSet('ShotTypeRebounding')
+
     def __init__(self,
                  team_id,
                  player_id,
@@ -35,11 +51,13 @@ class PlayerDashPtReb(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'PlayerID': player_id,
@@ -64,7 +82,17 @@ class PlayerDashPtReb(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -72,12 +100,3 @@ class PlayerDashPtReb(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.num_contested_rebounding = Endpoint.DataSet(data=data_sets['NumContestedRebounding'])
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets['OverallRebounding'])
-        self.reb_distance_rebounding = Endpoint.DataSet(data=data_sets['RebDistanceRebounding'])
-        self.shot_distance_rebounding = Endpoint.DataSet(data=data_sets['ShotDistanceRebounding'])
-        self.shot_type_rebounding = Endpoint.DataSet(data=data_sets['ShotTypeRebounding'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+DefendingShotsRow = namedtuple('DefendingShotsRow', ['CLOSE_DEF_PERSON_ID', 'GP', 'G', 'DEFENSE_CATEGORY', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS'])
+
+
 class PlayerDashPtShotDefend(Endpoint):
     endpoint = 'playerdashptshotdefend'
     expected_data = {'DefendingShots': ['CLOSE_DEF_PERSON_ID', 'GP', 'G', 'DEFENSE_CATEGORY', 'FREQ', 'D_FGM', 'D_FGA', 'D_FG_PCT', 'NORMAL_FG_PCT', 'PCT_PLUSMINUS']}
+    expected_data_types = {'DefendingShots': {'CLOSE_DEF_PERSON_ID': 'int', 'D_FG_PCT': 'float32', 'NORMAL_FG_PCT': 'float32', 'PCT_PLUSMINUS': 'float32'}}
+    record_types = {'DefendingShots': DefendingShotsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    defending_shots = Endpoint.LazyDataSet('DefendingShots')
+
     def __init__(self,
                  team_id,
                  player_id,
@@ -35,11 +43,13 @@ class PlayerDashPtShotDefend(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'PlayerID': player_id,
@@ -64,7 +74,17 @@ class PlayerDashPtShotDefend(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -72,8 +92,3 @@ class PlayerDashPtShotDefend(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.defending_shots = Endpoint.DataSet(data=data_sets['DefendingShots'])
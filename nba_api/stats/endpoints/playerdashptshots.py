@@ -1,18 +1,38 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+ClosestDefender10ftPlusShootingRow = namedtuple('ClosestDefender10ftPlusShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+ClosestDefenderShootingRow = namedtuple('ClosestDefenderShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+DribbleShootingRow = namedtuple('DribbleShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'DRIBBLE_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+GeneralShootingRow = namedtuple('GeneralShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+OverallRow = namedtuple('OverallRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+ShotClockShootingRow = namedtuple('ShotClockShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_CLOCK_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+TouchTimeShootingRow = namedtuple('TouchTimeShootingRow', ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'TOUCH_TIME_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+
+
 class PlayerDashPtShots(Endpoint):
     endpoint = 'playerdashptshots'
     expected_data = {'ClosestDefender10ftPlusShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'ClosestDefenderShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'DribbleShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'DRIBBLE_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'GeneralShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'Overall': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'ShotClockShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'SHOT_CLOCK_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'TouchTimeShooting': ['PLAYER_ID', 'PLAYER_NAME_LAST_FIRST', 'SORT_ORDER', 'GP', 'G', 'TOUCH_TIME_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT']}
+    expected_data_types = {'ClosestDefender10ftPlusShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'ClosestDefenderShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'DribbleShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'GeneralShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'Overall': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'ShotClockShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'TouchTimeShooting': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'ClosestDefender10ftPlusShooting': ClosestDefender10ftPlusShootingRow, 'ClosestDefenderShooting': ClosestDefenderShootingRow, 'DribbleShooting': DribbleShootingRow, 'GeneralShooting': GeneralShootingRow, 'Overall': OverallRow, 'ShotClockShooting': ShotClockShootingRow, 'TouchTimeShooting': TouchTimeShootingRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    closest_defender10ft_plus_shooting = Endpoint.LazyDataSet('ClosestDefender10ftPlusShooting')
+    closest_defender_shooting = Endpoint.LazyDataSet('ClosestDefenderShooting')
+    dribble_shooting = Endpoint.LazyDataSet('DribbleShooting')
+    general_shooting = Endpoint.LazyDataSet('GeneralShooting')
+    overall = Endpoint.LazyDataSet('Overall')
+    shot_clock_shooting = Endpoint.LazyDataSet('ShotClockShooting')
+    touch_time_shooting = Endpoint.LazyDataSet('TouchTimeShooting')
+
     def __init__(self,
                  team_id,
                  player_id,
@@ -35,11 +55,13 @@ class PlayerDashPtShots(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'PlayerID': player_id,
@@ -64,7 +86,17 @@ class PlayerDashPtShots(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -72,14 +104,3 @@ class PlayerDashPtShots(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.closest_defender10ft_plus_shooting = Endpoint.DataSet(data=data_sets['ClosestDefender10ftPlusShooting'])
-        self.closest_defender_shooting = Endpoint.DataSet(data=data_sets['ClosestDefenderShooting'])
-        self.dribble_shooting = Endpoint.DataSet(data=data_sets['DribbleShooting'])
-        self.general_shooting = Endpoint.DataSet(data=data_sets['GeneralShooting'])
-        self.overall = Endpoint.DataSet(data=data_sets['Overall'])
-        self.shot_clock_shooting = Endpoint.DataSet(data=data_sets['ShotClockShooting'])
-        self.touch_time_shooting = Endpoint.DataSet(data=data_sets['TouchTimeShooting'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import Season, LeagueIDNullable, SeasonTypeAllStarNullable
 
 
+LastFiveGamesAvgRow = namedtuple('LastFiveGamesAvgRow', ['PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'FG3M', 'FT_PCT', 'STL', 'BLK', 'TOV', 'FG_PCT'])
+SeasonAvgRow = namedtuple('SeasonAvgRow', ['PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'FG3M', 'FT_PCT', 'STL', 'BLK', 'TOV', 'FG_PCT'])
+
+
 class PlayerFantasyProfileBarGraph(Endpoint):
     endpoint = 'playerfantasyprofilebargraph'
     expected_data = {'LastFiveGamesAvg': ['PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'FG3M', 'FT_PCT', 'STL', 'BLK', 'TOV', 'FG_PCT'], 'SeasonAvg': ['PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'FAN_DUEL_PTS', 'NBA_FANTASY_PTS', 'PTS', 'REB', 'AST', 'FG3M', 'FT_PCT', 'STL', 'BLK', 'TOV', 'FG_PCT']}
+    expected_data_types = {'LastFiveGamesAvg': {'PLAYER_ID': 'int', 'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FT_PCT': 'float32', 'FG_PCT': 'float32'}, 'SeasonAvg': {'PLAYER_ID': 'int', 'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FT_PCT': 'float32', 'FG_PCT': 'float32'}}
+    record_types = {'LastFiveGamesAvg': LastFiveGamesAvgRow, 'SeasonAvg': SeasonAvgRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    last_five_games_avg = Endpoint.LazyDataSet('LastFiveGamesAvg')
+    season_avg = Endpoint.LazyDataSet('SeasonAvg')
+
     def __init__(self,
                  player_id,
                  season=Season.default,
@@ -21,11 +31,13 @@ class PlayerFantasyProfileBarGraph(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'PlayerID': player_id,
                 'Season': season,
@@ -36,7 +48,17 @@ class PlayerFantasyProfileBarGraph(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -44,9 +66,3 @@ class PlayerFantasyProfileBarGraph(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.last_five_games_avg = Endpoint.DataSet(data=data_sets['LastFiveGamesAvg'])
-        self.season_avg = Endpoint.DataSet(data=data_sets['SeasonAvg'])
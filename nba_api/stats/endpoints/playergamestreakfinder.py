@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import ConferenceNullable, DivisionSimpleNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonNullable, SeasonSegmentNullable, SeasonTypeNullable, StarterBenchNullable, DivisionNullable
 
 
+PlayerGameStreakFinderResultsRow = namedtuple('PlayerGameStreakFinderResultsRow', ['PLAYER_NAME_LAST_FIRST', 'PLAYER_ID', 'GAMESTREAK', 'STARTDATE', 'ENDDATE', 'ACTIVESTREAK', 'NUMSEASONS', 'LASTSEASON', 'FIRSTSEASON'])
+
+
 class PlayerGameStreakFinder(Endpoint):
     endpoint = 'playergamestreakfinder'
     expected_data = {'PlayerGameStreakFinderResults': ['PLAYER_NAME_LAST_FIRST', 'PLAYER_ID', 'GAMESTREAK', 'STARTDATE', 'ENDDATE', 'ACTIVESTREAK', 'NUMSEASONS', 'LASTSEASON', 'FIRSTSEASON']}
+    expected_data_types = {'PlayerGameStreakFinderResults': {'PLAYER_ID': 'int', 'STARTDATE': 'datetime', 'ENDDATE': 'datetime'}}
+    record_types = {'PlayerGameStreakFinderResults': PlayerGameStreakFinderResultsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_game_streak_finder_results = Endpoint.LazyDataSet('PlayerGameStreakFinderResults')
+
     def __init__(self,
                  active_streaks_only_nullable='',
                  conference_nullable=ConferenceNullable.default,
@@ -106,11 +114,13 @@ class PlayerGameStreakFinder(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'ActiveStreaksOnly': active_streaks_only_nullable,
                 'Conference': conference_nullable,
@@ -206,7 +216,17 @@ class PlayerGameStreakFinder(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -214,8 +234,3 @@ class PlayerGameStreakFinder(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.player_game_streak_finder_results = Endpoint.DataSet(data=data_sets['PlayerGameStreakFinderResults'])
@@ -1,18 +1,44 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, MeasureTypeDetailedDefense, Month, PaceAdjust, PerModeDetailed, Period, PlusMinus, Rank, Season, SeasonType, GameSegmentNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+OnOffCourtRow = namedtuple('OnOffCourtRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'NBA_FANTASY_PTS', 'CFID', 'CFPARAMS'])
+OverallRow = namedtuple('OverallRow', ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'NBA_FANTASY_PTS', 'CFID', 'CFPARAMS'])
+PlayerInfoRow = namedtuple('PlayerInfoRow', ['PERSON_ID', 'FIRST_NAME', 'LAST_NAME', 'DISPLAY_FIRST_LAST', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FI_LAST', 'BIRTHDATE', 'SCHOOL', 'COUNTRY', 'LAST_AFFILIATION'])
+ShotAreaOffCourtRow = namedtuple('ShotAreaOffCourtRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+ShotAreaOnCourtRow = namedtuple('ShotAreaOnCourtRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+ShotAreaOverallRow = namedtuple('ShotAreaOverallRow', ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+ShotDistanceOffCourtRow = namedtuple('ShotDistanceOffCourtRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+ShotDistanceOnCourtRow = namedtuple('ShotDistanceOnCourtRow', ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+ShotDistanceOverallRow = namedtuple('ShotDistanceOverallRow', ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'])
+VsPlayerInfoRow = namedtuple('VsPlayerInfoRow', ['PERSON_ID', 'FIRST_NAME', 'LAST_NAME', 'DISPLAY_FIRST_LAST', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FI_LAST', 'BIRTHDATE', 'SCHOOL', 'COUNTRY', 'LAST_AFFILIATION'])
+
+
 class PlayerVsPlayer(Endpoint):
     endpoint = 'playervsplayer'
     expected_data = {'OnOffCourt': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'NBA_FANTASY_PTS', 'CFID', 'CFPARAMS'], 'Overall': ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'NBA_FANTASY_PTS', 'CFID', 'CFPARAMS'], 'PlayerInfo': ['PERSON_ID', 'FIRST_NAME', 'LAST_NAME', 'DISPLAY_FIRST_LAST', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FI_LAST', 'BIRTHDATE', 'SCHOOL', 'COUNTRY', 'LAST_AFFILIATION'], 'ShotAreaOffCourt': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'ShotAreaOnCourt': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'ShotAreaOverall': ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'ShotDistanceOffCourt': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'ShotDistanceOnCourt': ['GROUP_SET', 'PLAYER_ID', 'PLAYER_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GROUP_VALUE', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'ShotDistanceOverall': ['GROUP_SET', 'GROUP_VALUE', 'PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FG_PCT', 'CFID', 'CFPARAMS'], 'VsPlayerInfo': ['PERSON_ID', 'FIRST_NAME', 'LAST_NAME', 'DISPLAY_FIRST_LAST', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FI_LAST', 'BIRTHDATE', 'SCHOOL', 'COUNTRY', 'LAST_AFFILIATION']}
+    expected_data_types = {'OnOffCourt': {'PLAYER_ID': 'int', 'VS_PLAYER_ID': 'int', 'W_PCT': 'float32', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32', 'CFID': 'int'}, 'Overall': {'PLAYER_ID': 'int', 'W_PCT': 'float32', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32', 'CFID': 'int'}, 'PlayerInfo': {'PERSON_ID': 'int', 'BIRTHDATE': 'datetime'}, 'ShotAreaOffCourt': {'PLAYER_ID': 'int', 'VS_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'ShotAreaOnCourt': {'PLAYER_ID': 'int', 'VS_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'ShotAreaOverall': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'ShotDistanceOffCourt': {'PLAYER_ID': 'int', 'VS_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'ShotDistanceOnCourt': {'PLAYER_ID': 'int', 'VS_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'ShotDistanceOverall': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'CFID': 'int'}, 'VsPlayerInfo': {'PERSON_ID': 'int', 'BIRTHDATE': 'datetime'}}
+    record_types = {'OnOffCourt': OnOffCourtRow, 'Overall': OverallRow, 'PlayerInfo': PlayerInfoRow, 'ShotAreaOffCourt': ShotAreaOffCourtRow, 'ShotAreaOnCourt': ShotAreaOnCourtRow, 'ShotAreaOverall': ShotAreaOverallRow, 'ShotDistanceOffCourt': ShotDistanceOffCourtRow, 'ShotDistanceOnCourt': ShotDistanceOnCourtRow, 'ShotDistanceOverall': ShotDistanceOverallRow, 'VsPlayerInfo': VsPlayerInfoRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    on_off_court = Endpoint.LazyDataSet('OnOffCourt')
+    overall = Endpoint.LazyDataSet('Overall')
+    player_info = Endpoint.LazyDataSet('PlayerInfo')
+    shot_area_off_court = Endpoint.LazyDataSet('ShotAreaOffCourt')
+    shot_area_on_court = Endpoint.LazyDataSet('ShotAreaOnCourt')
+    shot_area_overall = Endpoint.LazyDataSet('ShotAreaOverall')
+    shot_distance_off_court = Endpoint.LazyDataSet('ShotDistanceOffCourt')
+    shot_distance_on_court = Endpoint.LazyDataSet('ShotDistanceOnCourt')
+    shot_distance_overall = Endpoint.LazyDataSet('ShotDistanceOverall')
+    vs_player_info = Endpoint.LazyDataSet('VsPlayerInfo')
+
     def __init__(self,
                  vs_player_id,
                  player_id,
@@ -39,11 +65,13 @@ class PlayerVsPlayer(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'VsPlayerID': vs_player_id,
                 'PlayerID': player_id,
@@ -72,7 +100,17 @@ class PlayerVsPlayer(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -80,17 +118,3 @@ class PlayerVsPlayer(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.on_off_court = Endpoint.DataSet(data=data_sets['OnOffCourt'])
-        self.overall = Endpoint.DataSet(data=data_sets['Overall'])
-        self.player_info = Endpoint.DataSet(data=data_sets['PlayerInfo'])
-        self.shot_area_off_court = Endpoint.DataSet(data=data_sets['ShotAreaOffCourt'])
-        self.shot_area_on_court = Endpoint.DataSet(data=data_sets['ShotAreaOnCourt'])
-        self.shot_area_overall = Endpoint.DataSet(data=data_sets['ShotAreaOverall'])
-        self.shot_distance_off_court = Endpoint.DataSet(data=data_sets['ShotDistanceOffCourt'])
-        self.shot_distance_on_court = Endpoint.DataSet(data=data_sets['ShotDistanceOnCourt'])
-        self.shot_distance_overall = Endpoint.DataSet(data=data_sets['ShotDistanceOverall'])
-        self.vs_player_info = Endpoint.DataSet(data=data_sets['VsPlayerInfo'])
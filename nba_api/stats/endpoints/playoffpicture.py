@@ -1,29 +1,49 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, SeasonID
 
 
+EastConfPlayoffPictureRow = namedtuple('EastConfPlayoffPictureRow', ['CONFERENCE', 'HIGH_SEED_RANK', 'HIGH_SEED_TEAM', 'HIGH_SEED_TEAM_ID', 'LOW_SEED_RANK', 'LOW_SEED_TEAM', 'LOW_SEED_TEAM_ID', 'HIGH_SEED_SERIES_W', 'HIGH_SEED_SERIES_L', 'HIGH_SEED_SERIES_REMAINING_G', 'HIGH_SEED_SERIES_REMAINING_HOME_G', 'HIGH_SEED_SERIES_REMAINING_AWAY_G'])
+EastConfRemainingGamesRow = namedtuple('EastConfRemainingGamesRow', ['TEAM', 'TEAM_ID', 'REMAINING_G', 'REMAINING_HOME_G', 'REMAINING_AWAY_G'])
+EastConfStandingsRow = namedtuple('EastConfStandingsRow', ['CONFERENCE', 'RANK', 'TEAM', 'TEAM_ID', 'WINS', 'LOSSES', 'PCT', 'DIV', 'CONF', 'HOME', 'AWAY', 'GB', 'GR_OVER_500', 'GR_OVER_500_HOME', 'GR_OVER_500_AWAY', 'GR_UNDER_500', 'GR_UNDER_500_HOME', 'GR_UNDER_500_AWAY', 'RANKING_CRITERIA', 'CLINCHED_PLAYOFFS', 'CLINCHED_CONFERENCE', 'CLINCHED_DIVISION', 'ELIMINATED_PLAYOFFS', 'SOSA_REMAINING'])
+WestConfPlayoffPictureRow = namedtuple('WestConfPlayoffPictureRow', ['CONFERENCE', 'HIGH_SEED_RANK', 'HIGH_SEED_TEAM', 'HIGH_SEED_TEAM_ID', 'LOW_SEED_RANK', 'LOW_SEED_TEAM', 'LOW_SEED_TEAM_ID', 'HIGH_SEED_SERIES_W', 'HIGH_SEED_SERIES_L', 'HIGH_SEED_SERIES_REMAINING_G', 'HIGH_SEED_SERIES_REMAINING_HOME_G', 'HIGH_SEED_SERIES_REMAINING_AWAY_G'])
+WestConfRemainingGamesRow = namedtuple('WestConfRemainingGamesRow', ['TEAM', 'TEAM_ID', 'REMAINING_G', 'REMAINING_HOME_G', 'REMAINING_AWAY_G'])
+WestConfStandingsRow = namedtuple('WestConfStandingsRow', ['CONFERENCE', 'RANK', 'TEAM', 'TEAM_ID', 'WINS', 'LOSSES', 'PCT', 'DIV', 'CONF', 'HOME', 'AWAY', 'GB', 'GR_OVER_500', 'GR_OVER_500_HOME', 'GR_OVER_500_AWAY', 'GR_UNDER_500', 'GR_UNDER_500_HOME', 'GR_UNDER_500_AWAY', 'RANKING_CRITERIA', 'CLINCHED_PLAYOFFS', 'CLINCHED_CONFERENCE', 'CLINCHED_DIVISION', 'ELIMINATED_PLAYOFFS', 'SOSA_REMAINING'])
+
+
 class PlayoffPicture(Endpoint):
     endpoint = 'playoffpicture'
     expected_data = {'EastConfPlayoffPicture': ['CONFERENCE', 'HIGH_SEED_RANK', 'HIGH_SEED_TEAM', 'HIGH_SEED_TEAM_ID', 'LOW_SEED_RANK', 'LOW_SEED_TEAM', 'LOW_SEED_TEAM_ID', 'HIGH_SEED_SERIES_W', 'HIGH_SEED_SERIES_L', 'HIGH_SEED_SERIES_REMAINING_G', 'HIGH_SEED_SERIES_REMAINING_HOME_G', 'HIGH_SEED_SERIES_REMAINING_AWAY_G'], 'EastConfRemainingGames': ['TEAM', 'TEAM_ID', 'REMAINING_G', 'REMAINING_HOME_G', 'REMAINING_AWAY_G'], 'EastConfStandings': ['CONFERENCE', 'RANK', 'TEAM', 'TEAM_ID', 'WINS', 'LOSSES', 'PCT', 'DIV', 'CONF', 'HOME', 'AWAY', 'GB', 'GR_OVER_500', 'GR_OVER_500_HOME', 'GR_OVER_500_AWAY', 'GR_UNDER_500', 'GR_UNDER_500_HOME', 'GR_UNDER_500_AWAY', 'RANKING_CRITERIA', 'CLINCHED_PLAYOFFS', 'CLINCHED_CONFERENCE', 'CLINCHED_DIVISION', 'ELIMINATED_PLAYOFFS', 'SOSA_REMAINING'], 'WestConfPlayoffPicture': ['CONFERENCE', 'HIGH_SEED_RANK', 'HIGH_SEED_TEAM', 'HIGH_SEED_TEAM_ID', 'LOW_SEED_RANK', 'LOW_SEED_TEAM', 'LOW_SEED_TEAM_ID', 'HIGH_SEED_SERIES_W', 'HIGH_SEED_SERIES_L', 'HIGH_SEED_SERIES_REMAINING_G', 'HIGH_SEED_SERIES_REMAINING_HOME_G', 'HIGH_SEED_SERIES_REMAINING_AWAY_G'], 'WestConfRemainingGames': ['TEAM', 'TEAM_ID', 'REMAINING_G', 'REMAINING_HOME_G', 'REMAINING_AWAY_G'], 'WestConfStandings': ['CONFERENCE', 'RANK', 'TEAM', 'TEAM_ID', 'WINS', 'LOSSES', 'PCT', 'DIV', 'CONF', 'HOME', 'AWAY', 'GB', 'GR_OVER_500', 'GR_OVER_500_HOME', 'GR_OVER_500_AWAY', 'GR_UNDER_500', 'GR_UNDER_500_HOME', 'GR_UNDER_500_AWAY', 'RANKING_CRITERIA', 'CLINCHED_PLAYOFFS', 'CLINCHED_CONFERENCE', 'CLINCHED_DIVISION', 'ELIMINATED_PLAYOFFS', 'SOSA_REMAINING']}
+    expected_data_types = {'EastConfPlayoffPicture': {'HIGH_SEED_TEAM_ID': 'int', 'LOW_SEED_TEAM_ID': 'int'}, 'EastConfRemainingGames': {'TEAM_ID': 'int'}, 'EastConfStandings': {'TEAM_ID': 'int', 'PCT': 'float32'}, 'WestConfPlayoffPicture': {'HIGH_SEED_TEAM_ID': 'int', 'LOW_SEED_TEAM_ID': 'int'}, 'WestConfRemainingGames': {'TEAM_ID': 'int'}, 'WestConfStandings': {'TEAM_ID': 'int', 'PCT': 'float32'}}
+    record_types = {'EastConfPlayoffPicture': EastConfPlayoffPictureRow, 'EastConfRemainingGames': EastConfRemainingGamesRow, 'EastConfStandings': EastConfStandingsRow, 'WestConfPlayoffPicture': WestConfPlayoffPictureRow, 'WestConfRemainingGames': WestConfRemainingGamesRow, 'WestConfStandings': WestConfStandingsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    east_conf_playoff_picture = Endpoint.LazyDataSet('EastConfPlayoffPicture')
+    east_conf_remaining_games = Endpoint.LazyDataSet('EastConfRemainingGames')
+    east_conf_standings = Endpoint.LazyDataSet('EastConfStandings')
+    west_conf_playoff_picture = Endpoint.LazyDataSet('WestConfPlayoffPicture')
+    west_conf_remaining_games = Endpoint.LazyDataSet('WestConfRemainingGames')
+    west_conf_standings = Endpoint.LazyDataSet('WestConfStandings')
+
     def __init__(self,
                  league_id=LeagueID.default,
                  season_id=SeasonID.default,
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'LeagueID': league_id,
                 'SeasonID': season_id
@@ -32,7 +52,17 @@ class PlayoffPicture(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -40,13 +70,3 @@ class PlayoffPicture(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.east_conf_playoff_picture = Endpoint.DataSet(data=data_sets['EastConfPlayoffPicture'])
-        self.east_conf_remaining_games = Endpoint.DataSet(data=data_sets['EastConfRemainingGames'])
-        self.east_conf_standings = Endpoint.DataSet(data=data_sets['EastConfStandings'])
-        self.west_conf_playoff_picture = Endpoint.DataSet(data=data_sets['WestConfPlayoffPicture'])
-        self.west_conf_remaining_games = Endpoint.DataSet(data=data_sets['WestConfRemainingGames'])
-        self.west_conf_standings = Endpoint.DataSet(data=data_sets['WestConfStandings'])
@@ -1,18 +1,38 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import DayOffset, GameDate, LeagueID
 
 
+AvailableRow = namedtuple('AvailableRow', ['GAME_ID', 'PT_AVAILABLE'])
+EastConfStandingsByDayRow = namedtuple('EastConfStandingsByDayRow', ['TEAM_ID', 'LEAGUE_ID', 'SEASON_ID', 'STANDINGSDATE', 'CONFERENCE', 'TEAM', 'G', 'W', 'L', 'W_PCT', 'HOME_RECORD', 'ROAD_RECORD'])
+GameHeaderRow = namedtuple('GameHeaderRow', ['GAME_DATE_EST', 'GAME_SEQUENCE', 'GAME_ID', 'GAME_STATUS_ID', 'GAME_STATUS_TEXT', 'GAMECODE', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'SEASON', 'LIVE_PERIOD', 'LIVE_PC_TIME', 'NATL_TV_BROADCASTER_ABBREVIATION', 'LIVE_PERIOD_TIME_BCAST', 'WH_STATUS'])
+LastMeetingRow = namedtuple('LastMeetingRow', ['GAME_ID', 'LAST_GAME_ID', 'LAST_GAME_DATE_EST', 'LAST_GAME_HOME_TEAM_ID', 'LAST_GAME_HOME_TEAM_CITY', 'LAST_GAME_HOME_TEAM_NAME', 'LAST_GAME_HOME_TEAM_ABBREVIATION', 'LAST_GAME_HOME_TEAM_POINTS', 'LAST_GAME_VISITOR_TEAM_ID', 'LAST_GAME_VISITOR_TEAM_CITY', 'LAST_GAME_VISITOR_TEAM_NAME', 'LAST_GAME_VISITOR_TEAM_CITY1', 'LAST_GAME_VISITOR_TEAM_POINTS'])
+LineScoreRow = namedtuple('LineScoreRow', ['GAME_DATE_EST', 'GAME_SEQUENCE', 'GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY_NAME', 'TEAM_WINS_LOSSES', 'PTS_QTR1', 'PTS_QTR2', 'PTS_QTR3', 'PTS_QTR4', 'PTS_OT1', 'PTS_OT2', 'PTS_OT3', 'PTS_OT4', 'PTS_OT5', 'PTS_OT6', 'PTS_OT7', 'PTS_OT8', 'PTS_OT9', 'PTS_OT10', 'PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'TOV'])
+SeriesStandingsRow = namedtuple('SeriesStandingsRow', ['GAME_ID', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'GAME_DATE_EST', 'HOME_TEAM_WINS', 'HOME_TEAM_LOSSES', 'SERIES_LEADER'])
+WestConfStandingsByDayRow = namedtuple('WestConfStandingsByDayRow', ['TEAM_ID', 'LEAGUE_ID', 'SEASON_ID', 'STANDINGSDATE', 'CONFERENCE', 'TEAM', 'G', 'W', 'L', 'W_PCT', 'HOME_RECORD', 'ROAD_RECORD'])
+
+
 class Scoreboard(Endpoint):
     endpoint = 'scoreboard'
     expected_data = {'Available': ['GAME_ID', 'PT_AVAILABLE'], 'EastConfStandingsByDay': ['TEAM_ID', 'LEAGUE_ID', 'SEASON_ID', 'STANDINGSDATE', 'CONFERENCE', 'TEAM', 'G', 'W', 'L', 'W_PCT', 'HOME_RECORD', 'ROAD_RECORD'], 'GameHeader': ['GAME_DATE_EST', 'GAME_SEQUENCE', 'GAME_ID', 'GAME_STATUS_ID', 'GAME_STATUS_TEXT', 'GAMECODE', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'SEASON', 'LIVE_PERIOD', 'LIVE_PC_TIME', 'NATL_TV_BROADCASTER_ABBREVIATION', 'LIVE_PERIOD_TIME_BCAST', 'WH_STATUS'], 'LastMeeting': ['GAME_ID', 'LAST_GAME_ID', 'LAST_GAME_DATE_EST', 'LAST_GAME_HOME_TEAM_ID', 'LAST_GAME_HOME_TEAM_CITY', 'LAST_GAME_HOME_TEAM_NAME', 'LAST_GAME_HOME_TEAM_ABBREVIATION', 'LAST_GAME_HOME_TEAM_POINTS', 'LAST_GAME_VISITOR_TEAM_ID', 'LAST_GAME_VISITOR_TEAM_CITY', 'LAST_GAME_VISITOR_TEAM_NAME', 'LAST_GAME_VISITOR_TEAM_CITY1', 'LAST_GAME_VISITOR_TEAM_POINTS'], 'LineScore': ['GAME_DATE_EST', 'GAME_SEQUENCE', 'GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_CITY_NAME', 'TEAM_WINS_LOSSES', 'PTS_QTR1', 'PTS_QTR2', 'PTS_QTR3', 'PTS_QTR4', 'PTS_OT1', 'PTS_OT2', 'PTS_OT3', 'PTS_OT4', 'PTS_OT5', 'PTS_OT6', 'PTS_OT7', 'PTS_OT8', 'PTS_OT9', 'PTS_OT10', 'PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'TOV'], 'SeriesStandings': ['GAME_ID', 'HOME_TEAM_ID', 'VISITOR_TEAM_ID', 'GAME_DATE_EST', 'HOME_TEAM_WINS', 'HOME_TEAM_LOSSES', 'SERIES_LEADER'], 'WestConfStandingsByDay': ['TEAM_ID', 'LEAGUE_ID', 'SEASON_ID', 'STANDINGSDATE', 'CONFERENCE', 'TEAM', 'G', 'W', 'L', 'W_PCT', 'HOME_RECORD', 'ROAD_RECORD']}
+    expected_data_types = {'EastConfStandingsByDay': {'TEAM_ID': 'int', 'STANDINGSDATE': 'datetime', 'W_PCT': 'float32'}, 'GameHeader': {'GAME_DATE_EST': 'datetime', 'GAME_STATUS_ID': 'int', 'HOME_TEAM_ID': 'int', 'VISITOR_TEAM_ID': 'int', 'NATL_TV_BROADCASTER_ABBREVIATION': 'category'}, 'LastMeeting': {'LAST_GAME_DATE_EST': 'datetime', 'LAST_GAME_HOME_TEAM_ID': 'int', 'LAST_GAME_HOME_TEAM_ABBREVIATION': 'category', 'LAST_GAME_VISITOR_TEAM_ID': 'int'}, 'LineScore': {'GAME_DATE_EST': 'datetime', 'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32', 'FT_PCT': 'float32', 'FG3_PCT': 'float32'}, 'SeriesStandings': {'HOME_TEAM_ID': 'int', 'VISITOR_TEAM_ID': 'int', 'GAME_DATE_EST': 'datetime'}, 'WestConfStandingsByDay': {'TEAM_ID': 'int', 'STANDINGSDATE': 'datetime', 'W_PCT': 'float32'}}
+    record_types = {'Available': AvailableRow, 'EastConfStandingsByDay': EastConfStandingsByDayRow, 'GameHeader': GameHeaderRow, 'LastMeeting': LastMeetingRow, 'LineScore': LineScoreRow, 'SeriesStandings': SeriesStandingsRow, 'WestConfStandingsByDay': WestConfStandingsByDayRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available = Endpoint.LazyDataSet('Available')
+    east_conf_standings_by_day = Endpoint.LazyDataSet('EastConfStandingsByDay')
+    game_header = Endpoint.LazyDataSet('GameHeader')
+    last_meeting = Endpoint.LazyDataSet('LastMeeting')
+    line_score = Endpoint.LazyDataSet('LineScore')
+    series_standings = Endpoint.LazyDataSet('SeriesStandings')
+    west_conf_standings_by_day = Endpoint.LazyDataSet('WestConfStandingsByDay')
+
     def __init__(self,
                  day_offset=DayOffset.default,
                  game_date=GameDate.default,
@@ -20,11 +40,13 @@ class Scoreboard(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'DayOffset': day_offset,
                 'GameDate': game_date,
@@ -34,7 +56,17 @@ class Scoreboard(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -42,14 +74,3 @@ class Scoreboard(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.available = Endpoint.DataSet(data=data_sets['Available'])
-        self.east_conf_standings_by_day = Endpoint.DataSet(data=data_sets['EastConfStandingsByDay'])
-        self.game_header = Endpoint.DataSet(data=data_sets['GameHeader'])
-        self.last_meeting = Endpoint.DataSet(data=data_sets['LastMeeting'])
-        self.line_score = Endpoint.DataSet(data=data_sets['LineScore'])
-        self.series_standings = Endpoint.DataSet(data=data_sets['SeriesStandings'])
-        self.west_conf_standings_by_day = Endpoint.DataSet(data=data_sets['WestConfStandingsByDay'])
@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import ContextMeasureDetailed, LeagueID, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LastNGamesNullable, LocationNullable, MonthNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+ShotChartLineupDetailRow = namedtuple('ShotChartLineupDetailRow', ['GRID_TYPE', 'GAME_ID', 'GAME_EVENT_ID', 'GROUP_ID', 'GROUP_NAME', 'PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_NAME', 'PERIOD', 'MINUTES_REMAINING', 'SECONDS_REMAINING', 'EVENT_TYPE', 'ACTION_TYPE', 'SHOT_TYPE', 'SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE', 'SHOT_DISTANCE', 'LOC_X', 'LOC_Y', 'SHOT_ATTEMPTED_FLAG', 'SHOT_MADE_FLAG', 'GAME_DATE', 'HTM', 'VTM'])
+ShotChartLineupLeagueAverageRow = namedtuple('ShotChartLineupLeagueAverageRow', ['GRID_TYPE', 'SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE', 'FGA', 'FGM', 'FG_PCT'])
+
+
 class ShotChartLineupDetail(Endpoint):
     endpoint = 'shotchartlineupdetail'
     expected_data = {'ShotChartLineupDetail': ['GRID_TYPE', 'GAME_ID', 'GAME_EVENT_ID', 'GROUP_ID', 'GROUP_NAME', 'PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_NAME', 'PERIOD', 'MINUTES_REMAINING', 'SECONDS_REMAINING', 'EVENT_TYPE', 'ACTION_TYPE', 'SHOT_TYPE', 'SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE', 'SHOT_DISTANCE', 'LOC_X', 'LOC_Y', 'SHOT_ATTEMPTED_FLAG', 'SHOT_MADE_FLAG', 'GAME_DATE', 'HTM', 'VTM'], 'ShotChartLineupLeagueAverage': ['GRID_TYPE', 'SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE', 'FGA', 'FGM', 'FG_PCT']}
+    expected_data_types = {'ShotChartLineupDetail': {'GAME_EVENT_ID': 'int', 'PLAYER_ID': 'int', 'TEAM_ID': 'int', 'GAME_DATE': 'datetime'}, 'ShotChartLineupLeagueAverage': {'FG_PCT': 'float32'}}
+    record_types = {'ShotChartLineupDetail': ShotChartLineupDetailRow, 'ShotChartLineupLeagueAverage': ShotChartLineupLeagueAverageRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    shot_chart_lineup_detail = Endpoint.LazyDataSet('ShotChartLineupDetail')
+    shot_chart_lineup_league_average = Endpoint.LazyDataSet('ShotChartLineupLeagueAverage')
+
     def __init__(self,
                  context_measure_detailed=ContextMeasureDetailed.default,
                  group_id=0,
@@ -37,11 +47,13 @@ class ShotChartLineupDetail(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'ContextMeasure': context_measure_detailed,
                 'GROUP_ID': group_id,
@@ -68,7 +80,17 @@ class ShotChartLineupDetail(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -76,9 +98,3 @@ class ShotChartLineupDetail(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.shot_chart_lineup_detail = Endpoint.DataSet(data=data_sets['ShotChartLineupDetail'])
-        self.shot_chart_lineup_league_average = Endpoint.DataSet(data=data_sets['ShotChartLineupLeagueAverage'])
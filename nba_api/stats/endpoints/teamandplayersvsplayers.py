@@ -1,18 +1,34 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, MeasureTypeDetailedDefense, Month, PaceAdjust, PerModeDetailed, Period, PlusMinus, Rank, Season, SeasonType, ConferenceNullable, DivisionSimpleNullable, GameSegmentNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ShotClockRangeNullable, DivisionNullable
 
 
+PlayersVsPlayersRow = namedtuple('PlayersVsPlayersRow', ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'])
+TeamPlayersVsPlayersOffRow = namedtuple('TeamPlayersVsPlayersOffRow', ['GROUP_SET', 'TITLE_DESCRIPTION', 'PLAYER_ID', 'PLAYER_NAME', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'])
+TeamPlayersVsPlayersOnRow = namedtuple('TeamPlayersVsPlayersOnRow', ['GROUP_SET', 'TITLE_DESCRIPTION', 'PLAYER_ID', 'PLAYER_NAME', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'])
+TeamVsPlayersRow = namedtuple('TeamVsPlayersRow', ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'])
+TeamVsPlayersOffRow = namedtuple('TeamVsPlayersOffRow', ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'])
+
+
 class TeamAndPlayersVsPlayers(Endpoint):
     endpoint = 'teamandplayersvsplayers'
     expected_data = {'PlayersVsPlayers': ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'], 'TeamPlayersVsPlayersOff': ['GROUP_SET', 'TITLE_DESCRIPTION', 'PLAYER_ID', 'PLAYER_NAME', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'], 'TeamPlayersVsPlayersOn': ['GROUP_SET', 'TITLE_DESCRIPTION', 'PLAYER_ID', 'PLAYER_NAME', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'], 'TeamVsPlayers': ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS'], 'TeamVsPlayersOff': ['GROUP_SET', 'TITLE_DESCRIPTION', 'DESCRIPTION', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS']}
+    expected_data_types = {'PlayersVsPlayers': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}, 'TeamPlayersVsPlayersOff': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}, 'TeamPlayersVsPlayersOn': {'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}, 'TeamVsPlayers': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}, 'TeamVsPlayersOff': {'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}}
+    record_types = {'PlayersVsPlayers': PlayersVsPlayersRow, 'TeamPlayersVsPlayersOff': TeamPlayersVsPlayersOffRow, 'TeamPlayersVsPlayersOn': TeamPlayersVsPlayersOnRow, 'TeamVsPlayers': TeamVsPlayersRow, 'TeamVsPlayersOff': TeamVsPlayersOffRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    players_vs_players = Endpoint.LazyDataSet('PlayersVsPlayers')
+    team_players_vs_players_off = Endpoint.LazyDataSet('TeamPlayersVsPlayersOff')
+    team_players_vs_players_on = Endpoint.LazyDataSet('TeamPlayersVsPlayersOn')
+    team_vs_players = Endpoint.LazyDataSet('TeamVsPlayers')
+    team_vs_players_off = Endpoint.LazyDataSet('TeamVsPlayersOff')
+
     def __init__(self,
                  vs_team_id,
                  vs_player_id5,
@@ -52,11 +68,13 @@ class TeamAndPlayersVsPlayers(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'VsTeamID': vs_team_id,
                 'VsPlayerID5': vs_player_id5,
@@ -98,7 +116,17 @@ class TeamAndPlayersVsPlayers(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -106,12 +134,3 @@ class TeamAndPlayersVsPlayers(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.players_vs_players = Endpoint.DataSet(data=data_sets['PlayersVsPlayers'])
-        self.team_players_vs_players_off = Endpoint.DataSet(data=data_sets['TeamPlayersVsPlayersOff'])
-        self.team_players_vs_players_on = Endpoint.DataSet(data=data_sets['TeamPlayersVsPlayersOn'])
-        self.team_vs_players = Endpoint.DataSet(data=data_sets['TeamVsPlayers'])
-        self.team_vs_players_off = Endpoint.DataSet(data=data_sets['TeamVsPlayersOff'])
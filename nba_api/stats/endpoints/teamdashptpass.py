@@ -1,18 +1,28 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Season, SeasonTypeAllStar, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+PassesMadeRow = namedtuple('PassesMadeRow', ['TEAM_ID', 'TEAM_NAME', 'PASS_TYPE', 'G', 'PASS_FROM', 'PASS_TEAMMATE_PLAYER_ID', 'FREQUENCY', 'PASS', 'AST', 'FGM', 'FGA', 'FG_PCT', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3M', 'FG3A', 'FG3_PCT'])
+PassesReceivedRow = namedtuple('PassesReceivedRow', ['TEAM_ID', 'TEAM_NAME', 'PASS_TYPE', 'G', 'PASS_TO', 'PASS_TEAMMATE_PLAYER_ID', 'FREQUENCY', 'PASS', 'AST', 'FGM', 'FGA', 'FG_PCT', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3M', 'FG3A', 'FG3_PCT'])
+
+
 class TeamDashPtPass(Endpoint):
     endpoint = 'teamdashptpass'
     expected_data = {'PassesMade': ['TEAM_ID', 'TEAM_NAME', 'PASS_TYPE', 'G', 'PASS_FROM', 'PASS_TEAMMATE_PLAYER_ID', 'FREQUENCY', 'PASS', 'AST', 'FGM', 'FGA', 'FG_PCT', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3M', 'FG3A', 'FG3_PCT'], 'PassesReceived': ['TEAM_ID', 'TEAM_NAME', 'PASS_TYPE', 'G', 'PASS_TO', 'PASS_TEAMMATE_PLAYER_ID', 'FREQUENCY', 'PASS', 'AST', 'FGM', 'FGA', 'FG_PCT', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3M', 'FG3A', 'FG3_PCT']}
+    expected_data_types = {'PassesMade': {'TEAM_ID': 'int', 'PASS_TEAMMATE_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'PassesReceived': {'TEAM_ID': 'int', 'PASS_TEAMMATE_PLAYER_ID': 'int', 'FG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'PassesMade': PassesMadeRow, 'PassesReceived': PassesReceivedRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    passes_made = Endpoint.LazyDataSet('PassesMade')
+    passes_received = Endpoint.LazyDataSet('PassesReceived')
+
     def __init__(self,
                  team_id,
                  last_n_games=LastNGames.default,
@@ -32,11 +42,13 @@ class TeamDashPtPass(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LastNGames': last_n_games,
@@ -58,7 +70,17 @@ class TeamDashPtPass(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -66,9 +88,3 @@ class TeamDashPtPass(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.passes_made = Endpoint.DataSet(data=data_sets['PassesMade'])
-        self.passes_received = Endpoint.DataSet(data=data_sets['PassesReceived'])
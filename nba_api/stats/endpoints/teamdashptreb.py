@@ -1,18 +1,34 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+NumContestedReboundingRow = namedtuple('NumContestedReboundingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'REB_NUM_CONTESTING_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+OverallReboundingRow = namedtuple('OverallReboundingRow', ['TEAM_ID', 'TEAM_NAME', 'G', 'OVERALL', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+RebDistanceReboundingRow = namedtuple('RebDistanceReboundingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'REB_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+ShotDistanceReboundingRow = namedtuple('ShotDistanceReboundingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+ShotTypeReboundingRow = namedtuple('ShotTypeReboundingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_TYPE_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'])
+
+
 class TeamDashPtReb(Endpoint):
     endpoint = 'teamdashptreb'
     expected_data = {'NumContestedRebounding': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'REB_NUM_CONTESTING_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'OverallRebounding': ['TEAM_ID', 'TEAM_NAME', 'G', 'OVERALL', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'RebDistanceRebounding': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'REB_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'ShotDistanceRebounding': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_DIST_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT'], 'ShotTypeRebounding': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_TYPE_RANGE', 'REB_FREQUENCY', 'OREB', 'DREB', 'REB', 'C_OREB', 'C_DREB', 'C_REB', 'C_REB_PCT', 'UC_OREB', 'UC_DREB', 'UC_REB', 'UC_REB_PCT']}
+    expected_data_types = {'NumContestedRebounding': {'TEAM_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'OverallRebounding': {'TEAM_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'RebDistanceRebounding': {'TEAM_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'ShotDistanceRebounding': {'TEAM_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}, 'ShotTypeRebounding': {'TEAM_ID': 'int', 'C_REB_PCT': 'float32', 'UC_REB_PCT': 'float32'}}
+    record_types = {'NumContestedRebounding': NumContestedReboundingRow, 'OverallRebounding': OverallReboundingRow, 'RebDistanceRebounding': RebDistanceReboundingRow, 'ShotDistanceRebounding': ShotDistanceReboundingRow, 'ShotTypeRebounding': ShotTypeReboundingRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    num_contested_rebounding = Endpoint.LazyDataSet('NumContestedRebounding')
+    overall_rebounding = Endpoint.LazyDataSet('OverallRebounding')
+    reb_distance_rebounding = Endpoint.LazyDataSet('RebDistanceRebounding')
+    shot_distance_rebounding = Endpoint.LazyDataSet('ShotDistanceRebounding')
+    shot_type_rebounding = Endpoint.LazyDataSet('ShotTypeRebounding')
+
     def __init__(self,
                  team_id,
                  last_n_games=LastNGames.default,
@@ -34,11 +50,13 @@ class TeamDashPtReb(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LastNGames': last_n_games,
@@ -62,7 +80,17 @@ class TeamDashPtReb(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -70,12 +98,3 @@ class TeamDashPtReb(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.num_contested_rebounding = Endpoint.DataSet(data=data_sets['NumContestedRebounding'])
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets['OverallRebounding'])
-        self.reb_distance_rebounding = Endpoint.DataSet(data=data_sets['RebDistanceRebounding'])
-        self.shot_distance_rebounding = Endpoint.DataSet(data=data_sets['ShotDistanceRebounding'])
-        self.shot_type_rebounding = Endpoint.DataSet(data=data_sets['ShotTypeRebounding'])
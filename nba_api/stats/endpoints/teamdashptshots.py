@@ -1,18 +1,36 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, LeagueID, Month, PerModeSimple, Period, Season, SeasonTypeAllStar, GameSegmentNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+ClosestDefender10ftPlusShootingRow = namedtuple('ClosestDefender10ftPlusShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+ClosestDefenderShootingRow = namedtuple('ClosestDefenderShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+DribbleShootingRow = namedtuple('DribbleShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'DRIBBLE_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+GeneralShootingRow = namedtuple('GeneralShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+ShotClockShootingRow = namedtuple('ShotClockShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_CLOCK_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+TouchTimeShootingRow = namedtuple('TouchTimeShootingRow', ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'TOUCH_TIME_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'])
+
+
 class TeamDashPtShots(Endpoint):
     endpoint = 'teamdashptshots'
     expected_data = {'ClosestDefender10ftPlusShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'ClosestDefenderShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'CLOSE_DEF_DIST_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'DribbleShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'DRIBBLE_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'GeneralShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_TYPE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'ShotClockShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'SHOT_CLOCK_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT'], 'TouchTimeShooting': ['TEAM_ID', 'TEAM_NAME', 'SORT_ORDER', 'G', 'TOUCH_TIME_RANGE', 'FGA_FREQUENCY', 'FGM', 'FGA', 'FG_PCT', 'EFG_PCT', 'FG2A_FREQUENCY', 'FG2M', 'FG2A', 'FG2_PCT', 'FG3A_FREQUENCY', 'FG3M', 'FG3A', 'FG3_PCT']}
+    expected_data_types = {'ClosestDefender10ftPlusShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'ClosestDefenderShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'DribbleShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'GeneralShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'ShotClockShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}, 'TouchTimeShooting': {'TEAM_ID': 'int', 'FG_PCT': 'float32', 'EFG_PCT': 'float32', 'FG2_PCT': 'float32', 'FG3_PCT': 'float32'}}
+    record_types = {'ClosestDefender10ftPlusShooting': ClosestDefender10ftPlusShootingRow, 'ClosestDefenderShooting': ClosestDefenderShootingRow, 'DribbleShooting': DribbleShootingRow, 'GeneralShooting': GeneralShootingRow, 'ShotClockShooting': ShotClockShootingRow, 'TouchTimeShooting': TouchTimeShootingRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    closest_defender10ft_plus_shooting = Endpoint.LazyDataSet('ClosestDefender10ftPlusShooting')
+    closest_defender_shooting = Endpoint.LazyDataSet('ClosestDefenderShooting')
+    dribble_shooting = Endpoint.LazyDataSet('DribbleShooting')
+    general_shooting = Endpoint.LazyDataSet('GeneralShooting')
+    shot_clock_shooting = Endpoint.LazyDataSet('ShotClockShooting')
+    touch_time_shooting = Endpoint.LazyDataSet('TouchTimeShooting')
+
     def __init__(self,
                  team_id,
                  last_n_games=LastNGames.default,
@@ -34,11 +52,13 @@ class TeamDashPtShots(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LastNGames': last_n_games,
@@ -62,7 +82,17 @@ class TeamDashPtShots(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -70,13 +100,3 @@ class TeamDashPtShots(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.closest_defender10ft_plus_shooting = Endpoint.DataSet(data=data_sets['ClosestDefender10ftPlusShooting'])
-        self.closest_defender_shooting = Endpoint.DataSet(data=data_sets['ClosestDefenderShooting'])
-        self.dribble_shooting = Endpoint.DataSet(data=data_sets['DribbleShooting'])
-        self.general_shooting = Endpoint.DataSet(data=data_sets['GeneralShooting'])
-        self.shot_clock_shooting = Endpoint.DataSet(data=data_sets['ShotClockShooting'])
-        self.touch_time_shooting = Endpoint.DataSet(data=data_sets['TouchTimeShooting'])
@@ -1,27 +1,51 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
+
+
+TeamAwardsChampionshipsRow = namedtuple('TeamAwardsChampionshipsRow', ['YEARAWARDED', 'OPPOSITETEAM'])
+TeamAwardsConfRow = namedtuple('TeamAwardsConfRow', ['YEARAWARDED', 'OPPOSITETEAM'])
+TeamAwardsDivRow = namedtuple('TeamAwardsDivRow', ['YEARAWARDED', 'OPPOSITETEAM'])
+TeamBackgroundRow = namedtuple('TeamBackgroundRow', ['TEAM_ID', 'ABBREVIATION', 'NICKNAME', 'YEARFOUNDED', 'CITY', 'ARENA', 'ARENACAPACITY', 'OWNER', 'GENERALMANAGER', 'HEADCOACH', 'DLEAGUEAFFILIATION'])
+TeamHistoryRow = namedtuple('TeamHistoryRow', ['TEAM_ID', 'CITY', 'NICKNAME', 'YEARFOUNDED', 'YEARACTIVETILL'])
+TeamHofRow = namedtuple('TeamHofRow', ['PLAYERID', 'PLAYER', 'POSITION', 'JERSEY', 'SEASONSWITHTEAM', 'YEAR'])
+TeamRetiredRow = namedtuple('TeamRetiredRow', ['PLAYERID', 'PLAYER', 'POSITION', 'JERSEY', 'SEASONSWITHTEAM', 'YEAR'])
+TeamSocialSitesRow = namedtuple('TeamSocialSitesRow', ['ACCOUNTTYPE', 'WEBSITE_LINK'])
 
 
 class TeamDetails(Endpoint):
     endpoint = 'teamdetails'
     expected_data = {'TeamAwardsChampionships': ['YEARAWARDED', 'OPPOSITETEAM'], 'TeamAwardsConf': ['YEARAWARDED', 'OPPOSITETEAM'], 'TeamAwardsDiv': ['YEARAWARDED', 'OPPOSITETEAM'], 'TeamBackground': ['TEAM_ID', 'ABBREVIATION', 'NICKNAME', 'YEARFOUNDED', 'CITY', 'ARENA', 'ARENACAPACITY', 'OWNER', 'GENERALMANAGER', 'HEADCOACH', 'DLEAGUEAFFILIATION'], 'TeamHistory': ['TEAM_ID', 'CITY', 'NICKNAME', 'YEARFOUNDED', 'YEARACTIVETILL'], 'TeamHof': ['PLAYERID', 'PLAYER', 'POSITION', 'JERSEY', 'SEASONSWITHTEAM', 'YEAR'], 'TeamRetired': ['PLAYERID', 'PLAYER', 'POSITION', 'JERSEY', 'SEASONSWITHTEAM', 'YEAR'], 'TeamSocialSites': ['ACCOUNTTYPE', 'WEBSITE_LINK']}
+    expected_data_types = {'TeamBackground': {'TEAM_ID': 'int', 'ABBREVIATION': 'category'}, 'TeamHistory': {'TEAM_ID': 'int'}, 'TeamHof': {'PLAYERID': 'int'}, 'TeamRetired': {'PLAYERID': 'int'}}
+    record_types = {'TeamAwardsChampionships': TeamAwardsChampionshipsRow, 'TeamAwardsConf': TeamAwardsConfRow, 'TeamAwardsDiv': TeamAwardsDivRow, 'TeamBackground': TeamBackgroundRow, 'TeamHistory': TeamHistoryRow, 'TeamHof': TeamHofRow, 'TeamRetired': TeamRetiredRow, 'TeamSocialSites': TeamSocialSitesRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_awards_championships = Endpoint.LazyDataSet('TeamAwardsChampionships')
+    team_awards_conf = Endpoint.LazyDataSet('TeamAwardsConf')
+    team_awards_div = Endpoint.LazyDataSet('TeamAwardsDiv')
+    team_background = Endpoint.LazyDataSet('TeamBackground')
+    team_history = Endpoint.LazyDataSet('TeamHistory')
+    team_hof = Endpoint.LazyDataSet('TeamHof')
+    team_retired = Endpoint.LazyDataSet('TeamRetired')
+    team_social_sites = Endpoint.LazyDataSet('TeamSocialSites')
+
     def __init__(self,
                  team_id,
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id
         }
@@ -29,7 +53,17 @@ class TeamDetails(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -37,15 +71,3 @@ class TeamDetails(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.team_awards_championships = Endpoint.DataSet(data=data_sets['TeamAwardsChampionships'])
-        self.team_awards_conf = Endpoint.DataSet(data=data_sets['TeamAwardsConf'])
-        self.team_awards_div = Endpoint.DataSet(data=data_sets['TeamAwardsDiv'])
-        self.team_background = Endpoint.DataSet(data=data_sets['TeamBackground'])
-        self.team_history = Endpoint.DataSet(data=data_sets['TeamHistory'])
-        self.team_hof = Endpoint.DataSet(data=data_sets['TeamHof'])
-        self.team_retired = Endpoint.DataSet(data=data_sets['TeamRetired'])
-        self.team_social_sites = Endpoint.DataSet(data=data_sets['TeamSocialSites'])
@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import ConferenceNullable, DivisionSimpleNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonNullable, SeasonSegmentNullable, SeasonTypeNullable, DivisionNullable
 
 
+TeamGameStreakFinderParametersResultsRow = namedtuple('TeamGameStreakFinderParametersResultsRow', ['TEAM_NAME', 'TEAM_ID', 'GAMESTREAK', 'STARTDATE', 'ENDDATE', 'ACTIVESTREAK', 'NUMSEASONS', 'LASTSEASON', 'FIRSTSEASON', 'ABBREVIATION'])
+
+
 class TeamGameStreakFinder(Endpoint):
     endpoint = 'teamgamestreakfinder'
     expected_data = {'TeamGameStreakFinderParametersResults': ['TEAM_NAME', 'TEAM_ID', 'GAMESTREAK', 'STARTDATE', 'ENDDATE', 'ACTIVESTREAK', 'NUMSEASONS', 'LASTSEASON', 'FIRSTSEASON', 'ABBREVIATION']}
+    expected_data_types = {'TeamGameStreakFinderParametersResults': {'TEAM_ID': 'int', 'STARTDATE': 'datetime', 'ENDDATE': 'datetime', 'ABBREVIATION': 'category'}}
+    record_types = {'TeamGameStreakFinderParametersResults': TeamGameStreakFinderParametersResultsRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_game_streak_finder_parameters_results = Endpoint.LazyDataSet('TeamGameStreakFinderParametersResults')
+
     def __init__(self,
                  active_streaks_only_nullable='',
                  active_teams_only_nullable='',
@@ -205,11 +213,13 @@ class TeamGameStreakFinder(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'ActiveStreaksOnly': active_streaks_only_nullable,
                 'ActiveTeamsOnly': active_teams_only_nullable,
@@ -404,7 +414,17 @@ class TeamGameStreakFinder(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -412,8 +432,3 @@ class TeamGameStreakFinder(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.team_game_streak_finder_parameters_results = Endpoint.DataSet(data=data_sets['TeamGameStreakFinderParametersResults'])
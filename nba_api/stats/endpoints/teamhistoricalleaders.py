@@ -1,18 +1,26 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, SeasonID
 
 
+CareerLeadersByTeamRow = namedtuple('CareerLeadersByTeamRow', ['TEAM_ID', 'PTS', 'PTS_PERSON_ID', 'PTS_PLAYER', 'AST', 'AST_PERSON_ID', 'AST_PLAYER', 'REB', 'REB_PERSON_ID', 'REB_PLAYER', 'BLK', 'BLK_PERSON_ID', 'BLK_PLAYER', 'STL', 'STL_PERSON_ID', 'STL_PLAYER', 'SEASON_YEAR'])
+
+
 class TeamHistoricalLeaders(Endpoint):
     endpoint = 'teamhistoricalleaders'
     expected_data = {'CareerLeadersByTeam': ['TEAM_ID', 'PTS', 'PTS_PERSON_ID', 'PTS_PLAYER', 'AST', 'AST_PERSON_ID', 'AST_PLAYER', 'REB', 'REB_PERSON_ID', 'REB_PLAYER', 'BLK', 'BLK_PERSON_ID', 'BLK_PLAYER', 'STL', 'STL_PERSON_ID', 'STL_PLAYER', 'SEASON_YEAR']}
+    expected_data_types = {'CareerLeadersByTeam': {'TEAM_ID': 'int', 'PTS_PERSON_ID': 'int', 'AST_PERSON_ID': 'int', 'REB_PERSON_ID': 'int', 'BLK_PERSON_ID': 'int', 'STL_PERSON_ID': 'int'}}
+    record_types = {'CareerLeadersByTeam': CareerLeadersByTeamRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    career_leaders_by_team = Endpoint.LazyDataSet('CareerLeadersByTeam')
+
     def __init__(self,
                  team_id,
                  league_id=LeagueID.default,
@@ -20,11 +28,13 @@ class TeamHistoricalLeaders(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LeagueID': league_id,
@@ -34,7 +44,17 @@ class TeamHistoricalLeaders(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -42,8 +62,3 @@ class TeamHistoricalLeaders(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.career_leaders_by_team = Endpoint.DataSet(data=data_sets['CareerLeadersByTeam'])
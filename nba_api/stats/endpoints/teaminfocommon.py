@@ -1,18 +1,30 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueID, SeasonNullable, SeasonTypeNullable
 
 
+AvailableSeasonsRow = namedtuple('AvailableSeasonsRow', ['SEASON_ID'])
+TeamInfoCommonRow = namedtuple('TeamInfoCommonRow', ['TEAM_ID', 'SEASON_YEAR', 'TEAM_CITY', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CONFERENCE', 'TEAM_DIVISION', 'TEAM_CODE', 'W', 'L', 'PCT', 'CONF_RANK', 'DIV_RANK', 'MIN_YEAR', 'MAX_YEAR'])
+TeamSeasonRanksRow = namedtuple('TeamSeasonRanksRow', ['LEAGUE_ID', 'SEASON_ID', 'TEAM_ID', 'PTS_RANK', 'PTS_PG', 'REB_RANK', 'REB_PG', 'AST_RANK', 'AST_PG', 'OPP_PTS_RANK', 'OPP_PTS_PG'])
+
+
 class TeamInfoCommon(Endpoint):
     endpoint = 'teaminfocommon'
     expected_data = {'AvailableSeasons': ['SEASON_ID'], 'TeamInfoCommon': ['TEAM_ID', 'SEASON_YEAR', 'TEAM_CITY', 'TEAM_NAME', 'TEAM_ABBREVIATION', 'TEAM_CONFERENCE', 'TEAM_DIVISION', 'TEAM_CODE', 'W', 'L', 'PCT', 'CONF_RANK', 'DIV_RANK', 'MIN_YEAR', 'MAX_YEAR'], 'TeamSeasonRanks': ['LEAGUE_ID', 'SEASON_ID', 'TEAM_ID', 'PTS_RANK', 'PTS_PG', 'REB_RANK', 'REB_PG', 'AST_RANK', 'AST_PG', 'OPP_PTS_RANK', 'OPP_PTS_PG']}
+    expected_data_types = {'TeamInfoCommon': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'PCT': 'float32'}, 'TeamSeasonRanks': {'TEAM_ID': 'int'}}
+    record_types = {'AvailableSeasons': AvailableSeasonsRow, 'TeamInfoCommon': TeamInfoCommonRow, 'TeamSeasonRanks': TeamSeasonRanksRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_seasons = Endpoint.LazyDataSet('AvailableSeasons')
+    team_info_common = Endpoint.LazyDataSet('TeamInfoCommon')
+    team_season_ranks = Endpoint.LazyDataSet('TeamSeasonRanks')
+
     def __init__(self,
                  team_id,
                  league_id=LeagueID.default,
@@ -21,11 +33,13 @@ class TeamInfoCommon(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LeagueID': league_id,
@@ -36,7 +50,17 @@ class TeamInfoCommon(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -44,10 +68,3 @@ class TeamInfoCommon(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.available_seasons = Endpoint.DataSet(data=data_sets['AvailableSeasons'])
-        self.team_info_common = Endpoint.DataSet(data=data_sets['TeamInfoCommon'])
-        self.team_season_ranks = Endpoint.DataSet(data=data_sets['TeamSeasonRanks'])
@@ -1,18 +1,30 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import LastNGames, MeasureTypeDetailedDefense, Month, PaceAdjust, PerModeDetailed, Period, PlusMinus, Rank, Season, SeasonTypeAllStar, GameSegmentNullable, LeagueIDNullable, LocationNullable, OutcomeNullable, SeasonSegmentNullable, ConferenceNullable, DivisionNullable
 
 
+OverallTeamPlayerOnOffSummaryRow = namedtuple('OverallTeamPlayerOnOffSummaryRow', ['GROUP_SET', 'GROUP_VALUE', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'GP_RANK', 'W_RANK', 'L_RANK', 'W_PCT_RANK', 'MIN_RANK', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'FTM_RANK', 'FTA_RANK', 'FT_PCT_RANK', 'OREB_RANK', 'DREB_RANK', 'REB_RANK', 'AST_RANK', 'TOV_RANK', 'STL_RANK', 'BLK_RANK', 'BLKA_RANK', 'PF_RANK', 'PFD_RANK', 'PTS_RANK', 'PLUS_MINUS_RANK'])
+PlayersOffCourtTeamPlayerOnOffSummaryRow = namedtuple('PlayersOffCourtTeamPlayerOnOffSummaryRow', ['GROUP_SET', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'MIN', 'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'NET_RATING'])
+PlayersOnCourtTeamPlayerOnOffSummaryRow = namedtuple('PlayersOnCourtTeamPlayerOnOffSummaryRow', ['GROUP_SET', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'MIN', 'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'NET_RATING'])
+
+
 class TeamPlayerOnOffSummary(Endpoint):
     endpoint = 'teamplayeronoffsummary'
     expected_data = {'OverallTeamPlayerOnOffSummary': ['GROUP_SET', 'GROUP_VALUE', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GP', 'W', 'L', 'W_PCT', 'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'GP_RANK', 'W_RANK', 'L_RANK', 'W_PCT_RANK', 'MIN_RANK', 'FGM_RANK', 'FGA_RANK', 'FG_PCT_RANK', 'FG3M_RANK', 'FG3A_RANK', 'FG3_PCT_RANK', 'FTM_RANK', 'FTA_RANK', 'FT_PCT_RANK', 'OREB_RANK', 'DREB_RANK', 'REB_RANK', 'AST_RANK', 'TOV_RANK', 'STL_RANK', 'BLK_RANK', 'BLKA_RANK', 'PF_RANK', 'PFD_RANK', 'PTS_RANK', 'PLUS_MINUS_RANK'], 'PlayersOffCourtTeamPlayerOnOffSummary': ['GROUP_SET', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'MIN', 'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'NET_RATING'], 'PlayersOnCourtTeamPlayerOnOffSummary': ['GROUP_SET', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'VS_PLAYER_ID', 'VS_PLAYER_NAME', 'COURT_STATUS', 'GP', 'MIN', 'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'NET_RATING']}
+    expected_data_types = {'OverallTeamPlayerOnOffSummary': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'W_PCT': 'float32', 'FG_PCT': 'float32', 'FG3_PCT': 'float32', 'FT_PCT': 'float32'}, 'PlayersOffCourtTeamPlayerOnOffSummary': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'VS_PLAYER_ID': 'int'}, 'PlayersOnCourtTeamPlayerOnOffSummary': {'TEAM_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'VS_PLAYER_ID': 'int'}}
+    record_types = {'OverallTeamPlayerOnOffSummary': OverallTeamPlayerOnOffSummaryRow, 'PlayersOffCourtTeamPlayerOnOffSummary': PlayersOffCourtTeamPlayerOnOffSummaryRow, 'PlayersOnCourtTeamPlayerOnOffSummary': PlayersOnCourtTeamPlayerOnOffSummaryRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    overall_team_player_on_off_summary = Endpoint.LazyDataSet('OverallTeamPlayerOnOffSummary')
+    players_off_court_team_player_on_off_summary = Endpoint.LazyDataSet('PlayersOffCourtTeamPlayerOnOffSummary')
+    players_on_court_team_player_on_off_summary = Endpoint.LazyDataSet('PlayersOnCourtTeamPlayerOnOffSummary')
+
     def __init__(self,
                  team_id,
                  last_n_games=LastNGames.default,
@@ -38,11 +50,13 @@ class TeamPlayerOnOffSummary(Endpoint):
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'TeamID': team_id,
                 'LastNGames': last_n_games,
@@ -70,7 +84,17 @@ class TeamPlayerOnOffSummary(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -78,10 +102,3 @@ class TeamPlayerOnOffSummary(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.overall_team_player_on_off_summary = Endpoint.DataSet(data=data_sets['OverallTeamPlayerOnOffSummary'])
-        self.players_off_court_team_player_on_off_summary = Endpoint.DataSet(data=data_sets['PlayersOffCourtTeamPlayerOnOffSummary'])
-        self.players_on_court_team_player_on_off_summary = Endpoint.DataSet(data=data_sets['PlayersOnCourtTeamPlayerOnOffSummary'])
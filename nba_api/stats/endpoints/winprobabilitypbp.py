@@ -1,29 +1,41 @@
+from collections import namedtuple
+
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
 from nba_api.stats.library.parameters import RunType
 
 
+GameInfoRow = namedtuple('GameInfoRow', ['GAME_ID', 'GAME_DATE', 'HOME_TEAM_ID', 'HOME_TEAM_ABR', 'HOME_TEAM_PTS', 'VISITOR_TEAM_ID', 'VISITOR_TEAM_ABR', 'VISITOR_TEAM_PTS'])
+WinProbPBPRow = namedtuple('WinProbPBPRow', ['GAME_ID', 'EVENT_NUM', 'HOME_PCT', 'VISITOR_PCT', 'HOME_PTS', 'VISITOR_PTS', 'HOME_SCORE_MARGIN', 'PERIOD', 'SECONDS_REMAINING', 'HOME_POSS_IND', 'HOME_G', 'DESCRIPTION', 'LOCATION', 'PCTIMESTRING', 'ISVISIBLE'])
+
+
 class WinProbabilityPBP(Endpoint):
     endpoint = 'winprobabilitypbp'
     expected_data = {'GameInfo': ['GAME_ID', 'GAME_DATE', 'HOME_TEAM_ID', 'HOME_TEAM_ABR', 'HOME_TEAM_PTS', 'VISITOR_TEAM_ID', 'VISITOR_TEAM_ABR', 'VISITOR_TEAM_PTS'], 'WinProbPBP': ['GAME_ID', 'EVENT_NUM', 'HOME_PCT', 'VISITOR_PCT', 'HOME_PTS', 'VISITOR_PTS', 'HOME_SCORE_MARGIN', 'PERIOD', 'SECONDS_REMAINING', 'HOME_POSS_IND', 'HOME_G', 'DESCRIPTION', 'LOCATION', 'PCTIMESTRING', 'ISVISIBLE']}
+    expected_data_types = {'GameInfo': {'GAME_DATE': 'datetime', 'HOME_TEAM_ID': 'int', 'VISITOR_TEAM_ID': 'int'}, 'WinProbPBP': {'HOME_PCT': 'float32', 'VISITOR_PCT': 'float32'}}
+    record_types = {'GameInfo': GameInfoRow, 'WinProbPBP': WinProbPBPRow}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_info = Endpoint.LazyDataSet('GameInfo')
+    win_prob_p_bp = Endpoint.LazyDataSet('WinProbPBP')
+
     def __init__(self,
                  game_id,
                  run_type=RunType.default,
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {
                 'GameID': game_id,
                 'RunType': run_type
@@ -32,7 +44,17 @@ class WinProbabilityPBP(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -40,9 +62,3 @@ class WinProbabilityPBP(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-        self.game_info = Endpoint.DataSet(data=data_sets['GameInfo'])
-        self.win_prob_p_bp = Endpoint.DataSet(data=data_sets['WinProbPBP'])
@@ -0,0 +1,184 @@
+import re
+from datetime import datetime, timedelta
+
+from nba_api.library.cache import CachePolicy
+from nba_api.stats.library.parameters import SeasonYear
+
+
+# GAME_STATUS_ID of a game that is over. 1 is scheduled and 2 is in progress.
+game_status_final = 3
+
+live_endpoints = {
+    'boxscoreadvancedv2', 'boxscoredefensive', 'boxscorefourfactorsv2', 'boxscorematchups', 'boxscoremiscv2',
+    'boxscoreplayertrackv2', 'boxscorescoringv2', 'boxscoresummaryv2', 'boxscoretraditionalv2', 'boxscoreusagev2',
+    'playbyplay', 'playbyplayv2', 'scoreboard', 'scoreboardv2', 'winprobabilitypbp',
+}
+
+season_parameters = ('Season', 'SeasonYear')
+date_parameters = ('GameDate', 'DateTo', 'DateFrom')
+date_formats = ('%m/%d/%Y', '%Y-%m-%d')
+
+
+# EVENTMSGTYPE of the row that ends a period in PlayByPlay and PlayByPlayV2
+event_msg_type_period_end = 13
+
+
+class SeasonCachePolicy(CachePolicy):
+    # Derives the ttl of a response from the season and dates it covers:
+    #   - Completed seasons, finished games and dates that have settled never change and are kept for historical_ttl.
+    #   - Responses with a GAME_STATUS_ID for games that are not over, and the current box scores and play by play of
+    #     games that are not known to be over, are kept for live_ttl.
+    #   - Everything else, such as the current season, is kept for current_ttl.
+    # Box scores and play by play have no GAME_STATUS_ID, their game is known to be over from the statuses of earlier
+    # responses (scoreboards, box score summaries) or from the end of the play by play.
+
+    def __init__(self, historical_ttl=None, current_ttl=15 * 60, live_ttl=10, settled_days=2, current_season_year=None):
+        self.historical_ttl = historical_ttl
+        self.current_ttl = current_ttl
+        self.live_ttl = live_ttl
+        self.settled_days = settled_days
+        self.current_season_year = current_season_year
+        self.final_game_ids = set()
+
+    def get_current_season_year(self):
+        if self.current_season_year is not None:
+            return self.current_season_year
+        return SeasonYear.current_season_year
+
+    def get_ttl(self, endpoint, parameters, nba_response):
+        game_statuses = self.get_game_statuses(nba_response)
+        self.final_game_ids.update(self.get_final_game_ids(nba_response))
+        if any(status != game_status_final for status in game_statuses):
+            return self.live_ttl
+        if game_statuses and (parameters.get('GameID') or parameters.get('GameDate')):
+            # Every game of the response is over.
+            return self.historical_ttl
+        if self.is_historical(parameters):
+            return self.historical_ttl
+        if endpoint.lower() in live_endpoints:
+            # A game that is not known to be over may be in progress.
+            if self.is_final_game(parameters.get('GameID'), nba_response):
+                return self.historical_ttl
+            return self.live_ttl
+        return self.current_ttl
+
+    def is_final_game(self, game_id, nba_response):
+        if game_id and str(game_id) in self.final_game_ids:
+            return True
+        return self.is_final_play_by_play(nba_response)
+
+    def is_historical(self, parameters):
+        # Returns True if every season, game and date parameter refers to the past, False if one of them refers to the
+        # current season or recent dates and None if the request has none of them.
+        results = []
+        current_season_year = self.get_current_season_year()
+
+        for parameter in season_parameters:
+            season_year = self.get_season_year(parameters.get(parameter))
+            if season_year is not None:
+                results.append(season_year < current_season_year)
+            elif parameters.get(parameter) not in (None, ''):
+                # ALL and other values spanning seasons include the current one.
+                results.append(False)
+
+        game_season_year = self.get_game_season_year(parameters.get('GameID'))
+        if game_season_year is not None:
+            results.append(game_season_year < current_season_year)
+
+        settled_date = datetime.now().date() - timedelta(days=self.settled_days)
+        dates = {parameter: self.get_date(parameters.get(parameter)) for parameter in date_parameters}
+        if dates['DateFrom'] is not None and dates['DateTo'] is None:
+            # An open ended range runs up to today.
+            results.append(False)
+        for parameter in ('GameDate', 'DateTo'):
+            if dates[parameter] is not None:
+                results.append(dates[parameter] < settled_date)
+
+        if not results:
+            return None
+        return all(results)
+
+    @staticmethod
+    def get_season_year(value):
+        # '2015-16' and '2015' are both the 2015 season.
+        if value is None:
+            return None
+        match = re.match(r'^(\d{4})(-\d{2})?$', str(value))
+        if not match:
+            return None
+        return int(match.group(1))
+
+    @staticmethod
+    def get_game_season_year(game_id):
+        # Game ids look like 0021700807: a 3 digit league and season type prefix, then the last 2 digits of the season.
+        if game_id is None:
+            return None
+        match = re.match(r'^\d{3}(\d{2})\d{5}$', str(game_id))
+        if not match:
+            return None
+        year = int(match.group(1))
+        return 1900 + year if year >= 46 else 2000 + year
+
+    @staticmethod
+    def get_date(value):
+        if not value:
+            return None
+        for date_format in date_formats:
+            try:
+                return datetime.strptime(str(value), date_format).date()
+            except ValueError:
+                continue
+        return None
+
+    @staticmethod
+    def get_game_statuses(nba_response):
+        statuses = []
+        try:
+            data_sets = nba_response.get_data_sets()
+        except (ValueError, KeyError, TypeError):
+            return statuses
+        for data_set in data_sets.values():
+            if 'GAME_STATUS_ID' not in data_set['headers']:
+                continue
+            index = data_set['headers'].index('GAME_STATUS_ID')
+            statuses.extend(row[index] for row in data_set['data'])
+        return statuses
+
+    @staticmethod
+    def get_final_game_ids(nba_response):
+        game_ids = []
+        try:
+            data_sets = nba_response.get_data_sets()
+        except (ValueError, KeyError, TypeError):
+            return game_ids
+        for data_set in data_sets.values():
+            headers = data_set['headers']
+            if 'GAME_ID' not in headers or 'GAME_STATUS_ID' not in headers:
+                continue
+            game_id_index = headers.index('GAME_ID')
+            status_index = headers.index('GAME_STATUS_ID')
+            game_ids.extend(str(row[game_id_index]) for row in data_set['data'] if row[status_index] == game_status_final)
+        return game_ids
+
+    @staticmethod
+    def is_final_play_by_play(nba_response):
+        # The play by play of a game that is over ends with the end of the 4th period or of an overtime, with the
+        # scores apart.
+        try:
+            data_set = nba_response.get_data_sets().get('PlayByPlay')
+        except (ValueError, KeyError, TypeError):
+            return False
+        if not data_set or not data_set['data']:
+            return False
+        headers = data_set['headers']
+        if any(header not in headers for header in ('EVENTMSGTYPE', 'PERIOD', 'SCORE')):
+            return False
+        last_row = data_set['data'][-1]
+        if last_row[headers.index('EVENTMSGTYPE')] != event_msg_type_period_end or last_row[headers.index('PERIOD')] < 4:
+            return False
+        score_index = headers.index('SCORE')
+        for row in reversed(data_set['data']):
+            if row[score_index]:
+                scores = [score.strip() for score in row[score_index].split('-')]
+                return len(scores) == 2 and scores[0] != scores[1]
+        return False
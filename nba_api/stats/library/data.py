@@ -1,4386 +1,20 @@
+import os
+import struct
+import sys
+from array import array
+
+
+# The players and teams are packed in data.bin and only read the first time one of them is used.
+# tools/stats/static_data_generator regenerates the file.
+data_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data.bin')
+data_file_magic = b'NBAD'
+data_file_version = 1
+
 player_index_id = 0
 player_index_last_name = 1
 player_index_first_name = 2
 player_index_full_name = 3
 
-players = [
-    [76001, 'Abdelnaby', 'Alaa', 'Alaa Abdelnaby'],
-    [76002, 'Abdul-Aziz', 'Zaid', 'Zaid Abdul-Aziz'],
-    [76003, 'Abdul-Jabbar', 'Kareem', 'Kareem Abdul-Jabbar'],
-    [51, 'Abdul-Rauf', 'Mahmoud', 'Mahmoud Abdul-Rauf'],
-    [1505, 'Abdul-Wahad', 'Tariq', 'Tariq Abdul-Wahad'],
-    [949, 'Abdur-Rahim', 'Shareef', 'Shareef Abdur-Rahim'],
-    [76005, 'Abernethy', 'Tom', 'Tom Abernethy'],
-    [76006, 'Able', 'Forest', 'Forest Able'],
-    [76007, 'Abramovic', 'John', 'John Abramovic'],
-    [203518, 'Abrines', 'Alex', 'Alex Abrines'],
-    [101165, 'Acker', 'Alex', 'Alex Acker'],
-    [76008, 'Ackerman', 'Donald', 'Donald Ackerman'],
-    [76009, 'Acres', 'Mark', 'Mark Acres'],
-    [76010, 'Acton', 'Charles', 'Charles Acton'],
-    [203112, 'Acy', 'Quincy', 'Quincy Acy'],
-    [76011, 'Adams', 'Alvan', 'Alvan Adams'],
-    [76012, 'Adams', 'Don', 'Don Adams'],
-    [200801, 'Adams', 'Hassan', 'Hassan Adams'],
-    [1629121, 'Adams', 'Jaylen', 'Jaylen Adams'],
-    [203919, 'Adams', 'Jordan', 'Jordan Adams'],
-    [149, 'Adams', 'Michael', 'Michael Adams'],
-    [203500, 'Adams', 'Steven', 'Steven Adams'],
-    [912, 'Addison', 'Rafael', 'Rafael Addison'],
-    [1628389, 'Adebayo', 'Bam', 'Bam Adebayo'],
-    [76015, 'Adelman', 'Rick', 'Rick Adelman'],
-    [202399, 'Adrien', 'Jeff', 'Jeff Adrien'],
-    [201167, 'Afflalo', 'Arron', 'Arron Afflalo'],
-    [200772, 'Ager', 'Maurice', 'Maurice Ager'],
-    [76016, 'Aguirre', 'Mark', 'Mark Aguirre'],
-    [201336, 'Ahearn', 'Blake', 'Blake Ahearn'],
-    [76017, 'Ainge', 'Danny', 'Danny Ainge'],
-    [201582, 'Ajinca', 'Alexis', 'Alexis Ajinca'],
-    [76018, 'Akin', 'Henry', 'Henry Akin'],
-    [203006, 'Akognon', 'Josh', 'Josh Akognon'],
-    [1629152, 'Akoon-Purcell', 'DeVaughn', 'DeVaughn Akoon-Purcell'],
-    [202374, 'Alabi', 'Solomon', 'Solomon Alabi'],
-    [76019, 'Alarie', 'Mark', 'Mark Alarie'],
-    [76020, 'Alcorn', 'Gary', 'Gary Alcorn'],
-    [203128, 'Aldemir', 'Furkan', 'Furkan Aldemir'],
-    [202332, 'Aldrich', 'Cole', 'Cole Aldrich'],
-    [200746, 'Aldridge', 'LaMarcus', 'LaMarcus Aldridge'],
-    [76021, 'Aleksinas', 'Chuck', 'Chuck Aleksinas'],
-    [1626146, 'Alexander', 'Cliff', 'Cliff Alexander'],
-    [724, 'Alexander', 'Cory', 'Cory Alexander'],
-    [2042, 'Alexander', 'Courtney', 'Courtney Alexander'],
-    [76022, 'Alexander', 'Gary', 'Gary Alexander'],
-    [201570, 'Alexander', 'Joe', 'Joe Alexander'],
-    [2349, 'Alexander', 'Victor', 'Victor Alexander'],
-    [76024, 'Alford', 'Steve', 'Steve Alford'],
-    [76028, 'Allen', 'Bob', 'Bob Allen'],
-    [1628960, 'Allen', 'Grayson', 'Grayson Allen'],
-    [1628386, 'Allen', 'Jarrett', 'Jarrett Allen'],
-    [706, 'Allen', 'Jerome', 'Jerome Allen'],
-    [1628443, 'Allen', 'Kadeem', 'Kadeem Allen'],
-    [202730, 'Allen', 'Lavoy', 'Lavoy Allen'],
-    [76027, 'Allen', 'Lucius', 'Lucius Allen'],
-    [2124, 'Allen', 'Malik', 'Malik Allen'],
-    [76025, 'Allen', 'Randy', 'Randy Allen'],
-    [951, 'Allen', 'Ray', 'Ray Allen'],
-    [2754, 'Allen', 'Tony', 'Tony Allen'],
-    [76029, 'Allison', 'Odis', 'Odis Allison'],
-    [200984, 'Allred', 'Lance', 'Lance Allred'],
-    [76030, 'Allums', 'Darrell', 'Darrell Allums'],
-    [201165, 'Almond', 'Morris', 'Morris Almond'],
-    [308, 'Alston', 'Derrick', 'Derrick Alston'],
-    [1747, 'Alston', 'Rafer', 'Rafer Alston'],
-    [1824, 'Aluma', 'Peter', 'Peter Aluma'],
-    [680, 'Amaechi', 'John', 'John Amaechi'],
-    [732, 'Amaya', 'Ashraf', 'Ashraf Amaya'],
-    [202329, 'Aminu', 'Al-Farouq', 'Al-Farouq Aminu'],
-    [200811, 'Amundson', 'Lou', 'Lou Amundson'],
-    [76034, 'Anderegg', 'Bob', 'Bob Anderegg'],
-    [2365, 'Andersen', 'Chris', 'Chris Andersen'],
-    [2431, 'Andersen', 'David', 'David Andersen'],
-    [101187, 'Anderson', 'Alan', 'Alan Anderson'],
-    [202079, 'Anderson', 'Antonio', 'Antonio Anderson'],
-    [76035, 'Anderson', 'Cliff', 'Cliff Anderson'],
-    [76036, 'Anderson', 'Daniel', 'Daniel Anderson'],
-    [1507, 'Anderson', 'Derek', 'Derek Anderson'],
-    [76037, 'Anderson', 'Dwight', 'Dwight Anderson'],
-    [944, 'Anderson', 'Eric', 'Eric Anderson'],
-    [246, 'Anderson', 'Greg', 'Greg Anderson'],
-    [202341, 'Anderson', 'James', 'James Anderson'],
-    [76040, 'Anderson', 'Jerome', 'Jerome Anderson'],
-    [1626147, 'Anderson', 'Justin', 'Justin Anderson'],
-    [72, 'Anderson', 'Kenny', 'Kenny Anderson'],
-    [76041, 'Anderson', 'Kim', 'Kim Anderson'],
-    [203937, 'Anderson', 'Kyle', 'Kyle Anderson'],
-    [76042, 'Anderson', 'Michael', 'Michael Anderson'],
-    [76043, 'Anderson', 'Mitchell', 'Mitchell Anderson'],
-    [98, 'Anderson', 'Nick', 'Nick Anderson'],
-    [76045, 'Anderson', 'Richard', 'Richard Anderson'],
-    [76046, 'Anderson', 'Ron', 'Ron Anderson'],
-    [201583, 'Anderson', 'Ryan', 'Ryan Anderson'],
-    [1000, 'Anderson', 'Shandon', 'Shandon Anderson'],
-    [335, 'Anderson', 'Willie', 'Willie Anderson'],
-    [76048, 'Anderzunas', 'Wally', 'Wally Anderzunas'],
-    [101149, 'Andriuskevicius', 'Martynas', 'Martynas Andriuskevicius'],
-    [76049, 'Anielak', 'Don', 'Don Anielak'],
-    [1628387, 'Anigbogu', 'Ike', 'Ike Anigbogu'],
-    [76050, 'Ansley', 'Michael', 'Michael Ansley'],
-    [1512, 'Anstey', 'Chris', 'Chris Anstey'],
-    [203507, 'Antetokounmpo', 'Giannis', 'Giannis Antetokounmpo'],
-    [1628961, 'Antetokounmpo', 'Kostas', 'Kostas Antetokounmpo'],
-    [203648, 'Antetokounmpo', 'Thanasis', 'Thanasis Antetokounmpo'],
-    [2546, 'Anthony', 'Carmelo', 'Carmelo Anthony'],
-    [21, 'Anthony', 'Greg', 'Greg Anthony'],
-    [201202, 'Anthony', 'Joel', 'Joel Anthony'],
-    [203544, 'Antic', 'Pero', 'Pero Antic'],
-    [1628384, 'Anunoby', 'OG', 'OG Anunoby'],
-    [203951, 'Appling', 'Keith', 'Keith Appling'],
-    [2737, 'Araujo', 'Rafael', 'Rafael Araujo'],
-    [76053, 'Arceneaux', 'Stacey', 'Stacey Arceneaux'],
-    [76054, 'Archibald', 'Nate', 'Nate Archibald'],
-    [2425, 'Archibald', 'Robert', 'Robert Archibald'],
-    [1627853, 'Arcidiacono', 'Ryan', 'Ryan Arcidiacono'],
-    [76055, 'Ard', 'Jim', 'Jim Ard'],
-    [2240, 'Arenas', 'Gilbert', 'Gilbert Arenas'],
-    [2772, 'Ariza', 'Trevor', 'Trevor Ariza'],
-    [76056, 'Arizin', 'Paul', 'Paul Arizin'],
-    [76057, 'Arlauckas', 'Joe', 'Joe Arlauckas'],
-    [769, 'Armstrong', 'B.J.', 'B.J. Armstrong'],
-    [76061, 'Armstrong', 'Bob', 'Bob Armstrong'],
-    [2220, 'Armstrong', 'Brandon', 'Brandon Armstrong'],
-    [353, 'Armstrong', 'Darrell', 'Darrell Armstrong'],
-    [200756, 'Armstrong', 'Hilton', 'Hilton Armstrong'],
-    [76060, 'Armstrong', 'Paul', 'Paul Armstrong'],
-    [76059, 'Armstrong', 'Tate', 'Tate Armstrong'],
-    [76062, 'Arnelle', 'Jesse', 'Jesse Arnelle'],
-    [76063, 'Arnette', 'Jay', 'Jay Arnette'],
-    [76064, 'Arnzen', 'Bob', 'Bob Arnzen'],
-    [2306, 'Arroyo', 'Carlos', 'Carlos Arroyo'],
-    [201589, 'Arthur', 'Darrell', 'Darrell Arthur'],
-    [76065, 'Arthurs', 'John', 'John Arthurs'],
-    [1628503, 'Artis', 'Jamel', 'Jamel Artis'],
-    [201600, 'Asik', 'Omer', 'Omer Asik'],
-    [355, 'Askew', 'Vincent', 'Vincent Askew'],
-    [173, 'Askins', 'Keith', 'Keith Askins'],
-    [76068, 'Asmonga', 'Don', 'Don Asmonga'],
-    [76069, 'Atha', 'Richard', 'Richard Atha'],
-    [1088, 'Atkins', 'Chucky', 'Chucky Atkins'],
-    [76070, 'Attles', 'Alvin', 'Alvin Attles'],
-    [76071, 'Aubuchon', 'Chet', 'Chet Aubuchon'],
-    [278, 'Augmon', 'Stacey', 'Stacey Augmon'],
-    [201571, 'Augustin', 'D.J.', 'D.J. Augustin'],
-    [200788, 'Augustine', 'James', 'James Augustine'],
-    [1134, 'Austin', 'Ike', 'Ike Austin'],
-    [76073, 'Austin', 'John', 'John Austin'],
-    [76074, 'Austin', 'Ken', 'Ken Austin'],
-    [138, 'Avent', 'Anthony', 'Anthony Avent'],
-    [76076, 'Averitt', 'William', 'William Averitt'],
-    [1895, 'Avery', 'William', 'William Avery'],
-    [76078, 'Awtrey', 'Dennis', 'Dennis Awtrey'],
-    [202970, 'Ayon', 'Gustavo', 'Gustavo Ayon'],
-    [201965, 'Ayres', 'Jeff', 'Jeff Ayres'],
-    [1629028, 'Ayton', 'Deandre', 'Deandre Ayton'],
-    [101235, 'Azubuike', 'Kelenna', 'Kelenna Azubuike'],
-    [203569, 'Babb', 'Chris', 'Chris Babb'],
-    [202337, 'Babbitt', 'Luke', 'Luke Babbitt'],
-    [76079, 'Babic', 'Milos', 'Milos Babic'],
-    [76080, 'Bach', 'Johnny', 'Johnny Bach'],
-    [1628407, 'Bacon', 'Dwayne', 'Dwayne Bacon'],
-    [76081, 'Baechtold', 'Jim', 'Jim Baechtold'],
-    [2053, 'Bagaric', 'Dalibor', 'Dalibor Bagaric'],
-    [76082, 'Bagley', 'John', 'John Bagley'],
-    [1628963, 'Bagley III', 'Marvin', 'Marvin Bagley III'],
-    [76084, 'Bailey', 'Carl', 'Carl Bailey'],
-    [76083, 'Bailey', 'Gus', 'Gus Bailey'],
-    [76085, 'Bailey', 'James', 'James Bailey'],
-    [1847, 'Bailey', 'Thurl', 'Thurl Bailey'],
-    [1753, 'Bailey', 'Toby', 'Toby Bailey'],
-    [203946, 'Bairstow', 'Cameron', 'Cameron Bairstow'],
-    [1858, 'Baker', 'Mark', 'Mark Baker'],
-    [2486, 'Baker', 'Maurice', 'Maurice Baker'],
-    [76089, 'Baker', 'Norm', 'Norm Baker'],
-    [1627758, 'Baker', 'Ron', 'Ron Baker'],
-    [452, 'Baker', 'Vin', 'Vin Baker'],
-    [1627735, 'Baldwin IV', 'Wade', 'Wade Baldwin IV'],
-    [200764, 'Balkman', 'Renaldo', 'Renaldo Balkman'],
-    [76090, 'Ball', 'Cedric', 'Cedric Ball'],
-    [1628366, 'Ball', 'Lonzo', 'Lonzo Ball'],
-    [76091, 'Ballard', 'Greg', 'Greg Ballard'],
-    [76092, 'Baltimore', 'Herschel', 'Herschel Baltimore'],
-    [1628964, 'Bamba', 'Mohamed', 'Mohamed Bamba'],
-    [76093, 'Banks', 'Gene', 'Gene Banks'],
-    [2556, 'Banks', 'Marcus', 'Marcus Banks'],
-    [76094, 'Bannister', 'Ken', 'Ken Bannister'],
-    [76095, 'Bantom', 'Mike', 'Mike Bantom'],
-    [76096, 'Barber', 'John', 'John Barber'],
-    [2571, 'Barbosa', 'Leandro', 'Leandro Barbosa'],
-    [76097, 'Bardo', 'Stephen', 'Stephen Bardo'],
-    [200826, 'Barea', 'J.J.', 'J.J. Barea'],
-    [200745, 'Bargnani', 'Andrea', 'Andrea Bargnani'],
-    [76098, 'Barker', 'Cliff', 'Cliff Barker'],
-    [76099, 'Barker', 'Tom', 'Tom Barker'],
-    [787, 'Barkley', 'Charles', 'Charles Barkley'],
-    [2057, 'Barkley', 'Erick', 'Erick Barkley'],
-    [76102, 'Barksdale', 'Don', 'Don Barksdale'],
-    [203084, 'Barnes', 'Harrison', 'Harrison Barnes'],
-    [76103, 'Barnes', 'Harry', 'Harry Barnes'],
-    [76105, 'Barnes', 'Jim', 'Jim Barnes'],
-    [76104, 'Barnes', 'Marvin', 'Marvin Barnes'],
-    [2440, 'Barnes', 'Matt', 'Matt Barnes'],
-    [76107, 'Barnett', 'Dick', 'Dick Barnett'],
-    [76106, 'Barnett', 'Jim', 'Jim Barnett'],
-    [76108, 'Barnhill', 'John', 'John Barnhill'],
-    [76109, 'Barnhill', 'Norton', 'Norton Barnhill'],
-    [76110, 'Barnhorst', 'Leo', 'Leo Barnhorst'],
-    [76111, 'Barr', 'John', 'John Barr'],
-    [76112, 'Barr', 'Mike', 'Mike Barr'],
-    [76113, 'Barr', 'Thomas', 'Thomas Barr'],
-    [2857, 'Barrett', 'Andre', 'Andre Barrett'],
-    [76114, 'Barrett', 'Ernie', 'Ernie Barrett'],
-    [2853, 'Barron', 'Earl', 'Earl Barron'],
-    [344, 'Barros', 'Dana', 'Dana Barros'],
-    [699, 'Barry', 'Brent', 'Brent Barry'],
-    [1003, 'Barry', 'Drew', 'Drew Barry'],
-    [468, 'Barry', 'Jon', 'Jon Barry'],
-    [600013, 'Barry', 'Rick', 'Rick Barry'],
-    [76117, 'Bartels', 'Ed', 'Ed Bartels'],
-    [76118, 'Bartolome', 'Vic', 'Vic Bartolome'],
-    [203115, 'Barton', 'Will', 'Will Barton'],
-    [101188, 'Basden', 'Eddie', 'Eddie Basden'],
-    [76119, 'Baskerville', 'Jerry', 'Jerry Baskerville'],
-    [101138, 'Bass', 'Brandon', 'Brandon Bass'],
-    [76120, 'Bassett', 'Tim', 'Tim Bassett'],
-    [1766, 'Baston', 'Maceo', 'Maceo Baston'],
-    [2370, 'Bateer', 'Mengke', 'Mengke Bateer'],
-    [76121, 'Bates', 'Billyray', 'Billyray Bates'],
-    [1628966, 'Bates-Diop', 'Keita', 'Keita Bates-Diop'],
-    [101212, 'Batista', 'Esteban', 'Esteban Batista'],
-    [2471, 'Batiste', 'Mike', 'Mike Batiste'],
-    [1499, 'Battie', 'Tony', 'Tony Battie'],
-    [2203, 'Battier', 'Shane', 'Shane Battier'],
-    [174, 'Battle', 'John', 'John Battle'],
-    [76123, 'Battle', 'Kenny', 'Kenny Battle'],
-    [76124, 'Batton', 'Dave', 'Dave Batton'],
-    [201587, 'Batum', 'Nicolas', 'Nicolas Batum'],
-    [76125, 'Baum', 'Johnny', 'Johnny Baum'],
-    [76126, 'Baumholtz', 'Frankie', 'Frankie Baumholtz'],
-    [2437, 'Baxter', 'Lonny', 'Lonny Baxter'],
-    [201573, 'Bayless', 'Jerryd', 'Jerryd Bayless'],
-    [76127, 'Baylor', 'Elgin', 'Elgin Baylor'],
-    [203382, 'Baynes', 'Aron', 'Aron Baynes'],
-    [76128, 'Bazarevich', 'Sergei', 'Sergei Bazarevich'],
-    [203145, 'Bazemore', 'Kent', 'Kent Bazemore'],
-    [76129, 'Beach', 'Ed', 'Ed Beach'],
-    [203078, 'Beal', 'Bradley', 'Bradley Beal'],
-    [76130, 'Beard', 'Butch', 'Butch Beard'],
-    [76131, 'Beard', 'Ralph', 'Ralph Beard'],
-    [2602, 'Beasley', 'Jerome', 'Jerome Beasley'],
-    [1627736, 'Beasley', 'Malik', 'Malik Beasley'],
-    [201563, 'Beasley', 'Michael', 'Michael Beasley'],
-    [76133, 'Beaty', 'Zelmo', 'Zelmo Beaty'],
-    [201958, 'Beaubois', 'Rodrigue', 'Rodrigue Beaubois'],
-    [76134, 'Beck', 'Byron', 'Byron Beck'],
-    [1133, 'Beck', 'Corey', 'Corey Beck'],
-    [76136, 'Beck', 'Ernie', 'Ernie Beck'],
-    [76137, 'Becker', 'Moe', 'Moe Becker'],
-    [76138, 'Bedford', 'William', 'William Bedford'],
-    [76139, 'Beenders', 'Hank', 'Hank Beenders'],
-    [76140, 'Behagen', 'Ron', 'Ron Behagen'],
-    [76141, 'Behnke', 'Elmer', 'Elmer Behnke'],
-    [201158, 'Belinelli', 'Marco', 'Marco Belinelli'],
-    [2294, 'Bell', 'Charlie', 'Charlie Bell'],
-    [76142, 'Bell', 'Dennis', 'Dennis Bell'],
-    [1628395, 'Bell', 'Jordan', 'Jordan Bell'],
-    [1952, 'Bell', 'Raja', 'Raja Bell'],
-    [2559, 'Bell', 'Troy', 'Troy Bell'],
-    [76143, 'Bell', 'William', 'William Bell'],
-    [76144, 'Bellamy', 'Walt', 'Walt Bellamy'],
-    [1627761, 'Bembry', "DeAndre'", "DeAndre' Bembry"],
-    [76145, 'Bemoras', 'Irv', 'Irv Bemoras'],
-    [76146, 'Benbow', 'Leon', 'Leon Benbow'],
-    [1627733, 'Bender', 'Dragan', 'Dragan Bender'],
-    [1886, 'Bender', 'Jonathan', 'Jonathan Bender'],
-    [203968, 'Benimon', 'Jerrelle', 'Jerrelle Benimon'],
-    [104, 'Benjamin', 'Benoit', 'Benoit Benjamin'],
-    [1736, 'Benjamin', 'Corey', 'Corey Benjamin'],
-    [203461, 'Bennett', 'Anthony', 'Anthony Bennett'],
-    [1120, 'Bennett', 'Elmer', 'Elmer Bennett'],
-    [712, 'Bennett', 'Mario', 'Mario Bennett'],
-    [76151, 'Bennett', 'Mel', 'Mel Bennett'],
-    [76148, 'Bennett', 'Tony', 'Tony Bennett'],
-    [76152, 'Bennett', 'Winston', 'Winston Bennett'],
-    [128, 'Benoit', 'David', 'David Benoit'],
-    [202728, 'Benson', 'Keith', 'Keith Benson'],
-    [76154, 'Benson', 'Kent', 'Kent Benson'],
-    [1627791, 'Bentil', 'Ben', 'Ben Bentil'],
-    [76155, 'Berce', 'Gene', 'Gene Berce'],
-    [76156, 'Bergen', 'Gary', 'Gary Bergen'],
-    [76157, 'Berry', 'Ricky', 'Ricky Berry'],
-    [76158, 'Berry', 'Walter', 'Walter Berry'],
-    [1629137, 'Berry II', 'Joel', 'Joel Berry II'],
-    [202722, 'Bertans', 'Davis', 'Davis Bertans'],
-    [76159, 'Beshore', 'Del', 'Del Beshore'],
-    [696, 'Best', 'Travis', 'Travis Best'],
-    [201976, 'Beverley', 'Patrick', 'Patrick Beverley'],
-    [204021, 'Bhullar', 'Sim', 'Sim Bhullar'],
-    [76160, 'Bianchi', 'Al', 'Al Bianchi'],
-    [76161, 'Biasatti', 'Hank', 'Hank Biasatti'],
-    [76162, 'Bibby', 'Henry', 'Henry Bibby'],
-    [1710, 'Bibby', 'Mike', 'Mike Bibby'],
-    [76163, 'Biedenbach', 'Ed', 'Ed Biedenbach'],
-    [2740, 'Biedrins', 'Andris', 'Andris Biedrins'],
-    [76164, 'Bielke', 'Don', 'Don Bielke'],
-    [76165, 'Bigelow', 'Bob', 'Bob Bigelow'],
-    [1497, 'Billups', 'Chauncey', 'Chauncey Billups'],
-    [76166, 'Bing', 'Dave', 'Dave Bing'],
-    [76167, 'Binion', 'Joe', 'Joe Binion'],
-    [203920, 'Birch', 'Khem', 'Khem Birch'],
-    [1628444, 'Bird', 'Jabari', 'Jabari Bird'],
-    [76168, 'Bird', 'Jerry', 'Jerry Bird'],
-    [1449, 'Bird', 'Larry', 'Larry Bird'],
-    [76170, 'Birdsong', 'Otis', 'Otis Birdsong'],
-    [76171, 'Bishop', 'Gale', 'Gale Bishop'],
-    [202687, 'Biyombo', 'Bismack', 'Bismack Biyombo'],
-    [202357, 'Bjelica', 'Nemanja', 'Nemanja Bjelica'],
-    [76172, 'Blab', 'Uwe', 'Uwe Blab'],
-    [76173, 'Black', 'Charlie', 'Charlie Black'],
-    [76174, 'Black', 'Norman', 'Norman Black'],
-    [204028, 'Black', 'Tarik', 'Tarik Black'],
-    [76175, 'Black', 'Tom', 'Tom Black'],
-    [76176, 'Blackman', 'Rolando', 'Rolando Blackman'],
-    [76180, 'Blackwell', 'Alex', 'Alex Blackwell'],
-    [76177, 'Blackwell', 'Cory', 'Cory Blackwell'],
-    [1806, 'Blackwell', 'James', 'James Blackwell'],
-    [76179, 'Blackwell', 'Nate', 'Nate Blackwell'],
-    [201971, 'Blair', 'DeJuan', 'DeJuan Blair'],
-    [2581, 'Blake', 'Steve', 'Steve Blake'],
-    [202392, 'Blakely', 'Marqus', 'Marqus Blakely'],
-    [1628469, 'Blakeney', 'Antonio', 'Antonio Blakeney'],
-    [200807, 'Blalock', 'Will', 'Will Blalock'],
-    [76182, 'Blaney', 'George', 'George Blaney'],
-    [76183, 'Blanks', 'Lance', 'Lance Blanks'],
-    [76184, 'Blanton', 'Ricky', 'Ricky Blanton'],
-    [101154, 'Blatche', 'Andray', 'Andray Blatche'],
-    [302, 'Blaylock', 'Mookie', 'Mookie Blaylock'],
-    [202339, 'Bledsoe', 'Eric', 'Eric Bledsoe'],
-    [76186, 'Blevins', 'Leon', 'Leon Blevins'],
-    [76187, 'Block', 'John', 'John Block'],
-    [76188, 'Bloom', 'Mike', 'Mike Bloom'],
-    [916, 'Blount', 'Corie', 'Corie Blount'],
-    [1548, 'Blount', 'Mark', 'Mark Blount'],
-    [203505, 'Blue', 'Vander', 'Vander Blue'],
-    [1629129, 'Bluiett', 'Trevon', 'Trevon Bluiett'],
-    [76189, 'Blume', 'Ray', 'Ray Blume'],
-    [76190, 'Bobb', 'Nelson', 'Nelson Bobb'],
-    [2800, 'Bobbitt', 'Tony', 'Tony Bobbitt'],
-    [76191, 'Bockhorn', 'Arlen', 'Arlen Bockhorn'],
-    [76192, 'Boerwinkle', 'Tom', 'Tom Boerwinkle'],
-    [2586, 'Bogans', 'Keith', 'Keith Bogans'],
-    [203992, 'Bogdanovic', 'Bogdan', 'Bogdan Bogdanovic'],
-    [202711, 'Bogdanovic', 'Bojan', 'Bojan Bogdanovic'],
-    [177, 'Bogues', 'Muggsy', 'Muggsy Bogues'],
-    [101106, 'Bogut', 'Andrew', 'Andrew Bogut'],
-    [1564, 'Bohannon', 'Etdrick', 'Etdrick Bohannon'],
-    [76195, 'Bol', 'Manute', 'Manute Bol'],
-    [1628413, 'Bolden', 'Jonah', 'Jonah Bolden'],
-    [76196, 'Bolger', 'Bill', 'Bill Bolger'],
-    [1627762, 'Bolomboy', 'Joel', 'Joel Bolomboy'],
-    [76197, 'Bolstorff', 'Doug', 'Doug Bolstorff'],
-    [76203, 'Bon Salle', 'George H.', 'George H. Bon Salle'],
-    [76198, 'Bond', 'Phil', 'Phil Bond'],
-    [1603, 'Bond', 'Walter', 'Walter Bond'],
-    [1121, 'Boney', 'Dexter', 'Dexter Boney'],
-    [1629067, 'Bonga', 'Isaac', 'Isaac Bonga'],
-    [76201, 'Bonham', 'Ron', 'Ron Bonham'],
-    [41, 'Bonner', 'Anthony', 'Anthony Bonner'],
-    [2588, 'Bonner', 'Matt', 'Matt Bonner'],
-    [1626164, 'Booker', 'Devin', 'Devin Booker'],
-    [511, 'Booker', 'Melvin', 'Melvin Booker'],
-    [202344, 'Booker', 'Trevor', 'Trevor Booker'],
-    [200767, 'Boone', 'Josh', 'Josh Boone'],
-    [76204, 'Boone', 'Ron', 'Ron Boone'],
-    [1916, 'Booth', 'Calvin', 'Calvin Booth'],
-    [1522, 'Booth', 'Keith', 'Keith Booth'],
-    [76206, 'Boozer', 'Bob', 'Bob Boozer'],
-    [2430, 'Boozer', 'Carlos', 'Carlos Boozer'],
-    [2414, 'Borchardt', 'Curtis', 'Curtis Borchardt'],
-    [76207, 'Bornheimer', 'Jake', 'Jake Bornheimer'],
-    [1953, 'Borrell', 'Lazaro', 'Lazaro Borrell'],
-    [76209, 'Borsavage', 'Costic', 'Costic Borsavage'],
-    [76210, 'Boryla', 'Vince', 'Vince Boryla'],
-    [2547, 'Bosh', 'Chris', 'Chris Bosh'],
-    [76211, 'Bostic', 'Jim', 'Jim Bostic'],
-    [76212, 'Boston', 'Lawrence', 'Lawrence Boston'],
-    [76213, 'Boswell', 'Tom', 'Tom Boswell'],
-    [1628449, 'Boucher', 'Chris', 'Chris Boucher'],
-    [2257, 'Boumtje-Boumtje', 'Ruben', 'Ruben Boumtje-Boumtje'],
-    [76214, 'Boven', 'Don', 'Don Boven'],
-    [1898, 'Bowdler', 'Cal', 'Cal Bowdler'],
-    [1477, 'Bowen', 'Bruce', 'Bruce Bowen'],
-    [1763, 'Bowen', 'Ryan', 'Ryan Bowen'],
-    [194, 'Bowie', 'Anthony', 'Anthony Bowie'],
-    [76217, 'Bowie', 'Sam', 'Sam Bowie'],
-    [1085, 'Bowman', 'Ira', 'Ira Bowman'],
-    [76219, 'Bowman', 'Nate', 'Nate Bowman'],
-    [671, 'Boyce', 'Donnie', 'Donnie Boyce'],
-    [76221, 'Boyd', 'Dennis', 'Dennis Boyd'],
-    [76222, 'Boyd', 'Fred', 'Fred Boyd'],
-    [76223, 'Boyd', 'Ken', 'Ken Boyd'],
-    [1863, 'Boykins', 'Earl', 'Earl Boykins'],
-    [76224, 'Boykoff', 'Harry', 'Harry Boykoff'],
-    [76225, 'Boynes', 'Winford', 'Winford Boynes'],
-    [200841, 'Bozeman', 'Cedric', 'Cedric Bozeman'],
-    [76226, 'Bracey', 'Steve', 'Steve Bracey'],
-    [202342, 'Brackins', 'Craig', 'Craig Brackins'],
-    [76227, 'Bradds', 'Gary', 'Gary Bradds'],
-    [76228, 'Bradley', 'Alex', 'Alex Bradley'],
-    [76229, 'Bradley', 'Alonzo', 'Alonzo Bradley'],
-    [202340, 'Bradley', 'Avery', 'Avery Bradley'],
-    [76233, 'Bradley', 'Bill', 'Bill Bradley'],
-    [76230, 'Bradley', 'Charles', 'Charles Bradley'],
-    [76231, 'Bradley', 'Dudley', 'Dudley Bradley'],
-    [76232, 'Bradley', 'Joe', 'Joe Bradley'],
-    [2214, 'Bradley', 'Michael', 'Michael Bradley'],
-    [762, 'Bradley', 'Shawn', 'Shawn Bradley'],
-    [1628396, 'Bradley', 'Tony', 'Tony Bradley'],
-    [1361, 'Bradtke', 'Mark', 'Mark Bradtke'],
-    [66, 'Bragg', 'Marques', 'Marques Bragg'],
-    [1765, 'Braggs', 'Torraye', 'Torraye Braggs'],
-    [1920, 'Bramlett', 'A.J.', 'A.J. Bramlett'],
-    [76237, 'Branch', 'Adrian', 'Adrian Branch'],
-    [1882, 'Brand', 'Elton', 'Elton Brand'],
-    [210, 'Brandon', 'Terrell', 'Terrell Brandon'],
-    [76238, 'Brannum', 'Bob', 'Bob Brannum'],
-    [76239, 'Branson', 'Brad', 'Brad Branson'],
-    [76240, 'Branson', 'Jesse', 'Jesse Branson'],
-    [76241, 'Brasco', 'Jim', 'Jim Brasco'],
-    [76242, 'Bratz', 'Mike', 'Mike Bratz'],
-    [76243, 'Braun', 'Carl', 'Carl Braun'],
-    [160, 'Breaux', 'Tim', 'Tim Breaux'],
-    [2452, 'Bremer', 'J.R.', 'J.R. Bremer'],
-    [76245, 'Brennan', 'Pete', 'Pete Brennan'],
-    [76246, 'Brennan', 'Tom', 'Tom Brennan'],
-    [76247, 'Breuer', 'Randy', 'Randy Breuer'],
-    [201147, 'Brewer', 'Corey', 'Corey Brewer'],
-    [2249, 'Brewer', 'Jamison', 'Jamison Brewer'],
-    [76248, 'Brewer', 'Jim', 'Jim Brewer'],
-    [76249, 'Brewer', 'Ron', 'Ron Brewer'],
-    [200758, 'Brewer', 'Ronnie', 'Ronnie Brewer'],
-    [2056, 'Brezec', 'Primoz', 'Primoz Brezec'],
-    [76250, 'Brian', 'Frank', 'Frank Brian'],
-    [783, 'Brickowski', 'Frank', 'Frank Brickowski'],
-    [76252, 'Bridgeman', 'Junior', 'Junior Bridgeman'],
-    [76253, 'Bridges', 'Bill', 'Bill Bridges'],
-    [1628969, 'Bridges', 'Mikal', 'Mikal Bridges'],
-    [1628970, 'Bridges', 'Miles', 'Miles Bridges'],
-    [76254, 'Brightman', 'Al', 'Al Brightman'],
-    [76255, 'Brindley', 'Audley', 'Audley Brindley'],
-    [1628515, 'Briscoe', 'Isaiah', 'Isaiah Briscoe'],
-    [76256, 'Brisker', 'John', 'John Brisker'],
-    [76257, 'Bristow', 'Allan', 'Allan Bristow'],
-    [76258, 'Britt', 'Tyrone', 'Tyrone Britt'],
-    [76259, 'Britt', 'Wayman', 'Wayman Britt'],
-    [76260, 'Brittain', 'Mike', 'Mike Brittain'],
-    [76261, 'Britton', 'David', 'David Britton'],
-    [201972, 'Brockman', 'Jon', 'Jon Brockman'],
-    [1629151, 'Broekhoff', 'Ryan', 'Ryan Broekhoff'],
-    [76262, 'Brogan', 'Jim', 'Jim Brogan'],
-    [1627763, 'Brogdon', 'Malcolm', 'Malcolm Brogdon'],
-    [76263, 'Brokaw', 'Gary', 'Gary Brokaw'],
-    [76264, 'Brookfield', 'Price', 'Price Brookfield'],
-    [201166, 'Brooks', 'Aaron', 'Aaron Brooks'],
-    [1628415, 'Brooks', 'Dillon', 'Dillon Brooks'],
-    [76265, 'Brooks', 'Kevin', 'Kevin Brooks'],
-    [202705, 'Brooks', 'MarShon', 'MarShon Brooks'],
-    [76266, 'Brooks', 'Michael', 'Michael Brooks'],
-    [418, 'Brooks', 'Scott', 'Scott Brooks'],
-    [2810, 'Brown', 'Andre', 'Andre Brown'],
-    [1626148, 'Brown', 'Anthony', 'Anthony Brown'],
-    [76284, 'Brown', 'Bob', 'Bob Brown'],
-    [201628, 'Brown', 'Bobby', 'Bobby Brown'],
-    [1628971, 'Brown', 'Bruce', 'Bruce Brown'],
-    [359, 'Brown', 'Chucky', 'Chucky Brown'],
-    [2245, 'Brown', 'Damone', 'Damone Brown'],
-    [76270, 'Brown', 'Darrell', 'Darrell Brown'],
-    [244, 'Brown', 'Dee', 'Dee Brown'],
-    [200793, 'Brown', 'Dee', 'Dee Brown'],
-    [201974, 'Brown', 'Derrick', 'Derrick Brown'],
-    [2484, 'Brown', 'Devin', 'Devin Brown'],
-    [2081, 'Brown', 'Ernest', 'Ernest Brown'],
-    [76272, 'Brown', 'Fred', 'Fred Brown'],
-    [76273, 'Brown', 'George', 'George Brown'],
-    [1871, 'Brown', 'Gerald', 'Gerald Brown'],
-    [76275, 'Brown', 'Harold', 'Harold Brown'],
-    [203913, 'Brown', 'Jabari', 'Jabari Brown'],
-    [1627759, 'Brown', 'Jaylen', 'Jaylen Brown'],
-    [76276, 'Brown', 'John', 'John Brown'],
-    [2208, 'Brown', 'Kedrick', 'Kedrick Brown'],
-    [2198, 'Brown', 'Kwame', 'Kwame Brown'],
-    [76278, 'Brown', 'Leon', 'Leon Brown'],
-    [76279, 'Brown', 'Lewis', 'Lewis Brown'],
-    [203485, 'Brown', 'Lorenzo', 'Lorenzo Brown'],
-    [992, 'Brown', 'Marcus', 'Marcus Brown'],
-    [203900, 'Brown', 'Markel', 'Markel Brown'],
-    [1479, 'Brown', 'Mike', 'Mike Brown'],
-    [76277, 'Brown', 'Myron', 'Myron Brown'],
-    [136, 'Brown', 'P.J.', 'P.J. Brown'],
-    [753, 'Brown', 'Randy', 'Randy Brown'],
-    [76282, 'Brown', 'Raymond', 'Raymond Brown'],
-    [76283, 'Brown', 'Rickey', 'Rickey Brown'],
-    [76286, 'Brown', 'Roger', 'Roger Brown'],
-    [200769, 'Brown', 'Shannon', 'Shannon Brown'],
-    [76285, 'Brown', 'Stan', 'Stan Brown'],
-    [1628425, 'Brown', 'Sterling', 'Sterling Brown'],
-    [2357, 'Brown', 'Tierre', 'Tierre Brown'],
-    [76268, 'Brown', 'Tony', 'Tony Brown'],
-    [1628972, 'Brown Jr.', 'Troy', 'Troy Brown Jr.'],
-    [76287, 'Browne', 'Jim', 'Jim Browne'],
-    [76288, 'Brundy', 'Stanley', 'Stanley Brundy'],
-    [1628973, 'Brunson', 'Jalen', 'Jalen Brunson'],
-    [1594, 'Brunson', 'Rick', 'Rick Brunson'],
-    [1627852, 'Brussino', 'Nicolas', 'Nicolas Brussino'],
-    [76289, 'Bryant', 'Emmette', 'Emmette Bryant'],
-    [76290, 'Bryant', 'Joe', 'Joe Bryant'],
-    [977, 'Bryant', 'Kobe', 'Kobe Bryant'],
-    [95, 'Bryant', 'Mark', 'Mark Bryant'],
-    [1628418, 'Bryant', 'Thomas', 'Thomas Bryant'],
-    [76291, 'Bryant', 'Wallace', 'Wallace Bryant'],
-    [76292, 'Bryn', 'Torgeir', 'Torgeir Bryn'],
-    [76293, 'Buckhalter', 'Joe', 'Joe Buckhalter'],
-    [76294, 'Bucknall', 'Steve', 'Steve Bucknall'],
-    [76295, 'Buckner', 'Cleveland', 'Cleveland Buckner'],
-    [1761, 'Buckner', 'Greg', 'Greg Buckner'],
-    [76296, 'Buckner', 'Quinn', 'Quinn Buckner'],
-    [76297, 'Budd', 'Dave', 'Dave Budd'],
-    [201978, 'Budinger', 'Chase', 'Chase Budinger'],
-    [76298, 'Budko', 'Walter', 'Walter Budko'],
-    [146, 'Buechler', 'Jud', 'Jud Buechler'],
-    [1934, 'Buford', 'Rodney', 'Rodney Buford'],
-    [672, 'Bullard', 'Matt', 'Matt Bullard'],
-    [203493, 'Bullock', 'Reggie', 'Reggie Bullock'],
-    [76300, 'Bunch', 'Greg', 'Greg Bunch'],
-    [76301, 'Bunt', 'Dick', 'Dick Bunt'],
-    [76302, 'Buntin', 'Bill', 'Bill Buntin'],
-    [76303, 'Burden', 'Luther', 'Luther Burden'],
-    [2469, 'Burke', 'Pat', 'Pat Burke'],
-    [203504, 'Burke', 'Trey', 'Trey Burke'],
-    [76304, 'Burkman', 'Roger', 'Roger Burkman'],
-    [202692, 'Burks', 'Alec', 'Alec Burks'],
-    [2766, 'Burks', 'Antonio', 'Antonio Burks'],
-    [101207, 'Burleson', 'Kevin', 'Kevin Burleson'],
-    [76305, 'Burleson', 'Tom', 'Tom Burleson'],
-    [76306, 'Burmaster', 'Jack', 'Jack Burmaster'],
-    [76307, 'Burns', 'David', 'David Burns'],
-    [76308, 'Burns', 'Evers', 'Evers Burns'],
-    [76309, 'Burns', 'Jim', 'Jim Burns'],
-    [197, 'Burrell', 'Scott', 'Scott Burrell'],
-    [76311, 'Burris', 'Art', 'Art Burris'],
-    [675, 'Burrough', 'Junior', 'Junior Burrough'],
-    [76313, 'Burrow', 'Bob', 'Bob Burrow'],
-    [1629126, 'Burton', 'Deonte', 'Deonte Burton'],
-    [76314, 'Burton', 'Ed', 'Ed Burton'],
-    [416, 'Burton', 'Willie', 'Willie Burton'],
-    [76316, 'Burtt', 'Steve', 'Steve Burtt'],
-    [76317, 'Buse', 'Don', 'Don Buse'],
-    [202221, 'Butch', 'Brian', 'Brian Butch'],
-    [76318, 'Butcher', 'Donnie', 'Donnie Butcher'],
-    [76319, 'Butler', 'Al', 'Al Butler'],
-    [2406, 'Butler', 'Caron', 'Caron Butler'],
-    [202364, 'Butler', "Da'Sean", "Da'Sean Butler"],
-    [76320, 'Butler', 'Greg', 'Greg Butler'],
-    [2866, 'Butler', 'Jackie', 'Jackie Butler'],
-    [202710, 'Butler', 'Jimmy', 'Jimmy Butler'],
-    [348, 'Butler', 'Mitchell', 'Mitchell Butler'],
-    [2446, 'Butler', 'Rasual', 'Rasual Butler'],
-    [202779, 'Buycks', 'Dwight', 'Dwight Buycks'],
-    [201182, 'Byars', 'Derrick', 'Derrick Byars'],
-    [101115, 'Bynum', 'Andrew', 'Andrew Bynum'],
-    [101198, 'Bynum', 'Will', 'Will Bynum'],
-    [76321, 'Byrnes', 'Marty', 'Marty Byrnes'],
-    [76322, 'Byrnes', 'Tommy', 'Tommy Byrnes'],
-    [76323, 'Bytzura', 'Mike', 'Mike Bytzura'],
-    [2560, 'Cabarkapa', 'Zarko', 'Zarko Cabarkapa'],
-    [76324, 'Cable', 'Barney', 'Barney Cable'],
-    [203998, 'Caboclo', 'Bruno', 'Bruno Caboclo'],
-    [679, 'Caffey', 'Jason', 'Jason Caffey'],
-    [262, 'Cage', 'Michael', 'Michael Cage'],
-    [76326, 'Calabrese', 'Gerry', 'Gerry Calabrese'],
-    [201979, 'Calathes', 'Nick', 'Nick Calathes'],
-    [101181, 'Calderon', 'Jose', 'Jose Calderon'],
-    [154, 'Caldwell', 'Adrian', 'Adrian Caldwell'],
-    [76328, 'Caldwell', 'Jim', 'Jim Caldwell'],
-    [76329, 'Caldwell', 'Joe', 'Joe Caldwell'],
-    [203484, 'Caldwell-Pope', 'Kentavious', 'Kentavious Caldwell-Pope'],
-    [76331, 'Calhoun', 'Bill', 'Bill Calhoun'],
-    [76330, 'Calhoun', 'Corky', 'Corky Calhoun'],
-    [76332, 'Calip', 'Demetrius', 'Demetrius Calip'],
-    [76333, 'Callahan', 'Tom', 'Tom Callahan'],
-    [76334, 'Calloway', 'Rick', 'Rick Calloway'],
-    [76335, 'Calverley', 'Ernie', 'Ernie Calverley'],
-    [76336, 'Calvin', 'Mack', 'Mack Calvin'],
-    [76337, 'Cambridge', 'Dexter', 'Dexter Cambridge'],
-    [948, 'Camby', 'Marcus', 'Marcus Camby'],
-    [922, 'Campbell', 'Elden', 'Elden Campbell'],
-    [76338, 'Campbell', 'Tony', 'Tony Campbell'],
-    [203477, 'Canaan', 'Isaiah', 'Isaiah Canaan'],
-    [76339, 'Cannon', 'Larry', 'Larry Cannon'],
-    [203991, 'Capela', 'Clint', 'Clint Capela'],
-    [202382, 'Caracter', 'Derrick', 'Derrick Caracter'],
-    [2073, 'Cardinal', 'Brian', 'Brian Cardinal'],
-    [76340, 'Carl', 'Howie', 'Howie Carl'],
-    [76341, 'Carlisle', 'Chet', 'Chet Carlisle'],
-    [2367, 'Carlisle', 'Geno', 'Geno Carlisle'],
-    [76342, 'Carlisle', 'Rick', 'Rick Carlisle'],
-    [76343, 'Carlson', 'Al', 'Al Carlson'],
-    [76344, 'Carlson', 'Don', 'Don Carlson'],
-    [76345, 'Carney', 'Bob', 'Bob Carney'],
-    [200760, 'Carney', 'Rodney', 'Rodney Carney'],
-    [76346, 'Carpenter', 'Bob', 'Bob Carpenter'],
-    [156, 'Carr', 'Antoine', 'Antoine Carr'],
-    [76348, 'Carr', 'Austin', 'Austin Carr'],
-    [713, 'Carr', 'Chris', 'Chris Carr'],
-    [1757, 'Carr', 'Cory', 'Cory Carr'],
-    [76350, 'Carr', 'Kenny', 'Kenny Carr'],
-    [76351, 'Carr', 'M.L.', 'M.L. Carr'],
-    [76352, 'Carrington', 'Bob', 'Bob Carrington'],
-    [201960, 'Carroll', 'DeMarre', 'DeMarre Carroll'],
-    [76353, 'Carroll', 'Joe Barry', 'Joe Barry Carroll'],
-    [2679, 'Carroll', 'Matt', 'Matt Carroll'],
-    [1131, 'Carruth', 'Jimmy', 'Jimmy Carruth'],
-    [1853, 'Carter', 'Anthony', 'Anthony Carter'],
-    [76355, 'Carter', 'Butch', 'Butch Carter'],
-    [76356, 'Carter', 'Fred', 'Fred Carter'],
-    [76357, 'Carter', 'George', 'George Carter'],
-    [76358, 'Carter', 'Howard', 'Howard Carter'],
-    [76359, 'Carter', 'Jake', 'Jake Carter'],
-    [1628975, 'Carter', 'Jevon', 'Jevon Carter'],
-    [2466, 'Carter', 'Maurice', 'Maurice Carter'],
-    [76360, 'Carter', 'Reggie', 'Reggie Carter'],
-    [76361, 'Carter', 'Ron', 'Ron Carter'],
-    [1713, 'Carter', 'Vince', 'Vince Carter'],
-    [1628976, 'Carter Jr.', 'Wendell', 'Wendell Carter Jr.'],
-    [203487, 'Carter-Williams', 'Michael', 'Michael Carter-Williams'],
-    [76362, 'Cartwright', 'Bill', 'Bill Cartwright'],
-    [76363, 'Carty', 'Jay', 'Jay Carty'],
-    [1627936, 'Caruso', 'Alex', 'Alex Caruso'],
-    [76364, 'Cash', 'Cornelius', 'Cornelius Cash'],
-    [208, 'Cassell', 'Sam', 'Sam Cassell'],
-    [201956, 'Casspi', 'Omri', 'Omri Casspi'],
-    [76365, 'Catchings', 'Harvey', 'Harvey Catchings'],
-    [767, 'Catledge', 'Terry', 'Terry Catledge'],
-    [76367, 'Catlett', 'Sid', 'Sid Catlett'],
-    [1509, 'Cato', 'Kelvin', 'Kelvin Cato'],
-    [76368, 'Cattage', 'Bobby', 'Bobby Cattage'],
-    [1626161, 'Cauley-Stein', 'Willie', 'Willie Cauley-Stein'],
-    [1628505, 'Caupain', 'Troy', 'Troy Caupain'],
-    [190, 'Causwell', 'Duane', 'Duane Causwell'],
-    [1628463, 'Cavanaugh', 'Tyler', 'Tyler Cavanaugh'],
-    [76370, 'Cavenall', 'Ron', 'Ron Cavenall'],
-    [76, 'Ceballos', 'Cedric', 'Cedric Ceballos'],
-    [1911, 'Celestand', 'John', 'John Celestand'],
-    [76373, 'Cervi', 'Al', 'Al Cervi'],
-    [2763, 'Chalmers', 'Lionel', 'Lionel Chalmers'],
-    [201596, 'Chalmers', 'Mario', 'Mario Chalmers'],
-    [76374, 'Chamberlain', 'Bill', 'Bill Chamberlain'],
-    [76375, 'Chamberlain', 'Wilt', 'Wilt Chamberlain'],
-    [76376, 'Chambers', 'Jerry', 'Jerry Chambers'],
-    [1472, 'Chambers', 'Tom', 'Tom Chambers'],
-    [76378, 'Champion', 'Mike', 'Mike Champion'],
-    [2199, 'Chandler', 'Tyson', 'Tyson Chandler'],
-    [201163, 'Chandler', 'Wilson', 'Wilson Chandler'],
-    [76379, 'Chaney', 'Don', 'Don Chaney'],
-    [76380, 'Chaney', 'John', 'John Chaney'],
-    [364, 'Chapman', 'Rex', 'Rex Chapman'],
-    [76382, 'Chappell', 'Len', 'Len Chappell'],
-    [76383, 'Charles', 'Ken', 'Ken Charles'],
-    [76384, 'Charles', 'Lorenzo', 'Lorenzo Charles'],
-    [1629147, 'Chealey', 'Joe', 'Joe Chealey'],
-    [384, 'Cheaney', 'Calbert', 'Calbert Cheaney'],
-    [76385, 'Cheeks', 'Maurice', 'Maurice Cheeks'],
-    [76386, 'Chenier', 'Phil', 'Phil Chenier'],
-    [203805, 'Cherry', 'Will', 'Will Cherry'],
-    [76387, 'Chievous', 'Derrick', 'Derrick Chievous'],
-    [432, 'Chilcutt', 'Pete', 'Pete Chilcutt'],
-    [2735, 'Childress', 'Josh', 'Josh Childress'],
-    [719, 'Childress', 'Randolph', 'Randolph Childress'],
-    [164, 'Childs', 'Chris', 'Chris Childs'],
-    [76391, 'Chollet', 'Leroy', 'Leroy Chollet'],
-    [76392, 'Chones', 'Jim', 'Jim Chones'],
-    [1627737, 'Chriss', 'Marquese', 'Marquese Chriss'],
-    [76393, 'Christ', 'Fred', 'Fred Christ'],
-    [76394, 'Christensen', 'Cal', 'Cal Christensen'],
-    [76395, 'Christian', 'Bob', 'Bob Christian'],
-    [57, 'Christie', 'Doug', 'Doug Christie'],
-    [202091, 'Christmas', 'Dionte', 'Dionte Christmas'],
-    [1626176, 'Christmas', 'Rakeem', 'Rakeem Christmas'],
-    [203902, 'Christon', 'Semaj', 'Semaj Christon'],
-    [203565, 'Christopher', 'Patrick', 'Patrick Christopher'],
-    [928, 'Churchwell', 'Robert', 'Robert Churchwell'],
-    [76397, 'Clark', 'Archie', 'Archie Clark'],
-    [76398, 'Clark', 'Carlos', 'Carlos Clark'],
-    [201947, 'Clark', 'Earl', 'Earl Clark'],
-    [203546, 'Clark', 'Ian', 'Ian Clark'],
-    [1721, 'Clark', 'Keon', 'Keon Clark'],
-    [1626262, 'Clarke', 'Coty', 'Coty Clarke'],
-    [203903, 'Clarkson', 'Jordan', 'Jordan Clarkson'],
-    [1628492, 'Clavell', 'Gian', 'Gian Clavell'],
-    [201964, 'Claver', 'Victor', 'Victor Claver'],
-    [1127, 'Claxton', 'Charles', 'Charles Claxton'],
-    [2049, 'Claxton', 'Speedy', 'Speedy Claxton'],
-    [76402, 'Cleamons', 'Jim', 'Jim Cleamons'],
-    [2043, 'Cleaves', 'Mateen', 'Mateen Cleaves'],
-    [76403, 'Clemens', 'John', 'John Clemens'],
-    [1628499, 'Cleveland', 'Antonius', 'Antonius Cleveland'],
-    [76404, 'Clifton', 'Nat', 'Nat Clifton'],
-    [76406, 'Closs', 'Bill', 'Bill Closs'],
-    [1569, 'Closs', 'Keith', 'Keith Closs'],
-    [76407, 'Cloyd', 'Paul', 'Paul Cloyd'],
-    [76408, 'Cluggish', 'Marion', 'Marion Cluggish'],
-    [76409, 'Clyde', 'Ben', 'Ben Clyde'],
-    [76410, 'Coffey', 'Richard', 'Richard Coffey'],
-    [76411, 'Cofield', 'Fred', 'Fred Cofield'],
-    [715, 'Coker', 'John', 'John Coker'],
-    [202708, 'Cole', 'Norris', 'Norris Cole'],
-    [76412, 'Coleman', 'Ben', 'Ben Coleman'],
-    [934, 'Coleman', 'Derrick', 'Derrick Coleman'],
-    [76413, 'Coleman', 'E.C.', 'E.C. Coleman'],
-    [76414, 'Coleman', 'Jack', 'Jack Coleman'],
-    [76415, 'Coleman', 'Norris', 'Norris Coleman'],
-    [902, 'Coles', 'Bimbo', 'Bimbo Coles'],
-    [2044, 'Collier', 'Jason', 'Jason Collier'],
-    [76416, 'Collins', 'Art', 'Art Collins'],
-    [76418, 'Collins', 'Don', 'Don Collins'],
-    [76421, 'Collins', 'Doug', 'Doug Collins'],
-    [1530, 'Collins', 'James', 'James Collins'],
-    [2260, 'Collins', 'Jarron', 'Jarron Collins'],
-    [2215, 'Collins', 'Jason', 'Jason Collins'],
-    [76419, 'Collins', 'Jimmy', 'Jimmy Collins'],
-    [1628381, 'Collins', 'John', 'John Collins'],
-    [200776, 'Collins', 'Mardy', 'Mardy Collins'],
-    [202395, 'Collins', 'Sherron', 'Sherron Collins'],
-    [1628380, 'Collins', 'Zach', 'Zach Collins'],
-    [1627858, 'Collinsworth', 'Kyle', 'Kyle Collinsworth'],
-    [201954, 'Collison', 'Darren', 'Darren Collison'],
-    [2555, 'Collison', 'Nick', 'Nick Collison'],
-    [76422, 'Colone', 'Joe', 'Joe Colone'],
-    [2173, 'Colson', 'Sean', 'Sean Colson'],
-    [306, 'Colter', 'Steve', 'Steve Colter'],
-    [76425, 'Combs', 'Leroy', 'Leroy Combs'],
-    [76426, 'Comegys', 'Dallas', 'Dallas Comegys'],
-    [76427, 'Comley', 'Larry', 'Larry Comley'],
-    [76428, 'Conley', 'Gene', 'Gene Conley'],
-    [201144, 'Conley', 'Mike', 'Mike Conley'],
-    [76429, 'Conlin', 'Ed', 'Ed Conlin'],
-    [55, 'Conlon', 'Marty', 'Marty Conlon'],
-    [1626192, 'Connaughton', 'Pat', 'Pat Connaughton'],
-    [76431, 'Conner', 'Lester', 'Lester Conner'],
-    [76432, 'Connors', 'Chuck', 'Chuck Connors'],
-    [101215, 'Conroy', 'Will', 'Will Conroy'],
-    [76433, 'Cook', 'Anthony', 'Anthony Cook'],
-    [76434, 'Cook', 'Bert', 'Bert Cook'],
-    [76438, 'Cook', 'Bobby', 'Bobby Cook'],
-    [2567, 'Cook', 'Brian', 'Brian Cook'],
-    [201161, 'Cook', 'Daequan', 'Daequan Cook'],
-    [76435, 'Cook', 'Darwin', 'Darwin Cook'],
-    [76436, 'Cook', 'Jeff', 'Jeff Cook'],
-    [76437, 'Cook', 'Norm', 'Norm Cook'],
-    [2241, 'Cook', 'Omar', 'Omar Cook'],
-    [1626188, 'Cook', 'Quinn', 'Quinn Cook'],
-    [1628429, 'Cooke', 'Charles', 'Charles Cooke'],
-    [76439, 'Cooke', 'David', 'David Cooke'],
-    [76440, 'Cooke', 'Joe', 'Joe Cooke'],
-    [204022, 'Cooley', 'Jack', 'Jack Cooley'],
-    [76442, 'Cooper', 'Chuck', 'Chuck Cooper'],
-    [1030, 'Cooper', 'Duane', 'Duane Cooper'],
-    [76443, 'Cooper', 'Joe', 'Joe Cooper'],
-    [76444, 'Cooper', 'Michael', 'Michael Cooper'],
-    [76441, 'Cooper', 'Wayne', 'Wayne Cooper'],
-    [76446, 'Copa', 'Tom', 'Tom Copa'],
-    [203142, 'Copeland', 'Chris', 'Chris Copeland'],
-    [76447, 'Copeland', 'Hollis', 'Hollis Copeland'],
-    [76448, 'Copeland', 'Lanard', 'Lanard Copeland'],
-    [895, 'Corbin', 'Tyrone', 'Tyrone Corbin'],
-    [76450, 'Corchiani', 'Chris', 'Chris Corchiani'],
-    [76451, 'Corley', 'Ken', 'Ken Corley'],
-    [76452, 'Corley', 'Ray', 'Ray Corley'],
-    [76453, 'Corzine', 'Dave', 'Dave Corzine'],
-    [76454, 'Costello', 'Larry', 'Larry Costello'],
-    [1627856, 'Costello', 'Matt', 'Matt Costello'],
-    [203955, 'Cotton', 'Bryce', 'Bryce Cotton'],
-    [76456, 'Cotton', 'Jack', 'Jack Cotton'],
-    [1526, 'Cotton', 'James', 'James Cotton'],
-    [76457, 'Coughran', 'John', 'John Coughran'],
-    [76458, 'Counts', 'Mel', 'Mel Counts'],
-    [76459, 'Courtin', 'Steve', 'Steve Courtin'],
-    [1432, 'Courtney', 'Joe', 'Joe Courtney'],
-    [202408, 'Cousin', 'Marcus', 'Marcus Cousin'],
-    [202326, 'Cousins', 'DeMarcus', 'DeMarcus Cousins'],
-    [600003, 'Cousy', 'Bob', 'Bob Cousy'],
-    [203496, 'Covington', 'Robert', 'Robert Covington'],
-    [76462, 'Cowens', 'Dave', 'Dave Cowens'],
-    [76463, 'Cox', 'John', 'John Cox'],
-    [76464, 'Cox', 'Johnny', 'Johnny Cox'],
-    [76465, 'Cox', 'Wesley', 'Wesley Cox'],
-    [203459, 'Crabbe', 'Allen', 'Allen Crabbe'],
-    [1628470, 'Craig', 'Torrey', 'Torrey Craig'],
-    [1544, 'Crawford', 'Chris', 'Chris Crawford'],
-    [76466, 'Crawford', 'Freddie', 'Freddie Crawford'],
-    [2037, 'Crawford', 'Jamal', 'Jamal Crawford'],
-    [201621, 'Crawford', 'Joe', 'Joe Crawford'],
-    [202348, 'Crawford', 'Jordan', 'Jordan Crawford'],
-    [1629156, 'Crawford', 'Markel', 'Markel Crawford'],
-    [76468, 'Creighton', 'Jim', 'Jim Creighton'],
-    [76469, 'Crevier', 'Ron', 'Ron Crevier'],
-    [76470, 'Crisler', 'Hal', 'Hal Crisler'],
-    [2343, 'Crispin', 'Joe', 'Joe Crispin'],
-    [76471, 'Criss', 'Charlie', 'Charlie Criss'],
-    [76472, 'Crite', 'Winston', 'Winston Crite'],
-    [201159, 'Crittenton', 'Javaris', 'Javaris Crittenton'],
-    [76473, 'Crocker', 'Dillard', 'Dillard Crocker'],
-    [76474, 'Crompton', 'Jeffrey', 'Jeffrey Crompton'],
-    [76475, 'Crosby', 'Terry', 'Terry Crosby'],
-    [1506, 'Croshere', 'Austin', 'Austin Croshere'],
-    [76476, 'Cross', 'Jeff', 'Jeff Cross'],
-    [76477, 'Cross', 'Pete', 'Pete Cross'],
-    [76478, 'Cross', 'Russell', 'Russell Cross'],
-    [76479, 'Crossin', 'Francis', 'Francis Crossin'],
-    [180, 'Crotty', 'John', 'John Crotty'],
-    [76481, 'Crow', 'Mark', 'Mark Crow'],
-    [76482, 'Crowder', 'Corey', 'Corey Crowder'],
-    [203109, 'Crowder', 'Jae', 'Jae Crowder'],
-    [76483, 'Cummings', 'Pat', 'Pat Cummings'],
-    [187, 'Cummings', 'Terry', 'Terry Cummings'],
-    [1907, 'Cummings', 'Vonteego', 'Vonteego Cummings'],
-    [76487, 'Cunningham', 'Billy', 'Billy Cunningham'],
-    [201967, 'Cunningham', 'Dante', 'Dante Cunningham'],
-    [76485, 'Cunningham', 'Dick', 'Dick Cunningham'],
-    [203099, 'Cunningham', 'Jared', 'Jared Cunningham'],
-    [1061, 'Cunningham', 'William', 'William Cunningham'],
-    [76488, 'Curcic', 'Radisav', 'Radisav Curcic'],
-    [76489, 'Cure', 'Armand', 'Armand Cure'],
-    [940, 'Cureton', 'Earl', 'Earl Cureton'],
-    [223, 'Curley', 'Bill', 'Bill Curley'],
-    [76492, 'Curran', 'Fran', 'Fran Curran'],
-    [209, 'Curry', 'Dell', 'Dell Curry'],
-    [2201, 'Curry', 'Eddy', 'Eddy Curry'],
-    [201191, 'Curry', 'JamesOn', 'JamesOn Curry'],
-    [688, 'Curry', 'Michael', 'Michael Curry'],
-    [203552, 'Curry', 'Seth', 'Seth Curry'],
-    [201939, 'Curry', 'Stephen', 'Stephen Curry'],
-    [687, 'Cvetkovic', 'Rastko', 'Rastko Cvetkovic'],
-    [76505, "D'Antoni", 'Mike', "Mike D'Antoni"],
-    [76496, 'Dahler', 'Ed', 'Ed Dahler'],
-    [76497, 'Dailey', 'Quintin', 'Quintin Dailey'],
-    [2223, 'Dalembert', 'Samuel', 'Samuel Dalembert'],
-    [76498, 'Dallmar', 'Howie', 'Howie Dallmar'],
-    [956, 'Dampier', 'Erick', 'Erick Dampier'],
-    [76499, 'Dampier', 'Lou', 'Lou Dampier'],
-    [76500, 'Dandridge', 'Bob', 'Bob Dandridge'],
-    [1498, 'Daniels', 'Antonio', 'Antonio Daniels'],
-    [2845, 'Daniels', 'Erik', 'Erik Daniels'],
-    [1380, 'Daniels', 'Lloyd', 'Lloyd Daniels'],
-    [2605, 'Daniels', 'Marquis', 'Marquis Daniels'],
-    [76502, 'Daniels', 'Mel', 'Mel Daniels'],
-    [203584, 'Daniels', 'Troy', 'Troy Daniels'],
-    [390, 'Danilovic', 'Sasha', 'Sasha Danilovic'],
-    [76504, 'Dantley', 'Adrian', 'Adrian Dantley'],
-    [76506, 'Darcey', 'Henry', 'Henry Darcey'],
-    [76507, 'Darden', 'Jimmy', 'Jimmy Darden'],
-    [212, 'Dare', 'Yinka', 'Yinka Dare'],
-    [76509, 'Dark', 'Jesse', 'Jesse Dark'],
-    [76511, 'Darrow', 'Jimmy', 'Jimmy Darrow'],
-    [203540, 'Datome', 'Gigi', 'Gigi Datome'],
-    [921, 'Daugherty', 'Brad', 'Brad Daugherty'],
-    [1600, 'David', 'Kornel', 'Kornel David'],
-    [201176, 'Davidson', 'Jermareo', 'Jermareo Davidson'],
-    [76514, 'Davies', 'Bob', 'Bob Davies'],
-    [203561, 'Davies', 'Brandon', 'Brandon Davies'],
-    [203076, 'Davis', 'Anthony', 'Anthony Davis'],
-    [213, 'Davis', 'Antonio', 'Antonio Davis'],
-    [76515, 'Davis', 'Aubrey', 'Aubrey Davis'],
-    [1884, 'Davis', 'Baron', 'Baron Davis'],
-    [989, 'Davis', 'Ben', 'Ben Davis'],
-    [76538, 'Davis', 'Bill', 'Bill Davis'],
-    [76533, 'Davis', 'Bob', 'Bob Davis'],
-    [76516, 'Davis', 'Brad', 'Brad Davis'],
-    [76517, 'Davis', 'Brian', 'Brian Davis'],
-    [76518, 'Davis', 'Charlie', 'Charlie Davis'],
-    [76519, 'Davis', 'Charlie', 'Charlie Davis'],
-    [905, 'Davis', 'Dale', 'Dale Davis'],
-    [1627738, 'Davis', 'Deyonta', 'Deyonta Davis'],
-    [76521, 'Davis', 'Double D', 'Double D Davis'],
-    [202334, 'Davis', 'Ed', 'Ed Davis'],
-    [76522, 'Davis', 'Edward', 'Edward Davis'],
-    [1023, 'Davis', 'Emanual', 'Emanual Davis'],
-    [201175, 'Davis', 'Glen', 'Glen Davis'],
-    [76523, 'Davis', 'Harry', 'Harry Davis'],
-    [93, 'Davis', 'Hubert', 'Hubert Davis'],
-    [76524, 'Davis', 'James', 'James Davis'],
-    [76525, 'Davis', 'Jim', 'Jim Davis'],
-    [76526, 'Davis', 'Johnny', 'Johnny Davis'],
-    [2668, 'Davis', 'Josh', 'Josh Davis'],
-    [707, 'Davis', 'Mark', 'Mark Davis'],
-    [76528, 'Davis', 'Mark', 'Mark Davis'],
-    [76529, 'Davis', 'Mel', 'Mel Davis'],
-    [76530, 'Davis', 'Michael', 'Michael Davis'],
-    [76531, 'Davis', 'Mike', 'Mike Davis'],
-    [76520, 'Davis', 'Monti', 'Monti Davis'],
-    [200781, 'Davis', 'Paul', 'Paul Davis'],
-    [76532, 'Davis', 'Ralph', 'Ralph Davis'],
-    [1729, 'Davis', 'Ricky', 'Ricky Davis'],
-    [76534, 'Davis', 'Ron', 'Ron Davis'],
-    [426, 'Davis', 'Terry', 'Terry Davis'],
-    [76536, 'Davis', 'Walt', 'Walt Davis'],
-    [1453, 'Davis', 'Walter', 'Walter Davis'],
-    [203958, 'Dawkins', 'Andre', 'Andre Dawkins'],
-    [76539, 'Dawkins', 'Darryl', 'Darryl Dawkins'],
-    [1008, 'Dawkins', 'Johnny', 'Johnny Dawkins'],
-    [76541, 'Dawkins', 'Paul', 'Paul Dawkins'],
-    [1626183, 'Dawson', 'Branden', 'Branden Dawson'],
-    [201286, 'Dawson', 'Eric', 'Eric Dawson'],
-    [76542, 'Dawson', 'Tony', 'Tony Dawson'],
-    [103, 'Day', 'Todd', 'Todd Day'],
-    [201948, 'Daye', 'Austin', 'Austin Daye'],
-    [76543, 'Daye', 'Darren', 'Darren Daye'],
-    [201986, 'De Colo', 'Nando', 'Nando De Colo'],
-    [76545, 'DeBusschere', 'Dave', 'Dave DeBusschere'],
-    [692, 'DeClercq', 'Andrew', 'Andrew DeClercq'],
-    [76551, 'DeLong', 'Nate', 'Nate DeLong'],
-    [201942, 'DeRozan', 'DeMar', 'DeMar DeRozan'],
-    [76562, 'DeZonie', 'Hank', 'Hank DeZonie'],
-    [76544, 'Deane', 'Greg', 'Greg Deane'],
-    [203473, 'Dedmon', 'Dewayne', 'Dewayne Dedmon'],
-    [76546, 'Dees', 'Archie', 'Archie Dees'],
-    [143, 'Dehere', 'Terry', 'Terry Dehere'],
-    [76548, 'Dehnert', 'Red', 'Red Dehnert'],
-    [1626214, 'Dejean-Jones', 'Bryce', 'Bryce Dejean-Jones'],
-    [1626155, 'Dekker', 'Sam', 'Sam Dekker'],
-    [219, 'Del Negro', 'Vinny', 'Vinny Del Negro'],
-    [1627098, 'Delaney', 'Malcolm', 'Malcolm Delaney'],
-    [183, 'Dele', 'Bison', 'Bison Dele'],
-    [2568, 'Delfino', 'Carlos', 'Carlos Delfino'],
-    [1629116, 'Delgado', 'Angel', 'Angel Delgado'],
-    [960, 'Delk', 'Tony', 'Tony Delk'],
-    [203521, 'Dellavedova', 'Matthew', 'Matthew Dellavedova'],
-    [76552, 'Dembo', 'Fennis', 'Fennis Dembo'],
-    [76553, 'Demic', 'Larry', 'Larry Demic'],
-    [725, 'Demps', 'Dell', 'Dell Demps'],
-    [76555, 'Dempsey', 'George', 'George Dempsey'],
-    [2736, 'Deng', 'Luol', 'Luol Deng'],
-    [76556, 'Dennard', 'Kenny', 'Kenny Dennard'],
-    [76557, 'Denning', 'Blaine', 'Blaine Denning'],
-    [202458, 'Dentmon', 'Justin', 'Justin Dentmon'],
-    [76558, 'Denton', 'Randy', 'Randy Denton'],
-    [76559, 'Derline', 'Rod', 'Rod Derline'],
-    [76560, 'Deutsch', 'Dave', 'Dave Deutsch'],
-    [76561, 'Devlin', 'Walter', 'Walter Devlin'],
-    [76568, 'DiGregorio', 'Ernie', 'Ernie DiGregorio'],
-    [1628978, 'DiVincenzo', 'Donte', 'Donte DiVincenzo'],
-    [1760, 'Dial', 'Derrick', 'Derrick Dial'],
-    [1627767, 'Diallo', 'Cheick', 'Cheick Diallo'],
-    [1628977, 'Diallo', 'Hamidou', 'Hamidou Diallo'],
-    [2564, 'Diaw', 'Boris', 'Boris Diaw'],
-    [200821, 'Diawara', 'Yakhouba', 'Yakhouba Diawara'],
-    [200799, 'Diaz', 'Guillermo', 'Guillermo Diaz'],
-    [2424, 'Dickau', 'Dan', 'Dan Dickau'],
-    [2079, 'Dickens', 'Kaniel', 'Kaniel Dickens'],
-    [76563, 'Dickerson', 'Henry', 'Henry Dickerson'],
-    [1722, 'Dickerson', 'Michael', 'Michael Dickerson'],
-    [76564, 'Dickey', 'Derrek', 'Derrek Dickey'],
-    [76565, 'Dickey', 'Dick', 'Dick Dickey'],
-    [101143, 'Diener', 'Travis', 'Travis Diener'],
-    [203476, 'Dieng', 'Gorgui', 'Gorgui Dieng'],
-    [76566, 'Dierking', 'Connie', 'Connie Dierking'],
-    [76567, 'Dietrick', 'Coby', 'Coby Dietrick'],
-    [76569, 'Dillard', 'Mickey', 'Mickey Dillard'],
-    [76570, 'Dille', 'Bob', 'Bob Dille'],
-    [76571, 'Dillon', 'John', 'John Dillon'],
-    [1629142, 'Ding', 'Yanyuhang', 'Yanyuhang Ding'],
-    [76574, 'Dinkins', 'Byron', 'Byron Dinkins'],
-    [76575, 'Dinkins', 'Jackie', 'Jackie Dinkins'],
-    [76576, 'Dinwiddie', 'Bill', 'Bill Dinwiddie'],
-    [203915, 'Dinwiddie', 'Spencer', 'Spencer Dinwiddie'],
-    [101113, 'Diogu', 'Ike', 'Ike Diogu'],
-    [2205, 'Diop', 'DeSagana', 'DeSagana Diop'],
-    [76577, 'Dischinger', 'Terry', 'Terry Dischinger'],
-    [76578, 'Diute', 'Fred', 'Fred Diute'],
-    [124, 'Divac', 'Vlade', 'Vlade Divac'],
-    [2413, 'Dixon', 'Juan', 'Juan Dixon'],
-    [1059, 'Djordjevic', 'Aleksandar', 'Aleksandar Djordjevic'],
-    [76580, 'Dodd', 'Earl', 'Earl Dodd'],
-    [1720, 'Doleac', 'Michael', 'Michael Doleac'],
-    [76581, 'Dolhon', 'Joe', 'Joe Dolhon'],
-    [76582, 'Doll', 'Bob', 'Bob Doll'],
-    [76583, 'Donaldson', 'James', 'James Donaldson'],
-    [1629029, 'Doncic', 'Luka', 'Luka Doncic'],
-    [76584, 'Donham', 'Bob', 'Bob Donham'],
-    [76586, 'Donovan', 'Billy', 'Billy Donovan'],
-    [76585, 'Donovan', 'Harry', 'Harry Donovan'],
-    [2039, 'Dooling', 'Keyon', 'Keyon Dooling'],
-    [76587, 'Dorsey', 'Jacky', 'Jacky Dorsey'],
-    [201595, 'Dorsey', 'Joey', 'Joey Dorsey'],
-    [1628416, 'Dorsey', 'Tyler', 'Tyler Dorsey'],
-    [1628422, 'Dotson', 'Damyean', 'Damyean Dotson'],
-    [200763, 'Douby', 'Quincy', 'Quincy Douby'],
-    [76588, 'Douglas', 'Bruce', 'Bruce Douglas'],
-    [76589, 'Douglas', 'John', 'John Douglas'],
-    [76590, 'Douglas', 'Leon', 'Leon Douglas'],
-    [428, 'Douglas', 'Sherman', 'Sherman Douglas'],
-    [201962, 'Douglas', 'Toney', 'Toney Douglas'],
-    [201604, 'Douglas-Roberts', 'Chris', 'Chris Douglas-Roberts'],
-    [76592, 'Dove', 'Lloyd', 'Lloyd Dove'],
-    [202220, 'Dowdell', 'Zabian', 'Zabian Dowdell'],
-    [76593, 'Downey', 'Bill', 'Bill Downey'],
-    [76594, 'Downing', 'Steve', 'Steve Downing'],
-    [76595, 'Doyle', 'Danny', 'Danny Doyle'],
-    [1628495, 'Doyle', 'Milton', 'Milton Doyle'],
-    [1628408, 'Dozier', 'PJ', 'PJ Dozier'],
-    [76596, 'Dozier', 'Terry', 'Terry Dozier'],
-    [201609, 'Dragic', 'Goran', 'Goran Dragic'],
-    [204054, 'Dragic', 'Zoran', 'Zoran Dragic'],
-    [1068, 'Dreiling', 'Greg', 'Greg Dreiling'],
-    [1724, 'Drew', 'Bryce', 'Bryce Drew'],
-    [76598, 'Drew', 'John', 'John Drew'],
-    [76599, 'Drew', 'Larry', 'Larry Drew'],
-    [203580, 'Drew II', 'Larry', 'Larry Drew II'],
-    [17, 'Drexler', 'Clyde', 'Clyde Drexler'],
-    [1041, 'Driggers', 'Nate', 'Nate Driggers'],
-    [76603, 'Driscoll', 'Terry', 'Terry Driscoll'],
-    [1542, 'Drobnjak', 'Predrag', 'Predrag Drobnjak'],
-    [76604, 'Drollinger', 'Ralph', 'Ralph Drollinger'],
-    [203083, 'Drummond', 'Andre', 'Andre Drummond'],
-    [76623, 'DuVal', 'Dennis', 'Dennis DuVal'],
-    [76605, 'Duckett', 'Dick', 'Dick Duckett'],
-    [404, 'Duckworth', 'Kevin', 'Kevin Duckworth'],
-    [76607, 'Dudley', 'Charles', 'Charles Dudley'],
-    [201, 'Dudley', 'Chris', 'Chris Dudley'],
-    [201162, 'Dudley', 'Jared', 'Jared Dudley'],
-    [76608, 'Duerod', 'Terry', 'Terry Duerod'],
-    [76609, 'Duffy', 'Bob', 'Bob Duffy'],
-    [76610, 'Duffy', 'Bob', 'Bob Duffy'],
-    [2768, 'Duhon', 'Chris', 'Chris Duhon'],
-    [1626251, 'Dukan', 'Duje', 'Duje Dukan'],
-    [76611, 'Dukes', 'Walter', 'Walter Dukes'],
-    [247, 'Dumars', 'Joe', 'Joe Dumars'],
-    [30, 'Dumas', 'Richard', 'Richard Dumas'],
-    [434, 'Dumas', 'Tony', 'Tony Dumas'],
-    [76615, 'Duncan', 'Andy', 'Andy Duncan'],
-    [1495, 'Duncan', 'Tim', 'Tim Duncan'],
-    [2399, 'Dunleavy', 'Mike', 'Mike Dunleavy'],
-    [76616, 'Dunleavy', 'Mike', 'Mike Dunleavy'],
-    [1627739, 'Dunn', 'Kris', 'Kris Dunn'],
-    [76617, 'Dunn', 'Pat', 'Pat Dunn'],
-    [76618, 'Dunn', 'T.R.', 'T.R. Dunn'],
-    [2648, 'Dupree', 'Ronald', 'Ronald Dupree'],
-    [201142, 'Durant', 'Kevin', 'Kevin Durant'],
-    [76619, 'Duren', 'John', 'John Duren'],
-    [1090, 'Durham', 'Pat', 'Pat Durham'],
-    [76621, 'Durrant', 'Devin', 'Devin Durrant'],
-    [76622, 'Durrett', 'Ken', 'Ken Durrett'],
-    [76624, 'Dwan', 'Jack', 'Jack Dwan'],
-    [76625, 'Dykema', 'Craig', 'Craig Dykema'],
-    [76626, 'Dyker', 'Gene', 'Gene Dyker'],
-    [202406, 'Dyson', 'Jerome', 'Jerome Dyson'],
-    [289, 'Eackles', 'Ledell', 'Ledell Eackles'],
-    [76628, 'Eakins', 'Jim', 'Jim Eakins'],
-    [768, 'Earl', 'Acie', 'Acie Earl'],
-    [76630, 'Earle', 'Ed', 'Ed Earle'],
-    [203921, 'Early', 'Cleanthony', 'Cleanthony Early'],
-    [76631, 'Eaton', 'Mark', 'Mark Eaton'],
-    [76632, 'Eaves', 'Jerry', 'Jerry Eaves'],
-    [202365, 'Ebanks', 'Devin', 'Devin Ebanks'],
-    [76633, 'Ebben', 'Bill', 'Bill Ebben'],
-    [76634, 'Eberhard', 'Al', 'Al Eberhard'],
-    [2569, 'Ebi', 'Ndudi', 'Ndudi Ebi'],
-    [204067, 'Eddie', 'Jarell', 'Jarell Eddie'],
-    [76635, 'Eddie', 'Patrick', 'Patrick Eddie'],
-    [76636, 'Eddleman', 'Thomas', 'Thomas Eddleman'],
-    [76637, 'Edelin', 'Kent', 'Kent Edelin'],
-    [76638, 'Edmonson', 'Keith', 'Keith Edmonson'],
-    [721, 'Edney', 'Tyus', 'Tyus Edney'],
-    [76646, 'Edwards', 'Bill', 'Bill Edwards'],
-    [898, 'Edwards', 'Blue', 'Blue Edwards'],
-    [2451, 'Edwards', 'Corsley', 'Corsley Edwards'],
-    [346, 'Edwards', 'Doug', 'Doug Edwards'],
-    [76641, 'Edwards', 'Franklin', 'Franklin Edwards'],
-    [229, 'Edwards', 'James', 'James Edwards'],
-    [76643, 'Edwards', 'Jay', 'Jay Edwards'],
-    [2823, 'Edwards', 'John', 'John Edwards'],
-    [236, 'Edwards', 'Kevin', 'Kevin Edwards'],
-    [202197, 'Edwards', 'Shane', 'Shane Edwards'],
-    [1629053, 'Edwards', 'Vincent', 'Vincent Edwards'],
-    [76647, 'Egan', 'Johnny', 'Johnny Egan'],
-    [76648, 'Eggleston', 'Lonnie', 'Lonnie Eggleston'],
-    [76649, 'Ehlers', 'Eddie', 'Eddie Ehlers'],
-    [378, 'Ehlo', 'Craig', 'Craig Ehlo'],
-    [76651, 'Eichhorst', 'Dick', 'Dick Eichhorst'],
-    [458, 'Eisley', 'Howard', 'Howard Eisley'],
-    [1918, 'Ekezie', 'Obinna', 'Obinna Ekezie'],
-    [2064, 'El-Amin', 'Khalid', 'Khalid El-Amin'],
-    [76653, 'Eliason', 'Don', 'Don Eliason'],
-    [53, 'Elie', 'Mario', 'Mario Elie'],
-    [76655, 'Ellefson', 'Ray', 'Ray Ellefson'],
-    [1627740, 'Ellenson', 'Henry', 'Henry Ellenson'],
-    [201961, 'Ellington', 'Wayne', 'Wayne Ellington'],
-    [76656, 'Elliott', 'Bob', 'Bob Elliott'],
-    [251, 'Elliott', 'Sean', 'Sean Elliott'],
-    [76658, 'Ellis', 'Alexander', 'Alexander Ellis'],
-    [76664, 'Ellis', 'Bo', 'Bo Ellis'],
-    [107, 'Ellis', 'Dale', 'Dale Ellis'],
-    [1677, 'Ellis', 'Harold', 'Harold Ellis'],
-    [76661, 'Ellis', 'Joe', 'Joe Ellis'],
-    [111, 'Ellis', 'LaPhonso', 'LaPhonso Ellis'],
-    [1034, 'Ellis', 'LeRon', 'LeRon Ellis'],
-    [76663, 'Ellis', 'Leroy', 'Leroy Ellis'],
-    [101145, 'Ellis', 'Monta', 'Monta Ellis'],
-    [442, 'Ellison', 'Pervis', 'Pervis Ellison'],
-    [600010, 'Elmore', 'Len', 'Len Elmore'],
-    [1922, 'Elson', 'Francisco', 'Francisco Elson'],
-    [76667, 'Elston', 'Darrell', 'Darrell Elston'],
-    [2408, 'Ely', 'Melvin', 'Melvin Ely'],
-    [203954, 'Embiid', 'Joel', 'Joel Embiid'],
-    [76668, 'Embry', 'Wayne', 'Wayne Embry'],
-    [2765, 'Emmett', 'Andre', 'Andre Emmett'],
-    [76669, 'Endress', 'Ned', 'Ned Endress'],
-    [76670, 'Engler', 'Chris', 'Chris Engler'],
-    [76671, 'Englestad', 'Wayne', 'Wayne Englestad'],
-    [76672, 'English', 'A.J.', 'A.J. English'],
-    [76673, 'English', 'Alex', 'Alex English'],
-    [76674, 'English', 'Claude', 'Claude English'],
-    [76676, 'English', 'Jojo', 'Jojo English'],
-    [203119, 'English', 'Kim', 'Kim English'],
-    [76675, 'English', 'Scott', 'Scott English'],
-    [76677, 'Englund', 'Gene', 'Gene Englund'],
-    [203898, 'Ennis', 'Tyler', 'Tyler Ennis'],
-    [203516, 'Ennis III', 'James', 'James Ennis III'],
-    [76678, 'Epps', 'Ray', 'Ray Epps'],
-    [201623, 'Erden', 'Semih', 'Semih Erden'],
-    [76679, 'Erias', 'Bo', 'Bo Erias'],
-    [76680, 'Erickson', 'Keith', 'Keith Erickson'],
-    [76681, 'Erving', 'Julius', 'Julius Erving'],
-    [1915, 'Eschmeyer', 'Evan', 'Evan Eschmeyer'],
-    [76682, 'Eskridge', 'Jack', 'Jack Eskridge'],
-    [76683, 'Esposito', 'Vincenzo', 'Vincenzo Esposito'],
-    [76687, 'Evans', 'Bob', 'Bob Evans'],
-    [967, 'Evans', 'Brian', 'Brian Evans'],
-    [76685, 'Evans', 'Earl', 'Earl Evans'],
-    [1628980, 'Evans', 'Jacob', 'Jacob Evans'],
-    [1628393, 'Evans', 'Jawun', 'Jawun Evans'],
-    [202379, 'Evans', 'Jeremy', 'Jeremy Evans'],
-    [2230, 'Evans', 'Maurice', 'Maurice Evans'],
-    [76686, 'Evans', 'Mike', 'Mike Evans'],
-    [2501, 'Evans', 'Reggie', 'Reggie Evans'],
-    [201936, 'Evans', 'Tyreke', 'Tyreke Evans'],
-    [101137, 'Ewing', 'Daniel', 'Daniel Ewing'],
-    [121, 'Ewing', 'Patrick', 'Patrick Ewing'],
-    [201607, 'Ewing', 'Patrick', 'Patrick Ewing'],
-    [203957, 'Exum', 'Dante', 'Dante Exum'],
-    [201963, 'Eyenga', 'Christian', 'Christian Eyenga'],
-    [203105, 'Ezeli', 'Festus', 'Festus Ezeli'],
-    [76689, 'Ezersky', 'Johnny', 'Johnny Ezersky'],
-    [76690, 'Fabel', 'Joe', 'Joe Fabel'],
-    [76691, 'Fairchild', 'John', 'John Fairchild'],
-    [76692, 'Farbman', 'Phil', 'Phil Farbman'],
-    [202702, 'Faried', 'Kenneth', 'Kenneth Faried'],
-    [76693, 'Farley', 'Dick', 'Dick Farley'],
-    [200770, 'Farmar', 'Jordan', 'Jordan Farmar'],
-    [2824, 'Farmer', 'Desmon', 'Desmon Farmer'],
-    [76695, 'Farmer', 'Jim', 'Jim Farmer'],
-    [76694, 'Farmer', 'Mike', 'Mike Farmer'],
-    [1108, 'Farmer', 'Tony', 'Tony Farmer'],
-    [76696, 'Faught', 'Bob', 'Bob Faught'],
-    [203543, 'Faverani', 'Vitor', 'Vitor Faverani'],
-    [202324, 'Favors', 'Derrick', 'Derrick Favors'],
-    [201174, 'Fazekas', 'Nick', 'Nick Fazekas'],
-    [76697, 'Fedor', 'Dave', 'Dave Fedor'],
-    [76698, 'Feerick', 'Bob', 'Bob Feerick'],
-    [76699, 'Feher', 'Butch', 'Butch Feher'],
-    [994, 'Feick', 'Jamie', 'Jamie Feick'],
-    [76701, 'Feiereisel', 'Ron', 'Ron Feiereisel'],
-    [76702, 'Feigenbaum', 'George', 'George Feigenbaum'],
-    [76703, 'Feitl', 'Dave', 'Dave Feitl'],
-    [1627770, 'Felder', 'Kay', 'Kay Felder'],
-    [1626245, 'Felicio', 'Cristiano', 'Cristiano Felicio'],
-    [203467, 'Felix', 'Carrick', 'Carrick Felix'],
-    [101230, 'Felix', 'Noel', 'Noel Felix'],
-    [76704, 'Felix', 'Ray', 'Ray Felix'],
-    [101109, 'Felton', 'Raymond', 'Raymond Felton'],
-    [76705, 'Fendley', 'Jake', 'Jake Fendley'],
-    [76706, 'Fenley', 'Bill', 'Bill Fenley'],
-    [2724, 'Ferguson', 'Desmond', 'Desmond Ferguson'],
-    [1628390, 'Ferguson', 'Terrance', 'Terrance Ferguson'],
-    [201164, 'Fernandez', 'Rudy', 'Rudy Fernandez'],
-    [76707, 'Fernsten', 'Eric', 'Eric Fernsten'],
-    [76708, 'Ferrari', 'Al', 'Al Ferrari'],
-    [76709, 'Ferreira', 'Rolando', 'Rolando Ferreira'],
-    [273, 'Ferrell', 'Duane', 'Duane Ferrell'],
-    [1627812, 'Ferrell', 'Yogi', 'Yogi Ferrell'],
-    [76711, 'Ferrin', 'Arnie', 'Arnie Ferrin'],
-    [76712, 'Ferry', 'Bob', 'Bob Ferry'],
-    [198, 'Ferry', 'Danny', 'Danny Ferry'],
-    [201178, 'Fesenko', 'Kyrylo', 'Kyrylo Fesenko'],
-    [76713, 'Fields', 'Kenny', 'Kenny Fields'],
-    [202361, 'Fields', 'Landry', 'Landry Fields'],
-    [76714, 'Filipek', 'Ron', 'Ron Filipek'],
-    [76715, 'Fillmore', 'Greg', 'Greg Fillmore'],
-    [76716, 'Finkel', 'Hank', 'Hank Finkel'],
-    [714, 'Finley', 'Michael', 'Michael Finley'],
-    [76717, 'Finn', 'Danny', 'Danny Finn'],
-    [1627827, 'Finney-Smith', 'Dorian', 'Dorian Finney-Smith'],
-    [900, 'Fish', 'Matt', 'Matt Fish'],
-    [965, 'Fisher', 'Derek', 'Derek Fisher'],
-    [2809, 'Fitch', 'Gerald', 'Gerald Fitch'],
-    [76720, 'Fitzgerald', 'Bob', 'Bob Fitzgerald'],
-    [76719, 'Fitzgerald', 'Dick', 'Dick Fitzgerald'],
-    [2033, 'Fizer', 'Marcus', 'Marcus Fizer'],
-    [76721, 'Fleishman', 'Jerry', 'Jerry Fleishman'],
-    [76722, 'Fleming', 'Al', 'Al Fleming'],
-    [76723, 'Fleming', 'Ed', 'Ed Fleming'],
-    [313, 'Fleming', 'Vern', 'Vern Fleming'],
-    [2784, 'Flores', 'Luis', 'Luis Flores'],
-    [76725, 'Flowers', 'Bruce', 'Bruce Flowers'],
-    [76726, 'Floyd', 'Sleepy', 'Sleepy Floyd'],
-    [201938, 'Flynn', 'Jonny', 'Jonny Flynn'],
-    [76727, 'Flynn', 'Mike', 'Mike Flynn'],
-    [76728, 'Fogle', 'Larry', 'Larry Fogle'],
-    [76729, 'Foley', 'Jack', 'Jack Foley'],
-    [1829, 'Fontaine', 'Ike', 'Ike Fontaine'],
-    [76731, 'Fontaine', 'Levi', 'Levi Fontaine'],
-    [202880, 'Foote', 'Jeff', 'Jeff Foote'],
-    [1627854, 'Forbes', 'Bryn', 'Bryn Forbes'],
-    [201814, 'Forbes', 'Gary', 'Gary Forbes'],
-    [76732, 'Ford', 'Alphonso', 'Alphonso Ford'],
-    [2228, 'Ford', 'Alton', 'Alton Ford'],
-    [76733, 'Ford', 'Chris', 'Chris Ford'],
-    [76734, 'Ford', 'Don', 'Don Ford'],
-    [76735, 'Ford', 'Jake', 'Jake Ford'],
-    [76736, 'Ford', 'Phil', 'Phil Ford'],
-    [101213, 'Ford', 'Sharrod', 'Sharrod Ford'],
-    [726, 'Ford', 'Sherell', 'Sherell Ford'],
-    [2551, 'Ford', 'T.J.', 'T.J. Ford'],
-    [76738, 'Forman', 'Donnie', 'Donnie Forman'],
-    [76739, 'Forrest', 'Bayard', 'Bayard Forrest'],
-    [2218, 'Forte', 'Joseph', 'Joseph Forte'],
-    [202622, 'Fortson', 'Courtney', 'Courtney Fortson'],
-    [1504, 'Fortson', 'Danny', 'Danny Fortson'],
-    [76740, 'Foster', 'Fred', 'Fred Foster'],
-    [323, 'Foster', 'Greg', 'Greg Foster'],
-    [1902, 'Foster', 'Jeff', 'Jeff Foster'],
-    [76742, 'Foster', 'Rod', 'Rod Foster'],
-    [2238, 'Fotsis', 'Antonis', 'Antonis Fotsis'],
-    [203095, 'Fournier', 'Evan', 'Evan Fournier'],
-    [76744, 'Foust', 'Larry', 'Larry Foust'],
-    [76745, 'Fowler', 'Jerry', 'Jerry Fowler'],
-    [1762, 'Fowlkes', 'Tremaine', 'Tremaine Fowlkes'],
-    [1628368, 'Fox', "De'Aaron", "De'Aaron Fox"],
-    [76746, 'Fox', 'Harold', 'Harold Fox'],
-    [76747, 'Fox', 'Jim', 'Jim Fox'],
-    [296, 'Fox', 'Rick', 'Rick Fox'],
-    [200751, 'Foye', 'Randy', 'Randy Foye'],
-    [1502, 'Foyle', 'Adonal', 'Adonal Foyle'],
-    [2499, 'Frahm', 'Richie', 'Richie Frahm'],
-    [1883, 'Francis', 'Steve', 'Steve Francis'],
-    [76748, 'Frank', 'Tellis', 'Tellis Frank'],
-    [76749, 'Frankel', 'Nat', 'Nat Frankel'],
-    [203479, 'Franklin', 'Jamaal', 'Jamaal Franklin'],
-    [204025, 'Frazier', 'Tim', 'Tim Frazier'],
-    [76750, 'Frazier', 'Walt', 'Walt Frazier'],
-    [76751, 'Frazier', 'Will', 'Will Frazier'],
-    [1628982, 'Frazier Jr.', 'Melvin', 'Melvin Frazier Jr.'],
-    [76752, 'Frederick', 'Anthony', 'Anthony Frederick'],
-    [202690, 'Fredette', 'Jimmer', 'Jimmer Fredette'],
-    [76753, 'Free', 'World', 'World Free'],
-    [200777, 'Freeland', 'Joel', 'Joel Freeland'],
-    [76754, 'Freeman', 'Donnie', 'Donnie Freeman'],
-    [76755, 'Freeman', 'Gary', 'Gary Freeman'],
-    [76756, 'Freeman', 'Rod', 'Rod Freeman'],
-    [2782, 'Freije', 'Matt', 'Matt Freije'],
-    [76757, 'Frey', 'Frido', 'Frido Frey'],
-    [76758, 'Friend', 'Larry', 'Larry Friend'],
-    [76759, 'Frink', 'Pat', 'Pat Frink'],
-    [76760, 'Fritsche', 'Jim', 'Jim Fritsche'],
-    [101112, 'Frye', 'Channing', 'Channing Frye'],
-    [76761, 'Fryer', 'Bernie', 'Bernie Fryer'],
-    [76762, 'Fucarino', 'Frank', 'Frank Fucarino'],
-    [76763, 'Fuetsch', 'Herm', 'Herm Fuetsch'],
-    [76764, 'Fulks', 'Joe', 'Joe Fulks'],
-    [2673, 'Fuller', 'Hiram', 'Hiram Fuller'],
-    [957, 'Fuller', 'Todd', 'Todd Fuller'],
-    [76765, 'Fuller', 'Tony', 'Tony Fuller'],
-    [1628365, 'Fultz', 'Markelle', 'Markelle Fultz'],
-    [1444, 'Funderburke', 'Lawrence', 'Lawrence Funderburke'],
-    [76767, 'Furlow', 'Terry', 'Terry Furlow'],
-    [76768, 'Gabor', 'Billy', 'Billy Gabor'],
-    [2429, 'Gadzuric', 'Dan', 'Dan Gadzuric'],
-    [202070, 'Gaffney', 'Tony', 'Tony Gaffney'],
-    [101184, 'Gai', 'Deng', 'Deng Gai'],
-    [76769, 'Gainer', 'Elmer R.', 'Elmer R. Gainer'],
-    [76770, 'Gaines', 'Corey', 'Corey Gaines'],
-    [2558, 'Gaines', 'Reece', 'Reece Gaines'],
-    [202178, 'Gaines', 'Sundiata', 'Sundiata Gaines'],
-    [76771, 'Gale', 'Mike', 'Mike Gale'],
-    [76772, 'Gallagher', 'Chad', 'Chad Gallagher'],
-    [76773, 'Gallatin', 'Harry', 'Harry Gallatin'],
-    [201568, 'Gallinari', 'Danilo', 'Danilo Gallinari'],
-    [204038, 'Galloway', 'Langston', 'Langston Galloway'],
-    [76774, 'Gambee', 'Dave', 'Dave Gambee'],
-    [333, 'Gamble', 'Kevin', 'Kevin Gamble'],
-    [76776, 'Gantt', 'Bob', 'Bob Gantt'],
-    [200816, 'Garbajosa', 'Jorge', 'Jorge Garbajosa'],
-    [2092, 'Garces', 'Ruben', 'Ruben Garces'],
-    [2682, 'Garcia', 'Alex', 'Alex Garcia'],
-    [101128, 'Garcia', 'Francisco', 'Francisco Garcia'],
-    [76778, 'Gardner', 'Earl', 'Earl Gardner'],
-    [201242, 'Gardner', 'Thomas', 'Thomas Gardner'],
-    [76779, 'Gardner', 'Vern', 'Vern Gardner'],
-    [76780, 'Garfinkel', 'Jack', 'Jack Garfinkel'],
-    [1627868, 'Garino', 'Patricio', 'Patricio Garino'],
-    [76781, 'Garland', 'Gary', 'Gary Garland'],
-    [76782, 'Garland', 'Winston', 'Winston Garland'],
-    [76783, 'Garmaker', 'Dick', 'Dick Garmaker'],
-    [1612, 'Garner', 'Chris', 'Chris Garner'],
-    [76785, 'Garnett', 'Bill', 'Bill Garnett'],
-    [708, 'Garnett', 'Kevin', 'Kevin Garnett'],
-    [1831, 'Garnett', 'Marlon', 'Marlon Garnett'],
-    [76786, 'Garrett', 'Calvin', 'Calvin Garrett'],
-    [1051, 'Garrett', 'Dean', 'Dean Garrett'],
-    [203197, 'Garrett', 'Diante', 'Diante Garrett'],
-    [76788, 'Garrett', 'Eldo', 'Eldo Garrett'],
-    [76789, 'Garrett', 'Rowland', 'Rowland Garrett'],
-    [76790, 'Garrick', 'Tom', 'Tom Garrick'],
-    [76791, 'Garris', 'John', 'John Garris'],
-    [1619, 'Garris', 'Kiwane', 'Kiwane Garris'],
-    [1727, 'Garrity', 'Pat', 'Pat Garrity'],
-    [76793, 'Garvin', 'Jim', 'Jim Garvin'],
-    [201188, 'Gasol', 'Marc', 'Marc Gasol'],
-    [2200, 'Gasol', 'Pau', 'Pau Gasol'],
-    [76794, 'Gates', 'Frank', 'Frank Gates'],
-    [423, 'Gatling', 'Chris', 'Chris Gatling'],
-    [930, 'Gattison', 'Kenny', 'Kenny Gattison'],
-    [200752, 'Gay', 'Rudy', 'Rudy Gay'],
-    [76797, 'Gayda', 'Ed', 'Ed Gayda'],
-    [1845, 'Gaze', 'Andrew', 'Andrew Gaze'],
-    [1627771, 'Gbinije', 'Michael', 'Michael Gbinije'],
-    [1002, 'Geary', 'Reggie', 'Reggie Geary'],
-    [202087, 'Gee', 'Alonzo', 'Alonzo Gee'],
-    [761, 'Geiger', 'Matt', 'Matt Geiger'],
-    [101153, 'Gelabale', 'Mickael', 'Mickael Gelabale'],
-    [1904, 'George', 'Devean', 'Devean George'],
-    [76800, 'George', 'Jack', 'Jack George'],
-    [202331, 'George', 'Paul', 'Paul George'],
-    [76801, 'George', 'Tate', 'Tate George'],
-    [1627875, 'Georges-Hunt', 'Marcus', 'Marcus Georges-Hunt'],
-    [76802, 'Gerard', 'Gus', 'Gus Gerard'],
-    [76803, 'Gervin', 'Derrick', 'Derrick Gervin'],
-    [76804, 'Gervin', 'George', 'George Gervin'],
-    [76805, 'Getchell', 'Gorham', 'Gorham Getchell'],
-    [76806, 'Gianelli', 'John', 'John Gianelli'],
-    [76807, 'Gibbs', 'Dick', 'Dick Gibbs'],
-    [200789, 'Gibson', 'Daniel', 'Daniel Gibson'],
-    [76808, 'Gibson', 'Dee', 'Dee Gibson'],
-    [1626780, 'Gibson', 'Jonathan', 'Jonathan Gibson'],
-    [76809, 'Gibson', 'Mel', 'Mel Gibson'],
-    [76810, 'Gibson', 'Mike', 'Mike Gibson'],
-    [201959, 'Gibson', 'Taj', 'Taj Gibson'],
-    [76811, 'Gibson', 'Ward', 'Ward Gibson'],
-    [201592, 'Giddens', 'J.R.', 'J.R. Giddens'],
-    [201821, 'Gilder', 'Trey', 'Trey Gilder'],
-    [1628385, 'Giles III', 'Harry', 'Harry Giles III'],
-    [1628983, 'Gilgeous-Alexander', 'Shai', 'Shai Gilgeous-Alexander'],
-    [2109, 'Gill', 'Eddie', 'Eddie Gill'],
-    [383, 'Gill', 'Kendall', 'Kendall Gill'],
-    [76812, 'Gillery', 'Ben', 'Ben Gillery'],
-    [76813, 'Gillette', 'Gene', 'Gene Gillette'],
-    [288, 'Gilliam', 'Armen', 'Armen Gilliam'],
-    [76815, 'Gilliam', 'Herm', 'Herm Gilliam'],
-    [600014, 'Gilmore', 'Artis', 'Artis Gilmore'],
-    [76817, 'Gilmore', 'Walt', 'Walt Gilmore'],
-    [76818, 'Gilmur', 'Chuck', 'Chuck Gilmur'],
-    [1938, 'Ginobili', 'Manu', 'Manu Ginobili'],
-    [1921, 'Giricek', 'Gordan', 'Gordan Giricek'],
-    [76819, 'Givens', 'Jack', 'Jack Givens'],
-    [202148, 'Gladness', 'Mickell', 'Mickell Gladness'],
-    [76820, 'Glamack', 'George', 'George Glamack'],
-    [76821, 'Glass', 'Gerald', 'Gerald Glass'],
-    [76822, 'Glenn', 'Mike', 'Mike Glenn'],
-    [76823, 'Glick', 'Norman', 'Norman Glick'],
-    [76824, 'Glouchkov', 'Georgi', 'Georgi Glouchkov'],
-    [76825, 'Glover', 'Clarence', 'Clarence Glover'],
-    [1901, 'Glover', 'Dion', 'Dion Glover'],
-    [2601, 'Glyniadakis', 'Andreas', 'Andreas Glyniadakis'],
-    [76826, 'Gminski', 'Mike', 'Mike Gminski'],
-    [203497, 'Gobert', 'Rudy', 'Rudy Gobert'],
-    [76827, 'Godfread', 'Dan', 'Dan Godfread'],
-    [76828, 'Gola', 'Tom', 'Tom Gola'],
-    [76829, 'Goldfaden', 'Ben', 'Ben Goldfaden'],
-    [924, 'Goldwire', 'Anthony', 'Anthony Goldwire'],
-    [101155, 'Gomes', 'Ryan', 'Ryan Gomes'],
-    [76830, 'Gondrezick', 'Glen', 'Glen Gondrezick'],
-    [76831, 'Gondrezick', 'Grant', 'Grant Gondrezick'],
-    [2400, 'Gooden', 'Drew', 'Drew Gooden'],
-    [76832, 'Goodrich', 'Gail', 'Gail Goodrich'],
-    [1864, 'Goodrich', 'Steve', 'Steve Goodrich'],
-    [203462, 'Goodwin', 'Archie', 'Archie Goodwin'],
-    [76833, 'Goodwin', 'Wilfred', 'Wilfred Goodwin'],
-    [203932, 'Gordon', 'Aaron', 'Aaron Gordon'],
-    [2732, 'Gordon', 'Ben', 'Ben Gordon'],
-    [204079, 'Gordon', 'Drew', 'Drew Gordon'],
-    [201569, 'Gordon', 'Eric', 'Eric Gordon'],
-    [76834, 'Gordon', 'Lancaster', 'Lancaster Gordon'],
-    [76835, 'Gordon', 'Paul', 'Paul Gordon'],
-    [101162, 'Gortat', 'Marcin', 'Marcin Gortat'],
-    [76836, 'Gottlieb', 'Leo', 'Leo Gottlieb'],
-    [202726, 'Goudelock', 'Andrew', 'Andrew Goudelock'],
-    [76837, 'Govedarica', 'Bato', 'Bato Govedarica'],
-    [76838, 'Graboski', 'Joe', 'Joe Graboski'],
-    [76839, 'Grace', 'Ricky', 'Ricky Grace'],
-    [1628984, 'Graham', "Devonte'", "Devonte' Graham"],
-    [37, 'Graham', 'Greg', 'Greg Graham'],
-    [101121, 'Graham', 'Joey', 'Joey Graham'],
-    [76843, 'Graham', 'Mal', 'Mal Graham'],
-    [76841, 'Graham', 'Orlando', 'Orlando Graham'],
-    [76842, 'Graham', 'Paul', 'Paul Graham'],
-    [101211, 'Graham', 'Stephen', 'Stephen Graham'],
-    [1626203, 'Graham', 'Treveon', 'Treveon Graham'],
-    [76844, 'Grandholm', 'Jim', 'Jim Grandholm'],
-    [97, 'Grandison', 'Ronnie', 'Ronnie Grandison'],
-    [101122, 'Granger', 'Danny', 'Danny Granger'],
-    [76847, 'Granger', 'Stewart', 'Stewart Granger'],
-    [258, 'Grant', 'Brian', 'Brian Grant'],
-    [76850, 'Grant', 'Bud', 'Bud Grant'],
-    [202, 'Grant', 'Gary', 'Gary Grant'],
-    [285, 'Grant', 'Greg', 'Greg Grant'],
-    [265, 'Grant', 'Harvey', 'Harvey Grant'],
-    [270, 'Grant', 'Horace', 'Horace Grant'],
-    [203924, 'Grant', 'Jerami', 'Jerami Grant'],
-    [1626170, 'Grant', 'Jerian', 'Jerian Grant'],
-    [76852, 'Grant', 'Josh', 'Josh Grant'],
-    [1514, 'Grant', 'Paul', 'Paul Grant'],
-    [76853, 'Grant', 'Travis', 'Travis Grant'],
-    [76854, 'Grate', 'Don', 'Don Grate'],
-    [76855, 'Graves', 'Butch', 'Butch Graves'],
-    [201189, 'Gray', 'Aaron', 'Aaron Gray'],
-    [1070, 'Gray', 'Devin', 'Devin Gray'],
-    [1516, 'Gray', 'Ed', 'Ed Gray'],
-    [1026, 'Gray', 'Evric', 'Evric Gray'],
-    [76859, 'Gray', 'Gary', 'Gary Gray'],
-    [1627982, 'Gray', 'Josh', 'Josh Gray'],
-    [76860, 'Gray', 'Leonard', 'Leonard Gray'],
-    [1629154, 'Gray', 'Rob', 'Rob Gray'],
-    [76861, 'Gray', 'Stuart', 'Stuart Gray'],
-    [76862, 'Gray', 'Sylvester', 'Sylvester Gray'],
-    [76863, 'Gray', 'Wyndol', 'Wyndol Gray'],
-    [81, 'Grayer', 'Jeff', 'Jeff Grayer'],
-    [76865, 'Greacen', 'Bob', 'Bob Greacen'],
-    [920, 'Green', 'A.C.', 'A.C. Green'],
-    [201980, 'Green', 'Danny', 'Danny Green'],
-    [101209, 'Green', 'Devin', 'Devin Green'],
-    [203110, 'Green', 'Draymond', 'Draymond Green'],
-    [203475, 'Green', 'Erick', 'Erick Green'],
-    [203629, 'Green', 'Garlon', 'Garlon Green'],
-    [101123, 'Green', 'Gerald', 'Gerald Green'],
-    [203210, 'Green', 'JaMychal', 'JaMychal Green'],
-    [201145, 'Green', 'Jeff', 'Jeff Green'],
-    [76867, 'Green', 'Johnny', 'Johnny Green'],
-    [76868, 'Green', 'Ken', 'Ken Green'],
-    [76869, 'Green', 'Kenny', 'Kenny Green'],
-    [600011, 'Green', 'Lamar', 'Lamar Green'],
-    [1036, 'Green', 'Litterial', 'Litterial Green'],
-    [76872, 'Green', 'Luther', 'Luther Green'],
-    [76873, 'Green', 'Mike', 'Mike Green'],
-    [76874, 'Green', 'Rickey', 'Rickey Green'],
-    [76875, 'Green', 'Sean', 'Sean Green'],
-    [76877, 'Green', 'Si', 'Si Green'],
-    [76876, 'Green', 'Sidney', 'Sidney Green'],
-    [76878, 'Green', 'Steve', 'Steve Green'],
-    [201192, 'Green', 'Taurean', 'Taurean Green'],
-    [76879, 'Green', 'Tommy', 'Tommy Green'],
-    [2584, 'Green', 'Willie', 'Willie Green'],
-    [201590, 'Greene', 'Donte', 'Donte Greene'],
-    [101158, 'Greene', 'Orien', 'Orien Greene'],
-    [76880, 'Greenspan', 'Jerry', 'Jerry Greenspan'],
-    [76881, 'Greenwood', 'David', 'David Greenwood'],
-    [76882, 'Greer', 'Hal', 'Hal Greer'],
-    [2696, 'Greer', 'Lynn', 'Lynn Greer'],
-    [76883, 'Gregor', 'Gary', 'Gary Gregor'],
-    [76884, 'Gregory', 'Claude', 'Claude Gregory'],
-    [76885, 'Greig', 'John', 'John Greig'],
-    [76886, 'Grekin', 'Norm', 'Norm Grekin'],
-    [76887, 'Grevey', 'Kevin', 'Kevin Grevey'],
-    [1559, 'Griffin', 'Adrian', 'Adrian Griffin'],
-    [201933, 'Griffin', 'Blake', 'Blake Griffin'],
-    [2204, 'Griffin', 'Eddie', 'Eddie Griffin'],
-    [76888, 'Griffin', 'Greg', 'Greg Griffin'],
-    [76889, 'Griffin', 'Paul', 'Paul Griffin'],
-    [201981, 'Griffin', 'Taylor', 'Taylor Griffin'],
-    [76890, 'Griffith', 'Darrell', 'Darrell Griffith'],
-    [76891, 'Grigsby', 'Chuck', 'Chuck Grigsby'],
-    [1575, 'Grimm', 'Derek', 'Derek Grimm'],
-    [76893, 'Grimshaw', 'George', 'George Grimshaw'],
-    [76894, 'Groat', 'Dick', 'Dick Groat'],
-    [76895, 'Gross', 'Bob', 'Bob Gross'],
-    [76896, 'Grote', 'Jerry', 'Jerry Grote'],
-    [76897, 'Groza', 'Alex', 'Alex Groza'],
-    [101219, 'Grundy', 'Anthony', 'Anthony Grundy'],
-    [76899, 'Grunfeld', 'Ernie', 'Ernie Grunfeld'],
-    [76900, 'Guarilia', 'Gene', 'Gene Guarilia'],
-    [76901, 'Gudmundsson', 'Petur', 'Petur Gudmundsson'],
-    [76902, 'Guerin', 'Richie', 'Richie Guerin'],
-    [339, 'Gugliotta', 'Tom', 'Tom Gugliotta'],
-    [76903, 'Guibert', 'Andres', 'Andres Guibert'],
-    [76904, 'Guidinger', 'Jay', 'Jay Guidinger'],
-    [76905, 'Gunther', 'Coulby', 'Coulby Gunther'],
-    [76906, 'Gunther', 'Dave', 'Dave Gunther'],
-    [76907, 'Guokas', 'Al', 'Al Guokas'],
-    [76908, 'Guokas', 'Matt', 'Matt Guokas'],
-    [76909, 'Guokas', 'Matt', 'Matt Guokas'],
-    [203268, 'Gutierrez', 'Jorge', 'Jorge Gutierrez'],
-    [2062, 'Guyton', 'A.J.', 'A.J. Guyton'],
-    [2775, 'Ha', 'Ha', 'Ha Ha'],
-    [76910, 'Hackett', 'Rudy', 'Rudy Hackett'],
-    [201632, 'Haddadi', 'Hamed', 'Hamed Haddadi'],
-    [76911, 'Haffner', 'Scott', 'Scott Haffner'],
-    [76912, 'Hagan', 'Cliff', 'Cliff Hagan'],
-    [76913, 'Hagan', 'Glenn', 'Glenn Hagan'],
-    [76914, 'Hahn', 'Bob', 'Bob Hahn'],
-    [76915, 'Hairston', 'Al', 'Al Hairston'],
-    [76916, 'Hairston', 'Happy', 'Happy Hairston'],
-    [76917, 'Hairston', 'Lindsay', 'Lindsay Hairston'],
-    [201612, 'Hairston', 'Malik', 'Malik Hairston'],
-    [203798, 'Hairston', 'PJ', 'PJ Hairston'],
-    [2409, 'Haislip', 'Marcus', 'Marcus Haislip'],
-    [76918, 'Halbert', 'Chuck', 'Chuck Halbert'],
-    [76919, 'Halbrook', 'Harvey', 'Harvey Halbrook'],
-    [76920, 'Hale', 'Bruce', 'Bruce Hale'],
-    [917, 'Haley', 'Jack', 'Jack Haley'],
-    [76922, 'Halimon', 'Shaler', 'Shaler Halimon'],
-    [1628985, 'Hall', 'Devon', 'Devon Hall'],
-    [200837, 'Hall', 'Mike', 'Mike Hall'],
-    [76923, 'Halliburton', 'Jeff', 'Jeff Halliburton'],
-    [1032, 'Ham', 'Darvin', 'Darvin Ham'],
-    [984, 'Hamer', 'Steve', 'Steve Hamer'],
-    [76925, 'Hamilton', 'Dale', 'Dale Hamilton'],
-    [1627772, 'Hamilton', 'Daniel', 'Daniel Hamilton'],
-    [76926, 'Hamilton', 'Dennis', 'Dennis Hamilton'],
-    [202706, 'Hamilton', 'Jordan', 'Jordan Hamilton'],
-    [203120, 'Hamilton', 'Justin', 'Justin Hamilton'],
-    [76927, 'Hamilton', 'Ralph', 'Ralph Hamilton'],
-    [1888, 'Hamilton', 'Richard', 'Richard Hamilton'],
-    [76928, 'Hamilton', 'Roylee', 'Roylee Hamilton'],
-    [76929, 'Hamilton', 'Steve', 'Steve Hamilton'],
-    [2347, 'Hamilton', 'Tang', 'Tang Hamilton'],
-    [676, 'Hamilton', 'Thomas', 'Thomas Hamilton'],
-    [1985, 'Hamilton', 'Zendon', 'Zendon Hamilton'],
-    [903, 'Hammink', 'Geert', 'Geert Hammink'],
-    [67, 'Hammonds', 'Tom', 'Tom Hammonds'],
-    [1627773, 'Hammons', 'AJ', 'AJ Hammons'],
-    [241, 'Hancock', 'Darrin', 'Darrin Hancock'],
-    [1052, 'Handlogten', 'Ben', 'Ben Handlogten'],
-    [76935, 'Hankins', 'Cecil', 'Cecil Hankins'],
-    [76936, 'Hankinson', 'Phil', 'Phil Hankinson'],
-    [76937, 'Hannum', 'Alex', 'Alex Hannum'],
-    [76938, 'Hanrahan', 'Don', 'Don Hanrahan'],
-    [76939, 'Hans', 'Rollen', 'Rollen Hans'],
-    [203162, 'Hansbrough', 'Ben', 'Ben Hansbrough'],
-    [201946, 'Hansbrough', 'Tyler', 'Tyler Hansbrough'],
-    [76942, 'Hansen', 'Bob', 'Bob Hansen'],
-    [76940, 'Hansen', 'Glenn', 'Glenn Hansen'],
-    [76941, 'Hansen', 'Lars', 'Lars Hansen'],
-    [2580, 'Hansen', 'Travis', 'Travis Hansen'],
-    [1682, 'Hanson', 'Reggie', 'Reggie Hanson'],
-    [76944, 'Hanzlik', 'Bill', 'Bill Hanzlik'],
-    [202376, 'Harangody', 'Luke', 'Luke Harangody'],
-    [358, 'Hardaway', 'Anfernee', 'Anfernee Hardaway'],
-    [896, 'Hardaway', 'Tim', 'Tim Hardaway'],
-    [203501, 'Hardaway Jr.', 'Tim', 'Tim Hardaway Jr.'],
-    [201935, 'Harden', 'James', 'James Harden'],
-    [76945, 'Harding', 'Reggie', 'Reggie Harding'],
-    [76946, 'Hardnett', 'Charlie', 'Charlie Hardnett'],
-    [76947, 'Hardy', 'Alan', 'Alan Hardy'],
-    [76948, 'Hardy', 'James', 'James Hardy'],
-    [76949, 'Hargis', 'John', 'John Hargis'],
-    [203090, 'Harkless', 'Maurice', 'Maurice Harkless'],
-    [76950, 'Harkness', 'Jerry', 'Jerry Harkness'],
-    [76951, 'Harlicka', 'Skip', 'Skip Harlicka'],
-    [76952, 'Harmon', 'Jerome', 'Jerome Harmon'],
-    [157, 'Harper', 'Derek', 'Derek Harper'],
-    [202712, 'Harper', 'Justin', 'Justin Harper'],
-    [76954, 'Harper', 'Mike', 'Mike Harper'],
-    [166, 'Harper', 'Ron', 'Ron Harper'],
-    [1723, 'Harpring', 'Matt', 'Matt Harpring'],
-    [1626149, 'Harrell', 'Montrezl', 'Montrezl Harrell'],
-    [202725, 'Harrellson', 'Josh', 'Josh Harrellson'],
-    [2492, 'Harrington', 'Adam', 'Adam Harrington'],
-    [1733, 'Harrington', 'Al', 'Al Harrington'],
-    [2454, 'Harrington', 'Junior', 'Junior Harrington'],
-    [970, 'Harrington', 'Othella', 'Othella Harrington'],
-    [76956, 'Harris', 'Art', 'Art Harris'],
-    [76957, 'Harris', 'Bernie', 'Bernie Harris'],
-    [76959, 'Harris', 'Bob', 'Bob Harris'],
-    [76958, 'Harris', 'Chris', 'Chris Harris'],
-    [2734, 'Harris', 'Devin', 'Devin Harris'],
-    [203548, 'Harris', 'Elias', 'Elias Harris'],
-    [203914, 'Harris', 'Gary', 'Gary Harris'],
-    [203925, 'Harris', 'Joe', 'Joe Harris'],
-    [446, 'Harris', 'Lucious', 'Lucious Harris'],
-    [202412, 'Harris', 'Manny', 'Manny Harris'],
-    [200839, 'Harris', 'Mike', 'Mike Harris'],
-    [76960, 'Harris', 'Steve', 'Steve Harris'],
-    [202227, 'Harris', 'Terrel', 'Terrel Harris'],
-    [202699, 'Harris', 'Tobias', 'Tobias Harris'],
-    [76961, 'Harris', 'Tony', 'Tony Harris'],
-    [1626151, 'Harrison', 'Aaron', 'Aaron Harrison'],
-    [1626150, 'Harrison', 'Andrew', 'Andrew Harrison'],
-    [76962, 'Harrison', 'Bob', 'Bob Harrison'],
-    [2758, 'Harrison', 'David', 'David Harrison'],
-    [1627885, 'Harrison', 'Shaquille', 'Shaquille Harrison'],
-    [2078, 'Hart', 'Jason', 'Jason Hart'],
-    [1628404, 'Hart', 'Josh', 'Josh Hart'],
-    [1628392, 'Hartenstein', 'Isaiah', 'Isaiah Hartenstein'],
-    [176, 'Harvey', 'Antonio', 'Antonio Harvey'],
-    [2051, 'Harvey', 'Donnell', 'Donnell Harvey'],
-    [202238, 'Hasbrouck', 'Kenny', 'Kenny Hasbrouck'],
-    [321, 'Haskin', 'Scott', 'Scott Haskin'],
-    [76965, 'Haskins', 'Clem', 'Clem Haskins'],
-    [2617, 'Haslem', 'Udonis', 'Udonis Haslem'],
-    [2239, 'Hassell', 'Trenton', 'Trenton Hassell'],
-    [76967, 'Hassett', 'Billy', 'Billy Hassett'],
-    [76966, 'Hassett', 'Joey', 'Joey Hassett'],
-    [76968, 'Hastings', 'Scott', 'Scott Hastings'],
-    [2213, 'Haston', 'Kirk', 'Kirk Haston'],
-    [76969, 'Hatton', 'Vern', 'Vern Hatton'],
-    [76970, 'Havlicek', 'John', 'John Havlicek'],
-    [201150, 'Hawes', 'Spencer', 'Spencer Hawes'],
-    [76971, 'Hawes', 'Steve', 'Steve Hawes'],
-    [76972, 'Hawkins', 'Connie', 'Connie Hawkins'],
-    [765, 'Hawkins', 'Hersey', 'Hersey Hawkins'],
-    [1038, 'Hawkins', 'Juaquin', 'Juaquin Hawkins'],
-    [76974, 'Hawkins', 'Marshall', 'Marshall Hawkins'],
-    [1138, 'Hawkins', 'Michael', 'Michael Hawkins'],
-    [76975, 'Hawkins', 'Robert', 'Robert Hawkins'],
-    [76977, 'Hawkins', 'Tom', 'Tom Hawkins'],
-    [76978, 'Hawthorne', 'Nate', 'Nate Hawthorne'],
-    [101236, 'Hayes', 'Chuck', 'Chuck Hayes'],
-    [76979, 'Hayes', 'Elvin', 'Elvin Hayes'],
-    [2553, 'Hayes', 'Jarvis', 'Jarvis Hayes'],
-    [1628502, 'Hayes', 'Nigel', 'Nigel Hayes'],
-    [76980, 'Hayes', 'Steve', 'Steve Hayes'],
-    [202330, 'Hayward', 'Gordon', 'Gordon Hayward'],
-    [202351, 'Hayward', 'Lazar', 'Lazar Hayward'],
-    [2217, 'Haywood', 'Brendan', 'Brendan Haywood'],
-    [76981, 'Haywood', 'Spencer', 'Spencer Haywood'],
-    [76982, 'Hazen', 'John W.', 'John W. Hazen'],
-    [76983, 'Hazzard', 'Walt', 'Walt Hazzard'],
-    [101129, 'Head', 'Luther', 'Luther Head'],
-    [1049, 'Heal', 'Shane', 'Shane Heal'],
-    [76984, 'Heaney', 'Brian', 'Brian Heaney'],
-    [76985, 'Heard', 'Garfield', 'Garfield Heard'],
-    [203687, 'Hearn', 'Reggie', 'Reggie Hearn'],
-    [76986, 'Hedderick', 'Herm', 'Herm Hedderick'],
-    [76987, 'Heggs', 'Alvin', 'Alvin Heggs'],
-    [76988, 'Heinsohn', 'Tom', 'Tom Heinsohn'],
-    [76989, 'Hemric', 'Dick', 'Dick Hemric'],
-    [673, 'Henderson', 'Alan', 'Alan Henderson'],
-    [1538, 'Henderson', 'Cedric', 'Cedric Henderson'],
-    [76990, 'Henderson', 'Cedric', 'Cedric Henderson'],
-    [76991, 'Henderson', 'Dave', 'Dave Henderson'],
-    [76993, 'Henderson', 'Gerald', 'Gerald Henderson'],
-    [201945, 'Henderson', 'Gerald', 'Gerald Henderson'],
-    [1764, 'Henderson', 'J.R.', 'J.R. Henderson'],
-    [76992, 'Henderson', 'Jerome', 'Jerome Henderson'],
-    [76994, 'Henderson', 'Kevin', 'Kevin Henderson'],
-    [76996, 'Henderson', 'Tom', 'Tom Henderson'],
-    [971, 'Hendrickson', 'Mark', 'Mark Hendrickson'],
-    [76998, 'Hennessy', 'Larry', 'Larry Hennessy'],
-    [76999, 'Henriksen', 'Don', 'Don Henriksen'],
-    [77000, 'Henry', 'Al', 'Al Henry'],
-    [77004, 'Henry', 'Bill', 'Bill Henry'],
-    [77001, 'Henry', 'Carl', 'Carl Henry'],
-    [77002, 'Henry', 'Conner', 'Conner Henry'],
-    [1627988, 'Henry', 'Myke', 'Myke Henry'],
-    [77003, 'Henry', 'Skeeter', 'Skeeter Henry'],
-    [202333, 'Henry', 'Xavier', 'Xavier Henry'],
-    [203089, 'Henson', 'John', 'John Henson'],
-    [1667, 'Henson', 'Steve', 'Steve Henson'],
-    [77006, 'Herman', 'Bill', 'Bill Herman'],
-    [77007, 'Hermsen', 'Clarence', 'Clarence Hermsen'],
-    [1627823, 'Hernangomez', 'Juancho', 'Juancho Hernangomez'],
-    [1626195, 'Hernangomez', 'Willy', 'Willy Hernangomez'],
-    [1914, 'Herren', 'Chris', 'Chris Herren'],
-    [61, 'Herrera', 'Carl', 'Carl Herrera'],
-    [200835, 'Herrmann', 'Walter', 'Walter Herrmann'],
-    [77010, 'Herron', 'Keith', 'Keith Herron'],
-    [77011, 'Hertzberg', 'Sidney', 'Sidney Hertzberg'],
-    [1628987, 'Hervey', 'Kevin', 'Kevin Hervey'],
-    [77012, 'Hetzel', 'Fred', 'Fred Hetzel'],
-    [77013, 'Hewitt', 'Bill', 'Bill Hewitt'],
-    [77014, 'Hewson', 'Jack', 'Jack Hewson'],
-    [77015, 'Heyman', 'Art', 'Art Heyman'],
-    [1626209, 'Hezonja', 'Mario', 'Mario Hezonja'],
-    [201579, 'Hibbert', 'Roy', 'Roy Hibbert'],
-    [77016, 'Hickey', 'Matthew', 'Matthew Hickey'],
-    [1628439, 'Hicks', 'Isaiah', 'Isaiah Hicks'],
-    [77017, 'Hicks', 'Phil', 'Phil Hicks'],
-    [201581, 'Hickson', 'JJ', 'JJ Hickson'],
-    [1627741, 'Hield', 'Buddy', 'Buddy Hield'],
-    [202809, 'Higgins', 'Cory', 'Cory Higgins'],
-    [1848, 'Higgins', 'Mike', 'Mike Higgins'],
-    [77019, 'Higgins', 'Rod', 'Rod Higgins'],
-    [925, 'Higgins', 'Sean', 'Sean Higgins'],
-    [77021, 'Higgs', 'Kenny', 'Kenny Higgs'],
-    [77022, 'High', 'Johnny', 'Johnny High'],
-    [77023, 'Hightower', 'Wayne', 'Wayne Hightower'],
-    [2403, 'Nene', '', 'Nene'],
-    [77024, 'Hill', 'Armond', 'Armond Hill'],
-    [77025, 'Hill', 'Cleo', 'Cleo Hill'],
-    [77026, 'Hill', 'Gary', 'Gary Hill'],
-    [201588, 'Hill', 'George', 'George Hill'],
-    [255, 'Hill', 'Grant', 'Grant Hill'],
-    [201195, 'Hill', 'Herbert', 'Herbert Hill'],
-    [201941, 'Hill', 'Jordan', 'Jordan Hill'],
-    [203524, 'Hill', 'Solomon', 'Solomon Hill'],
-    [201631, 'Hill', 'Steven', 'Steven Hill'],
-    [238, 'Hill', 'Tyrone', 'Tyrone Hill'],
-    [77027, 'Hillhouse', 'Art', 'Art Hillhouse'],
-    [1626199, 'Hilliard', 'Darrun', 'Darrun Hilliard'],
-    [77028, 'Hillman', 'Darnell', 'Darnell Hillman'],
-    [77029, 'Hilton', 'Fred', 'Fred Hilton'],
-    [2550, 'Hinrich', 'Kirk', 'Kirk Hinrich'],
-    [77030, 'Hinson', 'Roy', 'Roy Hinson'],
-    [77031, 'Hirsch', 'Mel', 'Mel Hirsch'],
-    [77032, 'Hitch', 'Lew', 'Lew Hitch'],
-    [200823, 'Hite', 'Robert', 'Robert Hite'],
-    [202359, 'Hobson', 'Darington', 'Darington Hobson'],
-    [1106, 'Hodge', 'Donald', 'Donald Hodge'],
-    [101125, 'Hodge', 'Julius', 'Julius Hodge'],
-    [77034, 'Hodges', 'Craig', 'Craig Hodges'],
-    [77035, 'Hoefer', 'Adolph', 'Adolph Hoefer'],
-    [77036, 'Hoffman', 'Bear, The Body', 'Bear, The Body Hoffman'],
-    [77037, 'Hogsett', 'Bob', 'Bob Hogsett'],
-    [77038, 'Hogue', 'Paul', 'Paul Hogue'],
-    [697, 'Hoiberg', 'Fred', 'Fred Hoiberg'],
-    [77039, 'Holcomb', 'Doug', 'Doug Holcomb'],
-    [2450, 'Holcomb', 'Randy', 'Randy Holcomb'],
-    [1628988, 'Holiday', 'Aaron', 'Aaron Holiday'],
-    [201950, 'Holiday', 'Jrue', 'Jrue Holiday'],
-    [203200, 'Holiday', 'Justin', 'Justin Holiday'],
-    [77040, 'Holland', 'Brad', 'Brad Holland'],
-    [77041, 'Holland', 'Joe', 'Joe Holland'],
-    [204066, 'Holland', 'John', 'John Holland'],
-    [77042, 'Holland', 'Wilbur', 'Wilbur Holland'],
-    [77043, 'Hollins', 'Lionel', 'Lionel Hollins'],
-    [200797, 'Hollins', 'Ryan', 'Ryan Hollins'],
-    [77044, 'Hollis', 'Essie', 'Essie Hollis'],
-    [1626178, 'Hollis-Jefferson', 'Rondae', 'Rondae Hollis-Jefferson'],
-    [1626158, 'Holmes', 'Richaun', 'Richaun Holmes'],
-    [77045, 'Holstein', 'Jim', 'Jim Holstein'],
-    [77046, 'Holt', 'Alvin', 'Alvin Holt'],
-    [77047, 'Holton', 'Michael', 'Michael Holton'],
-    [77048, 'Holub', 'Dick', 'Dick Holub'],
-    [77049, 'Holup', 'Joe', 'Joe Holup'],
-    [77050, 'Holzman', 'Red', 'Red Holzman'],
-    [1532, 'Honeycutt', 'Jerald', 'Jerald Honeycutt'],
-    [202715, 'Honeycutt', 'Tyler', 'Tyler Honeycutt'],
-    [1967, 'Hood', 'Derek', 'Derek Hood'],
-    [203918, 'Hood', 'Rodney', 'Rodney Hood'],
-    [77051, 'Hoover', 'Tom', 'Tom Hoover'],
-    [77052, 'Hopkins', 'Bob', 'Bob Hopkins'],
-    [77053, 'Hoppen', 'Dave', 'Dave Hoppen'],
-    [77054, 'Hopson', 'Dennis', 'Dennis Hopson'],
-    [203816, 'Hopson', 'Scotty', 'Scotty Hopson'],
-    [77055, 'Horan', 'Johnny', 'Johnny Horan'],
-    [77056, 'Hordges', 'Cedrick', 'Cedrick Hordges'],
-    [201143, 'Horford', 'Al', 'Al Horford'],
-    [77057, 'Horford', 'Tito', 'Tito Horford'],
-    [77058, 'Horn', 'Ron', 'Ron Horn'],
-    [204, 'Hornacek', 'Jeff', 'Jeff Hornacek'],
-    [202862, 'Horner', 'Dennis', 'Dennis Horner'],
-    [109, 'Horry', 'Robert', 'Robert Horry'],
-    [77060, 'Horton', 'Ed', 'Ed Horton'],
-    [77061, 'Hosket', 'Wilmer', 'Wilmer Hosket'],
-    [77062, 'Houbregs', 'Bob', 'Bob Houbregs'],
-    [1627863, 'House', 'Danuel', 'Danuel House'],
-    [2067, 'House', 'Eddie', 'Eddie House'],
-    [275, 'Houston', 'Allan', 'Allan Houston'],
-    [780, 'Houston', 'Byron', 'Byron Houston'],
-    [77064, 'Hovasse', 'Tom', 'Tom Hovasse'],
-    [77065, 'Howard', 'Brian', 'Brian Howard'],
-    [2730, 'Howard', 'Dwight', 'Dwight Howard'],
-    [77066, 'Howard', 'Greg', 'Greg Howard'],
-    [2572, 'Howard', 'Josh', 'Josh Howard'],
-    [436, 'Howard', 'Juwan', 'Juwan Howard'],
-    [77067, 'Howard', 'Mo', 'Mo Howard'],
-    [77069, 'Howard', 'Otis', 'Otis Howard'],
-    [1128, 'Howard', 'Stephen', 'Stephen Howard'],
-    [77070, 'Howell', 'Bailey', 'Bailey Howell'],
-    [77072, 'Hubbard', 'Bob', 'Bob Hubbard'],
-    [77071, 'Hubbard', 'Phil', 'Phil Hubbard'],
-    [201991, 'Hudson', 'Lester', 'Lester Hudson'],
-    [77074, 'Hudson', 'Lou', 'Lou Hudson'],
-    [1607, 'Hudson', 'Troy', 'Troy Hudson'],
-    [1626273, 'Huertas', 'Marcelo', 'Marcelo Huertas'],
-    [1628989, 'Huerter', 'Kevin', 'Kevin Huerter'],
-    [203962, 'Huestis', 'Josh', 'Josh Huestis'],
-    [1572, 'Huffman', 'Nate', 'Nate Huffman'],
-    [77076, 'Hughes', 'Alfredrick', 'Alfredrick Hughes'],
-    [77077, 'Hughes', 'Eddie', 'Eddie Hughes'],
-    [77078, 'Hughes', 'Kim', 'Kim Hughes'],
-    [1716, 'Hughes', 'Larry', 'Larry Hughes'],
-    [1965, 'Hughes', 'Rick', 'Rick Hughes'],
-    [203133, 'Hummel', 'Robbie', 'Robbie Hummel'],
-    [77080, 'Hummer', 'John', 'John Hummer'],
-    [2415, 'Humphrey', 'Ryan', 'Ryan Humphrey'],
-    [77081, 'Humphries', 'Jay', 'Jay Humphries'],
-    [2743, 'Humphries', 'Kris', 'Kris Humphries'],
-    [77082, 'Hundley', 'Rod', 'Rod Hundley'],
-    [2599, 'Hunter', 'Brandon', 'Brandon Hunter'],
-    [77083, 'Hunter', 'Cedric', 'Cedric Hunter'],
-    [201805, 'Hunter', 'Chris', 'Chris Hunter'],
-    [77084, 'Hunter', 'Les', 'Les Hunter'],
-    [283, 'Hunter', 'Lindsey', 'Lindsey Hunter'],
-    [201629, 'Hunter', 'Othello', 'Othello Hunter'],
-    [1626154, 'Hunter', 'RJ', 'RJ Hunter'],
-    [2212, 'Hunter', 'Steven', 'Steven Hunter'],
-    [1626205, 'Hunter', 'Vincent', 'Vincent Hunter'],
-    [310, 'Hurley', 'Bobby', 'Bobby Hurley'],
-    [77086, 'Hurley', 'Roy', 'Roy Hurley'],
-    [77087, 'Huston', 'Geoff', 'Geoff Huston'],
-    [77088, 'Huston', 'Paul', 'Paul Huston'],
-    [77089, 'Hutchins', 'Mel', 'Mel Hutchins'],
-    [1628990, 'Hutchison', 'Chandler', 'Chandler Hutchison'],
-    [77090, 'Hutton', 'Joe', 'Joe Hutton'],
-    [77091, 'Hyder', 'Greg', 'Greg Hyder'],
-    [77092, 'Iavaroni', 'Marc', 'Marc Iavaroni'],
-    [201586, 'Ibaka', 'Serge', 'Serge Ibaka'],
-    [2738, 'Iguodala', 'Andre', 'Andre Iguodala'],
-    [980, 'Ilgauskas', 'Zydrunas', 'Zydrunas Ilgauskas'],
-    [101148, 'Ilic', 'Mile', 'Mile Ilic'],
-    [101141, 'Ilyasova', 'Ersan', 'Ersan Ilyasova'],
-    [77093, 'Imhoff', 'Darrall', 'Darrall Imhoff'],
-    [77094, 'Ingelsby', 'Tom', 'Tom Ingelsby'],
-    [204060, 'Ingles', 'Joe', 'Joe Ingles'],
-    [203996, 'Inglis', 'Damien', 'Damien Inglis'],
-    [201281, 'Ingram', 'Andre', 'Andre Ingram'],
-    [1627742, 'Ingram', 'Brandon', 'Brandon Ingram'],
-    [77095, 'Ingram', 'Joel', 'Joel Ingram'],
-    [77096, 'Irvin', 'Byron', 'Byron Irvin'],
-    [202681, 'Irving', 'Kyrie', 'Kyrie Irving'],
-    [1628371, 'Isaac', 'Jonathan', 'Jonathan Isaac'],
-    [77097, 'Issel', 'Dan', 'Dan Issel'],
-    [77098, 'Iuzzolino', 'Mike', 'Mike Iuzzolino'],
-    [947, 'Iverson', 'Allen', 'Allen Iverson'],
-    [2767, 'Ivey', 'Royal', 'Royal Ivey'],
-    [1628411, 'Iwundu', 'Wes', 'Wes Iwundu'],
-    [101127, 'Jack', 'Jarrett', 'Jarrett Jack'],
-    [1628935, 'Jackson', 'Aaron', 'Aaron Jackson'],
-    [77099, 'Jackson', 'Al', 'Al Jackson'],
-    [1517, 'Jackson', 'Bobby', 'Bobby Jackson'],
-    [202132, 'Jackson', 'Cedric', 'Cedric Jackson'],
-    [201616, 'Jackson', 'Darnell', 'Darnell Jackson'],
-    [1627743, 'Jackson', 'Demetrius', 'Demetrius Jackson'],
-    [1628402, 'Jackson', 'Frank', 'Frank Jackson'],
-    [77101, 'Jackson', 'Greg', 'Greg Jackson'],
-    [1114, 'Jackson', 'Jaren', 'Jaren Jackson'],
-    [1983, 'Jackson', 'Jermaine', 'Jermaine Jackson'],
-    [754, 'Jackson', 'Jim', 'Jim Jackson'],
-    [1628367, 'Jackson', 'Josh', 'Josh Jackson'],
-    [1628382, 'Jackson', 'Justin', 'Justin Jackson'],
-    [1628992, 'Jackson', 'Justin', 'Justin Jackson'],
-    [77103, 'Jackson', 'Lucious', 'Lucious Jackson'],
-    [2739, 'Jackson', 'Luke', 'Luke Jackson'],
-    [1531, 'Jackson', 'Marc', 'Marc Jackson'],
-    [349, 'Jackson', 'Mark', 'Mark Jackson'],
-    [77104, 'Jackson', 'Michael', 'Michael Jackson'],
-    [77105, 'Jackson', 'Myron', 'Myron Jackson'],
-    [77106, 'Jackson', 'Phil', 'Phil Jackson'],
-    [203510, 'Jackson', 'Pierre', 'Pierre Jackson'],
-    [77107, 'Jackson', 'Ralph', 'Ralph Jackson'],
-    [1872, 'Jackson', 'Randell', 'Randell Jackson'],
-    [202704, 'Jackson', 'Reggie', 'Reggie Jackson'],
-    [77109, 'Jackson', 'Stanley', 'Stanley Jackson'],
-    [1536, 'Jackson', 'Stephen', 'Stephen Jackson'],
-    [77100, 'Jackson', 'Tony', 'Tony Jackson'],
-    [77110, 'Jackson', 'Tracy', 'Tracy Jackson'],
-    [77111, 'Jackson', 'Wardell', 'Wardell Jackson'],
-    [1628991, 'Jackson Jr.', 'Jaren', 'Jaren Jackson Jr.'],
-    [77112, 'Jacobs', 'Winfred', 'Winfred Jacobs'],
-    [2418, 'Jacobsen', 'Casey', 'Casey Jacobsen'],
-    [1734, 'Jacobson', 'Sam', 'Sam Jacobson'],
-    [77114, 'Jamerson', 'Dave', 'Dave Jamerson'],
-    [77115, 'James', 'Aaron', 'Aaron James'],
-    [203108, 'James', 'Bernard', 'Bernard James'],
-    [202345, 'James', 'Damion', 'Damion James'],
-    [77116, 'James', 'Gene', 'Gene James'],
-    [1080, 'James', 'Henry', 'Henry James'],
-    [1744, 'James', 'Jerome', 'Jerome James'],
-    [2544, 'James', 'LeBron', 'LeBron James'],
-    [2229, 'James', 'Mike', 'Mike James'],
-    [1628455, 'James', 'Mike', 'Mike James'],
-    [1906, 'James', 'Tim', 'Tim James'],
-    [1712, 'Jamison', 'Antawn', 'Antawn Jamison'],
-    [1942, 'Jamison', 'Harold', 'Harold Jamison'],
-    [77120, 'Janisch', 'John', 'John Janisch'],
-    [77122, 'Janotta', 'Howie', 'Howie Janotta'],
-    [2060, 'Jaric', 'Marko', 'Marko Jaric'],
-    [77123, 'Jaros', 'Tony', 'Tony Jaros'],
-    [101180, 'Jasikevicius', 'Sarunas', 'Sarunas Jasikevicius'],
-    [201605, 'Jawai', 'Nathan', 'Nathan Jawai'],
-    [77125, 'Jeannette', 'Buddy', 'Buddy Jeannette'],
-    [77126, 'Jeelani', 'Abdul', 'Abdul Jeelani'],
-    [2423, 'Jefferies', 'Chris', 'Chris Jefferies'],
-    [201785, 'Jeffers', 'Othyus', 'Othyus Jeffers'],
-    [2744, 'Jefferson', 'Al', 'Al Jefferson'],
-    [1628518, 'Jefferson', 'Amile', 'Amile Jefferson'],
-    [203928, 'Jefferson', 'Cory', 'Cory Jefferson'],
-    [200971, 'Jefferson', 'Dontell', 'Dontell Jefferson'],
-    [2210, 'Jefferson', 'Richard', 'Richard Jefferson'],
-    [2407, 'Jeffries', 'Jared', 'Jared Jeffries'],
-    [202724, 'Jenkins', 'Charles', 'Charles Jenkins'],
-    [2798, 'Jenkins', 'Horace', 'Horace Jenkins'],
-    [203098, 'Jenkins', 'John', 'John Jenkins'],
-    [201943, 'Jennings', 'Brandon', 'Brandon Jennings'],
-    [24, 'Jennings', 'Keith', 'Keith Jennings'],
-    [1137, 'Jent', 'Chris', 'Chris Jent'],
-    [77129, 'Jepsen', 'Les', 'Les Jepsen'],
-    [201973, 'Jerebko', 'Jonas', 'Jonas Jerebko'],
-    [201998, 'Jerrells', 'Curtis', 'Curtis Jerrells'],
-    [203511, 'Jerrett', 'Grant', 'Grant Jerrett'],
-    [200817, 'Jeter', 'Pooh', 'Pooh Jeter'],
-    [2639, 'Johnsen', 'Britton', 'Britton Johnsen'],
-    [200792, 'Johnson', 'Alexander', 'Alexander Johnson'],
-    [1628993, 'Johnson', 'Alize', 'Alize Johnson'],
-    [101161, 'Johnson', 'Amir', 'Amir Johnson'],
-    [77131, 'Johnson', 'Andy', 'Andy Johnson'],
-    [1533, 'Johnson', 'Anthony', 'Anthony Johnson'],
-    [202356, 'Johnson', 'Armon', 'Armon Johnson'],
-    [77132, 'Johnson', 'Arnie', 'Arnie Johnson'],
-    [422, 'Johnson', 'Avery', 'Avery Johnson'],
-    [1627744, 'Johnson', 'Brice', 'Brice Johnson'],
-    [77130, 'Johnson', 'Buck', 'Buck Johnson'],
-    [201291, 'Johnson', 'Carldell', 'Carldell Johnson'],
-    [77133, 'Johnson', 'Charlie', 'Charlie Johnson'],
-    [202419, 'Johnson', 'Chris', 'Chris Johnson'],
-    [203187, 'Johnson', 'Chris', 'Chris Johnson'],
-    [77135, 'Johnson', 'Clay', 'Clay Johnson'],
-    [77136, 'Johnson', 'Clemon', 'Clemon Johnson'],
-    [1626177, 'Johnson', 'Dakari', 'Dakari Johnson'],
-    [683, 'Johnson', 'Darryl', 'Darryl Johnson'],
-    [77138, 'Johnson', 'Dave', 'Dave Johnson'],
-    [77139, 'Johnson', 'David', 'David Johnson'],
-    [1746, 'Johnson', 'DeMarco', 'DeMarco Johnson'],
-    [77141, 'Johnson', 'Dennis', 'Dennis Johnson'],
-    [2035, 'Johnson', 'DerMarr', 'DerMarr Johnson'],
-    [698, 'Johnson', 'Eddie', 'Eddie Johnson'],
-    [77144, 'Johnson', 'Eddie', 'Eddie Johnson'],
-    [77145, 'Johnson', 'Eric', 'Eric Johnson'],
-    [911, 'Johnson', 'Ervin', 'Ervin Johnson'],
-    [77146, 'Johnson', 'Frank', 'Frank Johnson'],
-    [77147, 'Johnson', 'George', 'George Johnson'],
-    [77148, 'Johnson', 'George', 'George Johnson'],
-    [77149, 'Johnson', 'George', 'George Johnson'],
-    [77150, 'Johnson', 'Gus', 'Gus Johnson'],
-    [77151, 'Johnson', 'Harold', 'Harold Johnson'],
-    [201274, 'Johnson', 'Ivan', 'Ivan Johnson'],
-    [202707, 'Johnson', 'JaJuan', 'JaJuan Johnson'],
-    [201949, 'Johnson', 'James', 'James Johnson'],
-    [2207, 'Johnson', 'Joe', 'Joe Johnson'],
-    [77152, 'Johnson', 'John', 'John Johnson'],
-    [77153, 'Johnson', 'Kannard', 'Kannard Johnson'],
-    [2256, 'Johnson', 'Ken', 'Ken Johnson'],
-    [77154, 'Johnson', 'Ken', 'Ken Johnson'],
-    [134, 'Johnson', 'Kevin', 'Kevin Johnson'],
-    [913, 'Johnson', 'Larry', 'Larry Johnson'],
-    [77156, 'Johnson', 'Larry', 'Larry Johnson'],
-    [77158, 'Johnson', 'Lee', 'Lee Johnson'],
-    [2669, 'Johnson', 'Linton', 'Linton Johnson'],
-    [77159, 'Johnson', 'Lynbert', 'Lynbert Johnson'],
-    [77142, 'Johnson', 'Magic', 'Magic Johnson'],
-    [77160, 'Johnson', 'Marques', 'Marques Johnson'],
-    [77168, 'Johnson', 'Mickey', 'Mickey Johnson'],
-    [77161, 'Johnson', 'Neil', 'Neil Johnson'],
-    [203910, 'Johnson', 'Nick', 'Nick Johnson'],
-    [77162, 'Johnson', 'Ollie', 'Ollie Johnson'],
-    [204179, 'Johnson', 'Omari', 'Omari Johnson'],
-    [203111, 'Johnson', 'Orlando', 'Orlando Johnson'],
-    [77163, 'Johnson', 'Reggie', 'Reggie Johnson'],
-    [77164, 'Johnson', 'Rich', 'Rich Johnson'],
-    [77165, 'Johnson', 'Ron', 'Ron Johnson'],
-    [1626169, 'Johnson', 'Stanley', 'Stanley Johnson'],
-    [77166, 'Johnson', 'Steffond', 'Steffond Johnson'],
-    [77134, 'Johnson', 'Steve', 'Steve Johnson'],
-    [201234, 'Johnson', 'Trey', 'Trey Johnson'],
-    [204020, 'Johnson', 'Tyler', 'Tyler Johnson'],
-    [77167, 'Johnson', 'Vinnie', 'Vinnie Johnson'],
-    [202325, 'Johnson', 'Wesley', 'Wesley Johnson'],
-    [203130, 'Johnson-Odom', 'Darius', 'Darius Johnson-Odom'],
-    [77170, 'Johnston', 'Nate', 'Nate Johnston'],
-    [77169, 'Johnston', 'Neil', 'Neil Johnston'],
-    [77171, 'Johnstone', 'Jim', 'Jim Johnstone'],
-    [203999, 'Jokic', 'Nikola', 'Nikola Jokic'],
-    [77172, 'Jolliff', 'Howie', 'Howie Jolliff'],
-    [2264, 'Jones', 'Alvin', 'Alvin Jones'],
-    [77173, 'Jones', 'Anthony', 'Anthony Jones'],
-    [77174, 'Jones', 'Askia', 'Askia Jones'],
-    [77180, 'Jones', 'Bill', 'Bill Jones'],
-    [77193, 'Jones', 'Bobby', 'Bobby Jones'],
-    [200784, 'Jones', 'Bobby', 'Bobby Jones'],
-    [77175, 'Jones', 'Caldwell', 'Caldwell Jones'],
-    [279, 'Jones', 'Charles', 'Charles Jones'],
-    [77178, 'Jones', 'Charles', 'Charles Jones'],
-    [1869, 'Jones', 'Charles R.', 'Charles R. Jones'],
-    [2563, 'Jones', 'Dahntay', 'Dahntay Jones'],
-    [1627745, 'Jones', 'Damian', 'Damian Jones'],
-    [1800, 'Jones', 'Damon', 'Damon Jones'],
-    [203199, 'Jones', 'DeQuan', 'DeQuan Jones'],
-    [202346, 'Jones', 'Dominique', 'Dominique Jones'],
-    [963, 'Jones', "Dontae'", "Dontae' Jones"],
-    [101204, 'Jones', 'Dwayne', 'Dwayne Jones'],
-    [77182, 'Jones', 'Dwight', 'Dwight Jones'],
-    [77183, 'Jones', 'Earl', 'Earl Jones'],
-    [224, 'Jones', 'Eddie', 'Eddie Jones'],
-    [77184, 'Jones', 'Edgar', 'Edgar Jones'],
-    [2410, 'Jones', 'Fred', 'Fred Jones'],
-    [77185, 'Jones', 'Jake', 'Jake Jones'],
-    [1627883, 'Jones', 'Jalen', 'Jalen Jones'],
-    [2592, 'Jones', 'James', 'James Jones'],
-    [77186, 'Jones', 'Jimmy', 'Jimmy Jones'],
-    [77187, 'Jones', 'Johnny', 'Johnny Jones'],
-    [1908, 'Jones', 'Jumaine', 'Jumaine Jones'],
-    [77188, 'Jones', 'K.C.', 'K.C. Jones'],
-    [203158, 'Jones', 'Kevin', 'Kevin Jones'],
-    [77200, 'Jones', 'Larry', 'Larry Jones'],
-    [77189, 'Jones', 'Major', 'Major Jones'],
-    [2891, 'Jones', 'Mark', 'Mark Jones'],
-    [90000, 'Jones', 'Mark', 'Mark Jones'],
-    [77195, 'Jones', 'Nick', 'Nick Jones'],
-    [77191, 'Jones', 'Ozell', 'Ozell Jones'],
-    [461, 'Jones', 'Popeye', 'Popeye Jones'],
-    [77192, 'Jones', 'Rich', 'Rich Jones'],
-    [77194, 'Jones', 'Robin', 'Robin Jones'],
-    [77196, 'Jones', 'Sam', 'Sam Jones'],
-    [2652, 'Jones', 'Shelton', 'Shelton Jones'],
-    [200780, 'Jones', 'Solomon', 'Solomon Jones'],
-    [77197, 'Jones', 'Steve', 'Steve Jones'],
-    [203093, 'Jones', 'Terrence', 'Terrence Jones'],
-    [1626145, 'Jones', 'Tyus', 'Tyus Jones'],
-    [77198, 'Jones', 'Wali', 'Wali Jones'],
-    [77199, 'Jones', 'Wallace', 'Wallace Jones'],
-    [77201, 'Jones', 'Wil', 'Wil Jones'],
-    [77202, 'Jones', 'Willie', 'Willie Jones'],
-    [77203, 'Jones', 'Willie', 'Willie Jones'],
-    [203103, 'Jones III', 'Perry', 'Perry Jones III'],
-    [1627884, 'Jones Jr.', 'Derrick', 'Derrick Jones Jr.'],
-    [1817, 'Jordan', 'Adonis', 'Adonis Jordan'],
-    [201599, 'Jordan', 'DeAndre', 'DeAndre Jordan'],
-    [77205, 'Jordan', 'Eddie', 'Eddie Jordan'],
-    [202366, 'Jordan', 'Jerome', 'Jerome Jordan'],
-    [893, 'Jordan', 'Michael', 'Michael Jordan'],
-    [674, 'Jordan', 'Reggie', 'Reggie Jordan'],
-    [77208, 'Jordan', 'Thomas', 'Thomas Jordan'],
-    [77209, 'Jordan', 'Walter', 'Walter Jordan'],
-    [77210, 'Jordon', 'Phil', 'Phil Jordon'],
-    [77211, 'Jorgensen', 'Johnny', 'Johnny Jorgensen'],
-    [77212, 'Jorgensen', 'Noble', 'Noble Jorgensen'],
-    [77213, 'Jorgensen', 'Roger', 'Roger Jorgensen'],
-    [202709, 'Joseph', 'Cory', 'Cory Joseph'],
-    [2123, 'Joseph', 'Garth', 'Garth Joseph'],
-    [203126, 'Joseph', 'Kris', 'Kris Joseph'],
-    [77214, 'Joseph', 'Yvon', 'Yvon Joseph'],
-    [77215, 'Judkins', 'Jeff', 'Jeff Judkins'],
-    [77217, 'Kachan', 'Edwin', 'Edwin Kachan'],
-    [77218, 'Kaftan', 'George', 'George Kaftan'],
-    [77219, 'Kalafat', 'Ed', 'Ed Kalafat'],
-    [2549, 'Kaman', 'Chris', 'Chris Kaman'],
-    [1626163, 'Kaminsky', 'Frank', 'Frank Kaminsky'],
-    [202683, 'Kanter', 'Enes', 'Enes Kanter'],
-    [77221, 'Kaplowitz', 'Ralph', 'Ralph Kaplowitz'],
-    [2574, 'Kapono', 'Jason', 'Jason Kapono'],
-    [77222, 'Kappen', 'Tony', 'Tony Kappen'],
-    [203508, 'Karasev', 'Sergey', 'Sergey Karasev'],
-    [201207, 'Karl', 'Coby', 'Coby Karl'],
-    [77223, 'Karl', 'George', 'George Karl'],
-    [77225, 'Kasid', 'Ed', 'Ed Kasid'],
-    [2435, 'Kasun', 'Mario', 'Mario Kasun'],
-    [77226, 'Katkaveck', 'Leo', 'Leo Katkaveck'],
-    [77227, 'Kauffman', 'Bob', 'Bob Kauffman'],
-    [201619, 'Kaun', 'Sasha', 'Sasha Kaun'],
-    [77228, 'Kautz', 'Wilbert', 'Wilbert Kautz'],
-    [77229, 'Kea', 'Clarence', 'Clarence Kea'],
-    [77230, 'Kearns', 'Michael', 'Michael Kearns'],
-    [77231, 'Kearns', 'Tommy', 'Tommy Kearns'],
-    [228, 'Keefe', 'Adam', 'Adam Keefe'],
-    [77233, 'Keeling', 'Harold', 'Harold Keeling'],
-    [77234, 'Keller', 'Ken', 'Ken Keller'],
-    [77235, 'Kelley', 'Rich', 'Rich Kelley'],
-    [77236, 'Kellogg', 'Clark', 'Clark Kellogg'],
-    [77237, 'Kelly', 'Gerard', 'Gerard Kelly'],
-    [203527, 'Kelly', 'Ryan', 'Ryan Kelly'],
-    [77238, 'Kelly', 'Tom', 'Tom Kelly'],
-    [77239, 'Kelser', 'Greg', 'Greg Kelser'],
-    [77240, 'Kelso', 'Ben', 'Ben Kelso'],
-    [431, 'Kemp', 'Shawn', 'Shawn Kemp'],
-    [1118, 'Kempton', 'Tim', 'Tim Kempton'],
-    [77242, 'Kendrick', 'Frank', 'Frank Kendrick'],
-    [1628379, 'Kennard', 'Luke', 'Luke Kennard'],
-    [202810, 'Kennedy', 'D.J.', 'D.J. Kennedy'],
-    [77243, 'Kennedy', 'Eugene', 'Eugene Kennedy'],
-    [77244, 'Kennedy', 'Joe', 'Joe Kennedy'],
-    [77245, 'Kennedy', 'William', 'William Kennedy'],
-    [77246, 'Kenon', 'Larry', 'Larry Kenon'],
-    [77247, 'Kenville', 'Bill', 'Bill Kenville'],
-    [1801, 'Kerner', 'Jonathan', 'Jonathan Kerner'],
-    [77248, 'Kerr', 'Johnny', 'Johnny Kerr'],
-    [70, 'Kerr', 'Steve', 'Steve Kerr'],
-    [77249, 'Kerris', 'Jack', 'Jack Kerris'],
-    [760, 'Kersey', 'Jerome', 'Jerome Kersey'],
-    [77251, 'Kessler', 'Alec', 'Alec Kessler'],
-    [1930, 'Ketner', 'Lari', 'Lari Ketner'],
-    [705, 'Keys', 'Randolph', 'Randolph Keys'],
-    [2751, 'Khryapa', 'Viktor', 'Viktor Khryapa'],
-    [467, 'Kidd', 'Jason', 'Jason Kidd'],
-    [77254, 'Kidd', 'Warren', 'Warren Kidd'],
-    [203077, 'Kidd-Gilchrist', 'Michael', 'Michael Kidd-Gilchrist'],
-    [77255, 'Kiffin', 'Irv', 'Irv Kiffin'],
-    [77256, 'Kiley', 'Jack', 'Jack Kiley'],
-    [77257, 'Killum', 'Ernie', 'Ernie Killum'],
-    [77258, 'Kilpatrick', 'Carl', 'Carl Kilpatrick'],
-    [203930, 'Kilpatrick', 'Sean', 'Sean Kilpatrick'],
-    [77259, 'Kimball', 'Toby', 'Toby Kimball'],
-    [77260, 'Kimble', 'Bo', 'Bo Kimble'],
-    [77261, 'Kimbrough', 'Stan', 'Stan Kimbrough'],
-    [77262, 'Kinch', 'Chad', 'Chad Kinch'],
-    [77263, 'King', 'Albert', 'Albert King'],
-    [77264, 'King', 'Bernard', 'Bernard King'],
-    [12, 'King', 'Chris', 'Chris King'],
-    [77266, 'King', 'Dan', 'Dan King'],
-    [701, 'King', 'Frankie', 'Frankie King'],
-    [77268, 'King', 'George', 'George King'],
-    [1628994, 'King', 'George', 'George King'],
-    [1562, 'King', 'Gerard', 'Gerard King'],
-    [77270, 'King', 'Jim', 'Jim King'],
-    [728, 'King', 'Jimmy', 'Jimmy King'],
-    [77272, 'King', 'Maury', 'Maury King'],
-    [77273, 'King', 'Reggie', 'Reggie King'],
-    [1101, 'King', 'Rich', 'Rich King'],
-    [351, 'King', 'Stacey', 'Stacey King'],
-    [77276, 'King', 'Tom', 'Tom King'],
-    [77277, 'Kinney', 'Bob', 'Bob Kinney'],
-    [200814, 'Kinsey', 'Tarence', 'Tarence Kinsey'],
-    [1905, 'Kirilenko', 'Andrei', 'Andrei Kirilenko'],
-    [203945, 'Kirk', 'Alex', 'Alex Kirk'],
-    [77278, 'Kirk', 'Walt', 'Walt Kirk'],
-    [77279, 'Kistler', 'Doug', 'Doug Kistler'],
-    [77280, 'Kitchen', 'Curtis', 'Curtis Kitchen'],
-    [1123, 'Kite', 'Greg', 'Greg Kite'],
-    [954, 'Kittles', 'Kerry', 'Kerry Kittles'],
-    [1628467, 'Kleber', 'Maxi', 'Maxi Kleber'],
-    [170, 'Kleine', 'Joe', 'Joe Kleine'],
-    [101132, 'Kleiza', 'Linas', 'Linas Kleiza'],
-    [77283, 'Klier', 'Leo', 'Leo Klier'],
-    [77284, 'Klotz', 'Herm', 'Herm Klotz'],
-    [77285, 'Klueh', 'Duane', 'Duane Klueh'],
-    [77290, 'Knight', 'Billy', 'Billy Knight'],
-    [77287, 'Knight', 'Bob', 'Bob Knight'],
-    [2688, 'Knight', 'Brandin', 'Brandin Knight'],
-    [202688, 'Knight', 'Brandon', 'Brandon Knight'],
-    [1510, 'Knight', 'Brevin', 'Brevin Knight'],
-    [1861, 'Knight', 'Negele', 'Negele Knight'],
-    [77288, 'Knight', 'Ron', 'Ron Knight'],
-    [77289, 'Knight', 'Toby', 'Toby Knight'],
-    [969, 'Knight', 'Travis', 'Travis Knight'],
-    [77291, 'Knorek', 'Lee', 'Lee Knorek'],
-    [77292, 'Knostman', 'Dick', 'Dick Knostman'],
-    [77293, 'Knowles', 'Rod', 'Rod Knowles'],
-    [1628995, 'Knox', 'Kevin', 'Kevin Knox'],
-    [77294, 'Kofoed', 'Bart', 'Bart Kofoed'],
-    [77295, 'Kojis', 'Don', 'Don Kojis'],
-    [77296, 'Komenich', 'Milo', 'Milo Komenich'],
-    [77297, 'Komives', 'Howard', 'Howard Komives'],
-    [402, 'Koncak', 'Jon', 'Jon Koncak'],
-    [77299, 'Koper', 'Bud', 'Bud Koper'],
-    [77300, 'Kopicki', 'Joe', 'Joe Kopicki'],
-    [1627788, 'Korkmaz', 'Furkan', 'Furkan Korkmaz'],
-    [77301, 'Kornet', 'Frank', 'Frank Kornet'],
-    [1628436, 'Kornet', 'Luke', 'Luke Kornet'],
-    [101117, 'Korolev', 'Yaroslav', 'Yaroslav Korolev'],
-    [2594, 'Korver', 'Kyle', 'Kyle Korver'],
-    [77302, 'Kosmalski', 'Len', 'Len Kosmalski'],
-    [77303, 'Kostecka', 'Andy', 'Andy Kostecka'],
-    [77304, 'Kottman', 'Harold', 'Harold Kottman'],
-    [201585, 'Koufos', 'Kosta', 'Kosta Koufos'],
-    [77305, 'Kozelko', 'Tom', 'Tom Kozelko'],
-    [77306, 'Kramer', 'Arvid', 'Arvid Kramer'],
-    [77307, 'Kramer', 'Barry', 'Barry Kramer'],
-    [77308, 'Kramer', 'Joel', 'Joel Kramer'],
-    [77309, 'Kraus', 'Dan', 'Dan Kraus'],
-    [77310, 'Krautblatt', 'Herb', 'Herb Krautblatt'],
-    [203139, 'Kravtsov', 'Viacheslav', 'Viacheslav Kravtsov'],
-    [77311, 'Krebs', 'Jim', 'Jim Krebs'],
-    [77312, 'Kreklow', 'Wayne', 'Wayne Kreklow'],
-    [77313, 'Kron', 'Tom', 'Tom Kron'],
-    [77314, 'Kropp', 'Tom', 'Tom Kropp'],
-    [2420, 'Krstic', 'Nenad', 'Nenad Krstic'],
-    [1474, 'Krystkowiak', 'Larry', 'Larry Krystkowiak'],
-    [77316, 'Kuberski', 'Steve', 'Steve Kuberski'],
-    [77317, 'Kubiak', 'Leo', 'Leo Kubiak'],
-    [77318, 'Kuczenski', 'Bruce', 'Bruce Kuczenski'],
-    [77319, 'Kudelka', 'Frank', 'Frank Kudelka'],
-    [77320, 'Kuester', 'John', 'John Kuester'],
-    [77322, 'Kuka', 'Ray', 'Ray Kuka'],
-    [389, 'Kukoc', 'Toni', 'Toni Kukoc'],
-    [1629083, 'Kulboka', 'Arnoldas', 'Arnoldas Kulboka'],
-    [77323, 'Kunnert', 'Kevin', 'Kevin Kunnert'],
-    [77324, 'Kupchak', 'Mitch', 'Mitch Kupchak'],
-    [77325, 'Kupec', 'Charles', 'Charles Kupec'],
-    [1629066, 'Kurucs', 'Rodions', 'Rodions Kurucs'],
-    [201633, 'Kurz', 'Rob', 'Rob Kurz'],
-    [2825, 'Kutluay', 'Ibrahim', 'Ibrahim Kutluay'],
-    [1628398, 'Kuzma', 'Kyle', 'Kyle Kuzma'],
-    [203136, 'Kuzmic', 'Ognjen', 'Ognjen Kuzmic'],
-    [1627851, 'Kuzminskas', 'Mindaugas', 'Mindaugas Kuzminskas'],
-    [77327, 'LaCour', 'Fred', 'Fred LaCour'],
-    [1711, 'LaFrentz', 'Raef', 'Raef LaFrentz'],
-    [77328, 'LaGarde', 'Tom', 'Tom LaGarde'],
-    [1601, 'LaRue', 'Rusty', 'Rusty LaRue'],
-    [77340, 'LaRusso', 'Rudy', 'Rudy LaRusso'],
-    [203897, 'LaVine', 'Zach', 'Zach LaVine'],
-    [1627746, 'Labissiere', 'Skal', 'Skal Labissiere'],
-    [77326, 'Lacey', 'Sam', 'Sam Lacey'],
-    [363, 'Laettner', 'Christian', 'Christian Laettner'],
-    [201802, 'Lafayette', 'Oliver', 'Oliver Lafayette'],
-    [100263, 'Laimbeer', 'Bill', 'Bill Laimbeer'],
-    [77329, 'Lalich', 'Pete', 'Pete Lalich'],
-    [77330, 'Lamar', 'Bo', 'Bo Lamar'],
-    [203117, 'Lamb', 'Doron', 'Doron Lamb'],
-    [203087, 'Lamb', 'Jeremy', 'Jeremy Lamb'],
-    [77331, 'Lambert', 'John', 'John Lambert'],
-    [77332, 'Lamp', 'Jeff', 'Jeff Lamp'],
-    [2573, 'Lampe', 'Maciej', 'Maciej Lampe'],
-    [77333, 'Lampley', 'Jim', 'Jim Lampley'],
-    [2253, 'Lampley', 'Sean', 'Sean Lampley'],
-    [201171, 'Landry', 'Carl', 'Carl Landry'],
-    [202068, 'Landry', 'Marcus', 'Marcus Landry'],
-    [77334, 'Landsberger', 'Mark', 'Mark Landsberger'],
-    [77335, 'Lane', 'Jerome', 'Jerome Lane'],
-    [457, 'Lang', 'Andrew', 'Andrew Lang'],
-    [226, 'Lang', 'Antonio', 'Antonio Lang'],
-    [2591, 'Lang', 'James', 'James Lang'],
-    [1892, 'Langdon', 'Trajan', 'Trajan Langdon'],
-    [101247, 'Langford', 'Keith', 'Keith Langford'],
-    [2061, 'Langhi', 'Dan', 'Dan Langhi'],
-    [600005, 'Lanier', 'Bob', 'Bob Lanier'],
-    [77338, 'Lantz', 'Stu', 'Stu Lantz'],
-    [1627879, 'Laprovittola', 'Nicolas', 'Nicolas Laprovittola'],
-    [77339, 'Larese', 'York', 'York Larese'],
-    [203499, 'Larkin', 'Shane', 'Shane Larkin'],
-    [77341, 'Laskowski', 'John', 'John Laskowski'],
-    [201186, 'Lasme', 'Stephane', 'Stephane Lasme'],
-    [77342, 'Lattin', 'Dave', 'Dave Lattin'],
-    [968, 'Lauderdale', 'Priest', 'Priest Lauderdale'],
-    [77344, 'Laurel', 'Rich', 'Rich Laurel'],
-    [77345, 'Lautenbach', 'Walt', 'Walt Lautenbach'],
-    [203530, 'Lauvergne', 'Joffrey', 'Joffrey Lauvergne'],
-    [77346, 'Lavelli', 'Tony', 'Tony Lavelli'],
-    [77347, 'Lavoy', 'Bob', 'Bob Lavoy'],
-    [201151, 'Law', 'Acie', 'Acie Law'],
-    [202371, 'Lawal', 'Gani', 'Gani Lawal'],
-    [77348, 'Lawrence', 'Ed', 'Ed Lawrence'],
-    [1535, 'Lawson', 'Jason', 'Jason Lawson'],
-    [201951, 'Lawson', 'Ty', 'Ty Lawson'],
-    [1627774, 'Layman', 'Jake', 'Jake Layman'],
-    [77350, 'Layton', 'Dennis', 'Dennis Layton'],
-    [1627747, 'LeVert', 'Caris', 'Caris LeVert'],
-    [1628388, 'Leaf', 'TJ', 'TJ Leaf'],
-    [77351, 'Leaks', 'Emanuel', 'Emanuel Leaks'],
-    [77352, 'Lear', 'Hal', 'Hal Lear'],
-    [77353, 'Leavell', 'Allen', 'Allen Leavell'],
-    [77354, 'Lebo', 'Jeff', 'Jeff Lebo'],
-    [287, 'Leckner', 'Eric', 'Eric Leckner'],
-    [203495, 'Ledo', 'Ricky', 'Ricky Ledo'],
-    [77356, 'Lee', 'Butch', 'Butch Lee'],
-    [77357, 'Lee', 'Clyde', 'Clyde Lee'],
-    [201584, 'Lee', 'Courtney', 'Courtney Lee'],
-    [1627814, 'Lee', 'Damion', 'Damion Lee'],
-    [101135, 'Lee', 'David', 'David Lee'],
-    [77358, 'Lee', 'Doug', 'Doug Lee'],
-    [77359, 'Lee', 'George', 'George Lee'],
-    [77360, 'Lee', 'Greg', 'Greg Lee'],
-    [77361, 'Lee', 'Keith', 'Keith Lee'],
-    [77362, 'Lee', 'Kurk', 'Kurk Lee'],
-    [202723, 'Lee', 'Malcolm', 'Malcolm Lee'],
-    [1629159, 'Lee', 'Marcus', 'Marcus Lee'],
-    [77363, 'Lee', 'Rock', 'Rock Lee'],
-    [77364, 'Lee', 'Ron', 'Ron Lee'],
-    [77365, 'Lee', 'Russell', 'Russell Lee'],
-    [77366, 'Leede', 'Ed', 'Ed Leede'],
-    [77367, 'Lefkowitz', 'Hank', 'Hank Lefkowitz'],
-    [100, 'Legler', 'Tim', 'Tim Legler'],
-    [77369, 'Lehmann', 'George', 'George Lehmann'],
-    [1627215, 'Lemon Jr.', 'Walter', 'Walter Lemon Jr.'],
-    [203458, 'Len', 'Alex', 'Alex Len'],
-    [702, 'Lenard', 'Voshon', 'Voshon Lenard'],
-    [77371, 'Leonard', 'Bob', 'Bob Leonard'],
-    [77370, 'Leonard', 'Gary', 'Gary Leonard'],
-    [202695, 'Leonard', 'Kawhi', 'Kawhi Leonard'],
-    [203086, 'Leonard', 'Meyers', 'Meyers Leonard'],
-    [77372, 'Les', 'Jim', 'Jim Les'],
-    [202727, 'Leslie', 'Travis', 'Travis Leslie'],
-    [77373, 'Lester', 'Ronnie', 'Ronnie Lester'],
-    [77374, 'Lett', 'Clifford', 'Clifford Lett'],
-    [202720, 'Leuer', 'Jon', 'Jon Leuer'],
-    [77375, 'Levane', 'Andrew', 'Andrew Levane'],
-    [77376, 'Lever', 'Lafayette', 'Lafayette Lever'],
-    [77377, 'Levingston', 'Cliff', 'Cliff Levingston'],
-    [77385, 'Lewis', 'Bobby', 'Bobby Lewis'],
-    [736, 'Lewis', 'Cedric', 'Cedric Lewis'],
-    [77379, 'Lewis', 'Fred', 'Fred Lewis'],
-    [77380, 'Lewis', 'Freddie', 'Freddie Lewis'],
-    [77381, 'Lewis', 'Grady', 'Grady Lewis'],
-    [729, 'Lewis', 'Martin', 'Martin Lewis'],
-    [1900, 'Lewis', 'Quincy', 'Quincy Lewis'],
-    [77383, 'Lewis', 'Ralph', 'Ralph Lewis'],
-    [1740, 'Lewis', 'Rashard', 'Rashard Lewis'],
-    [77384, 'Lewis', 'Reggie', 'Reggie Lewis'],
-    [77386, 'Liberty', 'Marcus', 'Marcus Liberty'],
-    [77387, 'Lichti', 'Todd', 'Todd Lichti'],
-    [202732, 'Liggins', 'DeAndre', 'DeAndre Liggins'],
-    [77388, 'Ligon', 'Bill', 'Bill Ligon'],
-    [203081, 'Lillard', 'Damian', 'Damian Lillard'],
-    [202391, 'Lin', 'Jeremy', 'Jeremy Lin'],
-    [77389, 'Lingenfelter', 'Steve', 'Steve Lingenfelter'],
-    [175, 'Lister', 'Alton', 'Alton Lister'],
-    [988, 'Livingston', 'Randy', 'Randy Livingston'],
-    [2733, 'Livingston', 'Shaun', 'Shaun Livingston'],
-    [77392, 'Livingstone', 'Ron', 'Ron Livingstone'],
-    [1024, 'Llamas', 'Horacio', 'Horacio Llamas'],
-    [77394, 'Lloyd', 'Earl', 'Earl Lloyd'],
-    [77395, 'Lloyd', 'Lewis', 'Lewis Lloyd'],
-    [77396, 'Lloyd', 'Scott', 'Scott Lloyd'],
-    [77397, 'Lochmueller', 'Bob', 'Bob Lochmueller'],
-    [77398, 'Lock', 'Robert', 'Robert Lock'],
-    [77399, 'Lockhart', 'Darrell', 'Darrell Lockhart'],
-    [1100, 'Lockhart', 'Ian', 'Ian Lockhart'],
-    [77401, 'Loder', 'Kevin', 'Kevin Loder'],
-    [77402, 'Lofgran', 'Don', 'Don Lofgran'],
-    [77403, 'Logan', 'Johnny', 'Johnny Logan'],
-    [38, 'Lohaus', 'Brad', 'Brad Lohaus'],
-    [1609, 'Long', 'Art', 'Art Long'],
-    [3, 'Long', 'Grant', 'Grant Long'],
-    [1381, 'Long', 'John', 'John Long'],
-    [77406, 'Long', 'Paul', 'Paul Long'],
-    [1627848, 'Long', 'Shawn', 'Shawn Long'],
-    [26, 'Longley', 'Luc', 'Luc Longley'],
-    [1626172, 'Looney', 'Kevon', 'Kevon Looney'],
-    [201572, 'Lopez', 'Brook', 'Brook Lopez'],
-    [1732, 'Lopez', 'Felipe', 'Felipe Lopez'],
-    [2221, 'Lopez', 'Raul', 'Raul Lopez'],
-    [201577, 'Lopez', 'Robin', 'Robin Lopez'],
-    [943, 'Lorthridge', 'Ryan', 'Ryan Lorthridge'],
-    [77409, 'Loscutoff', 'Jim', 'Jim Loscutoff'],
-    [77410, 'Lott', 'Plummer', 'Plummer Lott'],
-    [77411, 'Loughery', 'Kevin', 'Kevin Loughery'],
-    [77412, 'Love', 'Bob', 'Bob Love'],
-    [201567, 'Love', 'Kevin', 'Kevin Love'],
-    [77413, 'Love', 'Stan', 'Stan Love'],
-    [77414, 'Lovellette', 'Clyde', 'Clyde Lovellette'],
-    [77415, 'Lowe', 'Sidney', 'Sidney Lowe'],
-    [77416, 'Lowery', 'Chuck', 'Chuck Lowery'],
-    [200768, 'Lowry', 'Kyle', 'Kyle Lowry'],
-    [77417, 'Lucas', 'Al', 'Al Lucas'],
-    [77418, 'Lucas', 'Jerry', 'Jerry Lucas'],
-    [77419, 'Lucas', 'John', 'John Lucas'],
-    [203564, 'Lucas', 'Kalin', 'Kalin Lucas'],
-    [77420, 'Lucas', 'Maurice', 'Maurice Lucas'],
-    [101249, 'Lucas III', 'John', 'John Lucas III'],
-    [77421, 'Luckenbill', 'Ted', 'Ted Luckenbill'],
-    [1731, 'Lue', 'Tyronn', 'Tyronn Lue'],
-    [77422, 'Luisi', 'Jim', 'Jim Luisi'],
-    [77423, 'Lujack', 'Al', 'Al Lujack'],
-    [77424, 'Lumpkin', 'Phil', 'Phil Lumpkin'],
-    [77425, 'Lumpp', 'Ray', 'Ray Lumpp'],
-    [1627789, 'Luwawu-Cabarrot', 'Timothe', 'Timothe Luwawu-Cabarrot'],
-    [1628399, 'Lydon', 'Tyler', 'Tyler Lydon'],
-    [1626168, 'Lyles', 'Trey', 'Trey Lyles'],
-    [248, 'Lynch', 'George', 'George Lynch'],
-    [77426, 'Lynch', 'Kevin', 'Kevin Lynch'],
-    [77427, 'Lynn', 'Mike', 'Mike Lynn'],
-    [1627815, 'Mac', 'Sheldon', 'Sheldon Mac'],
-    [1928, 'MacCulloch', 'Todd', 'Todd MacCulloch'],
-    [77430, 'MacGilvray', 'Ronnie', 'Ronnie MacGilvray'],
-    [931, 'MacLean', 'Don', 'Don MacLean'],
-    [77428, 'Macaluso', 'Mike', 'Mike Macaluso'],
-    [77429, 'Macauley', 'Ed', 'Ed Macauley'],
-    [203159, 'Machado', 'Scott', 'Scott Machado'],
-    [101178, 'Macijauskas', 'Arvydas', 'Arvydas Macijauskas'],
-    [77432, 'Mack', 'Ollie', 'Ollie Mack'],
-    [694, 'Mack', 'Sam', 'Sam Mack'],
-    [202714, 'Mack', 'Shelvin', 'Shelvin Mack'],
-    [1635, 'Mackey', 'Malcolm', 'Malcolm Mackey'],
-    [77435, 'Macklin', 'Rudy', 'Rudy Macklin'],
-    [202731, 'Macklin', 'Vernon', 'Vernon Macklin'],
-    [77436, 'Macknowski', 'Johnny', 'Johnny Macknowski'],
-    [1629133, 'Macon', 'Daryl', 'Daryl Macon'],
-    [1855, 'Macon', 'Mark', 'Mark Macon'],
-    [1629122, 'Macura', 'J.P.', 'J.P. Macura'],
-    [77438, 'Macy', 'Kyle', 'Kyle Macy'],
-    [77439, 'Maddox', 'Jack', 'Jack Maddox'],
-    [2432, 'Maddox', 'Tito', 'Tito Maddox'],
-    [1666, 'Madkins', 'Gerald', 'Gerald Madkins'],
-    [2058, 'Madsen', 'Mark', 'Mark Madsen'],
-    [77441, 'Mager', 'Norm', 'Norm Mager'],
-    [203705, 'Magette', 'Josh', 'Josh Magette'],
-    [1894, 'Maggette', 'Corey', 'Corey Maggette'],
-    [77442, 'Magley', 'Dave', 'Dave Magley'],
-    [2048, 'Magloire', 'Jamaal', 'Jamaal Magloire'],
-    [101133, 'Mahinmi', 'Ian', 'Ian Mahinmi'],
-    [77443, 'Mahnken', 'John', 'John Mahnken'],
-    [77444, 'Mahoney', 'Francis', 'Francis Mahoney'],
-    [328, 'Mahorn', 'Rick', 'Rick Mahorn'],
-    [105, 'Majerle', 'Dan', 'Dan Majerle'],
-    [200970, 'Major', 'Renaldo', 'Renaldo Major'],
-    [1627748, 'Maker', 'Thon', 'Thon Maker'],
-    [77447, 'Malamed', 'Lionel', 'Lionel Malamed'],
-    [117, 'Malone', 'Jeff', 'Jeff Malone'],
-    [252, 'Malone', 'Karl', 'Karl Malone'],
-    [77449, 'Malone', 'Moses', 'Moses Malone'],
-    [1074, 'Maloney', 'Matt', 'Matt Maloney'],
-    [77450, 'Malovic', 'Steve', 'Steve Malovic'],
-    [77451, 'Manakas', 'Ted', 'Ted Manakas'],
-    [77452, 'Mandic', 'John', 'John Mandic'],
-    [77453, 'Mangiapane', 'Frank', 'Frank Mangiapane'],
-    [986, 'Mann', 'Marcus', 'Marcus Mann'],
-    [330, 'Manning', 'Danny', 'Danny Manning'],
-    [77454, 'Manning', 'Ed', 'Ed Manning'],
-    [316, 'Manning', 'Richard', 'Richard Manning'],
-    [77456, 'Mannion', 'Pace', 'Pace Mannion'],
-    [77457, 'Mantis', 'Nick', 'Nick Mantis'],
-    [77459, 'Maravich', 'Pete', 'Pete Maravich'],
-    [77458, 'Maravich', 'Peter', 'Peter Maravich'],
-    [203906, 'Marble', 'Devyn', 'Devyn Marble'],
-    [77460, 'Marble', 'Roy', 'Roy Marble'],
-    [950, 'Marbury', 'Stephon', 'Stephon Marbury'],
-    [36, 'Marciulionis', 'Sarunas', 'Sarunas Marciulionis'],
-    [77462, 'Mariaschin', 'Saul', 'Saul Mariaschin'],
-    [77463, 'Marin', 'Jack', 'Jack Marin'],
-    [1890, 'Marion', 'Shawn', 'Shawn Marion'],
-    [1626246, 'Marjanovic', 'Boban', 'Boban Marjanovic'],
-    [1628374, 'Markkanen', 'Lauri', 'Lauri Markkanen'],
-    [200806, 'Markota', 'Damir', 'Damir Markota'],
-    [1752, 'Marks', 'Sean', 'Sean Marks'],
-    [77464, 'Marlatt', 'Harvey', 'Harvey Marlatt'],
-    [77465, 'Marsh', 'Eric', 'Eric Marsh'],
-    [77466, 'Marsh', 'Jim', 'Jim Marsh'],
-    [681, 'Marshall', 'Donny', 'Donny Marshall'],
-    [923, 'Marshall', 'Donyell', 'Donyell Marshall'],
-    [203088, 'Marshall', 'Kendall', 'Kendall Marshall'],
-    [101185, 'Marshall', 'Rawle', 'Rawle Marshall'],
-    [77467, 'Marshall', 'Tom', 'Tom Marshall'],
-    [77468, 'Marshall', 'Vester', 'Vester Marshall'],
-    [77481, 'Martin', 'Bill', 'Bill Martin'],
-    [77478, 'Martin', 'Bob', 'Bob Martin'],
-    [77469, 'Martin', 'Brian', 'Brian Martin'],
-    [201858, 'Martin', 'Cartier', 'Cartier Martin'],
-    [733, 'Martin', 'Cuonzo', 'Cuonzo Martin'],
-    [239, 'Martin', 'Darrick', 'Darrick Martin'],
-    [77473, 'Martin', 'Don', 'Don Martin'],
-    [77471, 'Martin', 'Donald', 'Donald Martin'],
-    [77472, 'Martin', 'Fernando', 'Fernando Martin'],
-    [1626185, 'Martin', 'Jarell', 'Jarell Martin'],
-    [77474, 'Martin', 'Jeff', 'Jeff Martin'],
-    [2030, 'Martin', 'Kenyon', 'Kenyon Martin'],
-    [2755, 'Martin', 'Kevin', 'Kevin Martin'],
-    [77475, 'Martin', 'Larue', 'Larue Martin'],
-    [77476, 'Martin', 'Mo', 'Mo Martin'],
-    [77477, 'Martin', 'Phil', 'Phil Martin'],
-    [77479, 'Martin', 'Ronald', 'Ronald Martin'],
-    [77480, 'Martin', 'Slater', 'Slater Martin'],
-    [469, 'Mashburn', 'Jamal', 'Jamal Mashburn'],
-    [77482, 'Masino', 'Al', 'Al Masino'],
-    [193, 'Mason', 'Anthony', 'Anthony Mason'],
-    [2046, 'Mason', 'Desmond', 'Desmond Mason'],
-    [1628412, 'Mason', 'Frank', 'Frank Mason'],
-    [2427, 'Mason Jr.', 'Roger', 'Roger Mason Jr.'],
-    [763, 'Massenburg', 'Tony', 'Tony Massenburg'],
-    [77483, 'Mast', 'Eddie', 'Eddie Mast'],
-    [1628493, 'Mathiang', 'Mangok', 'Mangok Mathiang'],
-    [77484, 'Matthews', 'Wes', 'Wes Matthews'],
-    [202083, 'Matthews', 'Wesley', 'Wesley Matthews'],
-    [77485, 'Maughan', 'Ariel', 'Ariel Maughan'],
-    [77486, 'Maxey', 'Marlon', 'Marlon Maxey'],
-    [101131, 'Maxiell', 'Jason', 'Jason Maxiell'],
-    [77487, 'Maxwell', 'Cedric', 'Cedric Maxwell'],
-    [137, 'Maxwell', 'Vernon', 'Vernon Maxwell'],
-    [77489, 'May', 'Don', 'Don May'],
-    [77490, 'May', 'Scott', 'Scott May'],
-    [101118, 'May', 'Sean', 'Sean May'],
-    [195, 'Mayberry', 'Lee', 'Lee Mayberry'],
-    [77492, 'Mayes', 'Clyde', 'Clyde Mayes'],
-    [77493, 'Mayes', 'Tharon', 'Tharon Mayes'],
-    [77495, 'Mayfield', 'Bill', 'Bill Mayfield'],
-    [77494, 'Mayfield', 'Ken', 'Ken Mayfield'],
-    [201953, 'Maynor', 'Eric', 'Eric Maynor'],
-    [201564, 'Mayo', 'O.J.', 'O.J. Mayo'],
-    [77496, 'Mays', 'Travis', 'Travis Mays'],
-    [77497, 'Mazza', 'Matt', 'Matt Mazza'],
-    [201601, 'Mbah a Moute', 'Luc', 'Luc Mbah a Moute'],
-    [2788, 'Mbenga', 'DJ', 'DJ Mbenga'],
-    [77498, 'McAdoo', 'Bob', 'Bob McAdoo'],
-    [203949, 'McAdoo', 'James Michael', 'James Michael McAdoo'],
-    [77499, 'McBride', 'Ken', 'Ken McBride'],
-    [203492, 'McCallum', 'Ray', 'Ray McCallum'],
-    [737, 'McCann', 'Bob', 'Bob McCann'],
-    [77500, 'McCann', 'Brendan', 'Brendan McCann'],
-    [77502, 'McCants', 'Mel', 'Mel McCants'],
-    [101119, 'McCants', 'Rashad', 'Rashad McCants'],
-    [77503, 'McCarron', 'Mike', 'Mike McCarron'],
-    [77504, 'McCarter', 'Andre', 'Andre McCarter'],
-    [77505, 'McCarter', 'Willie', 'Willie McCarter'],
-    [77506, 'McCarthy', 'Johnny', 'Johnny McCarthy'],
-    [77507, 'McCarty', 'Howie', 'Howie McCarty'],
-    [1820, 'McCarty', 'Kelly', 'Kelly McCarty'],
-    [962, 'McCarty', 'Walter', 'Walter McCarty'],
-    [1043, 'McCaskill', 'Amal', 'Amal McCaskill'],
-    [1627775, 'McCaw', 'Patrick', 'Patrick McCaw'],
-    [77509, 'McClain', 'Dwayne', 'Dwayne McClain'],
-    [77510, 'McClain', 'Ted, Hound Dog', 'Ted, Hound Dog McClain'],
-    [2082, 'McClintock', 'Dan', 'Dan McClintock'],
-    [77512, 'McCloskey', 'Jack', 'Jack McCloskey'],
-    [45, 'McCloud', 'George', 'George McCloud'],
-    [203468, 'McCollum', 'CJ', 'CJ McCollum'],
-    [77513, 'McConathy', 'John', 'John McConathy'],
-    [77514, 'McConnell', 'Paul', 'Paul McConnell'],
-    [204456, 'McConnell', 'T.J.', 'T.J. McConnell'],
-    [77515, 'McCord', 'Keith', 'Keith McCord'],
-    [77516, 'McCormick', 'Tim', 'Tim McCormick'],
-    [1741, 'McCoy', 'Jelani', 'Jelani McCoy'],
-    [77517, 'McCracken', 'Paul', 'Paul McCracken'],
-    [200840, 'McCray', 'Chris', 'Chris McCray'],
-    [1622, 'McCray', 'Rodney', 'Rodney McCray'],
-    [77518, 'McCray', 'Scooter', 'Scooter McCray'],
-    [1628571, 'McCree', 'Erik', 'Erik McCree'],
-    [1626191, 'McCullough', 'Chris', 'Chris McCullough'],
-    [77520, 'McCullough', 'John', 'John McCullough'],
-    [723, 'McDaniel', 'Clint', 'Clint McDaniel'],
-    [1365, 'McDaniel', 'Xavier', 'Xavier McDaniel'],
-    [77523, 'McDaniels', 'Jim', 'Jim McDaniels'],
-    [203909, 'McDaniels', 'KJ', 'KJ McDaniels'],
-    [203926, 'McDermott', 'Doug', 'Doug McDermott'],
-    [77524, 'McDonald', 'Ben', 'Ben McDonald'],
-    [77525, 'McDonald', 'Glenn', 'Glenn McDonald'],
-    [1075, 'McDonald', 'Michael', 'Michael McDonald'],
-    [77527, 'McDowell', 'Hank', 'Hank McDowell'],
-    [686, 'McDyess', 'Antonio', 'Antonio McDyess'],
-    [77528, 'McElroy', 'Jim', 'Jim McElroy'],
-    [200829, 'McFarlin', 'Ivan', 'Ivan McFarlin'],
-    [77529, 'McGaha', 'Mel', 'Mel McGaha'],
-    [203956, 'McGary', 'Mitch', 'Mitch McGary'],
-    [201580, 'McGee', 'JaVale', 'JaVale McGee'],
-    [77530, 'McGee', 'Mike', 'Mike McGee'],
-    [77531, 'McGill', 'Bill', 'Bill McGill'],
-    [77532, 'McGinnis', 'George', 'George McGinnis'],
-    [77533, 'McGlocklin', 'Jon', 'Jon McGlocklin'],
-    [1503, 'McGrady', 'Tracy', 'Tracy McGrady'],
-    [77534, 'McGregor', 'Gil', 'Gil McGregor'],
-    [203585, 'McGruder', 'Rodney', 'Rodney McGruder'],
-    [77536, 'McGuire', 'Al', 'Al McGuire'],
-    [77535, 'McGuire', 'Allie', 'Allie McGuire'],
-    [77537, 'McGuire', 'Dick', 'Dick McGuire'],
-    [201187, 'McGuire', 'Dominic', 'Dominic McGuire'],
-    [1450, 'McHale', 'Kevin', 'Kevin McHale'],
-    [29, 'McIlvaine', 'Jim', 'Jim McIlvaine'],
-    [976, 'McInnis', 'Jeff', 'Jeff McInnis'],
-    [77540, 'McIntosh', 'Kenny', 'Kenny McIntosh'],
-    [77541, 'McKenna', 'Kevin', 'Kevin McKenna'],
-    [77542, 'McKenzie', 'Forrest', 'Forrest McKenzie'],
-    [77543, 'McKenzie', 'Stan', 'Stan McKenzie'],
-    [365, 'McKey', 'Derrick', 'Derrick McKey'],
-    [243, 'McKie', 'Aaron', 'Aaron McKie'],
-    [77547, 'McKinney', 'Billy', 'Billy McKinney'],
-    [77545, 'McKinney', 'Carlton', 'Carlton McKinney'],
-    [77546, 'McKinney', 'Horace', 'Horace McKinney'],
-    [203590, 'McKinney-Jones', 'Trey', 'Trey McKinney-Jones'],
-    [1628035, 'McKinnie', 'Alfonzo', 'Alfonzo McKinnie'],
-    [1629162, 'McLaughlin', 'Jordan', 'Jordan McLaughlin'],
-    [203463, 'McLemore', 'Ben', 'Ben McLemore'],
-    [77548, 'McLemore', 'Mccoy', 'Mccoy McLemore'],
-    [77549, 'McLeod', 'George', 'George McLeod'],
-    [2693, 'McLeod', 'Keith', 'Keith McLeod'],
-    [1728, 'McLeod', 'Roshown', 'Roshown McLeod'],
-    [77551, 'McMahon', 'Jack', 'Jack McMahon'],
-    [203, 'McMillan', 'Nate', 'Nate McMillan'],
-    [77553, 'McMillen', 'Tom', 'Tom McMillen'],
-    [77554, 'McMillian', 'Jim', 'Jim McMillian'],
-    [77555, 'McMillon', 'Shellie', 'Shellie McMillon'],
-    [77556, 'McMullan', 'Mal', 'Mal McMullan'],
-    [77557, 'McNabb', 'Chet', 'Chet McNabb'],
-    [77558, 'McNamara', 'Mark', 'Mark McNamara'],
-    [77559, 'McNamee', 'Joe', 'Joe McNamee'],
-    [202077, 'McNeal', 'Jerel', 'Jerel McNeal'],
-    [77560, 'McNealy', 'Chris', 'Chris McNealy'],
-    [77562, 'McNeill', 'Bob', 'Bob McNeill'],
-    [77561, 'McNeill', 'Larry', 'Larry McNeill'],
-    [77563, 'McNulty', 'Carl', 'Carl McNulty'],
-    [2101, 'McPherson', 'Paul', 'Paul McPherson'],
-    [77565, 'McQueen', 'Cozell', 'Cozell McQueen'],
-    [203895, 'McRae', 'Jordan', 'Jordan McRae'],
-    [77566, 'McReynolds', 'Thales', 'Thales McReynolds'],
-    [201177, 'McRoberts', 'Josh', 'Josh McRoberts'],
-    [77567, 'McWilliams', 'Eric', 'Eric McWilliams'],
-    [77568, 'Mearns', 'George', 'George Mearns'],
-    [2098, 'Medvedenko', 'Slava', 'Slava Medvedenko'],
-    [1577, 'Mee', 'Darnell', 'Darnell Mee'],
-    [201975, 'Meeks', 'Jodie', 'Jodie Meeks'],
-    [77570, 'Meely', 'Cliff', 'Cliff Meely'],
-    [77571, 'Meents', 'Scott', 'Scott Meents'],
-    [77572, 'Mehen', 'Dick', 'Dick Mehen'],
-    [77573, 'Meineke', 'Don', 'Don Meineke'],
-    [77574, 'Meinhold', 'Carl', 'Carl Meinhold'],
-    [1626257, 'Mejri', 'Salah', 'Salah Mejri'],
-    [203539, 'Mekel', 'Gal', 'Gal Mekel'],
-    [77576, 'Melchionni', 'Bill', 'Bill Melchionni'],
-    [77575, 'Melchionni', 'Gary', 'Gary Melchionni'],
-    [203097, 'Melo', 'Fab', 'Fab Melo'],
-    [1629001, 'Melton', "De'Anthony", "De'Anthony Melton"],
-    [77577, 'Melvin', 'Ed', 'Ed Melvin'],
-    [77578, 'Meminger', 'Dean', 'Dean Meminger'],
-    [77579, 'Mencel', 'Chuck', 'Chuck Mencel'],
-    [77580, 'Mengelt', 'John', 'John Mengelt'],
-    [77581, 'Menke', 'Ken', 'Ken Menke'],
-    [200822, 'Mensah-Bonsu', 'Pops', 'Pops Mensah-Bonsu'],
-    [1500, 'Mercer', 'Ron', 'Ron Mercer'],
-    [77582, 'Meriweather', 'Joe', 'Joe Meriweather'],
-    [77583, 'Meriwether', 'Porter', 'Porter Meriwether'],
-    [77584, 'Meschery', 'Tom', 'Tom Meschery'],
-    [1629002, 'Metu', 'Chimezie', 'Chimezie Metu'],
-    [684, 'Meyer', 'Loren', 'Loren Meyer'],
-    [77586, 'Meyers', 'Dave', 'Dave Meyers'],
-    [77587, 'Miasek', 'Stan', 'Stan Miasek'],
-    [77588, 'Micheaux', 'Larry', 'Larry Micheaux'],
-    [1626175, 'Mickey', 'Jordan', 'Jordan Mickey'],
-    [203114, 'Middleton', 'Khris', 'Khris Middleton'],
-    [77589, 'Mihalik', 'Zigmund', 'Zigmund Mihalik'],
-    [2036, 'Mihm', 'Chris', 'Chris Mihm'],
-    [77590, 'Mikan', 'Ed', 'Ed Mikan'],
-    [600012, 'Mikan', 'George', 'George Mikan'],
-    [77591, 'Mikan', 'Larry', 'Larry Mikan'],
-    [77593, 'Mikkelsen', 'Vern', 'Vern Mikkelsen'],
-    [77594, 'Miksis', 'Al', 'Al Miksis'],
-    [101223, 'Miles', 'Aaron', 'Aaron Miles'],
-    [101139, 'Miles', 'CJ', 'CJ Miles'],
-    [2032, 'Miles', 'Darius', 'Darius Miles'],
-    [77596, 'Miles', 'Eddie', 'Eddie Miles'],
-    [1527, 'Milic', 'Marko', 'Marko Milic'],
-    [2545, 'Milicic', 'Darko', 'Darko Milicic'],
-    [77598, 'Militzok', 'Nat', 'Nat Militzok'],
-    [1889, 'Miller', 'Andre', 'Andre Miller'],
-    [292, 'Miller', 'Anthony', 'Anthony Miller'],
-    [77605, 'Miller', 'Bill', 'Bill Miller'],
-    [77603, 'Miller', 'Bob', 'Bob Miller'],
-    [1802, 'Miller', 'Brad', 'Brad Miller'],
-    [203121, 'Miller', 'Darius', 'Darius Miller'],
-    [77602, 'Miller', 'Dick', 'Dick Miller'],
-    [77599, 'Miller', 'Eddie', 'Eddie Miller'],
-    [77600, 'Miller', 'Harry', 'Harry Miller'],
-    [77601, 'Miller', 'Jay', 'Jay Miller'],
-    [1626259, 'Miller', 'Malcolm', 'Malcolm Miller'],
-    [2034, 'Miller', 'Mike', 'Mike Miller'],
-    [932, 'Miller', 'Oliver', 'Oliver Miller'],
-    [203113, 'Miller', 'Quincy', 'Quincy Miller'],
-    [397, 'Miller', 'Reggie', 'Reggie Miller'],
-    [77604, 'Miller', 'Walt', 'Walt Miller'],
-    [168, 'Mills', 'Chris', 'Chris Mills'],
-    [77606, 'Mills', 'John', 'John Mills'],
-    [201988, 'Mills', 'Patty', 'Patty Mills'],
-    [371, 'Mills', 'Terry', 'Terry Mills'],
-    [202407, 'Millsap', 'Elijah', 'Elijah Millsap'],
-    [200794, 'Millsap', 'Paul', 'Paul Millsap'],
-    [1629003, 'Milton', 'Shake', 'Shake Milton'],
-    [114, 'Miner', 'Harold', 'Harold Miner'],
-    [77609, 'Minniefield', 'Dirk', 'Dirk Minniefield'],
-    [77610, 'Minor', 'Dave', 'Dave Minor'],
-    [65, 'Minor', 'Greg', 'Greg Minor'],
-    [77612, 'Minor', 'Mark', 'Mark Minor'],
-    [202703, 'Mirotic', 'Nikola', 'Nikola Mirotic'],
-    [77613, 'Misaka', 'Wat', 'Wat Misaka'],
-    [1954, 'Miskiri', 'Jason', 'Jason Miskiri'],
-    [1628378, 'Mitchell', 'Donovan', 'Donovan Mitchell'],
-    [77615, 'Mitchell', 'Mike', 'Mike Mitchell'],
-    [77616, 'Mitchell', 'Murray', 'Murray Mitchell'],
-    [417, 'Mitchell', 'Sam', 'Sam Mitchell'],
-    [77614, 'Mitchell', 'Todd', 'Todd Mitchell'],
-    [203183, 'Mitchell', 'Tony', 'Tony Mitchell'],
-    [203502, 'Mitchell', 'Tony', 'Tony Mitchell'],
-    [1628513, 'Mitrou-Long', 'Naz', 'Naz Mitrou-Long'],
-    [77618, 'Mix', 'Steve', 'Steve Mix'],
-    [77619, 'Mlkvy', 'Bill', 'Bill Mlkvy'],
-    [1749, 'Mobley', 'Cuttino', 'Cuttino Mobley'],
-    [211, 'Mobley', 'Eric', 'Eric Mobley'],
-    [77621, 'Moffett', 'Larry', 'Larry Moffett'],
-    [77622, 'Mogus', 'Leo', 'Leo Mogus'],
-    [1737, 'Mohammed', 'Nazr', 'Nazr Mohammed'],
-    [2040, 'Moiso', 'Jerome', 'Jerome Moiso'],
-    [77623, 'Mokeski', 'Paul', 'Paul Mokeski'],
-    [77624, 'Molinas', 'Jack', 'Jack Molinas'],
-    [77625, 'Molis', 'Wayne', 'Wayne Molis'],
-    [77626, 'Moncrief', 'Sidney', 'Sidney Moncrief'],
-    [77627, 'Money', 'Eric', 'Eric Money'],
-    [2752, 'Monia', 'Sergei', 'Sergei Monia'],
-    [1628370, 'Monk', 'Malik', 'Malik Monk'],
-    [600006, 'Monroe', 'Earl', 'Earl Monroe'],
-    [202328, 'Monroe', 'Greg', 'Greg Monroe'],
-    [77628, 'Monroe', 'Rodney', 'Rodney Monroe'],
-    [1626242, 'Montero', 'Luis', 'Luis Montero'],
-    [77630, 'Montgomery', 'Howie', 'Howie Montgomery'],
-    [376, 'Montross', 'Eric', 'Eric Montross'],
-    [200081, 'Moon', 'Jamario', 'Jamario Moon'],
-    [77631, 'Mooney', 'Jim', 'Jim Mooney'],
-    [77632, 'Moore', 'Andre', 'Andre Moore'],
-    [1628500, 'Moore', 'Ben', 'Ben Moore'],
-    [202734, 'Moore', "E'Twaun", "E'Twaun Moore"],
-    [77634, 'Moore', 'Jackie', 'Jackie Moore'],
-    [77633, 'Moore', 'Johnny', 'Johnny Moore'],
-    [77635, 'Moore', 'Lowes', 'Lowes Moore'],
-    [1630, 'Moore', 'Mikki', 'Mikki Moore'],
-    [77636, 'Moore', 'Otto', 'Otto Moore'],
-    [77637, 'Moore', 'Ron', 'Ron Moore'],
-    [929, 'Moore', 'Tracy', 'Tracy Moore'],
-    [203961, 'Moreland', 'Eric', 'Eric Moreland'],
-    [77639, 'Moreland', 'Jackie', 'Jackie Moreland'],
-    [77640, 'Morgan', 'Guy', 'Guy Morgan'],
-    [77641, 'Morgan', 'Rex', 'Rex Morgan'],
-    [77642, 'Morgenthaler', 'Elmo', 'Elmo Morgenthaler'],
-    [77644, 'Morningstar', 'Darren', 'Darren Morningstar'],
-    [356, 'Morris', 'Chris', 'Chris Morris'],
-    [202721, 'Morris', 'Darius', 'Darius Morris'],
-    [77647, 'Morris', 'Isaiah', 'Isaiah Morris'],
-    [1628537, 'Morris', 'Jaylen', 'Jaylen Morris'],
-    [202694, 'Morris', 'Marcus', 'Marcus Morris'],
-    [202693, 'Morris', 'Markieff', 'Markieff Morris'],
-    [77646, 'Morris', 'Max', 'Max Morris'],
-    [1628420, 'Morris', 'Monte', 'Monte Morris'],
-    [201043, 'Morris', 'Randolph', 'Randolph Morris'],
-    [2242, 'Morris', 'Terence', 'Terence Morris'],
-    [200747, 'Morrison', 'Adam', 'Adam Morrison'],
-    [77648, 'Morrison', 'Dwight', 'Dwight Morrison'],
-    [77649, 'Morrison', 'Mike', 'Mike Morrison'],
-    [201627, 'Morrow', 'Anthony', 'Anthony Morrow'],
-    [132, 'Morton', 'Dwayne', 'Dwayne Morton'],
-    [1972, 'Morton', 'John', 'John Morton'],
-    [77652, 'Morton', 'Richard', 'Richard Morton'],
-    [77653, 'Mosley', 'Glenn', 'Glenn Mosley'],
-    [77654, 'Moss', 'Perry', 'Perry Moss'],
-    [734, 'Moten', 'Lawrence', 'Lawrence Moten'],
-    [202700, 'Motiejunas', 'Donatas', 'Donatas Motiejunas'],
-    [1628405, 'Motley', 'Johnathan', 'Johnathan Motley'],
-    [2069, 'Mottola', 'Hanno', 'Hanno Mottola'],
-    [203102, 'Moultrie', 'Arnett', 'Arnett Moultrie'],
-    [297, 'Mourning', 'Alonzo', 'Alonzo Mourning'],
-    [202389, 'Mozgov', 'Timofey', 'Timofey Mozgov'],
-    [77657, 'Mrazovich', 'Chuck', 'Chuck Mrazovich'],
-    [1626144, 'Mudiay', 'Emmanuel', 'Emmanuel Mudiay'],
-    [77658, 'Mueller', 'Erwin', 'Erwin Mueller'],
-    [203498, 'Muhammad', 'Shabazz', 'Shabazz Muhammad'],
-    [77659, 'Mullaney', 'Joe', 'Joe Mullaney'],
-    [77660, 'Mullens', 'Bob', 'Bob Mullens'],
-    [201957, 'Mullens', 'Byron', 'Byron Mullens'],
-    [904, 'Mullin', 'Chris', 'Chris Mullin'],
-    [77662, 'Mullins', 'Jeff', 'Jeff Mullins'],
-    [942, 'Mundt', 'Todd', 'Todd Mundt'],
-    [204098, 'Munford', 'Xavier', 'Xavier Munford'],
-    [77664, 'Munk', 'Chris', 'Chris Munk'],
-    [77665, 'Munroe', 'George', 'George Munroe'],
-    [785, 'Murdock', 'Eric', 'Eric Murdock'],
-    [49, 'Muresan', 'Gheorghe', 'Gheorghe Muresan'],
-    [77668, 'Murphy', 'Allen', 'Allen Murphy'],
-    [77669, 'Murphy', 'Calvin', 'Calvin Murphy'],
-    [77672, 'Murphy', 'Dick', 'Dick Murphy'],
-    [203513, 'Murphy', 'Erik', 'Erik Murphy'],
-    [77670, 'Murphy', 'Jay', 'Jay Murphy'],
-    [77671, 'Murphy', 'John', 'John Murphy'],
-    [203122, 'Murphy', 'Kevin', 'Kevin Murphy'],
-    [77673, 'Murphy', 'Ronnie', 'Ronnie Murphy'],
-    [77674, 'Murphy', 'Tod', 'Tod Murphy'],
-    [2211, 'Murphy', 'Troy', 'Troy Murphy'],
-    [1627749, 'Murray', 'Dejounte', 'Dejounte Murray'],
-    [2436, 'Murray', 'Flip', 'Flip Murray'],
-    [1627750, 'Murray', 'Jamal', 'Jamal Murray'],
-    [77675, 'Murray', 'Ken', 'Ken Murray'],
-    [441, 'Murray', 'Lamond', 'Lamond Murray'],
-    [145, 'Murray', 'Tracy', 'Tracy Murray'],
-    [77676, 'Murrey', 'Dorie', 'Dorie Murrey'],
-    [203315, 'Murry', "Toure'", "Toure' Murry"],
-    [1629058, 'Musa', 'Dzanan', 'Dzanan Musa'],
-    [203488, 'Muscala', 'Mike', 'Mike Muscala'],
-    [77677, 'Musi', 'Angelo', 'Angelo Musi'],
-    [1054, 'Mustaf', 'Jerrod', 'Jerrod Mustaf'],
-    [87, 'Mutombo', 'Dikembe', 'Dikembe Mutombo'],
-    [982, 'Muursepp', 'Martin', 'Martin Muursepp'],
-    [939, 'Myers', 'Pete', 'Pete Myers'],
-    [1629004, 'Mykhailiuk', 'Svi', 'Svi Mykhailiuk'],
-    [1626122, "N'diaye", 'Makhtar', "Makhtar N'diaye"],
-    [2055, "N'diaye", 'Mamadou', "Mamadou N'diaye"],
-    [77681, 'Naber', 'Bob', 'Bob Naber'],
-    [77682, 'Nachamkin', 'Boris', 'Boris Nachamkin'],
-    [2411, 'Nachbar', 'Bostjan', 'Bostjan Nachbar'],
-    [1627846, 'Nader', 'Abdel', 'Abdel Nader'],
-    [77683, 'Nagel', 'Jerry', 'Jerry Nagel'],
-    [77684, 'Nagy', 'Fred', 'Fred Nagy'],
-    [1924, 'Nailon', 'Lee', 'Lee Nailon'],
-    [2059, 'Najera', 'Eduardo', 'Eduardo Najera'],
-    [77685, 'Nance', 'Larry', 'Larry Nance'],
-    [1626204, 'Nance Jr.', 'Larry', 'Larry Nance Jr.'],
-    [203894, 'Napier', 'Shabazz', 'Shabazz Napier'],
-    [77686, 'Napolitano', 'Paul', 'Paul Napolitano'],
-    [77688, 'Nash', 'Bob', 'Bob Nash'],
-    [77687, 'Nash', 'Charles', 'Charles Nash'],
-    [959, 'Nash', 'Steve', 'Steve Nash'],
-    [77689, 'Nater', 'Swen', 'Swen Nater'],
-    [77690, 'Nathan', 'Howard', 'Howard Nathan'],
-    [77691, 'Natt', 'Calvin', 'Calvin Natt'],
-    [77692, 'Natt', 'Kenny', 'Kenny Natt'],
-    [77693, 'Naulls', 'Willie', 'Willie Naulls'],
-    [2434, 'Navarro', 'Juan Carlos', 'Juan Carlos Navarro'],
-    [202380, 'Ndiaye', 'Hamady', 'Hamady Ndiaye'],
-    [101238, 'Ndong', 'Boniface', 'Boniface Ndong'],
-    [1626254, 'Ndour', 'Maurice', 'Maurice Ndour'],
-    [77694, 'Neal', 'Craig', 'Craig Neal'],
-    [202390, 'Neal', 'Gary', 'Gary Neal'],
-    [77695, 'Neal', 'Jim', 'Jim Neal'],
-    [77696, 'Neal', 'Lloyd', 'Lloyd Neal'],
-    [77697, 'Nealy', 'Ed', 'Ed Nealy'],
-    [203517, 'Nedovic', 'Nemanja', 'Nemanja Nedovic'],
-    [77698, 'Negratti', 'Al', 'Al Negratti'],
-    [77699, 'Nelson', 'Barry', 'Barry Nelson'],
-    [201634, 'Nelson', 'DeMarcus', 'DeMarcus Nelson'],
-    [77700, 'Nelson', 'Don', 'Don Nelson'],
-    [2749, 'Nelson', 'Jameer', 'Jameer Nelson'],
-    [77701, 'Nelson', 'Louie', 'Louie Nelson'],
-    [1129, 'Nembhard', 'Ruben', 'Ruben Nembhard'],
-    [1838, 'Nesby', 'Tyrone', 'Tyrone Nesby'],
-    [77704, 'Nessley', 'Martin', 'Martin Nessley'],
-    [1725, 'Nesterovic', 'Rasho', 'Rasho Nesterovic'],
-    [203526, 'Neto', 'Raul', 'Raul Neto'],
-    [77705, 'Neumann', 'Johnny', 'Johnny Neumann'],
-    [77706, 'Neumann', 'Paul', 'Paul Neumann'],
-    [77707, 'Nevitt', 'Chuck', 'Chuck Nevitt'],
-    [1116, 'Newbern', 'Melvin', 'Melvin Newbern'],
-    [1096, 'Newbill', 'Ivano', 'Ivano Newbill'],
-    [1956, 'Newble', 'Ira', 'Ira Newble'],
-    [77710, 'Newlin', 'Mike', 'Mike Newlin'],
-    [271, 'Newman', 'Johnny', 'Johnny Newman'],
-    [1629005, 'Newman', 'Malik', 'Malik Newman'],
-    [77712, 'Newmark', 'Dave', 'Dave Newmark'],
-    [1627777, 'Niang', 'Georges', 'Georges Niang'],
-    [201193, 'Nichols', 'Demetris', 'Demetris Nichols'],
-    [77713, 'Nichols', 'Jack', 'Jack Nichols'],
-    [203094, 'Nicholson', 'Andrew', 'Andrew Nicholson'],
-    [1093, 'Nickerson', 'Gaylon', 'Gaylon Nickerson'],
-    [77715, 'Nicks', 'Carl', 'Carl Nicks'],
-    [77716, 'Niemann', 'Rich', 'Rich Niemann'],
-    [77717, 'Niemiera', 'John', 'John Niemiera'],
-    [77718, 'Niles', 'Mike', 'Mike Niles'],
-    [77719, 'Nimphius', 'Kurt', 'Kurt Nimphius'],
-    [77720, 'Nix', 'Dyron', 'Dyron Nix'],
-    [77721, 'Nixon', 'Norm', 'Norm Nixon'],
-    [201149, 'Noah', 'Joakim', 'Joakim Noah'],
-    [77722, 'Noble', 'Chuck', 'Chuck Noble'],
-    [2804, 'Nocioni', 'Andres', 'Andres Nocioni'],
-    [200786, 'Noel', 'David', 'David Noel'],
-    [203457, 'Noel', 'Nerlens', 'Nerlens Noel'],
-    [77723, 'Noel', 'Paul', 'Paul Noel'],
-    [203512, 'Nogueira', 'Lucas', 'Lucas Nogueira'],
-    [77724, 'Nolan', 'Jim', 'Jim Nolan'],
-    [77725, 'Nolen', 'Paul', 'Paul Nolen'],
-    [999, 'Nordgaard', 'Jeff', 'Jeff Nordgaard'],
-    [77727, 'Nordmann', 'Robert', 'Robert Nordmann'],
-    [77728, 'Norlander', 'Johnny', 'Johnny Norlander'],
-    [77729, 'Norman', 'Connie', 'Connie Norman'],
-    [80, 'Norman', 'Ken', 'Ken Norman'],
-    [77731, 'Norris', 'Audie', 'Audie Norris'],
-    [983, 'Norris', 'Moochie', 'Moochie Norris'],
-    [77732, 'Norris', 'Sylvester', 'Sylvester Norris'],
-    [77733, 'Norwood', 'Willie', 'Willie Norwood'],
-    [77734, 'Nostrand', 'George', 'George Nostrand'],
-    [77735, 'Noszka', 'Stan', 'Stan Noszka'],
-    [77736, 'Novak', 'Mike', 'Mike Novak'],
-    [200779, 'Novak', 'Steve', 'Steve Novak'],
-    [77737, 'Nowell', 'Mel', 'Mel Nowell'],
-    [1717, 'Nowitzki', 'Dirk', 'Dirk Nowitzki'],
-    [1628373, 'Ntilikina', 'Frank', 'Frank Ntilikina'],
-    [203263, 'Nunnally', 'James', 'James Nunnally'],
-    [203994, 'Nurkic', 'Jusuf', 'Jusuf Nurkic'],
-    [77738, 'Nutt', 'Dennis', 'Dennis Nutt'],
-    [1628021, 'Nwaba', 'David', 'David Nwaba'],
-    [1022, 'Nwosu', 'Julius', 'Julius Nwosu'],
-    [1525, "O'Bannon", 'Charles', "Charles O'Bannon"],
-    [709, "O'Bannon", 'Ed', "Ed O'Bannon"],
-    [77742, "O'Boyle", 'John', "John O'Boyle"],
-    [77744, "O'Brien", 'Bob', "Bob O'Brien"],
-    [77743, "O'Brien", 'Buckshot', "Buckshot O'Brien"],
-    [1626266, "O'Brien", 'JJ', "JJ O'Brien"],
-    [200753, "O'Bryant", 'Patrick', "Patrick O'Bryant"],
-    [203948, "O'Bryant III", 'Johnny', "Johnny O'Bryant III"],
-    [77745, "O'Connell", 'Dermie', "Dermie O'Connell"],
-    [77746, "O'Donnell", 'Andy', "Andy O'Donnell"],
-    [77750, "O'Grady", 'Francis', "Francis O'Grady"],
-    [77752, "O'Keefe", 'Dick', "Dick O'Keefe"],
-    [77753, "O'Keefe", 'Tommy', "Tommy O'Keefe"],
-    [77754, "O'Koren", 'Mike', "Mike O'Koren"],
-    [77766, "O'Malley", 'Grady', "Grady O'Malley"],
-    [979, "O'Neal", 'Jermaine', "Jermaine O'Neal"],
-    [406, "O'Neal", 'Shaquille', "Shaquille O'Neal"],
-    [1626220, "O'Neale", 'Royce', "Royce O'Neale"],
-    [77767, "O'Neill", 'Mike', "Mike O'Neill"],
-    [203124, "O'Quinn", 'Kyle', "Kyle O'Quinn"],
-    [77773, "O'Shea", 'Kevin', "Kevin O'Shea"],
-    [77774, "O'Shields", 'Garland', "Garland O'Shields"],
-    [77776, "O'Sullivan", 'Dan', "Dan O'Sullivan"],
-    [891, 'Oakley', 'Charles', 'Charles Oakley'],
-    [101177, 'Oberto', 'Fabricio', 'Fabricio Oberto'],
-    [1627849, 'Ochefu', 'Daniel', 'Daniel Ochefu'],
-    [201141, 'Oden', 'Greg', 'Greg Oden'],
-    [1885, 'Odom', 'Lamar', 'Lamar Odom'],
-    [77747, 'Ogden', 'Carlos', 'Carlos Ogden'],
-    [77748, 'Ogden', 'Ralph', 'Ralph Ogden'],
-    [1628, 'Ogg', 'Alan', 'Alan Ogg'],
-    [77751, 'Ohl', 'Don', 'Don Ohl'],
-    [203317, 'Ohlbrecht', 'Tim', 'Tim Ohlbrecht'],
-    [1628400, 'Ojeleye', 'Semi', 'Semi Ojeleye'],
-    [2731, 'Okafor', 'Emeka', 'Emeka Okafor'],
-    [1626143, 'Okafor', 'Jahlil', 'Jahlil Okafor'],
-    [1629059, 'Okobo', 'Elie', 'Elie Okobo'],
-    [1629006, 'Okogie', 'Josh', 'Josh Okogie'],
-    [2246, 'Okur', 'Mehmet', 'Mehmet Okur'],
-    [203506, 'Oladipo', 'Victor', 'Victor Oladipo'],
-    [165, 'Olajuwon', 'Hakeem', 'Hakeem Olajuwon'],
-    [77756, 'Olberding', 'Mark', 'Mark Olberding'],
-    [77757, 'Oldham', 'Jawann', 'Jawann Oldham'],
-    [77758, 'Oldham', 'Johnny', 'Johnny Oldham'],
-    [77759, 'Oleynick', 'Frank', 'Frank Oleynick'],
-    [77760, 'Olive', 'John', 'John Olive'],
-    [1680, 'Oliver', 'Brian', 'Brian Oliver'],
-    [2352, 'Oliver', 'Dean', 'Dean Oliver'],
-    [1429, 'Oliver', 'Jimmy', 'Jimmy Oliver'],
-    [1563, 'Ollie', 'Kevin', 'Kevin Ollie'],
-    [77764, 'Ollrich', 'Gene', 'Gene Ollrich'],
-    [1709, 'Olowokandi', 'Michael', 'Michael Olowokandi'],
-    [77765, 'Olsen', 'Enoch', 'Enoch Olsen'],
-    [203482, 'Olynyk', 'Kelly', 'Kelly Olynyk'],
-    [202620, 'Onuaku', 'Arinze', 'Arinze Onuaku'],
-    [1627778, 'Onuaku', 'Chinanu', 'Chinanu Onuaku'],
-    [77768, 'Orms', 'Barry', 'Barry Orms'],
-    [77769, 'Orr', 'Johnny', 'Johnny Orr'],
-    [77770, 'Orr', 'Louis', 'Louis Orr'],
-    [77771, 'Ortiz', 'Jose', 'Jose Ortiz'],
-    [202350, 'Orton', 'Daniel', 'Daniel Orton'],
-    [77772, 'Osborne', 'Chuck', 'Chuck Osborne'],
-    [1626224, 'Osman', 'Cedi', 'Cedi Osman'],
-    [77775, 'Osterkorn', 'Wally', 'Wally Osterkorn'],
-    [731, 'Ostertag', 'Greg', 'Greg Ostertag'],
-    [77777, 'Othick', 'Matt', 'Matt Othick'],
-    [77778, 'Otten', 'Don', 'Don Otten'],
-    [77779, 'Otten', 'Mac', 'Mac Otten'],
-    [1626162, 'Oubre Jr.', 'Kelly', 'Kelly Oubre Jr.'],
-    [448, 'Outlaw', 'Bo', 'Bo Outlaw'],
-    [2566, 'Outlaw', 'Travis', 'Travis Outlaw'],
-    [77780, 'Overton', 'Claude', 'Claude Overton'],
-    [77, 'Overton', 'Doug', 'Doug Overton'],
-    [101261, 'Owens', 'Andre', 'Andre Owens'],
-    [182, 'Owens', 'Billy', 'Billy Owens'],
-    [2442, 'Owens', 'Chris', 'Chris Owens'],
-    [77782, 'Owens', 'Eddie', 'Eddie Owens'],
-    [77783, 'Owens', 'James', 'James Owens'],
-    [77784, 'Owens', 'Jim', 'Jim Owens'],
-    [77785, 'Owens', 'Keith', 'Keith Owens'],
-    [202082, 'Owens', 'Larry', 'Larry Owens'],
-    [77786, 'Owens', 'Tom', 'Tom Owens'],
-    [1077, 'Owes', 'Ray', 'Ray Owes'],
-    [2071, 'Oyedeji', 'Olumide', 'Olumide Oyedeji'],
-    [77788, 'Pace', 'Joe', 'Joe Pace'],
-    [2585, 'Pachulia', 'Zaza', 'Zaza Pachulia'],
-    [123, 'Pack', 'Robert', 'Robert Pack'],
-    [77789, 'Paddio', 'Gerald', 'Gerald Paddio'],
-    [1909, 'Padgett', 'Scott', 'Scott Padgett'],
-    [1627779, 'Paige', 'Marcus', 'Marcus Paige'],
-    [77790, 'Paine', 'Fred', 'Fred Paine'],
-    [1960, 'Palacio', 'Milt', 'Milt Palacio'],
-    [77791, 'Palazzi', 'Togo', 'Togo Palazzi'],
-    [77792, 'Palmer', 'Jim', 'Jim Palmer'],
-    [77793, 'Palmer', 'John', 'John Palmer'],
-    [77794, 'Palmer', 'Walter', 'Walter Palmer'],
-    [1950, 'Panko', 'Andy', 'Andy Panko'],
-    [1627834, 'Papagiannis', 'Georgios', 'Georgios Papagiannis'],
-    [203123, 'Papanikolaou', 'Kostas', 'Kostas Papanikolaou'],
-    [2457, 'Pargo', 'Jannero', 'Jannero Pargo'],
-    [202951, 'Pargo', 'Jeremy', 'Jeremy Pargo'],
-    [77797, 'Parham', 'Estes', 'Estes Parham'],
-    [305, 'Parish', 'Robert', 'Robert Parish'],
-    [77799, 'Park', 'Medford', 'Medford Park'],
-    [1515, 'Parker', 'Anthony', 'Anthony Parker'],
-    [203953, 'Parker', 'Jabari', 'Jabari Parker'],
-    [2470, 'Parker', 'Smush', 'Smush Parker'],
-    [77800, 'Parker', 'Sonny', 'Sonny Parker'],
-    [2225, 'Parker', 'Tony', 'Tony Parker'],
-    [77801, 'Parkinson', 'Jack', 'Jack Parkinson'],
-    [685, 'Parks', 'Cherokee', 'Cherokee Parks'],
-    [77802, 'Parr', 'Jack', 'Jack Parr'],
-    [77803, 'Parrack', 'Doyle', 'Doyle Parrack'],
-    [77804, 'Parsley', 'Charlie', 'Charlie Parsley'],
-    [202718, 'Parsons', 'Chandler', 'Chandler Parsons'],
-    [1097, 'Paspalj', 'Zarko', 'Zarko Paspalj'],
-    [77806, 'Passaglia', 'Marty', 'Marty Passaglia'],
-    [77807, 'Pastushok', 'George A.', 'George A. Pastushok'],
-    [77808, 'Patrick', 'Myles', 'Myles Patrick'],
-    [77809, 'Patrick', 'Stan', 'Stan Patrick'],
-    [1754, 'Patterson', 'Andrae', 'Andrae Patterson'],
-    [77811, 'Patterson', 'George', 'George Patterson'],
-    [203934, 'Patterson', 'Lamar', 'Lamar Patterson'],
-    [202335, 'Patterson', 'Patrick', 'Patrick Patterson'],
-    [1739, 'Patterson', 'Ruben', 'Ruben Patterson'],
-    [77812, 'Patterson', 'Steve', 'Steve Patterson'],
-    [77813, 'Patterson', 'Tommy', 'Tommy Patterson'],
-    [77814, 'Patterson', 'Worthy', 'Worthy Patterson'],
-    [1628383, 'Patton', 'Justin', 'Justin Patton'],
-    [203464, 'Paul', 'Brandon', 'Brandon Paul'],
-    [101108, 'Paul', 'Chris', 'Chris Paul'],
-    [77815, 'Paulk', 'Charlie', 'Charlie Paulk'],
-    [77816, 'Paulson', 'Jerry', 'Jerry Paulson'],
-    [77817, 'Paultz', 'Billy', 'Billy Paultz'],
-    [2562, 'Pavlovic', 'Sasha', 'Sasha Pavlovic'],
-    [77818, 'Paxson', 'Jim', 'Jim Paxson'],
-    [77819, 'Paxson', 'Jim', 'Jim Paxson'],
-    [77820, 'Paxson', 'John', 'John Paxson'],
-    [77821, 'Payak', 'Johnny', 'Johnny Payak'],
-    [203940, 'Payne', 'Adreian', 'Adreian Payne'],
-    [1626166, 'Payne', 'Cameron', 'Cameron Payne'],
-    [77822, 'Payne', 'Kenny', 'Kenny Payne'],
-    [77823, 'Payne', 'Tom', 'Tom Payne'],
-    [203901, 'Payton', 'Elfrid', 'Elfrid Payton'],
-    [56, 'Payton', 'Gary', 'Gary Payton'],
-    [77824, 'Payton', 'Mel', 'Mel Payton'],
-    [1627780, 'Payton II', 'Gary', 'Gary Payton II'],
-    [77825, 'Pearcy', 'George', 'George Pearcy'],
-    [77826, 'Pearcy', 'Henry', 'Henry Pearcy'],
-    [200762, 'Pecherov', 'Oleksiy', 'Oleksiy Pecherov'],
-    [77827, 'Peck', 'Wiley', 'Wiley Peck'],
-    [324, 'Peeler', 'Anthony', 'Anthony Peeler'],
-    [201593, 'Pekovic', 'Nikola', 'Nikola Pekovic'],
-    [77828, 'Pelkington', 'Jake', 'Jake Pelkington'],
-    [203658, 'Pelle', 'Norvel', 'Norvel Pelle'],
-    [77829, 'Pellom', 'Sam', 'Sam Pellom'],
-    [2130, 'Penberthy', 'Mike', 'Mike Penberthy'],
-    [2667, 'Penigar', 'Desmond', 'Desmond Penigar'],
-    [2632, 'Penney', 'Kirk', 'Kirk Penney'],
-    [46, 'Peplowski', 'Mike', 'Mike Peplowski'],
-    [781, 'Perdue', 'Will', 'Will Perdue'],
-    [2570, 'Perkins', 'Kendrick', 'Kendrick Perkins'],
-    [64, 'Perkins', 'Sam', 'Sam Perkins'],
-    [77834, 'Perkins', 'Warren', 'Warren Perkins'],
-    [200785, 'Perovic', 'Kosta', 'Kosta Perovic'],
-    [1628506, 'Perrantes', 'London', 'London Perrantes'],
-    [77835, 'Perry', 'Curtis', 'Curtis Perry'],
-    [386, 'Perry', 'Elliot', 'Elliot Perry'],
-    [897, 'Perry', 'Tim', 'Tim Perry'],
-    [456, 'Person', 'Chuck', 'Chuck Person'],
-    [445, 'Person', 'Wesley', 'Wesley Person'],
-    [1628409, 'Peters', 'Alec', 'Alec Peters'],
-    [77839, 'Petersen', 'Jim', 'Jim Petersen'],
-    [77840, 'Petersen', 'Loy', 'Loy Petersen'],
-    [77843, 'Peterson', 'Bob', 'Bob Peterson'],
-    [77841, 'Peterson', 'Ed', 'Ed Peterson'],
-    [77842, 'Peterson', 'Mel', 'Mel Peterson'],
-    [2050, 'Peterson', 'Morris', 'Morris Peterson'],
-    [77844, 'Petrie', 'Geoff', 'Geoff Petrie'],
-    [101130, 'Petro', 'Johan', 'Johan Petro'],
-    [77845, 'Petrovic', 'Drazen', 'Drazen Petrovic'],
-    [77846, 'Petruska', 'Richard', 'Richard Petruska'],
-    [77847, 'Pettit', 'Bob', 'Bob Pettit'],
-    [77848, 'Phegley', 'Roger', 'Roger Phegley'],
-    [77850, 'Phelan', 'Jack', 'Jack Phelan'],
-    [77849, 'Phelan', 'Jim', 'Jim Phelan'],
-    [74, 'Phelps', 'Derrick', 'Derrick Phelps'],
-    [77852, 'Phelps', 'Mike', 'Mike Phelps'],
-    [77853, 'Phillip', 'Andy', 'Andy Phillip'],
-    [77854, 'Phillips', 'Eddie', 'Eddie Phillips'],
-    [77855, 'Phillips', 'Gary', 'Gary Phillips'],
-    [184, 'Phills', 'Bobby', 'Bobby Phills'],
-    [15, 'Piatkowski', 'Eric', 'Eric Piatkowski'],
-    [1718, 'Pierce', 'Paul', 'Paul Pierce'],
-    [894, 'Pierce', 'Ricky', 'Ricky Pierce'],
-    [77858, 'Pietkiewicz', 'Stan', 'Stan Pietkiewicz'],
-    [2554, 'Pietrus', 'Mickael', 'Mickael Pietrus'],
-    [77859, 'Pilch', 'John', 'John Pilch'],
-    [291, 'Pinckney', 'Ed', 'Ed Pinckney'],
-    [200838, 'Pinkney', 'Kevinn', 'Kevinn Pinkney'],
-    [77861, 'Pinone', 'John', 'John Pinone'],
-    [77862, 'Piontek', 'Dave', 'Dave Piontek'],
-    [77863, 'Piotrowski', 'Tom', 'Tom Piotrowski'],
-    [937, 'Pippen', 'Scottie', 'Scottie Pippen'],
-    [77864, 'Pittman', 'Charlie', 'Charlie Pittman'],
-    [202354, 'Pittman', 'Dexter', 'Dexter Pittman'],
-    [2565, 'Planinic', 'Zoran', 'Zoran Planinic'],
-    [202353, 'Pleiss', 'Tibor', 'Tibor Pleiss'],
-    [1627850, 'Plumlee', 'Marshall', 'Marshall Plumlee'],
-    [203486, 'Plumlee', 'Mason', 'Mason Plumlee'],
-    [203101, 'Plumlee', 'Miles', 'Miles Plumlee'],
-    [77865, 'Plummer', 'Gary', 'Gary Plummer'],
-    [2750, 'Podkolzin', 'Pavel', 'Pavel Podkolzin'],
-    [1627751, 'Poeltl', 'Jakob', 'Jakob Poeltl'],
-    [77866, 'Polee', 'Dwayne', 'Dwayne Polee'],
-    [77867, 'Pollard', 'Jim', 'Jim Pollard'],
-    [1513, 'Pollard', 'Scot', 'Scot Pollard'],
-    [77868, 'Polson', 'Ralph', 'Ralph Polson'],
-    [178, 'Polynice', 'Olden', 'Olden Polynice'],
-    [77869, 'Pondexter', 'Cliff', 'Cliff Pondexter'],
-    [202347, 'Pondexter', 'Quincy', 'Quincy Pondexter'],
-    [77870, 'Pope', 'David', 'David Pope'],
-    [998, 'Pope', 'Mark', 'Mark Pope'],
-    [77872, 'Popson', 'Dave', 'Dave Popson'],
-    [77873, 'Poquette', 'Ben', 'Ben Poquette'],
-    [2084, 'Porter', 'Chris', 'Chris Porter'],
-    [77875, 'Porter', 'Howard', 'Howard Porter'],
-    [77876, 'Porter', 'Kevin', 'Kevin Porter'],
-    [345, 'Porter', 'Terry', 'Terry Porter'],
-    [1629008, 'Porter Jr.', 'Michael', 'Michael Porter Jr.'],
-    [203490, 'Porter Jr.', 'Otto', 'Otto Porter Jr.'],
-    [1626171, 'Portis', 'Bobby', 'Bobby Portis'],
-    [77878, 'Portman', 'Bob', 'Bob Portman'],
-    [204001, 'Porzingis', 'Kristaps', 'Kristaps Porzingis'],
-    [1899, 'Posey', 'James', 'James Posey'],
-    [2068, 'Postell', 'Lavor', 'Lavor Postell'],
-    [958, 'Potapenko', 'Vitaly', 'Vitaly Potapenko'],
-    [200796, 'Powe', 'Leon', 'Leon Powe'],
-    [203939, 'Powell', 'Dwight', 'Dwight Powell'],
-    [2694, 'Powell', 'Josh', 'Josh Powell'],
-    [2867, 'Powell', 'Kasib', 'Kasib Powell'],
-    [1626181, 'Powell', 'Norman', 'Norman Powell'],
-    [101232, 'Powell', 'Roger', 'Roger Powell'],
-    [1627816, 'Poythress', 'Alex', 'Alex Poythress'],
-    [77879, 'Pressey', 'Paul', 'Paul Pressey'],
-    [203515, 'Pressey', 'Phil', 'Phil Pressey'],
-    [77880, 'Pressley', 'Dominic', 'Dominic Pressley'],
-    [77881, 'Pressley', 'Harold', 'Harold Pressley'],
-    [1629009, 'Preston', 'Billy', 'Billy Preston'],
-    [201985, 'Price', 'AJ', 'AJ Price'],
-    [85, 'Price', 'Brent', 'Brent Price'],
-    [77883, 'Price', 'Jim', 'Jim Price'],
-    [899, 'Price', 'Mark', 'Mark Price'],
-    [77884, 'Price', 'Mike', 'Mike Price'],
-    [101179, 'Price', 'Ronnie', 'Ronnie Price'],
-    [77882, 'Price', 'Tony', 'Tony Price'],
-    [77886, 'Priddy', 'Bob', 'Bob Priddy'],
-    [203143, 'Prigioni', 'Pablo', 'Pablo Prigioni'],
-    [1627752, 'Prince', 'Taurean', 'Taurean Prince'],
-    [2419, 'Prince', 'Tayshaun', 'Tayshaun Prince'],
-    [77887, 'Pritchard', 'John', 'John Pritchard'],
-    [340, 'Pritchard', 'Kevin', 'Kevin Pritchard'],
-    [1919, 'Profit', 'Laron', 'Laron Profit'],
-    [201172, 'Pruitt', 'Gabe', 'Gabe Pruitt'],
-    [2038, 'Przybilla', 'Joel', 'Joel Przybilla'],
-    [77888, 'Pugh', 'Les', 'Les Pugh'],
-    [77889, 'Pugh', 'Roy', 'Roy Pugh'],
-    [77890, 'Pullard', 'Anthony', 'Anthony Pullard'],
-    [1626643, 'Pullen', 'Jacob', 'Jacob Pullen'],
-    [1628681, 'Purvis', 'Rodney', 'Rodney Purvis'],
-    [77891, 'Putman', 'Don', 'Don Putman'],
-    [1627753, 'Zhou Qi', '', 'Zhou Qi'],
-    [1627817, 'Quarterman', 'Tim', 'Tim Quarterman'],
-    [77892, 'Quick', 'Bob', 'Bob Quick'],
-    [200809, 'Quinn', 'Chris', 'Chris Quinn'],
-    [77893, 'Quinnett', 'Brian', 'Brian Quinnett'],
-    [1628397, 'Rabb', 'Ivan', 'Ivan Rabb'],
-    [77894, 'Rackley', 'Luke', 'Luke Rackley'],
-    [77895, 'Rader', 'Howie', 'Howie Rader'],
-    [77896, 'Radford', 'Mark', 'Mark Radford'],
-    [77897, 'Radford', 'Wayne', 'Wayne Radford'],
-    [129, 'Radja', 'Dino', 'Dino Radja'],
-    [2209, 'Radmanovic', 'Vladimir', 'Vladimir Radmanovic'],
-    [1893, 'Radojevic', 'Aleksandar', 'Aleksandar Radojevic'],
-    [77899, 'Radovich', 'Frank', 'Frank Radovich'],
-    [77900, 'Radovich', 'Moe', 'Moe Radovich'],
-    [203545, 'Raduljica', 'Miroslav', 'Miroslav Raduljica'],
-    [77901, 'Radziszewski', 'Ray', 'Ray Radziszewski'],
-    [77902, 'Ragelis', 'Ray', 'Ray Ragelis'],
-    [77903, 'Raiken', 'Sherwin', 'Sherwin Raiken'],
-    [77904, 'Rains', 'Ed', 'Ed Rains'],
-    [2080, 'Rakocevic', 'Igor', 'Igor Rakocevic'],
-    [77905, 'Rambis', 'Kurt', 'Kurt Rambis'],
-    [2762, 'Ramos', 'Peter John', 'Peter John Ramos'],
-    [77906, 'Ramsey', 'Cal', 'Cal Ramsey'],
-    [77907, 'Ramsey', 'Frank', 'Frank Ramsey'],
-    [77908, 'Ramsey', 'Ray', 'Ray Ramsey'],
-    [1821, 'Randall', 'Mark', 'Mark Randall'],
-    [1626184, 'Randle', 'Chasson', 'Chasson Randle'],
-    [203944, 'Randle', 'Julius', 'Julius Randle'],
-    [201576, 'Randolph', 'Anthony', 'Anthony Randolph'],
-    [101183, 'Randolph', 'Shavlik', 'Shavlik Randolph'],
-    [2216, 'Randolph', 'Zach', 'Zach Randolph'],
-    [77910, 'Rank', 'Wally', 'Wally Rank'],
-    [77911, 'Ransey', 'Kelvin', 'Kelvin Ransey'],
-    [77912, 'Ranzino', 'Sam', 'Sam Ranzino'],
-    [78656, 'Rasmussen', 'Blair', 'Blair Rasmussen'],
-    [1628504, 'Rathan-Mayes', 'Xavier', 'Xavier Rathan-Mayes'],
-    [77913, 'Ratkovicz', 'George', 'George Ratkovicz'],
-    [77914, 'Ratleff', 'Ed', 'Ed Ratleff'],
-    [77915, 'Ratliff', 'Mike', 'Mike Ratliff'],
-    [689, 'Ratliff', 'Theo', 'Theo Ratliff'],
-    [202360, 'Rautins', 'Andy', 'Andy Rautins'],
-    [77916, 'Rautins', 'Leo', 'Leo Rautins'],
-    [200810, 'Ray', 'Allan', 'Allan Ray'],
-    [77917, 'Ray', 'Clifford', 'Clifford Ray'],
-    [77918, 'Ray', 'Don', 'Don Ray'],
-    [77920, 'Ray', 'Jamesearl', 'Jamesearl Ray'],
-    [77919, 'Ray', 'Jim', 'Jim Ray'],
-    [77921, 'Raymond', 'Craig', 'Craig Raymond'],
-    [77922, 'Rea', 'Connie', 'Connie Rea'],
-    [77923, 'Reaves', 'Joe', 'Joe Reaves'],
-    [1442, 'Rebraca', 'Zeljko', 'Zeljko Rebraca'],
-    [695, 'Recasner', 'Eldridge', 'Eldridge Recasner'],
-    [2072, 'Redd', 'Michael', 'Michael Redd'],
-    [77925, 'Reddout', 'Frank', 'Frank Reddout'],
-    [200755, 'Redick', 'JJ', 'JJ Redick'],
-    [77926, 'Redmond', 'Marlon', 'Marlon Redmond'],
-    [1628432, 'Reed', 'Davon', 'Davon Reed'],
-    [77927, 'Reed', 'Hub', 'Hub Reed'],
-    [2770, 'Reed', 'Justin', 'Justin Reed'],
-    [77928, 'Reed', 'Ron', 'Ron Reed'],
-    [203186, 'Reed', 'Willie', 'Willie Reed'],
-    [77929, 'Reed', 'Willis', 'Willis Reed'],
-    [735, 'Reeves', 'Bryant', 'Bryant Reeves'],
-    [234, 'Reeves', 'Khalid', 'Khalid Reeves'],
-    [77932, 'Regan', 'Richie', 'Richie Regan'],
-    [77933, 'Rehfeldt', 'Don', 'Don Rehfeldt'],
-    [77937, 'Reid', 'Billy', 'Billy Reid'],
-    [690, 'Reid', 'Don', 'Don Reid'],
-    [462, 'Reid', 'J.R.', 'J.R. Reid'],
-    [77935, 'Reid', 'Jim', 'Jim Reid'],
-    [77936, 'Reid', 'Robert', 'Robert Reid'],
-    [202385, 'Reid', 'Ryan', 'Ryan Reid'],
-    [2876, 'Reiner', 'Jared', 'Jared Reiner'],
-    [77938, 'Reiser', 'Joseph', 'Joseph Reiser'],
-    [77939, 'Rellford', 'Richard', 'Richard Rellford'],
-    [720, 'Rencher', 'Terrence', 'Terrence Rencher'],
-    [77941, 'Rennicke', 'John', 'John Rennicke'],
-    [77942, 'Rensberger', 'Rob', 'Rob Rensberger'],
-    [981, 'Rentzias', 'Efthimios', 'Efthimios Rentzias'],
-    [704, 'Respert', 'Shawn', 'Shawn Respert'],
-    [77944, 'Restani', 'Kevin', 'Kevin Restani'],
-    [77945, 'Reynolds', 'George', 'George Reynolds'],
-    [77946, 'Reynolds', 'Jerry', 'Jerry Reynolds'],
-    [77947, 'Rhodes', 'Gene', 'Gene Rhodes'],
-    [1518, 'Rhodes', 'Rodrick', 'Rodrick Rhodes'],
-    [779, 'Rice', 'Glen', 'Glen Rice'],
-    [203318, 'Rice', 'Glen', 'Glen Rice'],
-    [201181, 'Richard', 'Chris', 'Chris Richard'],
-    [77950, 'Richardson', 'Clint', 'Clint Richardson'],
-    [2202, 'Richardson', 'Jason', 'Jason Richardson'],
-    [200978, 'Richardson', 'Jeremy', 'Jeremy Richardson'],
-    [1626196, 'Richardson', 'Josh', 'Josh Richardson'],
-    [1627781, 'Richardson', 'Malachi', 'Malachi Richardson'],
-    [77952, 'Richardson', 'Micheal Ray', 'Micheal Ray Richardson'],
-    [2369, 'Richardson', 'Norman', 'Norman Richardson'],
-    [71, 'Richardson', 'Pooh', 'Pooh Richardson'],
-    [2047, 'Richardson', 'Quentin', 'Quentin Richardson'],
-    [782, 'Richmond', 'Mitch', 'Mitch Richmond'],
-    [77954, 'Richter', 'John', 'John Richter'],
-    [77955, 'Ricketts', 'Dick', 'Dick Ricketts'],
-    [375, 'Rider', 'Isaiah', 'Isaiah Rider'],
-    [77957, 'Ridgle', 'Jackie', 'Jackie Ridgle'],
-    [2557, 'Ridnour', 'Luke', 'Luke Ridnour'],
-    [77958, 'Riebe', 'Mel', 'Mel Riebe'],
-    [77959, 'Riffey', 'Jim', 'Jim Riffey'],
-    [2541, 'Rigaudeau', 'Antoine', 'Antoine Rigaudeau'],
-    [77960, 'Riker', 'Tom', 'Tom Riker'],
-    [77963, 'Riley', 'Bob', 'Bob Riley'],
-    [35, 'Riley', 'Eric', 'Eric Riley'],
-    [77962, 'Riley', 'Pat', 'Pat Riley'],
-    [77964, 'Riley', 'Ron', 'Ron Riley'],
-    [77965, 'Rinaldi', 'Rich', 'Rich Rinaldi'],
-    [77966, 'Riordan', 'Mike', 'Mike Riordan'],
-    [77967, 'Risen', 'Arnie', 'Arnie Risen'],
-    [77968, 'Ritter', 'Goebel', 'Goebel Ritter'],
-    [77969, 'Rivas', 'Ramon', 'Ramon Rivas'],
-    [203085, 'Rivers', 'Austin', 'Austin Rivers'],
-    [77970, 'Rivers', 'David', 'David Rivers'],
-    [470, 'Rivers', 'Doc', 'Doc Rivers'],
-    [77972, 'Robbins', 'Lee', 'Lee Robbins'],
-    [203460, 'Roberson', 'Andre', 'Andre Roberson'],
-    [101194, 'Roberson', 'Anthony', 'Anthony Roberson'],
-    [77973, 'Roberson', 'Rick', 'Rick Roberson'],
-    [2121, 'Roberson', 'Terrance', 'Terrance Roberson'],
-    [77975, 'Roberts', 'Anthony', 'Anthony Roberts'],
-    [77979, 'Roberts', 'Bill', 'Bill Roberts'],
-    [203148, 'Roberts', 'Brian', 'Brian Roberts'],
-    [122, 'Roberts', 'Fred', 'Fred Roberts'],
-    [77977, 'Roberts', 'Joe', 'Joe Roberts'],
-    [101160, 'Roberts', 'Lawrence', 'Lawrence Roberts'],
-    [77978, 'Roberts', 'Marv', 'Marv Roberts'],
-    [914, 'Roberts', 'Stanley', 'Stanley Roberts'],
-    [926, 'Robertson', 'Alvin', 'Alvin Robertson'],
-    [600015, 'Robertson', 'Oscar', 'Oscar Robertson'],
-    [1926, 'Robertson', 'Ryan', 'Ryan Robertson'],
-    [77983, 'Robertson', 'Tony', 'Tony Robertson'],
-    [77984, 'Robey', 'Rick', 'Rick Robey'],
-    [2774, 'Robinson', 'Bernard', 'Bernard Robinson'],
-    [997, 'Robinson', 'Chris', 'Chris Robinson'],
-    [77986, 'Robinson', 'Cliff T.', 'Cliff T. Robinson'],
-    [361, 'Robinson', 'Clifford', 'Clifford Robinson'],
-    [764, 'Robinson', 'David', 'David Robinson'],
-    [1628421, 'Robinson', 'Devin', 'Devin Robinson'],
-    [1629130, 'Robinson', 'Duncan', 'Duncan Robinson'],
-    [1944, 'Robinson', 'Eddie', 'Eddie Robinson'],
-    [77988, 'Robinson', 'Flynn', 'Flynn Robinson'],
-    [299, 'Robinson', 'Glenn', 'Glenn Robinson'],
-    [77989, 'Robinson', 'Jackie', 'Jackie Robinson'],
-    [1554, 'Robinson', 'Jamal', 'Jamal Robinson'],
-    [381, 'Robinson', 'James', 'James Robinson'],
-    [1629010, 'Robinson', 'Jerome', 'Jerome Robinson'],
-    [1683, 'Robinson', 'Larry', 'Larry Robinson'],
-    [1629011, 'Robinson', 'Mitchell', 'Mitchell Robinson'],
-    [101126, 'Robinson', 'Nate', 'Nate Robinson'],
-    [77994, 'Robinson', 'Oliver', 'Oliver Robinson'],
-    [716, 'Robinson', 'Rumeal', 'Rumeal Robinson'],
-    [203080, 'Robinson', 'Thomas', 'Thomas Robinson'],
-    [77993, 'Robinson', 'Truck', 'Truck Robinson'],
-    [77996, 'Robinson', 'Wayne', 'Wayne Robinson'],
-    [203922, 'Robinson III', 'Glenn', 'Glenn Robinson III'],
-    [77997, 'Robinzine', 'Bill', 'Bill Robinzine'],
-    [77998, 'Robisch', 'Dave', 'Dave Robisch'],
-    [77999, 'Rocha', 'Red', 'Red Rocha'],
-    [78000, 'Roche', 'John', 'John Roche'],
-    [78001, 'Rock', 'Gene', 'Gene Rock'],
-    [78002, 'Rocker', 'Jack', 'Jack Rocker'],
-    [78003, 'Rodgers', 'Guy', 'Guy Rodgers'],
-    [23, 'Rodman', 'Dennis', 'Dennis Rodman'],
-    [200771, 'Rodriguez', 'Sergio', 'Sergio Rodriguez'],
-    [691, 'Roe', 'Lou', 'Lou Roe'],
-    [435, 'Rogers', 'Carlos', 'Carlos Rogers'],
-    [78007, 'Rogers', 'Johnny', 'Johnny Rogers'],
-    [78008, 'Rogers', 'Marshall', 'Marshall Rogers'],
-    [915, 'Rogers', 'Rodney', 'Rodney Rogers'],
-    [964, 'Rogers', 'Roy', 'Roy Rogers'],
-    [78010, 'Roges', 'Al', 'Al Roges'],
-    [78011, 'Rohloff', 'Ken', 'Ken Rohloff'],
-    [202375, 'Rolle', 'Magnum', 'Magnum Rolle'],
-    [78012, 'Rollins', 'Kenny', 'Kenny Rollins'],
-    [78013, 'Rollins', 'Phil', 'Phil Rollins'],
-    [78014, 'Rollins', 'Tree', 'Tree Rollins'],
-    [78015, 'Romar', 'Lorenzo', 'Lorenzo Romar'],
-    [200765, 'Rondo', 'Rajon', 'Rajon Rondo'],
-    [399, 'Rooks', 'Sean', 'Sean Rooks'],
-    [201565, 'Rose', 'Derrick', 'Derrick Rose'],
-    [147, 'Rose', 'Jalen', 'Jalen Rose'],
-    [990, 'Rose', 'Malik', 'Malik Rose'],
-    [78016, 'Rose', 'Robert', 'Robert Rose'],
-    [78017, 'Rosenberg', 'Alexander', 'Alexander Rosenberg'],
-    [78018, 'Rosenbluth', 'Lennie', 'Lennie Rosenbluth'],
-    [78019, 'Rosenstein', 'Hank', 'Hank Rosenstein'],
-    [78020, 'Rosenthal', 'Dick', 'Dick Rosenthal'],
-    [2624, 'Ross', 'Quinton', 'Quinton Ross'],
-    [203082, 'Ross', 'Terrence', 'Terrence Ross'],
-    [78021, 'Roth', 'Doug', 'Doug Roth'],
-    [78022, 'Roth', 'Scott', 'Scott Roth'],
-    [78023, 'Rothenberg', 'Irv', 'Irv Rothenberg'],
-    [78024, 'Rottner', 'Mickey', 'Mickey Rottner'],
-    [78025, 'Roundfield', 'Dan', 'Dan Roundfield'],
-    [78026, 'Roux', 'Giff', 'Giff Roux'],
-    [78027, 'Rowan', 'Ron', 'Ron Rowan'],
-    [78028, 'Rowe', 'Curtis', 'Curtis Rowe'],
-    [78029, 'Rowinski', 'Jim', 'Jim Rowinski'],
-    [78030, 'Rowland', 'Derrick', 'Derrick Rowland'],
-    [78031, 'Rowsom', 'Brian', 'Brian Rowsom'],
-    [200750, 'Roy', 'Brandon', 'Brandon Roy'],
-    [140, 'Royal', 'Donald', 'Donald Royal'],
-    [78033, 'Royer', 'Bob', 'Bob Royer'],
-    [32, 'Rozier', 'Clifford', 'Clifford Rozier'],
-    [1626179, 'Rozier', 'Terry', 'Terry Rozier'],
-    [201937, 'Rubio', 'Ricky', 'Ricky Rubio'],
-    [2462, 'Rucker', 'Guy', 'Guy Rucker'],
-    [78035, 'Rudd', 'Delaney', 'Delaney Rudd'],
-    [78036, 'Rudd', 'John', 'John Rudd'],
-    [204014, 'Rudez', 'Damjan', 'Damjan Rudez'],
-    [78037, 'Rudometkin', 'John', 'John Rudometkin'],
-    [1913, 'Ruffin', 'Michael', 'Michael Ruffin'],
-    [460, 'Ruffin', 'Trevor', 'Trevor Ruffin'],
-    [78039, 'Ruffner', 'Paul', 'Paul Ruffner'],
-    [78040, 'Ruklick', 'Joe', 'Joe Ruklick'],
-    [78041, 'Ruland', 'Jeff', 'Jeff Ruland'],
-    [78042, 'Rule', 'Bob', 'Bob Rule'],
-    [78043, 'Rullo', 'Jerry', 'Jerry Rullo'],
-    [474, 'Rusconi', 'Stefano', 'Stefano Rusconi'],
-    [201575, 'Rush', 'Brandon', 'Brandon Rush'],
-    [2416, 'Rush', 'Kareem', 'Kareem Rush'],
-    [78049, 'Russell', 'Bill', 'Bill Russell'],
-    [935, 'Russell', 'Bryon', 'Bryon Russell'],
-    [78047, 'Russell', 'Campy', 'Campy Russell'],
-    [78045, 'Russell', 'Cazzie', 'Cazzie Russell'],
-    [1626156, 'Russell', "D'Angelo", "D'Angelo Russell"],
-    [78046, 'Russell', 'Frank', 'Frank Russell'],
-    [78048, 'Russell', 'Walker', 'Walker Russell'],
-    [201041, 'Russell', 'Walker', 'Walker Russell'],
-    [717, 'Sabonis', 'Arvydas', 'Arvydas Sabonis'],
-    [1627734, 'Sabonis', 'Domantas', 'Domantas Sabonis'],
-    [203135, 'Sacre', 'Robert', 'Robert Sacre'],
-    [78050, 'Sadowski', 'Ed', 'Ed Sadowski'],
-    [78051, 'Sailors', 'Kenny', 'Kenny Sailors'],
-    [927, 'Salley', 'John', 'John Salley'],
-    [2422, 'Salmons', 'John', 'John Salmons'],
-    [1089, 'Salvadori', 'Kevin', 'Kevin Salvadori'],
-    [2066, 'Samake', 'Soumaila', 'Soumaila Samake'],
-    [200798, 'Samb', 'Cheikh', 'Cheikh Samb'],
-    [203960, 'Sampson', 'JaKarr', 'JaKarr Sampson'],
-    [2441, 'Sampson', 'Jamal', 'Jamal Sampson'],
-    [78055, 'Sampson', 'Ralph', 'Ralph Sampson'],
-    [202396, 'Samuels', 'Samardo', 'Samardo Samuels'],
-    [2143, 'Sanchez', 'Pepe', 'Pepe Sanchez'],
-    [78057, 'Sanders', 'Frankie', 'Frankie Sanders'],
-    [1874, 'Sanders', 'Jeff', 'Jeff Sanders'],
-    [202336, 'Sanders', 'Larry', 'Larry Sanders'],
-    [2684, 'Sanders', 'Melvin', 'Melvin Sanders'],
-    [78059, 'Sanders', 'Mike', 'Mike Sanders'],
-    [78060, 'Sanders', 'Thomas', 'Thomas Sanders'],
-    [1629068, 'Sanon', 'Issuf', 'Issuf Sanon'],
-    [2091, 'Santiago', 'Daniel', 'Daniel Santiago'],
-    [78061, 'Santini', 'Bob', 'Bob Santini'],
-    [78062, 'Sappleton', 'Wayne', 'Wayne Sappleton'],
-    [203967, 'Saric', 'Dario', 'Dario Saric'],
-    [987, 'Sasser', 'Jason', 'Jason Sasser'],
-    [2219, 'Sasser', 'Jeryl', 'Jeryl Sasser'],
-    [203107, 'Satoransky', 'Tomas', 'Tomas Satoransky'],
-    [2261, 'Satterfield', 'Kenny', 'Kenny Satterfield'],
-    [78063, 'Saul', 'Frank', 'Frank Saul'],
-    [78064, 'Sauldsberry', 'Woody', 'Woody Sauldsberry'],
-    [78065, 'Saunders', 'Fred', 'Fred Saunders'],
-    [78066, 'Savage', 'Don', 'Don Savage'],
-    [2453, 'Savovic', 'Predrag', 'Predrag Savovic'],
-    [78067, 'Sawyer', 'Alan', 'Alan Sawyer'],
-    [2243, 'Scalabrine', 'Brian', 'Brian Scalabrine'],
-    [2637, 'Scales', 'Alex', 'Alex Scales'],
-    [78068, 'Scales', 'Dewayne', 'Dewayne Scales'],
-    [78069, 'Schade', 'Frank', 'Frank Schade'],
-    [78070, 'Schadler', 'Ben', 'Ben Schadler'],
-    [78071, 'Schaefer', 'Herm', 'Herm Schaefer'],
-    [78072, 'Schafer', 'Bob', 'Bob Schafer'],
-    [78073, 'Scharnus', 'Ben', 'Ben Scharnus'],
-    [78074, 'Schatzman', 'Marv', 'Marv Schatzman'],
-    [78075, 'Schaus', 'Fred', 'Fred Schaus'],
-    [7, 'Schayes', 'Dan', 'Dan Schayes'],
-    [78076, 'Schayes', 'Dolph', 'Dolph Schayes'],
-    [78078, 'Schectman', 'Ossie', 'Ossie Schectman'],
-    [88, 'Scheffler', 'Steve', 'Steve Scheffler'],
-    [78080, 'Scheffler', 'Tom', 'Tom Scheffler'],
-    [78081, 'Schellhase', 'Dave', 'Dave Schellhase'],
-    [101195, 'Schenscher', 'Luke', 'Luke Schenscher'],
-    [78082, 'Scherer', 'Herb', 'Herb Scherer'],
-    [368, 'Schintzius', 'Dwayne', 'Dwayne Schintzius'],
-    [78084, 'Schlueter', 'Dale', 'Dale Schlueter'],
-    [78085, 'Schnellbacher', 'Otto', 'Otto Schnellbacher'],
-    [78086, 'Schnittker', 'Dick', 'Dick Schnittker'],
-    [78087, 'Schoene', 'Russ', 'Russ Schoene'],
-    [78088, 'Scholz', 'Dave', 'Dave Scholz'],
-    [78089, 'Schoon', 'Milt', 'Milt Schoon'],
-    [96, 'Schrempf', 'Detlef', 'Detlef Schrempf'],
-    [203471, 'Schroder', 'Dennis', 'Dennis Schroder'],
-    [78091, 'Schultz', 'Howie', 'Howie Schultz'],
-    [78092, 'Schulz', 'Dick', 'Dick Schulz'],
-    [78093, 'Schweitz', 'John', 'John Schweitz'],
-    [2449, 'Scola', 'Luis', 'Luis Scola'],
-    [78094, 'Scolari', 'Freddie', 'Freddie Scolari'],
-    [78095, 'Scott', 'Alvin', 'Alvin Scott'],
-    [1064, 'Scott', 'Brent', 'Brent Scott'],
-    [2, 'Scott', 'Byron', 'Byron Scott'],
-    [78097, 'Scott', 'Charlie', 'Charlie Scott'],
-    [192, 'Scott', 'Dennis', 'Dennis Scott'],
-    [1109, 'Scott', 'James', 'James Scott'],
-    [203118, 'Scott', 'Mike', 'Mike Scott'],
-    [78100, 'Scott', 'Ray', 'Ray Scott'],
-    [1035, 'Scott', 'Shawnelle', 'Shawnelle Scott'],
-    [78102, 'Scurry', 'Carey', 'Carey Scurry'],
-    [78103, 'Seals', 'Bruce', 'Bruce Seals'],
-    [1578, 'Seals', 'Shea', 'Shea Seals'],
-    [907, 'Sealy', 'Malik', 'Malik Sealy'],
-    [78105, 'Searcy', 'Ed', 'Ed Searcy'],
-    [78106, 'Sears', 'Ken', 'Ken Sears'],
-    [78107, 'See', 'Wayne', 'Wayne See'],
-    [200757, 'Sefolosha', 'Thabo', 'Thabo Sefolosha'],
-    [938, 'Seikaly', 'Rony', 'Rony Seikaly'],
-    [78109, 'Selbo', 'Glen', 'Glen Selbo'],
-    [202729, 'Selby', 'Josh', 'Josh Selby'],
-    [1627782, 'Selden', 'Wayne', 'Wayne Selden'],
-    [78110, 'Sellers', 'Brad', 'Brad Sellers'],
-    [78111, 'Sellers', 'Phil', 'Phil Sellers'],
-    [78112, 'Seltz', 'Rollie', 'Rollie Seltz'],
-    [78113, 'Selvy', 'Frank', 'Frank Selvy'],
-    [78114, 'Seminoff', 'Jim', 'Jim Seminoff'],
-    [200754, 'Sene', 'Mouhamed', 'Mouhamed Sene'],
-    [78115, 'Senesky', 'George', 'George Senesky'],
-    [202338, 'Seraphin', 'Kevin', 'Kevin Seraphin'],
-    [1738, 'Sesay', 'Ansu', 'Ansu Sesay'],
-    [201196, 'Sessions', 'Ramon', 'Ramon Sessions'],
-    [78116, 'Sewell', 'Tom', 'Tom Sewell'],
-    [1629012, 'Sexton', 'Collin', 'Collin Sexton'],
-    [78117, 'Seymour', 'Paul', 'Paul Seymour'],
-    [78118, 'Shaback', 'Nick', 'Nick Shaback'],
-    [1593, 'Shackleford', 'Charles', 'Charles Shackleford'],
-    [78120, 'Shaeffer', 'Carl', 'Carl Shaeffer'],
-    [78121, 'Shaffer', 'Lee', 'Lee Shaffer'],
-    [201203, 'Shakur', 'Mustafa', 'Mustafa Shakur'],
-    [1629013, 'Shamet', 'Landry', 'Landry Shamet'],
-    [1539, 'Shammgod', 'God', 'God Shammgod'],
-    [78123, 'Shannon', 'Earl', 'Earl Shannon'],
-    [78124, 'Shannon', 'Howie', 'Howie Shannon'],
-    [78125, 'Share', 'Charlie', 'Charlie Share'],
-    [78126, 'Sharman', 'Bill', 'Bill Sharman'],
-    [201594, 'Sharpe', 'Walter', 'Walter Sharpe'],
-    [1117, 'Shasky', 'John', 'John Shasky'],
-    [78128, 'Shavlik', 'Ron', 'Ron Shavlik'],
-    [216, 'Shaw', 'Brian', 'Brian Shaw'],
-    [1745, 'Shaw', 'Casey', 'Casey Shaw'],
-    [78130, 'Shea', 'Bob', 'Bob Shea'],
-    [78131, 'Sheffield', 'Fred', 'Fred Sheffield'],
-    [78132, 'Shelton', 'Craig', 'Craig Shelton'],
-    [78133, 'Shelton', 'Lonnie', 'Lonnie Shelton'],
-    [203129, 'Shengelia', 'Tornike', 'Tornike Shengelia'],
-    [1852, 'Sheppard', 'Jeff', 'Jeff Sheppard'],
-    [78135, 'Sheppard', 'Steve', 'Steve Sheppard'],
-    [78136, 'Sherod', 'Edmund', 'Edmund Sherod'],
-    [78653, 'Shipp', 'Charlie', 'Charlie Shipp'],
-    [2321, 'Shirley', 'Paul', 'Paul Shirley'],
-    [78138, 'Short', 'Gene', 'Gene Short'],
-    [78139, 'Short', 'Purvis', 'Purvis Short'],
-    [78140, 'Shouse', 'Dexter', 'Dexter Shouse'],
-    [78141, 'Shrider', 'Dick', 'Dick Shrider'],
-    [78142, 'Shue', 'Gene', 'Gene Shue'],
-    [78143, 'Shumate', 'John', 'John Shumate'],
-    [202697, 'Shumpert', 'Iman', 'Iman Shumpert'],
-    [203144, 'Shved', 'Alexey', 'Alexey Shved'],
-    [1627783, 'Siakam', 'Pascal', 'Pascal Siakam'],
-    [78144, 'Sibert', 'Sam', 'Sam Sibert'],
-    [78145, 'Sibley', 'Mark', 'Mark Sibley'],
-    [78146, 'Sichting', 'Jerry', 'Jerry Sichting'],
-    [78147, 'Siegfried', 'Larry', 'Larry Siegfried'],
-    [78148, 'Siewert', 'Ralph', 'Ralph Siewert'],
-    [78149, 'Sikma', 'Jack', 'Jack Sikma'],
-    [78150, 'Silas', 'James', 'James Silas'],
-    [78151, 'Silas', 'Paul', 'Paul Silas'],
-    [202918, 'Silas', 'Xavier', 'Xavier Silas'],
-    [202081, 'Siler', 'Garret', 'Garret Siler'],
-    [78152, 'Silliman', 'Mike', 'Mike Silliman'],
-    [101134, 'Simien', 'Wayne', 'Wayne Simien'],
-    [1627732, 'Simmons', 'Ben', 'Ben Simmons'],
-    [2250, 'Simmons', 'Bobby', 'Bobby Simmons'],
-    [200759, 'Simmons', 'Cedric', 'Cedric Simmons'],
-    [78153, 'Simmons', 'Connie', 'Connie Simmons'],
-    [78154, 'Simmons', 'Johnny', 'Johnny Simmons'],
-    [203613, 'Simmons', 'Jonathon', 'Jonathon Simmons'],
-    [1628424, 'Simmons', 'Kobi', 'Kobi Simmons'],
-    [1489, 'Simmons', 'Lionel', 'Lionel Simmons'],
-    [1750, 'Simon', 'Miles', 'Miles Simon'],
-    [1629014, 'Simons', 'Anfernee', 'Anfernee Simons'],
-    [54, 'Simpkins', 'Dickey', 'Dickey Simpkins'],
-    [202067, 'Simpson', 'Diamon', 'Diamon Simpson'],
-    [78157, 'Simpson', 'Ralph', 'Ralph Simpson'],
-    [1591, 'Sims', 'Alvin', 'Alvin Sims'],
-    [78160, 'Sims', 'Bob', 'Bob Sims'],
-    [201235, 'Sims', 'Courtney', 'Courtney Sims'],
-    [78159, 'Sims', 'Doug', 'Doug Sims'],
-    [203156, 'Sims', 'Henry', 'Henry Sims'],
-    [78161, 'Sims', 'Scott', 'Scott Sims'],
-    [202713, 'Singler', 'Kyle', 'Kyle Singler'],
-    [201606, 'Singletary', 'Sean', 'Sean Singletary'],
-    [202698, 'Singleton', 'Chris', 'Chris Singleton'],
-    [101189, 'Singleton', 'James', 'James Singleton'],
-    [78162, 'Singleton', 'Mckinley', 'Mckinley Singleton'],
-    [78163, 'Sinicola', 'Zeke', 'Zeke Sinicola'],
-    [78164, 'Sitton', 'Charlie', 'Charlie Sitton'],
-    [203491, 'Siva', 'Peyton', 'Peyton Siva'],
-    [101, 'Skiles', 'Scott', 'Scott Skiles'],
-    [78167, 'Skinner', 'Al', 'Al Skinner'],
-    [1730, 'Skinner', 'Brian', 'Brian Skinner'],
-    [78168, 'Skinner', 'Talvin', 'Talvin Skinner'],
-    [78169, 'Skoog', 'Whitey', 'Whitey Skoog'],
-    [78170, 'Slade', 'Jeff', 'Jeff Slade'],
-    [1073, 'Slater', 'Reggie', 'Reggie Slater'],
-    [78171, 'Slaughter', 'Jim', 'Jim Slaughter'],
-    [78172, 'Slaughter', 'Jose', 'Jose Slaughter'],
-    [2447, 'Slay', 'Tamar', 'Tamar Slay'],
-    [202388, 'Sloan', 'Donald', 'Donald Sloan'],
-    [78173, 'Sloan', 'Jerry', 'Jerry Sloan'],
-    [101166, 'Slokar', 'Uros', 'Uros Slokar'],
-    [78174, 'Sluby', 'Tom', 'Tom Sluby'],
-    [78175, 'Smart', 'Keith', 'Keith Smart'],
-    [203935, 'Smart', 'Marcus', 'Marcus Smart'],
-    [78176, 'Smawley', 'Belus', 'Belus Smawley'],
-    [78177, 'Smiley', 'Jack', 'Jack Smiley'],
-    [78178, 'Smith', 'Adrian', 'Adrian Smith'],
-    [78207, 'Smith', 'Bill', 'Bill Smith'],
-    [78209, 'Smith', 'Bill', 'Bill Smith'],
-    [78202, 'Smith', 'Bingo', 'Bingo Smith'],
-    [78203, 'Smith', 'Bobby', 'Bobby Smith'],
-    [293, 'Smith', 'Charles', 'Charles Smith'],
-    [1520, 'Smith', 'Charles', 'Charles Smith'],
-    [78179, 'Smith', 'Charles', 'Charles Smith'],
-    [1814, 'Smith', 'Chris', 'Chris Smith'],
-    [203147, 'Smith', 'Chris', 'Chris Smith'],
-    [78181, 'Smith', 'Clinton', 'Clinton Smith'],
-    [200783, 'Smith', 'Craig', 'Craig Smith'],
-    [78182, 'Smith', 'Deb', 'Deb Smith'],
-    [78183, 'Smith', 'Derek', 'Derek Smith'],
-    [78184, 'Smith', 'Don', 'Don Smith'],
-    [78185, 'Smith', 'Donald', 'Donald Smith'],
-    [2764, 'Smith', 'Donta', 'Donta Smith'],
-    [475, 'Smith', 'Doug', 'Doug Smith'],
-    [78187, 'Smith', 'Ed', 'Ed Smith'],
-    [78188, 'Smith', 'Elmore', 'Elmore Smith'],
-    [78189, 'Smith', 'Garfield', 'Garfield Smith'],
-    [78190, 'Smith', 'Greg', 'Greg Smith'],
-    [202962, 'Smith', 'Greg', 'Greg Smith'],
-    [202397, 'Smith', 'Ish', 'Ish Smith'],
-    [2747, 'Smith', 'JR', 'JR Smith'],
-    [2074, 'Smith', 'Jabari', 'Jabari Smith'],
-    [201160, 'Smith', 'Jason', 'Jason Smith'],
-    [202536, 'Smith', 'Jerry', 'Jerry Smith'],
-    [78191, 'Smith', 'Jim', 'Jim Smith'],
-    [693, 'Smith', 'Joe', 'Joe Smith'],
-    [2746, 'Smith', 'Josh', 'Josh Smith'],
-    [78192, 'Smith', 'Keith', 'Keith Smith'],
-    [181, 'Smith', 'Kenny', 'Kenny Smith'],
-    [78194, 'Smith', 'Labradford', 'Labradford Smith'],
-    [78195, 'Smith', 'Larry', 'Larry Smith'],
-    [1910, 'Smith', 'Leon', 'Leon Smith'],
-    [63, 'Smith', 'Michael', 'Michael Smith'],
-    [78197, 'Smith', 'Michael', 'Michael Smith'],
-    [2065, 'Smith', 'Mike', 'Mike Smith'],
-    [202701, 'Smith', 'Nolan', 'Nolan Smith'],
-    [78198, 'Smith', 'Otis', 'Otis Smith'],
-    [78199, 'Smith', 'Phil', 'Phil Smith'],
-    [78200, 'Smith', 'Randy', 'Randy Smith'],
-    [78201, 'Smith', 'Reggie', 'Reggie Smith'],
-    [78204, 'Smith', 'Robert', 'Robert Smith'],
-    [203893, 'Smith', 'Russ', 'Russ Smith'],
-    [78205, 'Smith', 'Sammy', 'Sammy Smith'],
-    [120, 'Smith', 'Steven', 'Steven Smith'],
-    [200848, 'Smith', 'Steven', 'Steven Smith'],
-    [1478, 'Smith', 'Stevin', 'Stevin Smith'],
-    [2604, 'Smith', 'Theron', 'Theron Smith'],
-    [380, 'Smith', 'Tony', 'Tony Smith'],
-    [78208, 'Smith', 'Willie', 'Willie Smith'],
-    [1629146, 'Smith', 'Zach', 'Zach Smith'],
-    [1629015, 'Smith', 'Zhaire', 'Zhaire Smith'],
-    [1628372, 'Smith Jr.', 'Dennis', 'Dennis Smith Jr.'],
-    [22, 'Smits', 'Rik', 'Rik Smits'],
-    [1091, 'Smrek', 'Mike', 'Mike Smrek'],
-    [78212, 'Smyth', 'Joe', 'Joe Smyth'],
-    [203503, 'Snell', 'Tony', 'Tony Snell'],
-    [727, 'Snow', 'Eric', 'Eric Snow'],
-    [78213, 'Snyder', 'Dick', 'Dick Snyder'],
-    [2745, 'Snyder', 'Kirk', 'Kirk Snyder'],
-    [78214, 'Sobek', 'George', 'George Sobek'],
-    [78215, 'Sobers', 'Ricky', 'Ricky Sobers'],
-    [78216, 'Sobie', 'Ron', 'Ron Sobie'],
-    [78217, 'Sojourner', 'Mike', 'Mike Sojourner'],
-    [2226, 'Solomon', 'Will', 'Will Solomon'],
-    [78219, 'Somerset', 'Willie', 'Willie Somerset'],
-    [2443, 'Songaila', 'Darius', 'Darius Songaila'],
-    [78220, 'Sorenson', 'Dave', 'Dave Sorenson'],
-    [203480, 'Southerland', 'James', 'James Southerland'],
-    [78221, 'Sovran', 'Gino', 'Gino Sovran'],
-    [2776, 'Sow', 'Pape', 'Pape Sow'],
-    [1629034, 'Spalding', 'Ray', 'Ray Spalding'],
-    [78222, 'Spanarkel', 'Jim', 'Jim Spanarkel'],
-    [2779, 'Spanoulis', 'Vassilis', 'Vassilis Spanoulis'],
-    [78223, 'Sparrow', 'Guy', 'Guy Sparrow'],
-    [600009, 'Sparrow', 'Rory', 'Rory Sparrow'],
-    [78225, 'Spears', 'Odie', 'Odie Spears'],
-    [78226, 'Spector', 'Art', 'Art Spector'],
-    [201578, 'Speights', 'Marreese', 'Marreese Speights'],
-    [1629016, 'Spellman', 'Omari', 'Omari Spellman'],
-    [78227, 'Spencer', 'Andre', 'Andre Spencer'],
-    [771, 'Spencer', 'Elmore', 'Elmore Spencer'],
-    [280, 'Spencer', 'Felton', 'Felton Spencer'],
-    [78230, 'Spicer', 'Lou', 'Lou Spicer'],
-    [78231, 'Spitzer', 'Craig', 'Craig Spitzer'],
-    [201168, 'Splitter', 'Tiago', 'Tiago Splitter'],
-    [78232, 'Spoelstra', 'Art', 'Art Spoelstra'],
-    [84, 'Sprewell', 'Latrell', 'Latrell Sprewell'],
-    [78233, 'Spriggs', 'Larry', 'Larry Spriggs'],
-    [78234, 'Springer', 'Jim', 'Jim Springer'],
-    [78235, 'Spruill', 'Jim', 'Jim Spruill'],
-    [1756, 'Stack', 'Ryan', 'Ryan Stack'],
-    [711, 'Stackhouse', 'Jerry', 'Jerry Stackhouse'],
-    [78237, 'Stacom', 'Kevin', 'Kevin Stacom'],
-    [78238, 'Stallworth', 'Dave', 'Dave Stallworth'],
-    [78239, 'Stallworth', 'Isaac', 'Isaac Stallworth'],
-    [78240, 'Stanczak', 'Ed', 'Ed Stanczak'],
-    [78241, 'Stansbury', 'Terence', 'Terence Stansbury'],
-    [317, 'Starks', 'John', 'John Starks'],
-    [78243, 'Starr', 'Keith', 'Keith Starr'],
-    [203917, 'Stauskas', 'Nik', 'Nik Stauskas'],
-    [78244, 'Staverman', 'Larry', 'Larry Staverman'],
-    [78245, 'Steele', 'Larry', 'Larry Steele'],
-    [1099, 'Steigenga', 'Matt', 'Matt Steigenga'],
-    [1735, 'Stepania', 'Vladimir', 'Vladimir Stepania'],
-    [203474, 'Stephens', 'DJ', 'DJ Stephens'],
-    [78247, 'Stephens', 'Everette', 'Everette Stephens'],
-    [78249, 'Stephens', 'Jack', 'Jack Stephens'],
-    [1086, 'Stephens', 'Joe', 'Joe Stephens'],
-    [202362, 'Stephenson', 'Lance', 'Lance Stephenson'],
-    [1627293, 'Stepheson', 'Alex', 'Alex Stepheson'],
-    [78250, 'Steppe', 'Brook', 'Brook Steppe'],
-    [78251, 'Stevens', 'Barry', 'Barry Stevens'],
-    [78252, 'Stevens', 'Wayne', 'Wayne Stevens'],
-    [2052, 'Stevenson', 'DeShawn', 'DeShawn Stevenson'],
-    [78253, 'Stewart', 'Dennis', 'Dennis Stewart'],
-    [1529, 'Stewart', 'Kebu', 'Kebu Stewart'],
-    [1125, 'Stewart', 'Larry', 'Larry Stewart'],
-    [1565, 'Stewart', 'Michael', 'Michael Stewart'],
-    [78256, 'Stewart', 'Norm', 'Norm Stewart'],
-    [201880, 'Stiemsma', 'Greg', 'Greg Stiemsma'],
-    [78257, 'Stipanovich', 'Steve', 'Steve Stipanovich'],
-    [179, 'Stith', 'Bryant', 'Bryant Stith'],
-    [78259, 'Stith', 'Sam', 'Sam Stith'],
-    [78260, 'Stith', 'Tom', 'Tom Stith'],
-    [78261, 'Stivrins', 'Alex', 'Alex Stivrins'],
-    [204065, 'Stockton', 'David', 'David Stockton'],
-    [304, 'Stockton', 'John', 'John Stockton'],
-    [978, 'Stojakovic', 'Peja', 'Peja Stojakovic'],
-    [1055, 'Stokes', 'Ed', 'Ed Stokes'],
-    [78264, 'Stokes', 'Greg', 'Greg Stokes'],
-    [203950, 'Stokes', 'Jarnell', 'Jarnell Stokes'],
-    [600016, 'Stokes', 'Maurice', 'Maurice Stokes'],
-    [78266, 'Stolkey', 'Art', 'Art Stolkey'],
-    [1627754, 'Stone', 'Diamond', 'Diamond Stone'],
-    [202933, 'Stone', 'Julyan', 'Julyan Stone'],
-    [2852, 'Storey', 'Awvee', 'Awvee Storey'],
-    [757, 'Stoudamire', 'Damon', 'Damon Stoudamire'],
-    [101136, 'Stoudamire', 'Salim', 'Salim Stoudamire'],
-    [2405, 'Stoudemire', "Amar'e", "Amar'e Stoudemire"],
-    [78267, 'Stovall', 'Paul', 'Paul Stovall'],
-    [201199, 'Strawberry', 'DJ', 'DJ Strawberry'],
-    [78268, 'Strawder', 'Joe', 'Joe Strawder'],
-    [78269, 'Stricker', 'Bill', 'Bill Stricker'],
-    [1065, 'Strickland', 'Erick', 'Erick Strickland'],
-    [1110, 'Strickland', 'Mark', 'Mark Strickland'],
-    [393, 'Strickland', 'Rod', 'Rod Strickland'],
-    [78270, 'Strickland', 'Roger', 'Roger Strickland'],
-    [78271, 'Stroeder', 'John', 'John Stroeder'],
-    [400, 'Strong', 'Derek', 'Derek Strong'],
-    [78273, 'Strothers', 'Lamont', 'Lamont Strothers'],
-    [78274, 'Stroud', 'John', 'John Stroud'],
-    [201155, 'Stuckey', 'Rodney', 'Rodney Stuckey'],
-    [78275, 'Stump', 'Gene', 'Gene Stump'],
-    [78276, 'Stutz', 'Stan', 'Stan Stutz'],
-    [78277, 'Suiter', 'Gary', 'Gary Suiter'],
-    [203096, 'Sullinger', 'Jared', 'Jared Sullinger'],
-    [201969, 'Summers', 'DaJuan', 'DaJuan Summers'],
-    [1628410, 'Sumner', 'Edmond', 'Edmond Sumner'],
-    [78654, 'Sumpter', 'Barry', 'Barry Sumpter'],
-    [201180, 'Sun', 'Sun', 'Sun Sun'],
-    [78278, 'Sunderlage', 'Don', 'Don Sunderlage'],
-    [1743, 'Sundov', 'Bruno', 'Bruno Sundov'],
-    [78279, 'Sundvold', 'Jon', 'Jon Sundvold'],
-    [682, 'Sura', 'Bob', 'Bob Sura'],
-    [78280, 'Surhoff', 'Dick', 'Dick Surhoff'],
-    [78281, 'Suttle', 'Dane', 'Dane Suttle'],
-    [357, 'Sutton', 'Greg', 'Greg Sutton'],
-    [78283, 'Swain', 'Bennie', 'Bennie Swain'],
-    [1628403, 'Swanigan', 'Caleb', 'Caleb Swanigan'],
-    [78284, 'Swanson', 'Norm', 'Norm Swanson'],
-    [78285, 'Swartz', 'Dan', 'Dan Swartz'],
-    [2552, 'Sweetney', 'Michael', 'Michael Sweetney'],
-    [2741, 'Swift', 'Robert', 'Robert Swift'],
-    [2031, 'Swift', 'Stromile', 'Stromile Swift'],
-    [78286, 'Swinson', 'Aaron', 'Aaron Swinson'],
-    [202377, 'Sy', 'Pape', 'Pape Sy'],
-    [78287, 'Sydnor', 'Wallace', 'Wallace Sydnor'],
-    [1132, 'Sykes', 'Larry', 'Larry Sykes'],
-    [1136, 'Szabo', 'Brett', 'Brett Szabo'],
-    [1887, 'Szczerbiak', 'Wally', 'Wally Szczerbiak'],
-    [440, 'Tabak', 'Zan', 'Zan Tabak'],
-    [2657, 'Tabuse', 'Yuta', 'Yuta Tabuse'],
-    [101147, 'Taft', 'Chris', 'Chris Taft'],
-    [78291, 'Tannenbaum', 'Sid', 'Sid Tannenbaum'],
-    [1434, 'Tarlac', 'Dragan', 'Dragan Tarlac'],
-    [78293, 'Tarpley', 'Roy', 'Roy Tarpley'],
-    [78294, 'Tatum', 'Earl', 'Earl Tatum'],
-    [1628369, 'Tatum', 'Jayson', 'Jayson Tatum'],
-    [204002, 'Tavares', 'Edy', 'Edy Tavares'],
-    [78295, 'Taylor', 'Anthony', 'Anthony Taylor'],
-    [78296, 'Taylor', 'Brian', 'Brian Taylor'],
-    [101182, 'Taylor', 'Donell', 'Donell Taylor'],
-    [78298, 'Taylor', 'Fred', 'Fred Taylor'],
-    [1627819, 'Taylor', 'Isaiah', 'Isaiah Taylor'],
-    [78297, 'Taylor', 'Jay', 'Jay Taylor'],
-    [78299, 'Taylor', 'Jeff', 'Jeff Taylor'],
-    [203106, 'Taylor', 'Jeffery', 'Jeffery Taylor'],
-    [201966, 'Taylor', 'Jermaine', 'Jermaine Taylor'],
-    [1511, 'Taylor', 'Johnny', 'Johnny Taylor'],
-    [78301, 'Taylor', 'Leonard', 'Leonard Taylor'],
-    [1508, 'Taylor', 'Maurice', 'Maurice Taylor'],
-    [201446, 'Taylor', 'Mike', 'Mike Taylor'],
-    [78302, 'Taylor', 'Roland', 'Roland Taylor'],
-    [203116, 'Taylor', 'Tyshawn', 'Tyshawn Taylor'],
-    [78303, 'Taylor', 'Vince', 'Vince Taylor'],
-    [78304, 'Teagle', 'Terry', 'Terry Teagle'],
-    [201952, 'Teague', 'Jeff', 'Jeff Teague'],
-    [203104, 'Teague', 'Marquis', 'Marquis Teague'],
-    [203141, 'Teletovic', 'Mirza', 'Mirza Teletovic'],
-    [2742, 'Telfair', 'Sebastian', 'Sebastian Telfair'],
-    [202066, 'Temple', 'Garrett', 'Garrett Temple'],
-    [1628462, 'Teodosic', 'Milos', 'Milos Teodosic'],
-    [78305, 'Terrell', 'Ira', 'Ira Terrell'],
-    [1629123, 'Terrell', 'Jared', 'Jared Terrell'],
-    [78307, 'Terry', 'Carlos', 'Carlos Terry'],
-    [78306, 'Terry', 'Chuck', 'Chuck Terry'],
-    [78308, 'Terry', 'Claude', 'Claude Terry'],
-    [1629150, 'Terry', 'Emanuel', 'Emanuel Terry'],
-    [1891, 'Terry', 'Jason', 'Jason Terry'],
-    [201934, 'Thabeet', 'Hasheem', 'Hasheem Thabeet'],
-    [78309, 'Thacker', 'Tom', 'Tom Thacker'],
-    [1628464, 'Theis', 'Daniel', 'Daniel Theis'],
-    [78310, 'Theus', 'Reggie', 'Reggie Theus'],
-    [78311, 'Thibeaux', 'Peter', 'Peter Thibeaux'],
-    [78312, 'Thieben', 'Bill', 'Bill Thieben'],
-    [78313, 'Thigpen', 'Justus', 'Justus Thigpen'],
-    [78314, 'Thirdkill', 'David', 'David Thirdkill'],
-    [203519, 'Thomas', 'Adonis', 'Adonis Thomas'],
-    [2873, 'Thomas', 'Billy', 'Billy Thomas'],
-    [1063, 'Thomas', 'Carl', 'Carl Thomas'],
-    [78316, 'Thomas', 'Charles', 'Charles Thomas'],
-    [2041, 'Thomas', 'Etan', 'Etan Thomas'],
-    [78317, 'Thomas', 'Irving', 'Irving Thomas'],
-    [202738, 'Thomas', 'Isaiah', 'Isaiah Thomas'],
-    [78318, 'Thomas', 'Isiah', 'Isiah Thomas'],
-    [1975, 'Thomas', 'Jamel', 'Jamel Thomas'],
-    [2839, 'Thomas', 'James', 'James Thomas'],
-    [78320, 'Thomas', 'Jim', 'Jim Thomas'],
-    [78321, 'Thomas', 'Joe', 'Joe Thomas'],
-    [1519, 'Thomas', 'John', 'John Thomas'],
-    [1903, 'Thomas', 'Kenny', 'Kenny Thomas'],
-    [1629017, 'Thomas', 'Khyri', 'Khyri Thomas'],
-    [703, 'Thomas', 'Kurt', 'Kurt Thomas'],
-    [202498, 'Thomas', 'Lance', 'Lance Thomas'],
-    [202952, 'Thomas', 'Malcolm', 'Malcolm Thomas'],
-    [78322, 'Thomas', 'Terry', 'Terry Thomas'],
-    [1501, 'Thomas', 'Tim', 'Tim Thomas'],
-    [200748, 'Thomas', 'Tyrus', 'Tyrus Thomas'],
-    [202717, 'Thompkins', 'Trey', 'Trey Thompkins'],
-    [78323, 'Thompson', 'Bernard', 'Bernard Thompson'],
-    [1631, 'Thompson', 'Billy', 'Billy Thompson'],
-    [240, 'Thompson', 'Brooks', 'Brooks Thompson'],
-    [78325, 'Thompson', 'Corny', 'Corny Thompson'],
-    [78326, 'Thompson', 'David', 'David Thompson'],
-    [101159, 'Thompson', 'Dijon', 'Dijon Thompson'],
-    [78327, 'Thompson', 'George', 'George Thompson'],
-    [203138, 'Thompson', 'Hollis', 'Hollis Thompson'],
-    [201574, 'Thompson', 'Jason', 'Jason Thompson'],
-    [78328, 'Thompson', 'John', 'John Thompson'],
-    [78329, 'Thompson', 'Kevin', 'Kevin Thompson'],
-    [202691, 'Thompson', 'Klay', 'Klay Thompson'],
-    [78, 'Thompson', 'LaSalle', 'LaSalle Thompson'],
-    [78331, 'Thompson', 'Mychal', 'Mychal Thompson'],
-    [202814, 'Thompson', 'Mychel', 'Mychel Thompson'],
-    [78332, 'Thompson', 'Paul', 'Paul Thompson'],
-    [78333, 'Thompson', 'Stephen', 'Stephen Thompson'],
-    [202684, 'Thompson', 'Tristan', 'Tristan Thompson'],
-    [78335, 'Thorn', 'Rod', 'Rod Thorn'],
-    [201154, 'Thornton', 'Al', 'Al Thornton'],
-    [738, 'Thornton', 'Bob', 'Bob Thornton'],
-    [201977, 'Thornton', 'Marcus', 'Marcus Thornton'],
-    [1628414, 'Thornwell', 'Sindarius', 'Sindarius Thornwell'],
-    [901, 'Thorpe', 'Otis', 'Otis Thorpe'],
-    [9, 'Threatt', 'Sedale', 'Sedale Threatt'],
-    [600001, 'Thurmond', 'Nate', 'Nate Thurmond'],
-    [78340, 'Thurston', 'Mel', 'Mel Thurston'],
-    [78341, 'Tidrick', 'Howard', 'Howard Tidrick'],
-    [78342, 'Tieman', 'Dan', 'Dan Tieman'],
-    [78343, 'Tillis', 'Darren', 'Darren Tillis'],
-    [78344, 'Tingle', 'Jack', 'Jack Tingle'],
-    [2224, 'Tinsley', 'Jamaal', 'Jamaal Tinsley'],
-    [47, 'Tisdale', 'Wayman', 'Wayman Tisdale'],
-    [1627861, 'Tobey', 'Mike', 'Mike Tobey'],
-    [78346, 'Todorovich', 'Marko', 'Marko Todorovich'],
-    [78348, 'Tolbert', 'Ray', 'Ray Tolbert'],
-    [78347, 'Tolbert', 'Tom', 'Tom Tolbert'],
-    [201229, 'Tolliver', 'Anthony', 'Anthony Tolliver'],
-    [78349, 'Tolson', 'Dean', 'Dean Tolson'],
-    [78350, 'Tomjanovich', 'Rudy', 'Rudy Tomjanovich'],
-    [78351, 'Toney', 'Andrew', 'Andrew Toney'],
-    [78352, 'Toney', 'Sedric', 'Sedric Toney'],
-    [78353, 'Tonkovich', 'Andy', 'Andy Tonkovich'],
-    [342, 'Toolson', 'Andy', 'Andy Toolson'],
-    [78355, 'Toomay', 'Jack', 'Jack Toomay'],
-    [78356, 'Toone', 'Bernard', 'Bernard Toone'],
-    [78357, 'Torgoff', 'Irv', 'Irv Torgoff'],
-    [78358, 'Tormohlen', 'Gene', 'Gene Tormohlen'],
-    [2351, 'Torres', 'Oscar', 'Oscar Torres'],
-    [78359, 'Tosheff', 'Bill', 'Bill Tosheff'],
-    [78360, 'Tough', 'Bob', 'Bob Tough'],
-    [1626253, 'Toupane', 'Axel', 'Axel Toupane'],
-    [78361, 'Towe', 'Monte', 'Monte Towe'],
-    [700, 'Tower', 'Keith', 'Keith Tower'],
-    [78363, 'Towery', 'William', 'William Towery'],
-    [78364, 'Townes', 'Linton', 'Linton Townes'],
-    [1626157, 'Towns', 'Karl-Anthony', 'Karl-Anthony Towns'],
-    [78365, 'Townsend', 'Raymond', 'Raymond Townsend'],
-    [78366, 'Trapp', 'George', 'George Trapp'],
-    [78367, 'Trapp', 'John', 'John Trapp'],
-    [1714, 'Traylor', 'Robert', 'Robert Traylor'],
-    [718, 'Trent', 'Gary', 'Gary Trent'],
-    [1629107, 'Trent Jr.', 'Gary', 'Gary Trent Jr.'],
-    [2244, 'Trepagnier', 'Jeff', 'Jeff Trepagnier'],
-    [78651, 'Tresvant', 'John', 'John Tresvant'],
-    [1629019, 'Trier', 'Allonzo', 'Allonzo Trier'],
-    [78368, 'Triptow', 'Dick', 'Dick Triptow'],
-    [78369, 'Tripucka', 'Kelly', 'Kelly Tripucka'],
-    [2456, 'Trybanski', 'Cezary', 'Cezary Trybanski'],
-    [2054, 'Tsakalidis', 'Jake', 'Jake Tsakalidis'],
-    [78370, 'Tschogl', 'John', 'John Tschogl'],
-    [78371, 'Tsioropoulos', 'Lou', 'Lou Tsioropoulos'],
-    [2401, 'Tskitishvili', 'Nikoloz', 'Nikoloz Tskitishvili'],
-    [78372, 'Tucker', 'Al', 'Al Tucker'],
-    [201169, 'Tucker', 'Alando', 'Alando Tucker'],
-    [141, 'Tucker', 'Anthony', 'Anthony Tucker'],
-    [78374, 'Tucker', 'Jim', 'Jim Tucker'],
-    [200782, 'Tucker', 'PJ', 'PJ Tucker'],
-    [78375, 'Tucker', 'Trent', 'Trent Tucker'],
-    [101142, 'Turiaf', 'Ronny', 'Ronny Turiaf'],
-    [1726, 'Turkcan', 'Mirsad', 'Mirsad Turkcan'],
-    [2045, 'Turkoglu', 'Hedo', 'Hedo Turkoglu'],
-    [78377, 'Turner', 'Andre', 'Andre Turner'],
-    [78385, 'Turner', 'Bill', 'Bill Turner'],
-    [78378, 'Turner', 'Elston', 'Elston Turner'],
-    [202323, 'Turner', 'Evan', 'Evan Turner'],
-    [78379, 'Turner', 'Henry', 'Henry Turner'],
-    [78380, 'Turner', 'Jack', 'Jack Turner'],
-    [78382, 'Turner', 'Jack', 'Jack Turner'],
-    [78381, 'Turner', 'Jeff', 'Jeff Turner'],
-    [1819, 'Turner', 'John', 'John Turner'],
-    [1626167, 'Turner', 'Myles', 'Myles Turner'],
-    [1943, 'Turner', 'Wayne', 'Wayne Turner'],
-    [78386, 'Turpin', 'Mel', 'Mel Turpin'],
-    [78387, 'Twardzik', 'Dave', 'Dave Twardzik'],
-    [78388, 'Twyman', 'Jack', 'Jack Twyman'],
-    [189, 'Tyler', 'B.J.', 'B.J. Tyler'],
-    [202719, 'Tyler', 'Jeremy', 'Jeremy Tyler'],
-    [78390, 'Tyler', 'Terry', 'Terry Tyler'],
-    [78391, 'Tyra', 'Charlie', 'Charlie Tyra'],
-    [202775, 'Ubiles', 'Edwin', 'Edwin Ubiles'],
-    [202327, 'Udoh', 'Ekpe', 'Ekpe Udoh'],
-    [2137, 'Udoka', 'Ime', 'Ime Udoka'],
-    [2757, 'Udrih', 'Beno', 'Beno Udrih'],
-    [101146, 'Ukic', 'Roko', 'Roko Ukic'],
-    [1627755, 'Ulis', 'Tyler', 'Tyler Ulis'],
-    [78392, 'Unseld', 'Wes', 'Wes Unseld'],
-    [78393, 'Uplinger', 'Hal', 'Hal Uplinger'],
-    [78394, 'Upshaw', 'Kelvin', 'Kelvin Upshaw'],
-    [1627784, 'Uthoff', 'Jarrod', 'Jarrod Uthoff'],
-    [202386, 'Uzoh', 'Ben', 'Ben Uzoh'],
-    [201987, 'Vaden', 'Robert', 'Robert Vaden'],
-    [202685, 'Valanciunas', 'Jonas', 'Jonas Valanciunas'],
-    [78395, 'Valentine', 'Darnell', 'Darnell Valentine'],
-    [1627756, 'Valentine', 'Denzel', 'Denzel Valentine'],
-    [78396, 'Valentine', 'Ron', 'Ron Valentine'],
-    [78397, 'Vallely', 'John', 'John Vallely'],
-    [78398, 'Van Arsdale', 'Dick', 'Dick Van Arsdale'],
-    [78399, 'Van Arsdale', 'Tom', 'Tom Van Arsdale'],
-    [78401, 'Van Breda Kolff', 'Butch', 'Butch Van Breda Kolff'],
-    [78400, 'Van Breda Kolff', 'Jan', 'Jan Van Breda Kolff'],
-    [89, 'Van Exel', 'Nick', 'Nick Van Exel'],
-    [1496, 'Van Horn', 'Keith', 'Keith Van Horn'],
-    [78406, 'Van Lier', 'Norm', 'Norm Van Lier'],
-    [1627832, 'VanVleet', 'Fred', 'Fred VanVleet'],
-    [78402, 'Vance', 'Gene', 'Gene Vance'],
-    [78403, 'Vander Velden', 'Log', 'Log Vander Velden'],
-    [1629020, 'Vanderbilt', 'Jarred', 'Jarred Vanderbilt'],
-    [78405, 'Vandeweghe', 'Ernie', 'Ernie Vandeweghe'],
-    [78404, 'Vandeweghe', 'Kiki', 'Kiki Vandeweghe'],
-    [78407, 'Vanos', 'Nick', 'Nick Vanos'],
-    [2128, 'Vanterpool', 'David', 'David Vanterpool'],
-    [2237, 'Varda', 'Ratko', 'Ratko Varda'],
-    [2760, 'Varejao', 'Anderson', 'Anderson Varejao'],
-    [202363, 'Varnado', 'Jarvis', 'Jarvis Varnado'],
-    [202349, 'Vasquez', 'Greivis', 'Greivis Vasquez'],
-    [78409, 'Vaughn', 'Charles', 'Charles Vaughn'],
-    [710, 'Vaughn', 'David', 'David Vaughn'],
-    [1521, 'Vaughn', 'Jacque', 'Jacque Vaughn'],
-    [1626173, 'Vaughn', 'Rashad', 'Rashad Vaughn'],
-    [78411, 'Vaughn', 'Virgil', 'Virgil Vaughn'],
-    [919, 'Vaught', 'Loy', 'Loy Vaught'],
-    [78413, 'Verga', 'Bob', 'Bob Verga'],
-    [78414, 'Verhoeven', 'Peter', 'Peter Verhoeven'],
-    [202686, 'Vesely', 'Jan', 'Jan Vesely'],
-    [78415, 'Vetra', 'Gundars', 'Gundars Vetra'],
-    [78416, 'Vianna', 'Joao', 'Joao Vianna'],
-    [101111, 'Villanueva', 'Charlie', 'Charlie Villanueva'],
-    [78418, 'Vincent', 'Jay', 'Jay Vincent'],
-    [78417, 'Vincent', 'Sam', 'Sam Vincent'],
-    [200790, 'Vinicius', 'Marcus', 'Marcus Vinicius'],
-    [1844, 'Vinson', 'Fred', 'Fred Vinson'],
-    [78419, 'Voce', 'Gary', 'Gary Voce'],
-    [78420, 'Volker', 'Floyd', 'Floyd Volker'],
-    [78421, 'Volkov', 'Alexander', 'Alexander Volkov'],
-    [78422, 'Von Nieda', 'Whitey', 'Whitey Von Nieda'],
-    [203943, 'Vonleh', 'Noah', 'Noah Vonleh'],
-    [2063, 'Voskuhl', 'Jake', 'Jake Voskuhl'],
-    [78423, 'Vranes', 'Danny', 'Danny Vranes'],
-    [2582, 'Vranes', 'Slavko', 'Slavko Vranes'],
-    [1037, 'Vrankovic', 'Stojko', 'Stojko Vrankovic'],
-    [78425, 'Vroman', 'Brett', 'Brett Vroman'],
-    [2761, 'Vroman', 'Jackson', 'Jackson Vroman'],
-    [202696, 'Vucevic', 'Nikola', 'Nikola Vucevic'],
-    [2756, 'Vujacic', 'Sasha', 'Sasha Vujacic'],
-    [2548, 'Wade', 'Dwyane', 'Dwyane Wade'],
-    [78426, 'Wade', 'Mark', 'Mark Wade'],
-    [101144, 'Wafer', 'Von', 'Von Wafer'],
-    [78427, 'Wager', 'Clint', 'Clint Wager'],
-    [2402, 'Wagner', 'Dajuan', 'Dajuan Wagner'],
-    [78428, 'Wagner', 'Danny', 'Danny Wagner'],
-    [78429, 'Wagner', 'Milt', 'Milt Wagner'],
-    [1629021, 'Wagner', 'Moritz', 'Moritz Wagner'],
-    [203079, 'Waiters', 'Dion', 'Dion Waiters'],
-    [78430, 'Waiters', 'Granville', 'Granville Waiters'],
-    [78431, 'Wakefield', 'Andre', 'Andre Wakefield'],
-    [78432, 'Walk', 'Neal', 'Neal Walk'],
-    [78433, 'Walker', 'Andy', 'Andy Walker'],
-    [952, 'Walker', 'Antoine', 'Antoine Walker'],
-    [78434, 'Walker', 'Brady', 'Brady Walker'],
-    [78435, 'Walker', 'Chet', 'Chet Walker'],
-    [78437, 'Walker', 'Darrell', 'Darrell Walker'],
-    [78436, 'Walker', 'Foots', 'Foots Walker'],
-    [201611, 'Walker', 'Henry', 'Henry Walker'],
-    [78438, 'Walker', 'Horace', 'Horace Walker'],
-    [78439, 'Walker', 'Jimmy', 'Jimmy Walker'],
-    [202689, 'Walker', 'Kemba', 'Kemba Walker'],
-    [78440, 'Walker', 'Kenny', 'Kenny Walker'],
-    [78441, 'Walker', 'Phil', 'Phil Walker'],
-    [955, 'Walker', 'Samaki', 'Samaki Walker'],
-    [78442, 'Walker', 'Wally', 'Wally Walker'],
-    [1629022, 'Walker IV', 'Lonnie', 'Lonnie Walker IV'],
-    [202322, 'Wall', 'John', 'John Wall'],
-    [1112, 'Wallace', 'Ben', 'Ben Wallace'],
-    [2222, 'Wallace', 'Gerald', 'Gerald Wallace'],
-    [961, 'Wallace', 'John', 'John Wallace'],
-    [78443, 'Wallace', 'Michael', 'Michael Wallace'],
-    [739, 'Wallace', 'Rasheed', 'Rasheed Wallace'],
-    [1627820, 'Wallace', 'Tyrone', 'Tyrone Wallace'],
-    [78444, 'Waller', 'Dwight', 'Dwight Waller'],
-    [78445, 'Waller', 'Jamie', 'Jamie Waller'],
-    [78446, 'Walsh', 'Jim', 'Jim Walsh'],
-    [101190, 'Walsh', 'Matt', 'Matt Walsh'],
-    [777, 'Walters', 'Rex', 'Rex Walters'],
-    [78447, 'Walther', 'Paul', 'Paul Walther'],
-    [78448, 'Walthour', 'Rabbit', 'Rabbit Walthour'],
-    [78450, 'Walton', 'Bill', 'Bill Walton'],
-    [78449, 'Walton', 'Lloyd', 'Lloyd Walton'],
-    [2575, 'Walton', 'Luke', 'Luke Walton'],
-    [1628476, 'Walton Jr.', 'Derrick', 'Derrick Walton Jr.'],
-    [202954, 'Wanamaker', 'Brad', 'Brad Wanamaker'],
-    [78453, 'Wanzer', 'Bobby', 'Bobby Wanzer'],
-    [78454, 'Warbington', 'Perry', 'Perry Warbington'],
-    [369, 'Ward', 'Charlie', 'Charlie Ward'],
-    [78455, 'Ward', 'Gerry', 'Gerry Ward'],
-    [78456, 'Ward', 'Henry', 'Henry Ward'],
-    [203810, 'Ware', 'Casper', 'Casper Ware'],
-    [78457, 'Ware', 'Jim', 'Jim Ware'],
-    [78458, 'Warley', 'Ben', 'Ben Warley'],
-    [78459, 'Warlick', 'Bob', 'Bob Warlick'],
-    [78460, 'Warner', 'Cornell', 'Cornell Warner'],
-    [1627866, 'Warney', 'Jameel', 'Jameel Warney'],
-    [78461, 'Warren', 'Johnny', 'Johnny Warren'],
-    [203933, 'Warren', 'TJ', 'TJ Warren'],
-    [202378, 'Warren', 'Willie', 'Willie Warren'],
-    [78462, 'Warrick', 'Bryan', 'Bryan Warrick'],
-    [101124, 'Warrick', 'Hakim', 'Hakim Warrick'],
-    [78463, 'Washburn', 'Chris', 'Chris Washburn'],
-    [78469, 'Washington', 'Bobby', 'Bobby Washington'],
-    [200827, 'Washington', 'Darius', 'Darius Washington'],
-    [78464, 'Washington', 'Duane', 'Duane Washington'],
-    [78465, 'Washington', 'Dwayne', 'Dwayne Washington'],
-    [1540, 'Washington', 'Eric', 'Eric Washington'],
-    [78466, 'Washington', 'Jim', 'Jim Washington'],
-    [78467, 'Washington', 'Kermit', 'Kermit Washington'],
-    [78468, 'Washington', 'Richard', 'Richard Washington'],
-    [78470, 'Washington', 'Stan', 'Stan Washington'],
-    [78471, 'Washington', 'Wilson', 'Wilson Washington'],
-    [1629139, 'Watanabe', 'Yuta', 'Yuta Watanabe'],
-    [201208, 'Watkins', 'Darryl', 'Darryl Watkins'],
-    [201228, 'Watson', 'C.J.', 'C.J. Watson'],
-    [2248, 'Watson', 'Earl', 'Earl Watson'],
-    [320, 'Watson', 'Jamie', 'Jamie Watson'],
-    [78474, 'Watts', 'Ron', 'Ron Watts'],
-    [78473, 'Watts', 'Slick', 'Slick Watts'],
-    [203146, 'Wayns', 'Maalik', 'Maalik Wayns'],
-    [204033, 'Wear', 'David', 'David Wear'],
-    [204037, 'Wear', 'Travis', 'Travis Wear'],
-    [221, 'Weatherspoon', 'Clar.', 'Clar. Weatherspoon'],
-    [78475, 'Weatherspoon', 'Nick', 'Nick Weatherspoon'],
-    [201602, 'Weaver', 'Kyle', 'Kyle Weaver'],
-    [78477, 'Webb', 'Jeff', 'Jeff Webb'],
-    [78478, 'Webb', 'Marcus', 'Marcus Webb'],
-    [892, 'Webb', 'Spud', 'Spud Webb'],
-    [1627821, 'Webb III', 'James', 'James Webb III'],
-    [185, 'Webber', 'Chris', 'Chris Webber'],
-    [1627362, 'Weber', 'Briante', 'Briante Weber'],
-    [78479, 'Weber', 'Forest', 'Forest Weber'],
-    [1067, 'Webster', 'Jeff', 'Jeff Webster'],
-    [101110, 'Webster', 'Martell', 'Martell Webster'],
-    [78481, 'Webster', 'Marvin', 'Marvin Webster'],
-    [78482, 'Wedman', 'Scott', 'Scott Wedman'],
-    [201603, 'Weems', 'Sonny', 'Sonny Weems'],
-    [78483, 'Wehr', 'Dick', 'Dick Wehr'],
-    [78484, 'Weidner', 'Brant', 'Brant Weidner'],
-    [78485, 'Weiss', 'Bob', 'Bob Weiss'],
-    [78486, 'Weitzman', 'Rick', 'Rick Weitzman'],
-    [1719, 'Wells', 'Bonzi', 'Bonzi Wells'],
-    [1528, 'Wells', 'Bubba', 'Bubba Wells'],
-    [78488, 'Wells', 'Owen', 'Owen Wells'],
-    [78489, 'Wells', 'Ralph', 'Ralph Wells'],
-    [1846, 'Welp', 'Chris', 'Chris Welp'],
-    [2412, 'Welsch', 'Jiri', 'Jiri Welsch'],
-    [1629118, 'Welsh', 'Thomas', 'Thomas Welsh'],
-    [82, 'Wennington', 'Bill', 'Bill Wennington'],
-    [78492, 'Wenstrom', 'Matt', 'Matt Wenstrom'],
-    [438, 'Werdann', 'Robert', 'Robert Werdann'],
-    [78494, 'Wertis', 'Ray', 'Ray Wertis'],
-    [133, 'Wesley', 'David', 'David Wesley'],
-    [78495, 'Wesley', 'Walt', 'Walt Wesley'],
-    [2561, 'West', 'David', 'David West'],
-    [2753, 'West', 'Delonte', 'Delonte West'],
-    [28, 'West', 'Doug', 'Doug West'],
-    [78497, 'West', 'Jerry', 'Jerry West'],
-    [201238, 'West', 'Mario', 'Mario West'],
-    [770, 'West', 'Mark', 'Mark West'],
-    [78499, 'West', 'Roland', 'Roland West'],
-    [201566, 'Westbrook', 'Russell', 'Russell Westbrook'],
-    [78500, 'Westphal', 'Paul', 'Paul Westphal'],
-    [78501, 'Wetzel', 'John', 'John Wetzel'],
-    [101156, 'Whaley', 'Robert', 'Robert Whaley'],
-    [941, 'Whatley', 'Ennis', 'Ennis Whatley'],
-    [1545, 'Wheat', 'DeJuan', 'DeJuan Wheat'],
-    [78504, 'Wheeler', 'Clinton', 'Clinton Wheeler'],
-    [1755, 'Wheeler', 'Tyson', 'Tyson Wheeler'],
-    [78506, 'Whitaker', 'Lucian', 'Lucian Whitaker'],
-    [201591, 'White', 'DJ', 'DJ White'],
-    [1628401, 'White', 'Derrick', 'Derrick White'],
-    [78507, 'White', 'Eric', 'Eric White'],
-    [78508, 'White', 'Herb', 'Herb White'],
-    [78509, 'White', 'Hubie', 'Hubie White'],
-    [1751, 'White', 'Jahidi', 'Jahidi White'],
-    [200778, 'White', 'James', 'James White'],
-    [78510, 'White', 'Jojo', 'Jojo White'],
-    [1627855, 'White', 'Okaro', 'Okaro White'],
-    [1839, 'White', 'Randy', 'Randy White'],
-    [2206, 'White', 'Rodney', 'Rodney White'],
-    [78512, 'White', 'Rory', 'Rory White'],
-    [203091, 'White', 'Royce', 'Royce White'],
-    [78513, 'White', 'Rudy', 'Rudy White'],
-    [202358, 'White', 'Terrico', 'Terrico White'],
-    [78514, 'White', 'Tony', 'Tony White'],
-    [78515, 'White', 'Willie', 'Willie White'],
-    [1628510, 'White III', 'Andrew', 'Andrew White III'],
-    [1627785, 'Whitehead', 'Isaiah', 'Isaiah Whitehead'],
-    [78516, 'Whitehead', 'Jerome', 'Jerome Whitehead'],
-    [1126, 'Whiteside', 'Donald', 'Donald Whiteside'],
-    [202355, 'Whiteside', 'Hassan', 'Hassan Whiteside'],
-    [730, 'Whitfield', 'Dwayne', 'Dwayne Whitfield'],
-    [78519, 'Whitney', 'Charles', 'Charles Whitney'],
-    [43, 'Whitney', 'Chris', 'Chris Whitney'],
-    [203963, 'Whittington', 'Shayne', 'Shayne Whittington'],
-    [78520, 'Wicks', 'Sidney', 'Sidney Wicks'],
-    [78521, 'Wier', 'Murray', 'Murray Wier'],
-    [78522, 'Wiesenhahn', 'Bob', 'Bob Wiesenhahn'],
-    [203952, 'Wiggins', 'Andrew', 'Andrew Wiggins'],
-    [78523, 'Wiggins', 'Mitchell', 'Mitchell Wiggins'],
-    [78524, 'Wilburn', 'Ken', 'Ken Wilburn'],
-    [203912, 'Wilcox', 'CJ', 'CJ Wilcox'],
-    [2404, 'Wilcox', 'Chris', 'Chris Wilcox'],
-    [78525, 'Wilcutt', 'D.C.', 'D.C. Wilcutt'],
-    [78526, 'Wiley', 'Gene', 'Gene Wiley'],
-    [1628451, 'Wiley', 'Jacob', 'Jacob Wiley'],
-    [78527, 'Wiley', 'Michael', 'Michael Wiley'],
-    [78528, 'Wiley', 'Morlon', 'Morlon Wiley'],
-    [78529, 'Wilfong', 'Win', 'Win Wilfong'],
-    [78530, 'Wilkens', 'Lenny', 'Lenny Wilkens'],
-    [78531, 'Wilkerson', 'Bob', 'Bob Wilkerson'],
-    [78532, 'Wilkes', 'Jamaal', 'Jamaal Wilkes'],
-    [78533, 'Wilkes', 'James', 'James Wilkes'],
-    [2863, 'Wilkins', 'Damien', 'Damien Wilkins'],
-    [1122, 'Wilkins', 'Dominique', 'Dominique Wilkins'],
-    [78534, 'Wilkins', 'Eddielee', 'Eddielee Wilkins'],
-    [786, 'Wilkins', 'Gerald', 'Gerald Wilkins'],
-    [1629145, 'Wilkins', 'Isaiah', 'Isaiah Wilkins'],
-    [78537, 'Wilkins', 'Jeff', 'Jeff Wilkins'],
-    [78538, 'Wilkinson', 'Dale', 'Dale Wilkinson'],
-    [2366, 'Wilks', 'Mike', 'Mike Wilks'],
-    [1425, 'Williams', 'Aaron', 'Aaron Williams'],
-    [1626210, 'Williams', 'Alan', 'Alan Williams'],
-    [1541, 'Williams', 'Alvin', 'Alvin Williams'],
-    [78539, 'Williams', 'Arthur', 'Arthur Williams'],
-    [78540, 'Williams', 'Bernie', 'Bernie Williams'],
-    [78564, 'Williams', 'Bob', 'Bob Williams'],
-    [1585, 'Williams', 'Brandon', 'Brandon Williams'],
-    [433, 'Williams', 'Buck', 'Buck Williams'],
-    [203710, 'Williams', 'C.J.', 'C.J. Williams'],
-    [78547, 'Williams', 'Chuck', 'Chuck Williams'],
-    [78541, 'Williams', 'Chuckie', 'Chuckie Williams'],
-    [78543, 'Williams', 'Cliff', 'Cliff Williams'],
-    [101258, 'Williams', 'Corey', 'Corey Williams'],
-    [101114, 'Williams', 'Deron', 'Deron Williams'],
-    [202682, 'Williams', 'Derrick', 'Derrick Williams'],
-    [78545, 'Williams', 'Don', 'Don Williams'],
-    [78546, 'Williams', 'Earl', 'Earl Williams'],
-    [202343, 'Williams', 'Elliot', 'Elliot Williams'],
-    [677, 'Williams', 'Eric', 'Eric Williams'],
-    [2421, 'Williams', 'Frank', 'Frank Williams'],
-    [78548, 'Williams', 'Freeman', 'Freeman Williams'],
-    [78549, 'Williams', 'Gus', 'Gus Williams'],
-    [78550, 'Williams', 'Guy', 'Guy Williams'],
-    [1006, 'Williams', 'Herb', 'Herb Williams'],
-    [73, 'Williams', 'Hot Rod', 'Hot Rod Williams'],
-    [1715, 'Williams', 'Jason', 'Jason Williams'],
-    [101214, 'Williams', 'Jawad', 'Jawad Williams'],
-    [2398, 'Williams', 'Jay', 'Jay Williams'],
-    [420, 'Williams', 'Jayson', 'Jayson Williams'],
-    [966, 'Williams', 'Jerome', 'Jerome Williams'],
-    [78554, 'Williams', 'John', 'John Williams'],
-    [1629140, 'Williams', 'Johnathan', 'Johnathan Williams'],
-    [202716, 'Williams', 'Jordan', 'Jordan Williams'],
-    [200818, 'Williams', 'Justin', 'Justin Williams'],
-    [78555, 'Williams', 'Kenny', 'Kenny Williams'],
-    [78556, 'Williams', 'Kevin', 'Kevin Williams'],
-    [31, 'Williams', 'Lorenzo', 'Lorenzo Williams'],
-    [101150, 'Williams', 'Lou', 'Lou Williams'],
-    [200766, 'Williams', 'Marcus', 'Marcus Williams'],
-    [201173, 'Williams', 'Marcus', 'Marcus Williams'],
-    [101107, 'Williams', 'Marvin', 'Marvin Williams'],
-    [52, 'Williams', 'Micheal', 'Micheal Williams'],
-    [78558, 'Williams', 'Mike', 'Mike Williams'],
-    [78560, 'Williams', 'Milt', 'Milt Williams'],
-    [2590, 'Williams', 'Mo', 'Mo Williams'],
-    [42, 'Williams', 'Monty', 'Monty Williams'],
-    [78561, 'Williams', 'Nate', 'Nate Williams'],
-    [78566, 'Williams', 'Pete', 'Pete Williams'],
-    [78571, 'Williams', 'Ray', 'Ray Williams'],
-    [199, 'Williams', 'Reggie', 'Reggie Williams'],
-    [202130, 'Williams', 'Reggie', 'Reggie Williams'],
-    [78563, 'Williams', 'Rickey', 'Rickey Williams'],
-    [78565, 'Williams', 'Rob', 'Rob Williams'],
-    [78567, 'Williams', 'Ron', 'Ron Williams'],
-    [78568, 'Williams', 'Sam', 'Sam Williams'],
-    [78569, 'Williams', 'Samuel', 'Samuel Williams'],
-    [281, 'Williams', 'Scott', 'Scott Williams'],
-    [201157, 'Williams', 'Sean', 'Sean Williams'],
-    [1742, 'Williams', 'Shammond', 'Shammond Williams'],
-    [200761, 'Williams', 'Shawne', 'Shawne Williams'],
-    [200749, 'Williams', 'Shelden', 'Shelden Williams'],
-    [78570, 'Williams', 'Sly', 'Sly Williams'],
-    [201944, 'Williams', 'Terrence', 'Terrence Williams'],
-    [1576, 'Williams', 'Travis', 'Travis Williams'],
-    [1627786, 'Williams', 'Troy', 'Troy Williams'],
-    [1005, 'Williams', 'Walt', 'Walt Williams'],
-    [78573, 'Williams', 'Ward', 'Ward Williams'],
-    [78574, 'Williams', 'Willie', 'Willie Williams'],
-    [1629057, 'Williams III', 'Robert', 'Robert Williams III'],
-    [1628475, 'Williams Jr.', 'Matt', 'Matt Williams Jr.'],
-    [722, 'Williamson', 'Corliss', 'Corliss Williamson'],
-    [78575, 'Williamson', 'John', 'John Williamson'],
-    [788, 'Willis', 'Kevin', 'Kevin Willis'],
-    [78577, 'Willoughby', 'Bill', 'Bill Willoughby'],
-    [2000, 'Willoughby', 'Dedric', 'Dedric Willoughby'],
-    [78586, 'Wilson', 'Bob', 'Bob Wilson'],
-    [78585, 'Wilson', 'Bobby', 'Bobby Wilson'],
-    [1628391, 'Wilson', 'D.J.', 'D.J. Wilson'],
-    [78579, 'Wilson', 'George', 'George Wilson'],
-    [78580, 'Wilson', 'Isaiah', 'Isaiah Wilson'],
-    [203966, 'Wilson', 'Jamil', 'Jamil Wilson'],
-    [78581, 'Wilson', 'Mike', 'Mike Wilson'],
-    [78582, 'Wilson', 'Nikita', 'Nikita Wilson'],
-    [78578, 'Wilson', 'Othell', 'Othell Wilson'],
-    [78583, 'Wilson', 'Rick', 'Rick Wilson'],
-    [78584, 'Wilson', 'Ricky', 'Ricky Wilson'],
-    [78587, 'Wilson', 'Thomas', 'Thomas Wilson'],
-    [1027, 'Wilson', 'Trevor', 'Trevor Wilson'],
-    [1627787, 'Wiltjer', 'Kyle', 'Kyle Wiltjer'],
-    [78589, 'Winchester', 'Kennard', 'Kennard Winchester'],
-    [78590, 'Windis', 'Tony', 'Tony Windis'],
-    [78591, 'Windsor', 'John', 'John Windsor'],
-    [78592, 'Winfield', 'Lee', 'Lee Winfield'],
-    [766, 'Wingate', 'David', 'David Wingate'],
-    [112, 'Wingfield', 'Dontonio', 'Dontonio Wingfield'],
-    [78596, 'Wingo', 'Harthorne', 'Harthorne Wingo'],
-    [78597, 'Winkler', 'Marv', 'Marv Winkler'],
-    [1626159, 'Winslow', 'Justise', 'Justise Winslow'],
-    [1984, 'Winslow', 'Rickie', 'Rickie Winslow'],
-    [1868, 'Winter', 'Trevor', 'Trevor Winter'],
-    [78600, 'Winters', 'Brian', 'Brian Winters'],
-    [78601, 'Winters', 'Voise', 'Voise Winters'],
-    [78602, 'Wise', 'Willie', 'Willie Wise'],
-    [203481, 'Withey', 'Jeff', 'Jeff Withey'],
-    [78603, 'Witte', 'Luke', 'Luke Witte'],
-    [1456, 'Wittman', 'Randy', 'Randy Wittman'],
-    [78605, 'Witts', 'Garry', 'Garry Witts'],
-    [78606, 'Wohl', 'Dave', 'Dave Wohl'],
-    [341, 'Wolf', 'Joe', 'Joe Wolf'],
-    [2106, 'Wolkowyski', 'Ruben', 'Ruben Wolkowyski'],
-    [203489, 'Wolters', 'Nate', 'Nate Wolters'],
-    [78610, 'Wood', 'Al', 'Al Wood'],
-    [78612, 'Wood', 'Bob', 'Bob Wood'],
-    [1626174, 'Wood', 'Christian', 'Christian Wood'],
-    [116, 'Wood', 'David', 'David Wood'],
-    [78609, 'Wood', 'Howard', 'Howard Wood'],
-    [78611, 'Wood', 'Leon', 'Leon Wood'],
-    [2254, 'Woods', 'Loren', 'Loren Woods'],
-    [2417, 'Woods', 'Qyntel', 'Qyntel Woods'],
-    [1010, 'Woods', 'Randy', 'Randy Woods'],
-    [78614, 'Woodson', 'Mike', 'Mike Woodson'],
-    [78615, 'Woolridge', 'Orlando', 'Orlando Woolridge'],
-    [906, 'Workman', 'Haywoode', 'Haywoode Workman'],
-    [78616, 'Workman', 'Mark', 'Mark Workman'],
-    [78617, 'Workman', 'Tom', 'Tom Workman'],
-    [1897, 'World Peace', 'Metta', 'Metta World Peace'],
-    [78618, 'Worthen', 'Sam', 'Sam Worthen'],
-    [1460, 'Worthy', 'James', 'James Worthy'],
-    [101120, 'Wright', 'Antoine', 'Antoine Wright'],
-    [101152, 'Wright', 'Bracey', 'Bracey Wright'],
-    [78620, 'Wright', 'Brad', 'Brad Wright'],
-    [201148, 'Wright', 'Brandan', 'Brandan Wright'],
-    [202874, 'Wright', 'Chris', 'Chris Wright'],
-    [203203, 'Wright', 'Chris', 'Chris Wright'],
-    [1626153, 'Wright', 'Delon', 'Delon Wright'],
-    [2748, 'Wright', 'Dorell', 'Dorell Wright'],
-    [78621, 'Wright', 'Howard', 'Howard Wright'],
-    [78622, 'Wright', 'Joby', 'Joby Wright'],
-    [201153, 'Wright', 'Julian', 'Julian Wright'],
-    [78623, 'Wright', 'Larry', 'Larry Wright'],
-    [953, 'Wright', 'Lorenzen', 'Lorenzen Wright'],
-    [1007, 'Wright', 'Luther', 'Luther Wright'],
-    [412, 'Wright', 'Sharone', 'Sharone Wright'],
-    [203100, 'Wroten', 'Tony', 'Tony Wroten'],
-    [78627, 'Wynder', 'A.J.', 'A.J. Wynder'],
-    [1627824, 'Yabusele', 'Guerschon', 'Guerschon Yabusele'],
-    [2397, 'Yao Ming', '', 'Yao Ming'],
-    [2428, 'Yarbrough', 'Vincent', 'Vincent Yarbrough'],
-    [78628, 'Yardley', 'George', 'George Yardley'],
-    [78629, 'Yates', 'Barry', 'Barry Yates'],
-    [78630, 'Yates', 'Wayne', 'Wayne Yates'],
-    [78631, 'Yelverton', 'Charlie', 'Charlie Yelverton'],
-    [201146, 'Yi Jianlian', '', 'Yi Jianlian'],
-    [78632, 'Yonakor', 'Rich', 'Rich Yonakor'],
-    [78633, 'Young', 'Danny', 'Danny Young'],
-    [203923, 'Young', 'James', 'James Young'],
-    [1626202, 'Young', 'Joe', 'Joe Young'],
-    [1748, 'Young', 'Korleone', 'Korleone Young'],
-    [78634, 'Young', 'Michael', 'Michael Young'],
-    [201156, 'Young', 'Nick', 'Nick Young'],
-    [78635, 'Young', 'Perry', 'Perry Young'],
-    [201970, 'Young', 'Sam', 'Sam Young'],
-    [201152, 'Young', 'Thaddeus', 'Thaddeus Young'],
-    [1937, 'Young', 'Tim', 'Tim Young'],
-    [1629027, 'Young', 'Trae', 'Trae Young'],
-    [78638, 'Zaslofsky', 'Max', 'Max Zaslofsky'],
-    [78639, 'Zawoluk', 'Robert', 'Robert Zawoluk'],
-    [203469, 'Zeller', 'Cody', 'Cody Zeller'],
-    [78640, 'Zeller', 'Dave', 'Dave Zeller'],
-    [78641, 'Zeller', 'Gary', 'Gary Zeller'],
-    [78642, 'Zeller', 'Hank', 'Hank Zeller'],
-    [202545, 'Zeller', 'Luke', 'Luke Zeller'],
-    [203092, 'Zeller', 'Tyler', 'Tyler Zeller'],
-    [78643, 'Zeno', 'Tony', 'Tony Zeno'],
-    [78644, 'Zevenbergen', 'Phil', 'Phil Zevenbergen'],
-    [1917, 'Zhi-zhi', 'Wang', 'Wang Zhi-zhi'],
-    [678, 'Zidek', 'George', 'George Zidek'],
-    [2583, 'Zimmerman', 'Derrick', 'Derrick Zimmerman'],
-    [1627757, 'Zimmerman', 'Stephen', 'Stephen Zimmerman'],
-    [1627835, 'Zipser', 'Paul', 'Paul Zipser'],
-    [1627790, 'Zizic', 'Ante', 'Ante Zizic'],
-    [78647, 'Zoet', 'Jim', 'Jim Zoet'],
-    [78648, 'Zopf', 'Bill', 'Bill Zopf'],
-    [1627826, 'Zubac', 'Ivica', 'Ivica Zubac'],
-    [78650, 'Zunic', 'Matt', 'Matt Zunic'],
-]
-
-
 team_index_id = 0
 team_index_abbreviation = 1
 team_index_nickname = 2
@@ -4389,35 +23,102 @@ team_index_city = 4
 team_index_full_name = 5
 team_index_state = 6
 
-teams = [
-    [1610612737, 'ATL', 'Hawks', 1949, 'Atlanta', 'Atlanta Hawks', 'Atlanta'],
-    [1610612738, 'BOS', 'Celtics', 1946, 'Boston', 'Boston Celtics', 'Massachusetts'],
-    [1610612739, 'CLE', 'Cavaliers', 1970, 'Cleveland', 'Cleveland Cavaliers', 'Ohio'],
-    [1610612740, 'NOP', 'Pelicans', 2002, 'New Orleans', 'New Orleans Pelicans', 'Louisiana'],
-    [1610612741, 'CHI', 'Bulls', 1966, 'Chicago', 'Chicago Bulls', 'Illinois'],
-    [1610612742, 'DAL', 'Mavericks', 1980, 'Dallas', 'Dallas Mavericks', 'Texas'],
-    [1610612743, 'DEN', 'Nuggets', 1976, 'Denver', 'Denver Nuggets', 'Colorado'],
-    [1610612744, 'GSW', 'Warriors', 1946, 'Golden State', 'Golden State Warriors', 'California'],
-    [1610612745, 'HOU', 'Rockets', 1967, 'Houston', 'Houston Rockets', 'Texas'],
-    [1610612746, 'LAC', 'Clippers', 1970, 'Los Angeles', 'Los Angeles Clippers', 'California'],
-    [1610612747, 'LAL', 'Lakers', 1948, 'Los Angeles', 'Los Angeles Lakers', 'California'],
-    [1610612748, 'MIA', 'Heat', 1988, 'Miami', 'Miami Heat', 'Florida'],
-    [1610612749, 'MIL', 'Bucks', 1968, 'Milwaukee', 'Milwaukee Bucks', 'Wisconsin'],
-    [1610612750, 'MIN', 'Timberwolves', 1989, 'Minnesota', 'Minnesota Timberwolves', 'Minnesota'],
-    [1610612751, 'BKN', 'Nets', 1976, 'Brooklyn', 'Brooklyn Nets', 'New York'],
-    [1610612752, 'NYK', 'Knicks', 1946, 'New York', 'New York Knicks', 'New York'],
-    [1610612753, 'ORL', 'Magic', 1989, 'Orlando', 'Orlando Magic', 'Florida'],
-    [1610612754, 'IND', 'Pacers', 1976, 'Indiana', 'Indiana Pacers', 'Indiana'],
-    [1610612755, 'PHI', '76ers', 1949, 'Philadelphia', 'Philadelphia 76ers', 'Pennsylvania'],
-    [1610612756, 'PHX', 'Suns', 1968, 'Phoenix', 'Phoenix Suns', 'Arizona'],
-    [1610612757, 'POR', 'Trail Blazers', 1970, 'Portland', 'Portland Trail Blazers', 'Oregon'],
-    [1610612758, 'SAC', 'Kings', 1948, 'Sacramento', 'Sacramento Kings', 'California'],
-    [1610612759, 'SAS', 'Spurs', 1976, 'San Antonio', 'San Antonio Spurs', 'Texas'],
-    [1610612760, 'OKC', 'Thunder', 1967, 'Oklahoma City', 'Oklahoma City Thunder', 'Oklahoma'],
-    [1610612761, 'TOR', 'Raptors', 1995, 'Toronto', 'Toronto Raptors', 'Ontario'],
-    [1610612762, 'UTA', 'Jazz', 1974, 'Utah', 'Utah Jazz', 'Utah'],
-    [1610612763, 'MEM', 'Grizzlies', 1995, 'Memphis', 'Memphis Grizzlies', 'Tennessee'],
-    [1610612764, 'WAS', 'Wizards', 1961, 'Washington', 'Washington Wizards', 'District of Columbia'],
-    [1610612765, 'DET', 'Pistons', 1948, 'Detroit', 'Detroit Pistons', 'Michigan'],
-    [1610612766, 'CHA', 'Hornets', 1988, 'Charlotte', 'Charlotte Hornets', 'North Carolina'],
-]
+
+class Table:
+    # A read only list of rows stored by column. Integer columns are int64 arrays and text columns are int32 indexes
+    # into a string table shared by every table. Rows are built as lists when they are read.
+
+    def __init__(self, columns, strings, row_count):
+        self.row_count = row_count
+        self._columns = columns
+        self._strings = strings
+        self._values = [None] * len(columns)
+
+    def __len__(self):
+        return self.row_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.row_count))]
+        if index < 0:
+            index += self.row_count
+        if not 0 <= index < self.row_count:
+            raise IndexError('Table index out of range')
+        return [self.get_column(column_index)[index] for column_index in range(len(self._columns))]
+
+    def __iter__(self):
+        return map(list, zip(*[self.get_column(column_index) for column_index in range(len(self._columns))]))
+
+    def get_column(self, column_index):
+        values = self._values[column_index]
+        if values is None:
+            column_type, column = self._columns[column_index]
+            if column_type == 's':
+                strings = self._strings
+                values = [strings[string_index] for string_index in column]
+            else:
+                values = column.tolist()
+            self._values[column_index] = values
+        return values
+
+
+def _read_array(typecode, content, offset, count):
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(content[offset:end])
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values, end
+
+
+def read_data_file(path=data_file_path):
+    # Layout, little endian:
+    #   magic, version (uint32), string count (uint32), string bytes length (uint32), strings (utf-8, NUL separated)
+    #   table count (uint32), then for each table:
+    #     name length (uint32), name (utf-8), row count (uint32), column count (uint32), column types ('q' or 's')
+    #     and one array per column: int64 values for 'q' columns, int32 string indexes for 's' columns
+    with open(path, 'rb') as f:
+        content = f.read()
+    if content[:4] != data_file_magic:
+        raise Exception('InvalidDataFile: {} is not a static data file.'.format(path))
+    version, string_count, strings_length = struct.unpack_from('<III', content, 4)
+    if version != data_file_version:
+        raise Exception('InvalidDataFile: Unsupported version {}.'.format(version))
+    offset = 16
+    strings = content[offset:offset + strings_length].decode('utf-8').split('\0') if string_count else []
+    offset += strings_length
+    table_count, = struct.unpack_from('<I', content, offset)
+    offset += 4
+    tables = {}
+    for _ in range(table_count):
+        name_length, = struct.unpack_from('<I', content, offset)
+        offset += 4
+        name = content[offset:offset + name_length].decode('utf-8')
+        offset += name_length
+        row_count, column_count = struct.unpack_from('<II', content, offset)
+        offset += 8
+        column_types = content[offset:offset + column_count].decode('ascii')
+        offset += column_count
+        columns = []
+        for column_type in column_types:
+            column, offset = _read_array('q' if column_type == 'q' else 'i', content, offset, row_count)
+            columns.append((column_type, column))
+        tables[name] = Table(columns=columns, strings=strings, row_count=row_count)
+    return tables
+
+
+def load_tables():
+    tables = read_data_file()
+    globals().update(tables)
+    return tables
+
+
+def __getattr__(name):
+    if name in ('players', 'teams'):
+        return load_tables()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+# Module level __getattr__ needs Python 3.7, older versions read the file on import.
+if sys.version_info < (3, 7):
+    load_tables()
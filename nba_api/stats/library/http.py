@@ -1,5 +1,7 @@
-import json
-from nba_api.library import http
+from collections import namedtuple
+from itertools import repeat
+
+from nba_api.library import http, jsoncodec
 
 
 try:
@@ -15,77 +17,134 @@ except ImportError:
     }
 
 
+row_types = ('tuple', 'dict', 'record')
+
+_record_types = {}
+
+
+def get_record_type(headers):
+    # One namedtuple class per distinct set of headers. Headers that are not valid field names are renamed to _1, _2...
+    headers = tuple(headers)
+    record_type = _record_types.get(headers)
+    if record_type is None:
+        record_type = _record_types[headers] = namedtuple('Row', headers, rename=True)
+        record_type._headers = headers
+    return record_type
+
+
+def iter_rows(headers, rows, row_type='tuple', record_type=None):
+    if row_type == 'tuple':
+        return map(tuple, rows)
+    if row_type == 'dict':
+        return map(dict, map(zip, repeat(headers), rows))
+    if row_type == 'record':
+        # record_type is only used when its fields, or the headers its fields were renamed from, are the headers of
+        # the response.
+        if record_type is None or getattr(record_type, '_headers', record_type._fields) != tuple(headers):
+            record_type = get_record_type(headers)
+        return map(record_type._make, rows)
+    raise Exception('InvalidArgument: row_type must be one of {}.'.format(', '.join(row_types)))
+
+
 class NBAStatsResponse(http.NBAResponse):
+    # Derived views are built once from the decoded response and shared between calls.
+
+    def __init__(self, response, status_code, url):
+        super().__init__(response=response, status_code=status_code, url=url)
+        self._normalized_dict = None
+        self._parameters = None
+        self._headers_from_data_sets = None
+        self._data_sets = None
+
+    def get_released(self, keep_response=False):
+        # The headers are kept, as they also list the names of the data sets.
+        headers = self.get_headers_from_data_sets()
+        released = super().get_released(keep_response=keep_response)
+        released._headers_from_data_sets = headers
+        return released
+
+    def _get_result_sets(self):
+        raw_data = self.get_dict()
+        if 'resultSets' in raw_data:
+            return raw_data['resultSets']
+        return raw_data['resultSet']
 
     def get_normalized_dict(self):
-        raw_data = self.get_dict()
+        if self._normalized_dict is not None:
+            return self._normalized_dict
 
-        data = {}
+        results = self._get_result_sets()
+        if 'Meta' in results:
+            # Not a list of data sets, returned as is.
+            self._normalized_dict = results
+            return results
 
-        if 'resultSets' in raw_data:
-            results = raw_data['resultSets']
-            if 'Meta' in results:
-                return results
-        else:
-            results = raw_data['resultSet']
+        data = {}
         if isinstance(results, dict):
             results = [results]
         for result in results:
-            name = result['name']
-            headers = result['headers']
-            row_set = result['rowSet']
-
-            rows = []
-            for raw_row in row_set:
-                row = {}
-                for i in range(len(headers)):
-                    row[headers[i]] = raw_row[i]
-                rows.append(row)
-            data[name] = rows
+            data[result['name']] = list(iter_rows(result['headers'], result['rowSet'], row_type='dict'))
 
+        self._normalized_dict = data
         return data
 
+    def iter_rows(self, name, row_type='tuple'):
+        # Yields the rows of one data set one at a time as tuples, namedtuple records or dictionaries.
+        data_set = self.get_data_sets()[name]
+        return iter_rows(data_set['headers'], data_set['data'], row_type=row_type)
+
     def get_normalized_json(self):
-        return json.dumps(self.get_normalized_dict())
+        return jsoncodec.dumps(self.get_normalized_dict())
 
     def get_parameters(self):
         if not self.valid_json() or 'parameters' not in self.get_dict():
             return None
+        if self._parameters is not None:
+            return self._parameters
 
         parameters = self.get_dict()['parameters']
-        if isinstance(parameters, dict):
-            return parameters
-
-        parameters = {}
-        for parameter in self.get_dict()['parameters']:
-            for key, value in parameter.items():
-                parameters.update({key: value})
+        if not isinstance(parameters, dict):
+            merged_parameters = {}
+            for parameter in parameters:
+                for key, value in parameter.items():
+                    merged_parameters.update({key: value})
+            parameters = merged_parameters
+
+        self._parameters = parameters
         return parameters
 
     def get_headers_from_data_sets(self):
-        raw_dict = self.get_dict()
-        if 'resultSets' in raw_dict:
-            results = raw_dict['resultSets']
-        else:
-            results = raw_dict['resultSet']
+        if self._headers_from_data_sets is not None:
+            return self._headers_from_data_sets
+
+        results = self._get_result_sets()
         if isinstance(results, dict):
             if 'name' not in results:
-                return {}
-            return {results['name']: results['headers']}
-        return {result_set['name']: result_set['headers'] for result_set in results}
+                headers = {}
+            else:
+                headers = {results['name']: results['headers']}
+        else:
+            headers = {result_set['name']: result_set['headers'] for result_set in results}
+
+        self._headers_from_data_sets = headers
+        return headers
 
     def get_data_sets(self):
-        raw_dict = self.get_dict()
-        if 'resultSets' in raw_dict:
-            results = raw_dict['resultSets']
-        else:
-            results = raw_dict['resultSet']
+        if self._data_sets is not None:
+            return self._data_sets
+
+        results = self._get_result_sets()
         if isinstance(results, dict):
             if 'name' not in results:
-                return {}
-            return {results['name']: {'headers': results['headers'], 'data': results['rowSet']}}
-        return {result_set['name']: {'headers': result_set['headers'], 'data': result_set['rowSet']}
-                for result_set in results}
+                data_sets = {}
+            else:
+                data_sets = {results['name']: {'headers': results['headers'], 'data': results['rowSet']}}
+        else:
+            data_sets = {result_set['name']: {'headers': result_set['headers'], 'data': result_set['rowSet']}
+                         for result_set in results}
+
+        self._data_sets = data_sets
+        return data_sets
 
 
 class NBAStatsHTTP(http.NBAHTTP):
@@ -96,7 +155,20 @@ class NBAStatsHTTP(http.NBAHTTP):
 
     headers = STATS_HEADERS
 
+    error_contents = '<Error><Message>An error has occurred.</Message></Error>'
+
     def clean_contents(self, contents):
         if '{"Message":"An error has occurred."}' in contents:
-            return '<Error><Message>An error has occurred.</Message></Error>'
+            return self.error_contents
         return contents
+
+    def is_retryable_response(self, status_code, contents):
+        # The generic error is returned for server side failures, even with a 200 status code. Parameter validation
+        # errors come back as plain text with a 400 status code and are not worth retrying.
+        if self.retry_policy is not None and contents == self.error_contents:
+            return True
+        return super().is_retryable_response(status_code, contents)
+
+
+class AsyncNBAStatsHTTP(http.AsyncNBAHTTP, NBAStatsHTTP):
+    pass
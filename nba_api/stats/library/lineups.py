@@ -0,0 +1,143 @@
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayparser import description_columns, get_event_msg_type
+
+
+player_columns = (('PLAYER1_ID', 'PLAYER1_TEAM_ID'), ('PLAYER2_ID', 'PLAYER2_TEAM_ID'),
+                  ('PLAYER3_ID', 'PLAYER3_TEAM_ID'))
+# Events whose players can be on the bench
+bench_event_msg_types = (EventMsgType.TIMEOUT.value, EventMsgType.EJECTION.value, EventMsgType.UNKNOWN.value)
+bench_foul_markers = ('T.FOUL', 'Technical')
+
+_headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'PERIOD']
+
+
+def get_lineup_key(player_ids):
+    # {1626157, 203083, 201142} -> '201142-203083-1626157'
+    return '-'.join(str(player_id) for player_id in sorted(player_ids))
+
+
+class LineupTracker:
+    # Attaches the players on the court to PlayByPlayV2 rows. Rows are added in EVENTNUM order, one game after another.
+    # The starters of a period are the players in its events before they are subbed in, so the rows of a period are
+    # kept until five starters are known for both teams, or until the period ends.
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.indexes = [headers.index(header) for header in _headers]
+        self.player_indexes = [(headers.index(player_column), headers.index(team_column))
+                               for player_column, team_column in player_columns]
+        self.description_indexes = [headers.index(column) for _, column in description_columns if column in headers]
+        self.game_id = None
+        self.period = None
+        self._start_period()
+
+    def _start_period(self):
+        self.rows = []
+        self.starters = {}
+        self.subbed_in = {}
+        self.lineups = None
+        self.lineup_keys = {}
+
+    def _is_bench_event(self, event_msg_type, row):
+        if event_msg_type in bench_event_msg_types:
+            return True
+        if event_msg_type == EventMsgType.FOUL.value:
+            return any(marker in (row[index] or '') for index in self.description_indexes
+                       for marker in bench_foul_markers)
+        return False
+
+    def _add_starters(self, event_msg_type, row):
+        if event_msg_type == EventMsgType.SUBSTITUTION.value:
+            (out_index, team_index), (in_index, _) = self.player_indexes[:2]
+            team_id = row[team_index]
+            if team_id is None:
+                return
+            if row[out_index] not in self.subbed_in.setdefault(team_id, set()):
+                self.starters.setdefault(team_id, set()).add(row[out_index])
+            self.subbed_in[team_id].add(row[in_index])
+            return
+        if self._is_bench_event(event_msg_type, row):
+            return
+        for player_index, team_index in self.player_indexes:
+            team_id = row[team_index]
+            if team_id is not None and row[player_index] not in self.subbed_in.get(team_id, ()):
+                self.starters.setdefault(team_id, set()).add(row[player_index])
+
+    def _substitute(self, row):
+        (out_index, team_index), (in_index, _) = self.player_indexes[:2]
+        team_id = row[team_index]
+        if team_id is None:
+            return
+        lineup = self.lineups.setdefault(team_id, set())
+        lineup.discard(row[out_index])
+        lineup.add(row[in_index])
+        # A new dict, as the previous one is shared by the rows before the substitution
+        self.lineup_keys = dict(self.lineup_keys)
+        self.lineup_keys[team_id] = get_lineup_key(lineup)
+
+    def _resolve(self):
+        # Returns the kept rows of the period with their lineups
+        self.lineups = {team_id: set(starters) for team_id, starters in self.starters.items()}
+        self.lineup_keys = {team_id: get_lineup_key(lineup) for team_id, lineup in self.lineups.items()}
+        rows = self.rows
+        self.rows = None
+        return [self._get_row_lineups(row) for row in rows]
+
+    def _get_row_lineups(self, row):
+        if get_event_msg_type(row[self.indexes[2]]) == EventMsgType.SUBSTITUTION.value:
+            self._substitute(row)
+        return row, self.lineup_keys
+
+    def add_row(self, row):
+        # Returns a list of (row, {team id: lineup key}) for the rows whose lineups are known. The lineups of a
+        # substitution are the ones after it.
+        game_id, event_num, event_msg_type, period = [row[index] for index in self.indexes]
+        rows = []
+        if game_id != self.game_id or period != self.period:
+            rows.extend(self.close())
+            self.game_id = game_id
+            self.period = period
+            self._start_period()
+        if self.lineups is not None:
+            rows.append(self._get_row_lineups(row))
+            return rows
+
+        self.rows.append(row)
+        self._add_starters(get_event_msg_type(event_msg_type), row)
+        if len(self.starters) == 2 and all(len(starters) >= 5 for starters in self.starters.values()):
+            rows.extend(self._resolve())
+        return rows
+
+    def close(self):
+        # Returns the kept rows of a period that ended before all of its starters were known.
+        if self.lineups is not None:
+            return []
+        return self._resolve()
+
+
+def iter_lineups(headers, rows):
+    tracker = LineupTracker(headers)
+    for row in rows:
+        for row_lineups in tracker.add_row(row):
+            yield row_lineups
+    for row_lineups in tracker.close():
+        yield row_lineups
+
+
+def iter_data_set_lineups(data_sets):
+    # Yields (row, {team id: lineup key}) for PlayByPlayV2 data sets, which can be a generator that gets one game at
+    # a time.
+    tracker = None
+    for data_set in data_sets:
+        data = data_set.get_dict()
+        if tracker is None or tracker.headers != data['headers']:
+            if tracker is not None:
+                for row_lineups in tracker.close():
+                    yield row_lineups
+            tracker = LineupTracker(data['headers'])
+        for row in data['data']:
+            for row_lineups in tracker.add_row(row):
+                yield row_lineups
+    if tracker is not None:
+        for row_lineups in tracker.close():
+            yield row_lineups
@@ -0,0 +1,110 @@
+from nba_api.stats.endpoints._base import _import_pyarrow
+
+
+class ParquetWriter:
+    # Appends data sets of the same shape to one Parquet file, one row group per write.
+    # The schema is taken from the first writes unless one is given, and later tables are cast to it:
+    #   - Columns with a data type keep it.
+    #   - Numbers of columns without a data type are stored as float64, so the ints and floats of a column match.
+    #   - Columns that are all nulls have no type yet. Writes are kept in memory until every column has one, or until
+    #     max_pending_rows rows are kept, and the columns still without a type are then stored as strings.
+
+    def __init__(self, where, schema=None, compression='snappy', max_pending_rows=100000, **options):
+        self.where = where
+        self.schema = schema
+        self.compression = compression
+        self.max_pending_rows = max_pending_rows
+        self.options = options
+        self.rows_written = 0
+        self._writer = None
+        self._pending_tables = []
+        self._pending_schema = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_table(self, data_set):
+        pyarrow = _import_pyarrow()
+        if isinstance(data_set, pyarrow.Table):
+            table = data_set
+            data_types = None
+        else:
+            table = data_set.get_arrow_table()
+            data_types = data_set.data_types
+        columns = []
+        for name, column in zip(table.column_names, table.columns):
+            # Dictionary columns are stored as plain strings so responses with different categories share a schema.
+            if pyarrow.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            elif data_types is not None and name not in data_types and pyarrow.types.is_integer(column.type):
+                column = column.cast(pyarrow.float64())
+            columns.append(column)
+        table = pyarrow.Table.from_arrays(columns, names=table.column_names)
+        if self.schema is None:
+            return table
+        return self.cast(table, self.schema)
+
+    def cast(self, table, schema):
+        pyarrow = _import_pyarrow()
+        if table.column_names != schema.names:
+            raise Exception('InvalidSchema: Expected columns {} but got {}.'.format(schema.names, table.column_names))
+        for field, table_field in zip(schema, table.schema):
+            is_numeric = pyarrow.types.is_integer(table_field.type) or pyarrow.types.is_floating(table_field.type)
+            if pyarrow.types.is_string(field.type) and is_numeric:
+                raise Exception('InvalidSchema: {} holds numbers but is stored as strings.'.format(field.name))
+        try:
+            return table.cast(schema)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as error:
+            raise Exception('InvalidSchema: {}'.format(error))
+
+    def get_pending_schema(self, table):
+        # Fills the fields that are still all nulls with the types of the new table.
+        pyarrow = _import_pyarrow()
+        schema = self._pending_schema
+        if schema is None:
+            return table.schema
+        if table.column_names != schema.names:
+            raise Exception('InvalidSchema: Expected columns {} but got {}.'.format(schema.names, table.column_names))
+        return pyarrow.schema([table_field if pyarrow.types.is_null(field.type) else field
+                               for field, table_field in zip(schema, table.schema)])
+
+    def write(self, data_set):
+        pyarrow = _import_pyarrow()
+        table = self.get_table(data_set)
+        if self._writer is None and self.schema is None:
+            self._pending_schema = self.get_pending_schema(table)
+            self._pending_tables.append(table)
+            has_null_fields = any(pyarrow.types.is_null(field.type) for field in self._pending_schema)
+            if has_null_fields and sum(pending.num_rows for pending in self._pending_tables) < self.max_pending_rows:
+                return
+            self.open(self._pending_schema)
+            return
+        if self._writer is None:
+            self.open(self.schema)
+        self.write_table(table)
+
+    def open(self, schema):
+        import pyarrow.parquet
+        self.schema = pyarrow.schema([pyarrow.field(field.name, pyarrow.string()) if pyarrow.types.is_null(field.type)
+                                      else field for field in schema])
+        self._writer = pyarrow.parquet.ParquetWriter(self.where, self.schema, compression=self.compression,
+                                                     **self.options)
+        pending_tables = self._pending_tables
+        self._pending_tables = []
+        self._pending_schema = None
+        for table in pending_tables:
+            self.write_table(self.cast(table, self.schema))
+
+    def write_table(self, table):
+        self._writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        self.rows_written += table.num_rows
+
+    def close(self):
+        if self._pending_tables:
+            self.open(self._pending_schema)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,275 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayregex import (re_block, re_field_goal_made, re_field_goal_missed,
+                                                   re_free_throw_made, re_free_throw_miss, re_foul, re_jump_ball,
+                                                   re_rebound_player, re_rebound_team, re_steal, re_substitution,
+                                                   re_timeout, re_turnover_player, re_turnover_team, re_violation)
+
+
+# The events each EVENTMSGTYPE can describe, tried in order. An event is only matched against its regex when the
+# description contains its marker, so most descriptions run a single regex.
+event_patterns = {
+    EventMsgType.FIELD_GOAL_MADE.value: [('field_goal_made', re_field_goal_made, ' PTS)')],
+    EventMsgType.FIELD_GOAL_MISSED.value: [('field_goal_missed', re_field_goal_missed, 'MISS '),
+                                           ('block', re_block, ' BLOCK ')],
+    EventMsgType.FREE_THROW.value: [('free_throw_miss', re_free_throw_miss, 'MISS '),
+                                    ('free_throw_made', re_free_throw_made, ' PTS)')],
+    EventMsgType.REBOUND.value: [('rebound_player', re_rebound_player, ' REBOUND '),
+                                 ('rebound_team', re_rebound_team, ' Rebound')],
+    EventMsgType.TURNOVER.value: [('steal', re_steal, 'STEAL '),
+                                  ('turnover_team', re_turnover_team, ' Turnover: '),
+                                  ('turnover_player', re_turnover_player, 'Turnover ')],
+    EventMsgType.FOUL.value: [('foul', re_foul, None)],
+    EventMsgType.VIOLATION.value: [('violation', re_violation, ' Violation:')],
+    EventMsgType.SUBSTITUTION.value: [('substitution', re_substitution, 'SUB: ')],
+    EventMsgType.TIMEOUT.value: [('timeout', re_timeout, ' Timeout: ')],
+    EventMsgType.JUMP_BALL.value: [('jump_ball', re_jump_ball, 'Jump Ball ')],
+}
+
+# Groups returned as ints. A foul's team group is a string since it is not always a number, as in (P1.TN).
+int_groups = ('assists', 'blocks', 'defensive', 'distance', 'full', 'offensive', 'personal', 'points', 'short',
+              'steals', 'turnovers')
+event_int_groups = {
+    'turnover_player': ('team', ),
+}
+
+description_columns = (('home', 'HOMEDESCRIPTION'), ('neutral', 'NEUTRALDESCRIPTION'),
+                       ('visitor', 'VISITORDESCRIPTION'))
+
+Description = namedtuple('Description', ['side', 'event', 'groups'])
+Event = namedtuple('Event', ['game_id', 'event_num', 'event_msg_type', 'side', 'event', 'groups'])
+
+
+def _to_int(value):
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _get_matchers(patterns):
+    matchers = []
+    for event, regex, marker in patterns:
+        groups = [group for group in regex.groupindex
+                  if group in int_groups or group in event_int_groups.get(event, ())]
+        matchers.append((event, regex.match, marker, groups))
+    return matchers
+
+
+_event_matchers = {event_msg_type: _get_matchers(patterns) for event_msg_type, patterns in event_patterns.items()}
+
+
+def _get_column_matchers(patterns):
+    # Like _get_matchers, with the positions of the named groups in match.groups() instead of the int groups.
+    matchers = []
+    for event, regex, marker in patterns:
+        positions = [regex.groupindex[group] - 1 for group in regex.groupindex]
+        matchers.append((event, regex.match, marker, positions))
+    return matchers
+
+
+_column_matchers = {event_msg_type: _get_column_matchers(patterns) for event_msg_type, patterns in event_patterns.items()}
+_event_groups = {event: list(regex.groupindex) for patterns in event_patterns.values() for event, regex, _ in patterns}
+
+
+def get_event_msg_type(event_msg_type):
+    if isinstance(event_msg_type, EventMsgType):
+        return event_msg_type.value
+    return int(event_msg_type)
+
+
+def parse_description(event_msg_type, description):
+    # Returns (event, groups) for the first event of the EVENTMSGTYPE that matches the description, or None.
+    if not description:
+        return None
+    for event, match, marker, groups in _event_matchers.get(get_event_msg_type(event_msg_type), ()):
+        if marker is not None and marker not in description:
+            continue
+        result = match(description)
+        if result is None:
+            continue
+        values = result.groupdict()
+        for group in groups:
+            values[group] = _to_int(values[group])
+        return event, values
+    return None
+
+
+def parse_row(event_msg_type, home_description, visitor_description, neutral_description=None):
+    # Returns a Description for each of the home, neutral and visitor descriptions that matches.
+    descriptions = []
+    for side, description in (('home', home_description), ('neutral', neutral_description),
+                              ('visitor', visitor_description)):
+        parsed = parse_description(event_msg_type, description)
+        if parsed is not None:
+            descriptions.append(Description(side, *parsed))
+    return descriptions
+
+
+def parse_rows(headers, rows):
+    # Yields an Event for each description that matches in PlayByPlay rows. Rows without a known event are skipped.
+    game_id_index = headers.index('GAME_ID')
+    event_num_index = headers.index('EVENTNUM')
+    event_msg_type_index = headers.index('EVENTMSGTYPE')
+    description_indexes = [(side, headers.index(column)) for side, column in description_columns if column in headers]
+    for row in rows:
+        event_msg_type = get_event_msg_type(row[event_msg_type_index])
+        if event_msg_type not in _event_matchers:
+            continue
+        for side, index in description_indexes:
+            parsed = parse_description(event_msg_type, row[index])
+            if parsed is not None:
+                yield Event(row[game_id_index], row[event_num_index], event_msg_type, side, *parsed)
+
+
+def parse_data_set(data_set):
+    # Parses the PlayByPlay data set of PlayByPlay or PlayByPlayV2.
+    data = data_set.get_dict()
+    return parse_rows(data['headers'], data['data'])
+
+
+bulk_headers = ['GAME_ID', 'EVENTNUM', 'SIDE']
+game_headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE'] + [column for _, column in description_columns]
+
+
+def _get_columns(data_set, headers):
+    # Returns one list of values per header, with None for the headers the data set does not have.
+    if isinstance(data_set, Endpoint.ColumnarDataSet):
+        return [data_set.get_column(header) if header in data_set.headers else [None] * data_set.row_count
+                for header in headers]
+    data = data_set.get_dict()
+    rows = data['data']
+    columns = []
+    for header in headers:
+        if header in data['headers']:
+            index = data['headers'].index(header)
+            columns.append([row[index] for row in rows])
+        else:
+            columns.append([None] * len(rows))
+    return columns
+
+
+def _to_int_column(values):
+    try:
+        return list(map(int, values))
+    except (TypeError, ValueError):
+        return [_to_int(value) for value in values]
+
+
+def _get_values(column, indexes):
+    if not indexes:
+        return []
+    if len(indexes) == 1:
+        return [column[indexes[0]]]
+    return list(itemgetter(*indexes)(column))
+
+
+def _extract_game_events(columns, event_columns):
+    # Extends event_columns, {event: [column]}, with the events of the columns of one PlayByPlay data set.
+    game_ids, event_nums, event_msg_types = columns[:3]
+    sides = [(side, columns[3 + side_index]) for side_index, (side, _) in enumerate(description_columns)]
+    for row_index, event_msg_type in enumerate(event_msg_types):
+        matchers = _column_matchers.get(event_msg_type)
+        if matchers is None:
+            continue
+        for side, descriptions in sides:
+            description = descriptions[row_index]
+            if not description:
+                continue
+            for event, match, marker, positions in matchers:
+                if marker is not None and marker not in description:
+                    continue
+                result = match(description)
+                if result is None:
+                    continue
+                values = result.groups()
+                event_column = event_columns[event]
+                event_column[0].append(game_ids[row_index])
+                event_column[1].append(event_nums[row_index])
+                event_column[2].append(side)
+                for column, position in zip(event_column[3:], positions):
+                    column.append(values[position])
+                break
+
+
+def _get_event_columns():
+    return {event: [[] for _ in bulk_headers + groups] for event, groups in _event_groups.items()}
+
+
+def _type_event_columns(event_columns):
+    # Replaces empty groups with None and converts the int groups.
+    for event, columns in event_columns.items():
+        groups = _event_groups[event]
+        for index, group in enumerate(groups, len(bulk_headers)):
+            column = columns[index]
+            if '' in column:
+                column = [value or None for value in column]
+            if group in int_groups or group in event_int_groups.get(event, ()):
+                column = _to_int_column(column)
+            columns[index] = column
+    return event_columns
+
+
+def _get_event_data_sets(event_columns):
+    return {event: Endpoint.ColumnarDataSet.from_columns(bulk_headers + [group.upper() for group in _event_groups[event]],
+                                                         columns)
+            for event, columns in event_columns.items()}
+
+
+def extract_events(data_sets):
+    # Parses the PlayByPlay data sets of many responses straight into columns, with the same regexes and markers as
+    # parse_description but without building an Event and a dictionary for each description.
+    # Returns {event: ColumnarDataSet} with GAME_ID, EVENTNUM and SIDE followed by the upper cased regex groups, in
+    # the order of the rows, then home, neutral and visitor. Groups that are empty or do not participate are None.
+    event_columns = _get_event_columns()
+    for data_set in data_sets:
+        _extract_game_events(_get_columns(data_set, game_headers), event_columns)
+    return _get_event_data_sets(_type_event_columns(event_columns))
+
+
+def _get_game(data_set):
+    # The columns a worker needs, with the GAME_ID of every row the same string object so it is pickled once.
+    columns = _get_columns(data_set, game_headers)
+    game_ids = columns[0]
+    if game_ids and game_ids.count(game_ids[0]) == len(game_ids):
+        columns[0] = [game_ids[0]] * len(game_ids)
+    return columns
+
+
+def _extract_games_events(games):
+    # Runs in the worker processes. Rows are ordered by EVENTNUM before they are parsed.
+    event_columns = _get_event_columns()
+    for columns in games:
+        event_nums = columns[1]
+        if event_nums != sorted(event_nums):
+            order = sorted(range(len(event_nums)), key=event_nums.__getitem__)
+            columns = [_get_values(column, order) for column in columns]
+        _extract_game_events(columns, event_columns)
+    return _type_event_columns(event_columns)
+
+
+def _merge_event_columns(event_columns, results):
+    for result in results:
+        for event, columns in result.items():
+            for column, values in zip(event_columns[event], columns):
+                column.extend(values)
+
+
+def extract_events_parallel(data_sets, max_workers=None, games_per_batch=10):
+    # extract_events with the games spread over a pool of processes, in GAME_ID then EVENTNUM order. Workers are sent
+    # batches of games holding only the columns they parse and send back the typed columns of each event.
+    games = sorted((_get_game(data_set) for data_set in data_sets), key=lambda columns: columns[0][:1])
+    batches = [games[start:start + games_per_batch] for start in range(0, len(games), games_per_batch)]
+    event_columns = _get_event_columns()
+    if max_workers == 1:
+        _merge_event_columns(event_columns, map(_extract_games_events, batches))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            _merge_event_columns(event_columns, executor.map(_extract_games_events, batches))
+    return _get_event_data_sets(event_columns)
@@ -0,0 +1,253 @@
+import re
+from collections import namedtuple
+
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayparser import description_columns, get_event_msg_type, parse_description
+
+
+# How a possession ends
+end_field_goal = 'field_goal'
+end_free_throw = 'free_throw'
+end_defensive_rebound = 'defensive_rebound'
+end_turnover = 'turnover'
+end_period = 'period_end'
+# The other team shot or turned the ball over without a rebound or turnover ending the possession in the data
+end_offense_change = 'offense_change'
+
+Possession = namedtuple('Possession', ['game_id', 'period', 'number', 'offense', 'offense_team_id', 'start_event_num',
+                                       'end_event_num', 'start_time', 'end_time', 'duration', 'points', 'end'])
+
+# The events that decide possessions, by EVENTMSGTYPE
+possession_events = {
+    EventMsgType.FIELD_GOAL_MADE.value: ('field_goal_made', ),
+    EventMsgType.FIELD_GOAL_MISSED.value: ('field_goal_missed', ),
+    EventMsgType.FREE_THROW.value: ('free_throw_made', 'free_throw_miss'),
+    EventMsgType.REBOUND.value: ('rebound_player', 'rebound_team'),
+    EventMsgType.TURNOVER.value: ('turnover_player', 'turnover_team'),
+}
+# Events that can come between a made field goal and its and-one free throw
+and_one_event_msg_types = (EventMsgType.FOUL.value, EventMsgType.SUBSTITUTION.value, EventMsgType.TIMEOUT.value,
+                           EventMsgType.VIOLATION.value, EventMsgType.EJECTION.value)
+# Free throws that do not end a possession, as their team keeps or gets the ball back after them
+kept_free_throw_types = ('Technical', 'Flagrant')
+
+_other_side = {'home': 'visitor', 'visitor': 'home'}
+_free_throw_count_regex = re.compile(r'(\d) of (\d)')
+_headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'PERIOD', 'PCTIMESTRING']
+
+
+def get_seconds(time):
+    # '11:45' -> 705
+    if not time:
+        return None
+    minutes, seconds = time.split(':')
+    return int(minutes) * 60 + int(seconds)
+
+
+class PossessionBuilder:
+    # Splits PlayByPlay rows into possessions. Rows are added in EVENTNUM order, one game after another, and each
+    # possession is returned by the row that ends it, so only the possession being built is kept.
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.indexes = [headers.index(header) for header in _headers]
+        self.description_indexes = [(side, headers.index(column))
+                                    for side, column in description_columns if column in headers]
+        self.team_id_index = headers.index('PLAYER1_TEAM_ID') if 'PLAYER1_TEAM_ID' in headers else None
+        self.game_id = None
+        self.period = None
+        self.team_ids = {}
+        self.number = 0
+        self.last_event_num = None
+        self.last_time = None
+        self._start(None, None)
+
+    def _start(self, offense, time):
+        self.offense = offense
+        self.start_event_num = None
+        self.start_time = time
+        self.points = 0
+        # The end of a possession on a made field goal waits for a possible and-one free throw
+        self.pending_end = None
+
+    def _end(self, end, event_num, time, next_offense=None):
+        possessions = []
+        if self.offense is not None:
+            start_seconds = get_seconds(self.start_time)
+            end_seconds = get_seconds(time)
+            duration = None if start_seconds is None or end_seconds is None else start_seconds - end_seconds
+            self.number += 1
+            possessions.append(Possession(self.game_id, self.period, self.number, self.offense,
+                                          self.team_ids.get(self.offense), self.start_event_num, event_num,
+                                          self.start_time, time, duration, self.points, end))
+        self._start(next_offense, time)
+        return possessions
+
+    def _end_pending(self, next_offense=True):
+        end, event_num, time = self.pending_end
+        return self._end(end, event_num, time, next_offense=_other_side[self.offense] if next_offense else None)
+
+    def _set_offense(self, side, event_num, time):
+        # Returns the possession that ends when a team other than the offense shoots or turns the ball over
+        if self.offense is None or self.offense == side:
+            self.offense = side
+            return []
+        possessions = self._end(end_offense_change, event_num, time, next_offense=side)
+        self.start_event_num = event_num
+        return possessions
+
+    def _get_event(self, event_msg_type, row):
+        for side, index in self.description_indexes:
+            parsed = parse_description(event_msg_type, row[index])
+            if parsed is not None and parsed[0] in possession_events[event_msg_type]:
+                return side, parsed[0], parsed[1], row[index]
+        return None
+
+    def _start_row(self, game_id, period, event_num, time):
+        # Returns the possession left open by the previous period or game.
+        possessions = []
+        if game_id != self.game_id or period != self.period:
+            possessions.extend(self.close())
+            if game_id != self.game_id:
+                self.game_id = game_id
+                self.team_ids = {}
+                self.number = 0
+            self.period = period
+            self._start(None, time)
+        self.last_event_num = event_num
+        self.last_time = time
+        return possessions
+
+    def _get_row_event(self, event_msg_type, row):
+        if event_msg_type not in possession_events:
+            return None
+        event = self._get_event(event_msg_type, row)
+        if event is None or event[0] not in _other_side:
+            return None
+        return event
+
+    def _is_and_one(self, event):
+        return event is not None and event[1] in ('free_throw_made', 'free_throw_miss') and event[0] == self.offense \
+            and event[2]['free_throw_type'] == '1 of 1'
+
+    def _set_team_id(self, event_msg_type, side, row):
+        # Team rebounds have no team id
+        if self.team_id_index is not None and event_msg_type != EventMsgType.REBOUND.value \
+                and row[self.team_id_index] is not None:
+            self.team_ids[side] = row[self.team_id_index]
+
+    def _add_period_end(self, event_num, time):
+        # The period can end right after a possession, with no time or events left for the next one
+        possessions = []
+        if self.start_event_num is not None or get_seconds(self.start_time) != get_seconds(time):
+            self.start_event_num = self.start_event_num or event_num
+            possessions = self._end(end_period, event_num, time)
+        self._start(None, time)
+        return possessions
+
+    def _add_field_goal_made(self, event, event_num, time):
+        side, _, _, description = event
+        possessions = self._set_offense(side, event_num, time)
+        self.points += 3 if '3PT' in description else 2
+        self.pending_end = (end_field_goal, event_num, time)
+        return possessions
+
+    def _add_field_goal_missed(self, event, event_num, time):
+        return self._set_offense(event[0], event_num, time)
+
+    def _add_free_throw(self, event, event_num, time):
+        side, event, groups, _ = event
+        free_throw_type = groups['free_throw_type']
+        if free_throw_type.split(' ')[0] in kept_free_throw_types:
+            if event == 'free_throw_made' and side == self.offense:
+                self.points += 1
+            return []
+        possessions = self._set_offense(side, event_num, time)
+        count = _free_throw_count_regex.search(free_throw_type)
+        if event == 'free_throw_made':
+            self.points += 1
+            if count is not None and count.group(1) == count.group(2):
+                possessions.extend(self._end(end_free_throw, event_num, time, next_offense=_other_side[side]))
+        return possessions
+
+    def _add_rebound(self, event, event_num, time):
+        side = event[0]
+        if self.offense is None:
+            self.offense = side
+        elif side != self.offense:
+            return self._end(end_defensive_rebound, event_num, time, next_offense=side)
+        return []
+
+    def _add_turnover(self, event, event_num, time):
+        side, _, groups, _ = event
+        if groups['turnover_type'] == 'No':
+            return []
+        possessions = self._set_offense(side, event_num, time)
+        possessions.extend(self._end(end_turnover, event_num, time, next_offense=_other_side[side]))
+        return possessions
+
+    event_handlers = {
+        EventMsgType.FIELD_GOAL_MADE.value: _add_field_goal_made,
+        EventMsgType.FIELD_GOAL_MISSED.value: _add_field_goal_missed,
+        EventMsgType.FREE_THROW.value: _add_free_throw,
+        EventMsgType.REBOUND.value: _add_rebound,
+        EventMsgType.TURNOVER.value: _add_turnover,
+    }
+
+    def add_row(self, row):
+        # Returns the possessions the row ends.
+        game_id, event_num, event_msg_type, period, time = [row[index] for index in self.indexes]
+        event_msg_type = get_event_msg_type(event_msg_type)
+        possessions = self._start_row(game_id, period, event_num, time)
+        event = self._get_row_event(event_msg_type, row)
+        if self.pending_end is not None:
+            if event is None and event_msg_type in and_one_event_msg_types:
+                return possessions
+            if self._is_and_one(event):
+                # The and-one free throw belongs to the possession and ends it when it is made
+                self.pending_end = None
+            else:
+                possessions.extend(self._end_pending())
+        if event_msg_type == EventMsgType.PERIOD_END.value:
+            possessions.extend(self._add_period_end(event_num, time))
+            return possessions
+        if self.start_event_num is None:
+            self.start_event_num = event_num
+        if event is None:
+            return possessions
+        self._set_team_id(event_msg_type, event[0], row)
+        possessions.extend(self.event_handlers[event_msg_type](self, event, event_num, time))
+        return possessions
+
+    def close(self):
+        # Returns the possession left open at the end of the rows, when they do not end with the end of the period.
+        if self.pending_end is not None:
+            return self._end_pending(next_offense=False)
+        return self._end(end_period, self.last_event_num, self.last_time)
+
+
+def iter_possessions(headers, rows):
+    builder = PossessionBuilder(headers)
+    for row in rows:
+        for possession in builder.add_row(row):
+            yield possession
+    for possession in builder.close():
+        yield possession
+
+
+def iter_data_set_possessions(data_sets):
+    # Yields the possessions of PlayByPlay data sets, which can be a generator that gets one game at a time.
+    builder = None
+    for data_set in data_sets:
+        data = data_set.get_dict()
+        if builder is None or builder.headers != data['headers']:
+            if builder is not None:
+                for possession in builder.close():
+                    yield possession
+            builder = PossessionBuilder(data['headers'])
+        for row in data['data']:
+            for possession in builder.add_row(row):
+                yield possession
+    if builder is not None:
+        for possession in builder.close():
+            yield possession
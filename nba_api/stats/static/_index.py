@@ -0,0 +1,50 @@
+from nba_api.stats.library import data
+
+
+def get_id_key(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_name_key(value):
+    return str(value).lower()
+
+
+# Rows of data.players and data.teams by id or by lowercase name, built the first time they are needed.
+_indexes = {}
+
+
+def get_index(table_name, row_id, get_key):
+    index = _indexes.get((table_name, row_id))
+    if index is None:
+        index = {}
+        for row in getattr(data, table_name):
+            index.setdefault(get_key(row[row_id]), []).append(row)
+        _indexes[(table_name, row_id)] = index
+    return index
+
+
+def find_in_index(table_name, value, row_id, get_key, get_dict):
+    rows = get_index(table_name, row_id, get_key).get(get_key(value), [])
+    if len(rows) > 1:
+        raise Exception('Found more than 1 id')
+    elif not rows:
+        return None
+    else:
+        return get_dict(rows[0])
+
+
+def find_all_in_index(table_name, values, row_id, get_key, get_dict):
+    # Returns a dictionary or None for every value, in order. Repeated values share the same dictionary.
+    index = get_index(table_name, row_id, get_key)
+    dicts_by_key = {}
+    dicts = []
+    for value in values:
+        key = get_key(value)
+        if key not in dicts_by_key:
+            rows = index.get(key)
+            dicts_by_key[key] = get_dict(rows[0]) if rows else None
+        dicts.append(dicts_by_key[key])
+    return dicts
@@ -1,16 +1,25 @@
 import re
-from nba_api.stats.library.data import players
+from nba_api.stats.library import data
 from nba_api.stats.library.data import player_index_id, player_index_full_name, player_index_first_name, player_index_last_name
+from nba_api.stats.static._index import find_all_in_index, find_in_index, get_id_key, get_index, get_name_key
 
 
 def _find_players(regex_pattern, row_id):
     players_found = []
-    for player in players:
+    for player in data.players:
         if re.search(regex_pattern, str(player[row_id]), flags=re.I):
             players_found.append(_get_player_dict(player))
     return players_found
 
 
+def _find_player_in_index(value, row_id, get_key):
+    return find_in_index('players', value, row_id, get_key, _get_player_dict)
+
+
+def _find_players_in_index(values, row_id, get_key):
+    return find_all_in_index('players', values, row_id, get_key, _get_player_dict)
+
+
 def _get_player_dict(player_row):
     return {
         'id': player_row[player_index_id],
@@ -33,18 +42,20 @@ def find_players_by_last_name(regex_pattern):
 
 
 def find_player_by_id(player_id):
-    regex_pattern = '^{}$'.format(player_id)
-    players_list = _find_players(regex_pattern, player_index_id)
-    if len(players_list) > 1:
-        raise Exception('Found more than 1 id')
-    elif not players_list:
-        return None
-    else:
-        return players_list[0]
+    return _find_player_in_index(player_id, player_index_id, get_id_key)
+
+
+def find_players_by_ids(player_ids):
+    return _find_players_in_index(player_ids, player_index_id, get_id_key)
+
+
+def find_players_by_exact_full_name(full_name):
+    player_index = get_index('players', player_index_full_name, get_name_key)
+    return [_get_player_dict(player) for player in player_index.get(get_name_key(full_name), [])]
 
 
 def get_players():
     players_list = []
-    for player in players:
+    for player in data.players:
         players_list.append(_get_player_dict(player))
     return players_list
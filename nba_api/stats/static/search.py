@@ -0,0 +1,149 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+
+from nba_api.stats.static import players, teams
+
+
+# Result ranks, best first. Fuzzy matches are ranked after every other match by their similarity.
+rank_exact = 0
+rank_prefix = 1
+rank_token_prefix = 2
+rank_fuzzy = 3
+
+_separator_regex = re.compile(r"[\s\-.,'`]+")
+
+
+def fold(text):
+    # Lowercase, without accents or punctuation, with single spaces between words: 'Nenê Hilário' -> 'nene hilario'
+    decomposed = unicodedata.normalize('NFKD', text)
+    text = ''.join(character for character in decomposed if not unicodedata.combining(character)).lower()
+    return ' '.join(token for token in _separator_regex.split(text) if token)
+
+
+def get_trigrams(folded_text):
+    padded = '  {} '.format(folded_text)
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    # Searches records by name with a sorted array of names for prefixes, a sorted array of name tokens for
+    # token prefixes and a trigram index for typos.
+
+    def __init__(self, records, get_names):
+        self.records = records
+        names = []
+        tokens = []
+        # Trigrams are indexed per name, so a record with several names is as similar as its closest name.
+        self.name_records = []
+        self.trigram_counts = []
+        self.trigram_index = {}
+        for record_index, record in enumerate(records):
+            for name in get_names(record):
+                folded_name = fold(name)
+                if not folded_name:
+                    continue
+                names.append((folded_name, record_index))
+                tokens.extend((token, record_index) for token in folded_name.split(' '))
+                name_trigrams = get_trigrams(folded_name)
+                for trigram in name_trigrams:
+                    self.trigram_index.setdefault(trigram, []).append(len(self.name_records))
+                self.name_records.append(record_index)
+                self.trigram_counts.append(len(name_trigrams))
+        self.names = sorted(set(names))
+        self.tokens = sorted(set(tokens))
+
+    @staticmethod
+    def _find_prefix(sorted_values, prefix):
+        # Returns {record index: first matching value} for the (value, record index) pairs whose value starts with prefix.
+        start = bisect_left(sorted_values, (prefix,))
+        end = bisect_left(sorted_values, (prefix + '\uffff',), start)
+        record_indexes = {}
+        for value, record_index in sorted_values[start:end]:
+            record_indexes.setdefault(record_index, value)
+        return record_indexes
+
+    def prefix_search(self, query):
+        # Returns {record index: rank} for names that start with the query.
+        folded_query = fold(query)
+        if not folded_query:
+            return {}
+        return {record_index: rank_exact if name == folded_query else rank_prefix
+                for record_index, name in self._find_prefix(self.names, folded_query).items()}
+
+    def token_search(self, query):
+        # Returns the record indexes that have a name token starting with every token of the query.
+        query_tokens = fold(query).split(' ')
+        if query_tokens == ['']:
+            return set()
+        record_indexes = None
+        for token in query_tokens:
+            token_matches = set(self._find_prefix(self.tokens, token))
+            record_indexes = token_matches if record_indexes is None else record_indexes & token_matches
+            if not record_indexes:
+                break
+        return record_indexes
+
+    def fuzzy_search(self, query, min_similarity=0.4):
+        # Returns {record index: similarity}, the Dice coefficient of the trigrams of the query and of the closest name.
+        query_trigrams = get_trigrams(fold(query))
+        shared_counts = {}
+        for trigram in query_trigrams:
+            for name_index in self.trigram_index.get(trigram, ()):
+                shared_counts[name_index] = shared_counts.get(name_index, 0) + 1
+        similarities = {}
+        for name_index, shared_count in shared_counts.items():
+            similarity = 2.0 * shared_count / (len(query_trigrams) + self.trigram_counts[name_index])
+            record_index = self.name_records[name_index]
+            if similarity >= min_similarity and similarity > similarities.get(record_index, 0.0):
+                similarities[record_index] = similarity
+        return similarities
+
+    def search(self, query, limit=10, fuzzy=True, min_similarity=0.4):
+        # Returns the best records for the query: exact names, then name prefixes, then token prefixes, then fuzzy
+        # matches by similarity. Ties are broken by the order of the records.
+        ranks = {}
+        for record_index in self.token_search(query):
+            ranks[record_index] = (rank_token_prefix, 0.0)
+        for record_index, rank in self.prefix_search(query).items():
+            ranks[record_index] = (rank, 0.0)
+        if fuzzy and (limit is None or len(ranks) < limit):
+            for record_index, similarity in self.fuzzy_search(query, min_similarity=min_similarity).items():
+                if record_index not in ranks:
+                    ranks[record_index] = (rank_fuzzy, -similarity)
+
+        def get_order(record_index):
+            return ranks[record_index], record_index
+
+        if limit is None:
+            ordered = sorted(ranks, key=get_order)
+        else:
+            ordered = heapq.nsmallest(limit, ranks, key=get_order)
+        return [dict(self.records[record_index]) for record_index in ordered]
+
+
+_indexes = {}
+
+
+def get_player_index():
+    if 'players' not in _indexes:
+        _indexes['players'] = NameIndex(players.get_players(),
+                                        get_names=lambda player: [player['full_name']])
+    return _indexes['players']
+
+
+def get_team_index():
+    if 'teams' not in _indexes:
+        _indexes['teams'] = NameIndex(teams.get_teams(),
+                                      get_names=lambda team: [team['full_name'], team['abbreviation'],
+                                                              team['nickname'], team['city']])
+    return _indexes['teams']
+
+
+def search_players(query, limit=10, fuzzy=True, min_similarity=0.4):
+    return get_player_index().search(query, limit=limit, fuzzy=fuzzy, min_similarity=min_similarity)
+
+
+def search_teams(query, limit=10, fuzzy=True, min_similarity=0.4):
+    return get_team_index().search(query, limit=limit, fuzzy=fuzzy, min_similarity=min_similarity)
@@ -1,17 +1,26 @@
 import re
-from nba_api.stats.library.data import teams
+from nba_api.stats.library import data
 from nba_api.stats.library.data import team_index_id, team_index_abbreviation, team_index_nickname, team_index_full_name
 from nba_api.stats.library.data import team_index_city, team_index_state, team_index_year_founded
+from nba_api.stats.static._index import find_all_in_index, find_in_index, get_id_key, get_name_key
 
 
 def _find_teams(regex_pattern, row_id):
     teams_found = []
-    for team in teams:
+    for team in data.teams:
         if re.search(regex_pattern, str(team[row_id]), flags=re.I):
             teams_found.append(_get_team_dict(team))
     return teams_found
 
 
+def _find_team_in_index(value, row_id, get_key):
+    return find_in_index('teams', value, row_id, get_key, _get_team_dict)
+
+
+def _find_teams_in_index(values, row_id, get_key):
+    return find_all_in_index('teams', values, row_id, get_key, _get_team_dict)
+
+
 def _get_team_dict(team_row):
     return {
         'id': team_row[team_index_id],
@@ -42,36 +51,34 @@ def find_teams_by_nickname(regex_pattern):
 
 def find_teams_by_year_founded(year):
     teams_found = []
-    for team in teams:
+    for team in data.teams:
         if team[team_index_year_founded] == year:
             teams_found.append(_get_team_dict(team))
     return teams_found
 
 
 def find_team_by_abbreviation(abbreviation):
-    regex_pattern = '^{}$'.format(abbreviation)
-    teams_list = _find_teams(regex_pattern, team_index_abbreviation)
-    if len(teams_list) > 1:
-        raise Exception('Found more than 1 id')
-    elif not teams_list:
-        return None
-    else:
-        return teams_list[0]
+    return _find_team_in_index(abbreviation, team_index_abbreviation, get_name_key)
 
 
 def find_team_name_by_id(team_id):
-    regex_pattern = '^{}$'.format(team_id)
-    teams_list = _find_teams(regex_pattern, team_index_id)
-    if len(teams_list) > 1:
-        raise Exception('Found more than 1 id')
-    elif not teams_list:
-        return None
-    else:
-        return teams_list[0]
+    return _find_team_in_index(team_id, team_index_id, get_id_key)
+
+
+def find_team_by_full_name(full_name):
+    return _find_team_in_index(full_name, team_index_full_name, get_name_key)
+
+
+def find_teams_by_ids(team_ids):
+    return _find_teams_in_index(team_ids, team_index_id, get_id_key)
+
+
+def find_teams_by_abbreviations(abbreviations):
+    return _find_teams_in_index(abbreviations, team_index_abbreviation, get_name_key)
 
 
 def get_teams():
     teams_list = []
-    for team in teams:
+    for team in data.teams:
         teams_list.append(_get_team_dict(team))
     return teams_list
@@ -0,0 +1,75 @@
+import os
+import sys
+import random
+import timeit
+
+from nba_api.library import jsoncodec
+
+
+# Usage: python scripts/benchmark_json_backends.py [payload files or FileCache directories...]
+# Without arguments, payloads shaped like LeagueDashPtStats and PlayByPlayV2 responses are generated.
+
+
+def load_payloads(paths):
+    payloads = []
+    for path in paths:
+        file_paths = [path]
+        if os.path.isdir(path):
+            file_paths = [os.path.join(path, file_name) for file_name in sorted(os.listdir(path))]
+        for file_path in file_paths:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                contents = f.read()
+            decoded = jsoncodec.loads(contents)
+            if isinstance(decoded, dict) and 'contents' in decoded and 'key' in decoded:
+                # FileCache entry, the payload is the cached response.
+                contents = decoded['contents']
+            payloads.append((os.path.basename(file_path), contents))
+    return payloads
+
+
+def generate_payload(name, headers, row_count, row_generator):
+    random.seed(0)
+    rows = [row_generator(i) for i in range(row_count)]
+    return name, jsoncodec.dumps({
+        'resource': name.lower(),
+        'parameters': {},
+        'resultSets': [{'name': name, 'headers': headers, 'rowSet': rows}],
+    })
+
+
+def generate_payloads():
+    pt_stats_headers = ['PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'GP', 'W', 'L', 'MIN'] + \
+                       ['STAT_{}'.format(i) for i in range(22)]
+    pbp_headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'EVENTMSGACTIONTYPE', 'PERIOD', 'WCTIMESTRING',
+                   'PCTIMESTRING', 'HOMEDESCRIPTION', 'NEUTRALDESCRIPTION', 'VISITORDESCRIPTION', 'SCORE',
+                   'SCOREMARGIN'] + ['PLAYER{}_{}'.format(p, c) for p in (1, 2, 3) for c in
+                                     ('TYPE', 'ID', 'NAME', 'TEAM_ID', 'TEAM_CITY', 'TEAM_NICKNAME', 'TEAM_ABBREVIATION')]
+    return [
+        generate_payload('LeagueDashPtStats', pt_stats_headers, 500, lambda i: [
+            200000 + i, 'Player {}'.format(i), 1610612737 + i % 30, 'ABC', 70, 40, 30, 30.5,
+        ] + [round(random.random() * 100, 1) for _ in range(22)]),
+        generate_payload('PlayByPlay', pbp_headers, 40000, lambda i: [
+            '0021800001', i, random.randint(1, 13), random.randint(0, 100), 1 + i % 4, '7:10 PM', '11:42',
+            "Evans 24' 3PT Jump Shot (3 PTS) (O'Quinn 1 AST)", None, None, '3 - 0', '3',
+        ] + [4, 1628389, 'Bam Adebayo', 1610612748, 'Miami', 'Heat', 'MIA'] * 3),
+    ]
+
+
+def main(paths):
+    payloads = load_payloads(paths) if paths else generate_payloads()
+    backends = jsoncodec.get_available_backends()
+    original_backend = jsoncodec.get_backend()
+    for name, contents in payloads:
+        print('{} ({:.1f} MB)'.format(name, len(contents) / 1e6))
+        timings = {}
+        for backend in backends:
+            jsoncodec.set_backend(backend)
+            timings[backend] = min(timeit.repeat(lambda: jsoncodec.loads(contents), number=5, repeat=3)) / 5
+        for backend in backends:
+            speedup = timings['json'] / timings[backend]
+            print('    {:<10} {:8.2f} ms  {:4.1f}x'.format(backend, timings[backend] * 1000, speedup))
+    jsoncodec.set_backend(original_backend)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
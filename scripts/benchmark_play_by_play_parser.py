@@ -0,0 +1,69 @@
+import random
+import sys
+import timeit
+
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.playbyplayparser import extract_events, parse_rows
+
+
+# Usage: python scripts/benchmark_play_by_play_parser.py [game count]
+# Compares parsing PlayByPlay rows one Event at a time, then building the columns of each event, with extract_events.
+
+headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'EVENTMSGACTIONTYPE', 'PERIOD', 'HOMEDESCRIPTION',
+           'NEUTRALDESCRIPTION', 'VISITORDESCRIPTION']
+descriptions = [
+    (1, "Evans 24' 3PT Jump Shot (3 PTS) (O'Quinn 1 AST)", None),
+    (1, None, 'Adebayo Layup (2 PTS)'),
+    (2, "MISS O'Quinn 17' Jump Shot", 'Collins BLOCK (1 BLK)'),
+    (3, 'Sumner Free Throw 2 of 2 (1 PTS)', None),
+    (3, None, 'MISS Prince Free Throw 1 of 2'),
+    (4, None, 'Zubac REBOUND (Off:2 Def:4)'),
+    (4, 'Timberwolves Rebound', None),
+    (5, 'G. Harrison Double Dribble Turnover (P1.T10)', 'Bradley STEAL (2 STL)'),
+    (6, 'Collison P.FOUL (P1.TN) (M.Lindsay)', None),
+    (8, 'SUB: Leaf FOR Collins', None),
+    (9, None, 'TRAIL BLAZERS Timeout: Regular (Full 5 Short 0)'),
+    (12, None, None),
+]
+
+
+def generate_games(game_count, rows_per_game=450):
+    random.seed(0)
+    games = []
+    for game_index in range(game_count):
+        game_id = '00218{:05d}'.format(game_index)
+        rows = []
+        for event_num in range(rows_per_game):
+            event_msg_type, home, visitor = random.choice(descriptions)
+            rows.append([game_id, event_num, event_msg_type, 0, 1 + event_num * 4 // rows_per_game, home, None, visitor])
+        games.append(Endpoint.DataSet(data={'headers': headers, 'data': rows}))
+    return games
+
+
+def parse_rows_to_columns(games):
+    event_columns = {}
+    for game in games:
+        data = game.get_dict()
+        for event in parse_rows(data['headers'], data['data']):
+            values = [event.game_id, event.event_num, event.side] + list(event.groups.values())
+            columns = event_columns.setdefault(event.event, [[] for _ in values])
+            for column, value in zip(columns, values):
+                column.append(value)
+    return event_columns
+
+
+def main(game_count):
+    games = generate_games(game_count)
+    print('{} games, {} rows'.format(game_count, sum(len(game.get_dict()['data']) for game in games)))
+    timings = [
+        ('parse_rows', lambda: sum(1 for game in games for _ in parse_rows(headers, game.get_dict()['data']))),
+        ('parse_rows + columns', lambda: parse_rows_to_columns(games)),
+        ('extract_events', lambda: extract_events(games)),
+    ]
+    for name, function in timings:
+        timing = min(timeit.repeat(function, number=1, repeat=3))
+        print('    {:<22} {:8.2f} s'.format(name, timing))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 160)
@@ -10,12 +10,14 @@ setuptools.setup(
     author_email="swar.m.patel@gmail.com",
     description="An API Client package to access the APIs for NBA.com",
     install_requires=["requests"],
+    python_requires=">=3.5",
     keywords='nba api sports data basketball stats',
     license="MIT",
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/swar/nba_api",
     packages=setuptools.find_packages(),
+    package_data={"nba_api.stats.library": ["data.bin"]},
     classifiers=[
         "Intended Audience :: Developers",
         "Intended Audience :: Science/Research",
@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+
+
+class FakeResponse(object):
+    def __init__(self, text, status_code=200, url='https://stats.nba.com/stats/fake'):
+        self.text = text
+        self.status_code = status_code
+        self.url = url
+
+
+class FakeSession(object):
+    # Returns text, or the (text, status_code) and exceptions of outcomes in order, after waiting delay seconds.
+    def __init__(self, text='{"resultSets": []}', outcomes=None, delay=0):
+        self.text = text
+        self.outcomes = list(outcomes or [])
+        self.delay = delay
+        self.calls = []
+        self.closed = False
+
+    def get_outcome(self):
+        if not self.outcomes:
+            return self.text, 200
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def get(self, url, params=None, headers=None, proxies=None, timeout=None):
+        self.calls.append((url, params))
+        time.sleep(self.delay)
+        return FakeResponse(*self.get_outcome())
+
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncResponse(object):
+    def __init__(self, text, status=200, url='https://stats.nba.com/stats/fake', delay=0):
+        self._text = text
+        self.status = status
+        self.url = url
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def text(self):
+        await asyncio.sleep(self.delay)
+        return self._text
+
+
+class FakeAsyncSession(FakeSession):
+
+    def get(self, url, params=None, headers=None, proxy=None, timeout=None):
+        self.calls.append((url, params, proxy))
+        text, status = self.get_outcome()
+        return FakeAsyncResponse(text, status=status, delay=self.delay)
+
+    async def close(self):
+        self.closed = True
+
+
+# The fakes are handed to tests as fixtures, so test modules do not import each other.
+
+@pytest.fixture
+def fake_session():
+    return FakeSession()
+
+
+@pytest.fixture
+def other_fake_session():
+    return FakeSession()
+
+
+@pytest.fixture
+def fake_async_session():
+    return FakeAsyncSession()
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
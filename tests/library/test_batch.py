@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nba_api.library.batch import EndpointBatch, get_requests
+
+
+class FakeEndpoint(object):
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, value, delay=0.0, fail=False):
+        self.value = value
+        self.delay = delay
+        self.fail = fail
+        self.nba_response = None
+
+    def _start(self):
+        with FakeEndpoint.lock:
+            FakeEndpoint.active += 1
+            FakeEndpoint.max_active = max(FakeEndpoint.max_active, FakeEndpoint.active)
+
+    def _finish(self):
+        with FakeEndpoint.lock:
+            FakeEndpoint.active -= 1
+        if self.fail:
+            raise ValueError(self.value)
+        self.nba_response = self.value
+
+    def get_request(self):
+        self._start()
+        time.sleep(self.delay)
+        self._finish()
+
+    async def get_request_async(self, session=None):
+        self._start()
+        await asyncio.sleep(self.delay)
+        self._finish()
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    FakeEndpoint.active = 0
+    FakeEndpoint.max_active = 0
+
+
+def test_get_requests_keeps_order_and_caps_concurrency():
+    endpoints = [FakeEndpoint(value=i, delay=0.01 * (10 - i)) for i in range(10)]
+    results = get_requests(endpoints, max_workers=3)
+    assert [endpoint.nba_response for endpoint in results] == list(range(10))
+    assert FakeEndpoint.max_active <= 3
+
+
+def test_as_completed_yields_fastest_first():
+    endpoints = [FakeEndpoint(value='slow', delay=0.2), FakeEndpoint(value='fast')]
+    results = list(EndpointBatch(endpoints, max_workers=2).as_completed())
+    assert [endpoint.value for endpoint in results] == ['fast', 'slow']
+
+
+def test_errors_are_raised_or_recorded():
+    endpoints = [FakeEndpoint(value=0), FakeEndpoint(value=1, fail=True), FakeEndpoint(value=2)]
+    with pytest.raises(ValueError):
+        EndpointBatch(endpoints).get_requests()
+
+    batch = EndpointBatch(endpoints)
+    results = batch.get_requests(raise_exception_on_error=False)
+    assert [endpoint.nba_response for endpoint in results] == [0, None, 2]
+    assert list(batch.errors) == [1]
+
+
+def test_get_requests_async_caps_concurrency():
+    endpoints = [FakeEndpoint(value=i, delay=0.01) for i in range(20)]
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(EndpointBatch(endpoints, max_workers=5).get_requests_async())
+    finally:
+        loop.close()
+    assert [endpoint.nba_response for endpoint in results] == list(range(20))
+    assert FakeEndpoint.max_active <= 5
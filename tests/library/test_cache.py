@@ -0,0 +1,106 @@
+import os
+import time
+
+from nba_api.library.cache import LRUCache, FileCache, CachePolicy, get_cache_key
+from nba_api.stats.library.http import NBAStatsHTTP
+
+
+def value(contents='{}'):
+    return 'https://stats.nba.com/stats/fake', 200, contents
+
+
+class FixedPolicy(CachePolicy):
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.calls = []
+
+    def get_ttl(self, endpoint, parameters, nba_response):
+        self.calls.append((endpoint, parameters))
+        return self.ttl
+
+
+def test_cache_key_is_independent_of_parameter_order():
+    assert get_cache_key('url', sorted({'B': 1, 'A': None}.items())) == 'url?A=&B=1'
+
+
+class TestLRUCache(object):
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.set('a', value())
+        cache.set('b', value())
+        cache.get('a')
+        cache.set('c', value())
+        assert cache.get('b') is None
+        assert cache.get('a') == value()
+        assert len(cache) == 2
+
+    def test_evicts_by_size(self):
+        cache = LRUCache(max_entries=None, max_size=10)
+        cache.set('a', value('12345'))
+        cache.set('b', value('123456'))
+        assert cache.get('a') is None
+        assert cache.size == 6
+
+    def test_entries_expire(self):
+        cache = LRUCache(ttl=60)
+        cache.set('a', value(), ttl=0.01)
+        cache.set('b', value())
+        time.sleep(0.02)
+        assert cache.get('a') is None
+        assert cache.get('b') == value()
+
+
+class TestFileCache(object):
+
+    def test_round_trip_and_expiry(self, tmp_path):
+        cache = FileCache(directory=str(tmp_path))
+        cache.set('a', value('{"a": 1}'))
+        cache.set('b', value(), ttl=-1)
+        assert FileCache(directory=str(tmp_path)).get('a') == value('{"a": 1}')
+        assert cache.get('b') is None
+
+    def test_corrupt_and_foreign_files_are_misses(self, tmp_path):
+        cache = FileCache(directory=str(tmp_path))
+        for key, contents in (('a', '[1, 2]'), ('b', '{"key": "b"}'), ('c', '{"key": "c", "url"')):
+            file_path = cache._get_file_path(key)
+            with open(file_path, 'w') as f:
+                f.write(contents)
+            assert cache.get(key) is None
+            assert not os.path.exists(file_path)
+
+    def test_evicts_oldest_files(self, tmp_path):
+        cache = FileCache(directory=str(tmp_path), max_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, value())
+            time.sleep(0.01)
+        assert cache.get('a') is None
+        assert cache.get('c') == value()
+
+
+class TestNBAHTTPCache(object):
+
+    def test_repeated_requests_are_served_from_cache(self, fake_session):
+        session = fake_session
+        client = NBAStatsHTTP(session=session, cache=LRUCache())
+        first = client.send_api_request('fake', {'B': 1, 'A': 2})
+        second = client.send_api_request('fake', {'A': 2, 'B': 1})
+        assert len(session.calls) == 1
+        assert second.get_response() == first.get_response()
+
+    def test_invalid_responses_are_not_cached(self, fake_session):
+        session = fake_session
+        session.text = '{"Message":"An error has occurred."}'
+        client = NBAStatsHTTP(session=session, cache=LRUCache())
+        client.send_api_request('fake', {})
+        client.send_api_request('fake', {})
+        assert len(session.calls) == 2
+
+    def test_policy_decides_ttl(self, fake_session):
+        session = fake_session
+        policy = FixedPolicy(ttl=0)
+        client = NBAStatsHTTP(session=session, cache=LRUCache(), cache_policy=policy)
+        client.send_api_request('Fake', {'A': 1})
+        client.send_api_request('Fake', {'A': 1})
+        assert len(session.calls) == 2
+        assert policy.calls[0] == ('Fake', {'A': 1})
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from nba_api.library import http
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse, AsyncNBAStatsHTTP
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_session():
+    yield
+    NBAStatsHTTP.close_session()
+    http.NBAHTTP.close_session()
+
+
+class TestSessions(object):
+
+    def test_create_session_mounts_pool_adapter(self):
+        session = http.create_session(pool_connections=2, pool_maxsize=25)
+        adapter = session.get_adapter('https://stats.nba.com')
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 25
+        session.close()
+
+    def test_shared_session_is_reused(self):
+        assert NBAStatsHTTP.get_session() is NBAStatsHTTP.get_session()
+
+    def test_shared_session_used_by_default(self, fake_session):
+        session = fake_session
+        NBAStatsHTTP.set_session(session)
+        NBAStatsHTTP().send_api_request(endpoint='fake', parameters={'B': 1, 'A': 2})
+        NBAStatsHTTP().send_api_request(endpoint='fake', parameters={'B': 1, 'A': 2})
+        assert len(session.calls) == 2
+        assert session.calls[0][1] == [('A', 2), ('B', 1)]
+
+    def test_instance_session_overrides_shared(self, fake_session, other_fake_session):
+        shared = fake_session
+        specific = other_fake_session
+        NBAStatsHTTP.set_session(shared)
+        NBAStatsHTTP(session=specific).send_api_request(endpoint='fake', parameters={})
+        assert not shared.calls
+        assert len(specific.calls) == 1
+
+    def test_context_manager_closes_instance_session(self, fake_session):
+        session = fake_session
+        with NBAStatsHTTP(session=session) as client:
+            client.send_api_request(endpoint='fake', parameters={})
+        assert session.closed
+
+    def test_set_session_keeps_previous_open(self, fake_session):
+        first = fake_session
+        NBAStatsHTTP.set_session(first)
+        NBAStatsHTTP.configure_session(pool_maxsize=4)
+        # Other threads may still be sending requests on it
+        assert not first.closed
+
+    def test_close_session(self, fake_session):
+        NBAStatsHTTP.set_session(fake_session)
+        NBAStatsHTTP.close_session()
+        assert fake_session.closed
+        assert NBAStatsHTTP.get_session() is not fake_session
+
+
+class TestAsync(object):
+
+    def test_send_api_request(self, fake_async_session, loop):
+        pytest.importorskip('aiohttp')
+        session = fake_async_session
+        session.text = '{"resultSets": [{"name": "A", "headers": ["X"], "rowSet": [[1]]}]}'
+
+        async def request():
+            async with AsyncNBAStatsHTTP(session=session) as client:
+                return await client.send_api_request(endpoint='fake', parameters={'B': 1, 'A': None},
+                                                     proxy='127.0.0.1:80')
+
+        response = loop.run_until_complete(request())
+        assert session.closed
+        assert session.calls[0][1] == [('B', '1')]
+        assert session.calls[0][2] == 'http://127.0.0.1:80'
+        assert response.get_data_sets() == {'A': {'headers': ['X'], 'data': [[1]]}}
+
+    def test_endpoint_get_request_async(self, fake_async_session, loop):
+        pytest.importorskip('aiohttp')
+        from nba_api.stats.endpoints import commonteamyears
+        session = fake_async_session
+        session.text = '{"resultSets": [{"name": "TeamYears", "headers": ["TEAM_ID"], "rowSet": [[1]]}]}'
+        endpoint = commonteamyears.CommonTeamYears(get_request=False)
+        loop.run_until_complete(endpoint.get_request_async(session=session))
+        assert endpoint.team_years.get_dict() == {'headers': ['TEAM_ID'], 'data': [[1]]}
+
+    def test_get_session_discards_session_of_closed_loop(self, loop):
+        pytest.importorskip('aiohttp')
+
+        async def get_session():
+            return AsyncNBAStatsHTTP.get_session()
+
+        first_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(get_session())
+        first_loop.close()
+        second = loop.run_until_complete(get_session())
+        assert second is not first
+        assert first.closed and first.connector is None
+        loop.run_until_complete(AsyncNBAStatsHTTP.close_session())
+        assert second.closed
+
+
+class TestResponses(object):
+
+    contents = '{"parameters": [{"A": 1}, {"B": 2}], "resultSets": [{"name": "A", "headers": ["X", "Y"], "rowSet": [[1, 2]]}]}'
+
+    def test_response_is_decoded_once(self, monkeypatch):
+        decoded = []
+        loads = http.jsoncodec.loads
+        monkeypatch.setattr(http.jsoncodec, 'loads', lambda text: decoded.append(text) or loads(text))
+        response = NBAStatsResponse(response=self.contents, status_code=200, url=None)
+        assert response.valid_json()
+        assert response.get_parameters() == {'A': 1, 'B': 2}
+        assert response.get_data_sets() == {'A': {'headers': ['X', 'Y'], 'data': [[1, 2]]}}
+        assert response.get_headers_from_data_sets() == {'A': ['X', 'Y']}
+        assert response.get_normalized_dict() == {'A': [{'X': 1, 'Y': 2}]}
+        assert response.get_data_sets() is response.get_data_sets()
+        assert len(decoded) == 1
+
+    def test_get_json_returns_original_text(self):
+        response = NBAStatsResponse(response=self.contents, status_code=200, url=None)
+        assert response.get_json() is self.contents
+
+    def test_invalid_json(self):
+        response = NBAStatsResponse(response='<Error></Error>', status_code=200, url=None)
+        assert not response.valid_json()
+        assert not response.valid_json()
+        with pytest.raises(ValueError):
+            response.get_json()
+
+    def test_iter_rows(self):
+        contents = '{"resultSets": [{"name": "A", "headers": ["X", "Y", "In Paint"], "rowSet": [[1, 2, 3], [4, 5, 6]]}]}'
+        response = NBAStatsResponse(response=contents, status_code=200, url=None)
+        assert list(response.iter_rows('A')) == [(1, 2, 3), (4, 5, 6)]
+        assert next(response.iter_rows('A', row_type='dict')) == {'X': 1, 'Y': 2, 'In Paint': 3}
+        records = list(response.iter_rows('A', row_type='record'))
+        assert records[1].X == 4 and records[1]._2 == 6
+        assert type(records[0]) is type(next(response.iter_rows('A', row_type='record')))
+        with pytest.raises(Exception, match='InvalidArgument'):
+            response.iter_rows('A', row_type='list')
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from nba_api.library import jsoncodec
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = jsoncodec.get_backend()
+    yield
+    jsoncodec.set_backend(backend)
+
+
+payload = ('{"resultSets": [{"name": "A", "headers": ["PLAYER_NAME", "PCT"], '
+           '"rowSet": [["Luka Don\\u010di\\u0107", 0.5], ["Jokic", null]]}]}')
+
+
+@pytest.mark.parametrize('backend', jsoncodec.get_available_backends())
+def test_backends_round_trip(backend):
+    jsoncodec.set_backend(backend)
+    decoded = jsoncodec.loads(payload)
+    assert decoded['resultSets'][0]['rowSet'][0] == ['Luka Dončić', 0.5]
+    assert jsoncodec.loads(jsoncodec.dumps(decoded)) == decoded
+    with pytest.raises(ValueError):
+        jsoncodec.loads('<Error><Message>An error has occurred.</Message></Error>')
+
+
+def test_fallback_and_unknown_backend():
+    assert 'json' in jsoncodec.get_available_backends()
+    assert jsoncodec.set_backend('json') == 'json'
+    with pytest.raises(Exception):
+        jsoncodec.set_backend('unknown')
+
+
+@pytest.mark.parametrize('backend', jsoncodec.get_available_backends())
+def test_get_json_does_not_depend_on_backend(backend):
+    from nba_api.stats.endpoints._base import Endpoint
+    from nba_api.stats.library.http import NBAStatsResponse
+    jsoncodec.set_backend(backend)
+    result_set = json.loads(payload)['resultSets'][0]
+    data_set = Endpoint.DataSet(data={'headers': result_set['headers'], 'data': result_set['rowSet']})
+    assert data_set.get_json() == json.dumps(data_set.get_dict())
+    response = NBAStatsResponse(response=payload, status_code=200, url=None)
+    assert response.get_normalized_json() == json.dumps(response.get_normalized_dict())
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from nba_api.library.ratelimit import TokenBucket, FileTokenBucket, RateLimiter, FCNTL
+
+
+class CountingBucket(object):
+    def __init__(self):
+        self.reserved = 0
+
+    def reserve(self, tokens=1):
+        self.reserved += tokens
+        return 0.0
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_rejects_invalid_arguments():
+    with pytest.raises(Exception):
+        TokenBucket(rate=0)
+
+
+@pytest.mark.skipif(not FCNTL, reason='fcntl is not available')
+def test_file_token_bucket_is_shared_through_the_file(tmp_path):
+    file_path = str(tmp_path / 'bucket')
+    first = FileTokenBucket(file_path=file_path, rate=10, burst=2)
+    second = FileTokenBucket(file_path=file_path, rate=10, burst=2)
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    assert first.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.skipif(not FCNTL, reason='fcntl is not available')
+def test_file_token_bucket_does_not_block_the_event_loop(tmp_path, loop):
+    import fcntl
+    file_path = str(tmp_path / 'bucket')
+    bucket = FileTokenBucket(file_path=file_path, rate=10, burst=2)
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    events = []
+
+    async def release():
+        # Only runs while acquire_async waits for the lock if the event loop is free
+        await asyncio.sleep(0.05)
+        events.append('released')
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+    async def acquire():
+        await bucket.acquire_async()
+        events.append('acquired')
+
+    async def both():
+        await asyncio.gather(acquire(), release())
+
+    # Releases the lock anyway, so a blocked event loop fails the test instead of hanging it
+    timer = threading.Timer(2, fcntl.flock, args=(fd, fcntl.LOCK_UN))
+    timer.start()
+    try:
+        loop.run_until_complete(both())
+    finally:
+        timer.cancel()
+        os.close(fd)
+    assert events == ['released', 'acquired']
+
+
+def test_rate_limiter_uses_shared_and_endpoint_buckets():
+    shared = CountingBucket()
+    box_score = CountingBucket()
+    limiter = RateLimiter(bucket=shared, endpoint_buckets={'BoxScoreSummaryV2': box_score})
+    limiter.acquire('boxscoresummaryv2')
+    limiter.acquire('scoreboardv2')
+    assert shared.reserved == 2
+    assert box_score.reserved == 1
+
+
+def test_rate_limiter_is_applied_by_nba_http(fake_session):
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    bucket = CountingBucket()
+    client = NBAStatsHTTP(session=fake_session, rate_limiter=RateLimiter(bucket=bucket))
+    client.send_api_request(endpoint='fake', parameters={})
+    assert bucket.reserved == 1
+    assert NBAStatsHTTP.rate_limiter is None
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+import requests
+
+from nba_api.library.retry import RetryPolicy, CircuitBreaker, CircuitBreakerOpen
+from nba_api.stats.library.http import NBAStatsHTTP
+
+
+valid = ('{"resultSets": []}', 200)
+server_error = ('{"Message":"An error has occurred."}', 200)
+bad_parameter = ('The field Season must match the regular expression', 400)
+
+
+def no_wait_policy(max_attempts=3):
+    return RetryPolicy(max_attempts=max_attempts, backoff_factor=0)
+
+
+class TestRetryPolicy(object):
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.get_backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        assert all(0 <= policy.get_backoff(3) <= 4 for _ in range(100))
+
+
+class TestSendWithRetries(object):
+
+    def test_retries_error_contents_until_valid(self, fake_session):
+        session = fake_session
+        session.outcomes = [server_error, server_error, valid]
+        response = NBAStatsHTTP(session=session, retry_policy=no_wait_policy()).send_api_request('fake', {})
+        assert len(session.calls) == 3
+        assert response.valid_json()
+
+    def test_retries_connection_errors(self, fake_session):
+        session = fake_session
+        session.outcomes = [requests.exceptions.ConnectionError(), valid]
+        NBAStatsHTTP(session=session, retry_policy=no_wait_policy()).send_api_request('fake', {})
+        assert len(session.calls) == 2
+
+    def test_retries_connection_reset_mid_body(self, fake_session):
+        session = fake_session
+        session.outcomes = [requests.exceptions.ChunkedEncodingError(), valid]
+        NBAStatsHTTP(session=session, retry_policy=no_wait_policy()).send_api_request('fake', {})
+        assert len(session.calls) == 2
+
+    def test_gives_up_after_max_attempts(self, fake_session):
+        session = fake_session
+        session.outcomes = [requests.exceptions.Timeout()] * 2
+        with pytest.raises(requests.exceptions.Timeout):
+            NBAStatsHTTP(session=session, retry_policy=no_wait_policy(max_attempts=2)).send_api_request('fake', {})
+        assert len(session.calls) == 2
+
+    def test_permanent_errors_are_not_retried(self, fake_session):
+        session = fake_session
+        session.outcomes = [bad_parameter]
+        response = NBAStatsHTTP(session=session, retry_policy=no_wait_policy()).send_api_request('fake', {})
+        assert len(session.calls) == 1
+        assert not response.valid_json()
+
+    def test_single_attempt_without_policy(self, fake_session):
+        session = fake_session
+        session.outcomes = [server_error]
+        NBAStatsHTTP(session=session).send_api_request('fake', {})
+        assert len(session.calls) == 1
+
+
+class TestCircuitBreaker(object):
+
+    def test_opens_after_threshold_and_fails_fast(self, fake_session):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        session = fake_session
+        session.outcomes = [server_error, server_error]
+        client = NBAStatsHTTP(session=session, retry_policy=no_wait_policy(), circuit_breaker=breaker)
+        with pytest.raises(CircuitBreakerOpen):
+            client.send_api_request('fake', {})
+        assert len(session.calls) == 2
+        assert breaker.is_open('stats.nba.com')
+
+    def test_half_open_trial_closes_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure('stats.nba.com')
+        breaker.before_request('stats.nba.com')
+        with pytest.raises(CircuitBreakerOpen):
+            breaker.before_request('stats.nba.com')
+        breaker.record_success('stats.nba.com')
+        assert not breaker.is_open('stats.nba.com')
+
+    def test_trial_interrupted_by_other_exception_is_released(self, fake_session):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        session = fake_session
+        session.outcomes = [server_error, KeyError(), valid]
+        client = NBAStatsHTTP(session=session, retry_policy=no_wait_policy(max_attempts=1), circuit_breaker=breaker)
+        client.send_api_request('fake', {})
+        assert breaker.is_open('stats.nba.com')
+        with pytest.raises(KeyError):
+            client.send_api_request('fake', {})
+        # The next request is let through as a new trial instead of failing fast
+        assert client.send_api_request('fake', {}).valid_json()
+        assert not breaker.is_open('stats.nba.com')
+
+    def test_cancelled_async_trial_is_released(self, fake_async_session, loop):
+        pytest.importorskip('aiohttp')
+        from nba_api.stats.library.http import AsyncNBAStatsHTTP
+
+        fake_async_session.outcomes = [asyncio.CancelledError()]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure('stats.nba.com')
+        with pytest.raises(asyncio.CancelledError):
+            client = AsyncNBAStatsHTTP(session=fake_async_session, circuit_breaker=breaker)
+            loop.run_until_complete(client.send_api_request('fake', {}))
+        breaker.before_request('stats.nba.com')
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nba_api.library.singleflight import SingleFlight
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP
+
+
+def test_concurrent_calls_share_one_result():
+    single_flight = SingleFlight()
+    calls = []
+
+    def function():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(single_flight.do('key', function))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(set(map(id, results))) == 1
+    assert single_flight.in_flight() == 0
+
+
+def test_exceptions_are_shared_and_not_kept():
+    single_flight = SingleFlight()
+
+    def function():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', function)
+    assert single_flight.do('key', lambda: 1) == 1
+
+
+def test_nba_http_coalesces_identical_requests(fake_session):
+    session = fake_session
+    session.delay = 0.1
+    client = NBAStatsHTTP(session=session, single_flight=SingleFlight())
+    responses = []
+
+    def request(parameters):
+        responses.append(client.send_api_request('fake', parameters))
+
+    threads = [threading.Thread(target=request, args=({'A': 1, 'B': 2},)) for _ in range(5)]
+    threads.append(threading.Thread(target=request, args=({'A': 2},)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(session.calls) == 2
+    assert len(set(map(id, responses))) == 2
+
+
+def test_async_nba_http_coalesces_identical_requests(fake_async_session, loop):
+    pytest.importorskip('aiohttp')
+    session = fake_async_session
+    session.delay = 0.05
+    client = AsyncNBAStatsHTTP(session=session, single_flight=SingleFlight())
+
+    async def requests():
+        return await asyncio.gather(*[client.send_api_request('fake', {'A': 1}) for _ in range(5)])
+
+    responses = loop.run_until_complete(requests())
+    assert len(session.calls) == 1
+    assert len(set(map(id, responses))) == 1
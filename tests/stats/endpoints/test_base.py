@@ -0,0 +1,216 @@
+import gc
+import json
+import weakref
+
+import pytest
+
+from nba_api.stats.endpoints import BoxScoreSummaryV2
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.http import NBAStatsResponse
+
+data = {
+    'headers': ['GAME_ID', 'PLAYER_ID', 'FG_PCT', 'TEAM_ABBREVIATION', 'PTS', 'COMMENT', 'START_POSITION'],
+    'data': [
+        ['0021800001', 201939, 0.5, 'GSW', 30, None, 'G'],
+        ['0021800001', 2544, None, 'LAL', None, None, 'F'],
+        ['0021800001', 201142, 1, 'GSW', 25, None, None],
+    ],
+}
+
+
+class TestColumnarDataSet:
+    def test_get_dict_round_trip(self):
+        data_set = Endpoint.ColumnarDataSet(data=data)
+        assert data_set.get_dict() == data
+        assert data_set.data == data
+
+    def test_column_storage(self):
+        data_set = Endpoint.ColumnarDataSet(data=data)
+        assert data_set.columns['PLAYER_ID'].values.typecode == 'q'
+        assert data_set.columns['PLAYER_ID'].mask is None
+        assert data_set.columns['FG_PCT'].values.typecode == 'd'
+        assert data_set.columns['PTS'].mask.tolist() == [0, 1, 0]
+        codes, categories = data_set.get_categories('TEAM_ABBREVIATION')
+        assert codes.tolist() == [0, 1, 0]
+        assert categories == ['GSW', 'LAL']
+        assert data_set.get_column('START_POSITION') == ['G', 'F', None]
+        assert data_set.get_column('COMMENT') == [None, None, None]
+
+    def test_from_columns(self):
+        columns = [list(column) for column in zip(*data['data'])]
+        data_set = Endpoint.ColumnarDataSet.from_columns(data['headers'], columns)
+        assert data_set.row_count == 3
+        assert data_set.get_dict() == data
+
+    def test_get_array(self):
+        numpy = pytest.importorskip('numpy')
+        data_set = Endpoint.ColumnarDataSet(data=data)
+        assert data_set.get_array('PLAYER_ID').dtype == numpy.int64
+        assert data_set.get_array('PLAYER_ID').tolist() == [201939, 2544, 201142]
+        points = data_set.get_array('PTS')
+        assert points[0] == 30 and numpy.isnan(points[1])
+
+    def test_get_data_frame(self):
+        pytest.importorskip('pandas')
+        data_frame = Endpoint.ColumnarDataSet(data=data).get_data_frame()
+        assert list(data_frame.columns) == data['headers']
+        assert str(data_frame['TEAM_ABBREVIATION'].dtype) == 'category'
+        assert data_frame['TEAM_ABBREVIATION'].tolist() == ['GSW', 'LAL', 'GSW']
+        assert data_frame['PLAYER_ID'].tolist() == [201939, 2544, 201142]
+
+    def test_create_data_set(self):
+        endpoint = Endpoint()
+        assert type(endpoint.create_data_set(data)) is Endpoint.DataSet
+        endpoint.columnar = True
+        assert type(endpoint.create_data_set(data)) is Endpoint.ColumnarDataSet
+
+
+data_types = {'GAME_ID': 'int', 'PLAYER_ID': 'int', 'FG_PCT': 'float32', 'TEAM_ABBREVIATION': 'category'}
+
+
+class TestDataTypes:
+    def test_get_data_frame(self):
+        pytest.importorskip('pandas')
+        data_frame = Endpoint.DataSet(data=data, data_types=data_types).get_data_frame()
+        assert str(data_frame['PLAYER_ID'].dtype) == 'Int64'
+        assert str(data_frame['FG_PCT'].dtype) == 'float32'
+        assert str(data_frame['TEAM_ABBREVIATION'].dtype) == 'category'
+        # Values that do not convert keep the inferred type
+        assert data_frame['GAME_ID'].tolist() == ['0021800001'] * 3
+
+    def test_opt_out(self):
+        pytest.importorskip('pandas')
+        data_frame = Endpoint.DataSet(data=data, data_types=data_types).get_data_frame(apply_data_types=False)
+        assert str(data_frame['FG_PCT'].dtype) == 'float64'
+
+    def test_dates(self):
+        pytest.importorskip('pandas')
+        dates = {'headers': ['GAME_DATE', 'TEAM_ID'], 'data': [['2018-10-16T00:00:00', 1610612744], [None, None]]}
+        date_types = {'GAME_DATE': 'datetime', 'TEAM_ID': 'int'}
+        data_frame = Endpoint.ColumnarDataSet(data=dates, data_types=date_types).get_data_frame()
+        assert str(data_frame['GAME_DATE'].dtype).startswith('datetime64')
+        assert data_frame['TEAM_ID'].tolist()[0] == 1610612744
+
+    def test_create_data_set(self):
+        endpoint = Endpoint()
+        endpoint.expected_data_types = {'PlayerStats': data_types}
+        assert endpoint.create_data_set(data, name='PlayerStats').data_types == data_types
+        assert endpoint.create_data_set(data, name='TeamStats').data_types == {}
+
+
+class TestLazyDataSets:
+    def get_endpoint(self):
+        result_sets = [{'name': name, 'headers': ['GAME_ID'], 'rowSet': [['0021800001']]}
+                       for name in BoxScoreSummaryV2.expected_data]
+        endpoint = BoxScoreSummaryV2(game_id='0021800001', get_request=False)
+        endpoint.nba_response = NBAStatsResponse(response=json.dumps({'resultSets': result_sets}), status_code=200, url=None)
+        endpoint.load_response()
+        return endpoint
+
+    def test_built_on_first_access(self):
+        endpoint = self.get_endpoint()
+        assert endpoint._loaded_data_sets == {}
+        line_score = endpoint.line_score
+        assert line_score.get_dict() == {'headers': ['GAME_ID'], 'data': [['0021800001']]}
+        assert list(endpoint._loaded_data_sets) == ['LineScore']
+        assert endpoint.line_score is line_score
+
+    def test_data_sets(self):
+        endpoint = self.get_endpoint()
+        assert len(endpoint.data_sets) == len(BoxScoreSummaryV2.expected_data)
+        assert endpoint.data_sets[0] is endpoint.available_video
+
+    def test_load_response_resets(self):
+        endpoint = self.get_endpoint()
+        line_score = endpoint.line_score
+        endpoint.load_response()
+        assert endpoint.line_score is not line_score
+
+    def test_not_loaded(self):
+        endpoint = BoxScoreSummaryV2(game_id='0021800001', get_request=False)
+        assert endpoint.line_score is None
+        assert endpoint.data_sets is None
+
+    def test_columnar_releases_rows(self):
+        endpoint = self.get_endpoint()
+        endpoint.columnar = True
+        nba_response = weakref.ref(endpoint.nba_response)
+        endpoint.nba_response.get_data_sets()
+        line_score = endpoint.line_score
+        gc.collect()
+        # The decoded response and its row lists are freed once the columns are built
+        assert nba_response() is None
+        assert endpoint.nba_response._dict is None and endpoint.nba_response._data_sets is None
+        assert endpoint.nba_response.get_response() is None
+        assert line_score.get_dict() == {'headers': ['GAME_ID'], 'data': [['0021800001']]}
+        assert type(endpoint.available_video) is Endpoint.ColumnarDataSet
+        assert len(endpoint.data_sets) == len(BoxScoreSummaryV2.expected_data)
+        with pytest.raises(Exception, match='ResponseReleased'):
+            endpoint.get_dict()
+        with pytest.raises(Exception, match='ResponseReleased'):
+            endpoint.get_json()
+
+    def test_columnar_normalized_dict(self):
+        normalized_dict = self.get_endpoint().get_normalized_dict()
+        endpoint = self.get_endpoint()
+        endpoint.columnar = True
+        endpoint.line_score
+        assert endpoint.nba_response.is_released()
+        assert list(endpoint.get_available_data()) == list(BoxScoreSummaryV2.expected_data)
+        assert endpoint.get_normalized_dict() == normalized_dict
+        assert json.loads(endpoint.get_normalized_json()) == normalized_dict
+
+    def test_columnar_keep_response(self):
+        endpoint = self.get_endpoint()
+        endpoint.columnar = True
+        endpoint.keep_response = True
+        endpoint.line_score
+        assert endpoint.nba_response._data_sets is None
+        assert list(endpoint.get_dict()) == ['resultSets']
+
+
+class TestIterRows:
+    @pytest.mark.parametrize('data_set_class', [Endpoint.DataSet, Endpoint.ColumnarDataSet])
+    def test_iter_rows(self, data_set_class):
+        data_set = data_set_class(data=data)
+        assert list(data_set.iter_rows()) == [tuple(row) for row in data['data']]
+        assert next(data_set.iter_rows(row_type='dict'))['PLAYER_ID'] == 201939
+        assert [row.TEAM_ABBREVIATION for row in data_set.iter_rows(row_type='record')] == ['GSW', 'LAL', 'GSW']
+
+
+class TestRecordTypes:
+    def get_endpoint(self, headers):
+        from nba_api.stats.endpoints import CommonTeamYears
+        row = ['00', 1610612737, '1949', '2018', 'ATL'][:len(headers)]
+        contents = {'resultSets': [{'name': 'TeamYears', 'headers': headers, 'rowSet': [row]}]}
+        endpoint = CommonTeamYears(get_request=False)
+        endpoint.nba_response = NBAStatsResponse(response=json.dumps(contents), status_code=200, url=None)
+        endpoint.load_response()
+        return endpoint
+
+    def test_generated_record_type(self):
+        import pickle
+        from nba_api.stats.endpoints.commonteamyears import TeamYearsRow
+        endpoint = self.get_endpoint(['LEAGUE_ID', 'TEAM_ID', 'MIN_YEAR', 'MAX_YEAR', 'ABBREVIATION'])
+        records = endpoint.get_normalized_records()['TeamYears']
+        assert type(records[0]) is TeamYearsRow
+        assert records[0].ABBREVIATION == 'ATL'
+        assert pickle.loads(pickle.dumps(records)) == records
+
+    def test_changed_headers(self):
+        from nba_api.stats.endpoints.commonteamyears import TeamYearsRow
+        endpoint = self.get_endpoint(['LEAGUE_ID', 'TEAM_ID'])
+        record = endpoint.team_years.get_records()[0]
+        assert type(record) is not TeamYearsRow
+        assert record.TEAM_ID == 1610612737
+
+    def test_renamed_record_type(self):
+        from collections import namedtuple
+        headers = ['TEAM_ID', 'TEAM_ID', 'MIN-YEAR']
+        # As generated for headers that are not valid or unique field names
+        RenamedRow = namedtuple('RenamedRow', headers, rename=True)
+        RenamedRow._headers = tuple(headers)
+        data_set = Endpoint.DataSet(data={'headers': headers, 'data': [[1, 2, '1949']]}, record_type=RenamedRow)
+        record = data_set.get_records()[0]
+        assert type(record) is RenamedRow
+        assert record == (1, 2, '1949')
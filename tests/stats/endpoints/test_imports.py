@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import nba_api.stats.endpoints as endpoints
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def get_imported_modules(statement):
+    '''Runs statement in a fresh interpreter and returns the modules it imported.'''
+    code = 'import json, sys\n{}\nprint(json.dumps(sorted(sys.modules)))'.format(statement)
+    environment = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=root, env=environment)
+    return set(json.loads(output.decode('utf-8')))
+
+
+def get_endpoint_modules(modules):
+    return {module for module in modules if module.startswith('nba_api.stats.endpoints.')}
+
+
+class TestLazyImports:
+    def test_import_one_endpoint(self):
+        modules = get_imported_modules('from nba_api.stats.endpoints import scoreboardv2, ScoreboardV2')
+        assert get_endpoint_modules(modules) == {'nba_api.stats.endpoints._base', 'nba_api.stats.endpoints.scoreboardv2'}
+        assert 'pandas' not in modules
+        assert 'numpy' not in modules
+        assert 'pyarrow' not in modules
+
+    def test_pandas_flag(self):
+        statement = 'from nba_api.stats.endpoints._base import PANDAS\nassert PANDAS is ("pandas" in sys.modules)'
+        modules = get_imported_modules(statement)
+        assert get_endpoint_modules(modules) == {'nba_api.stats.endpoints._base'}
+
+    def test_import_package(self):
+        modules = get_imported_modules('import nba_api.stats.endpoints')
+        assert get_endpoint_modules(modules) == set()
+
+    def test_names(self):
+        from nba_api.stats.endpoints import ScoreboardV2, scoreboardv2
+        assert ScoreboardV2 is scoreboardv2.ScoreboardV2
+        assert endpoints.PlayByPlayV2.endpoint == 'playbyplayv2'
+        assert 'CommonAllPlayers' in dir(endpoints)
+        for module in endpoints.__all__:
+            assert module in endpoints.endpoint_classes.values()
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            endpoints.NotAnEndpoint
@@ -0,0 +1,79 @@
+import json
+from datetime import datetime, timedelta
+
+from nba_api.stats.library.cachepolicy import SeasonCachePolicy
+from nba_api.stats.library.http import NBAStatsResponse
+
+
+def get_policy():
+    return SeasonCachePolicy(historical_ttl=None, current_ttl=600, live_ttl=10, current_season_year=2018)
+
+
+policy = get_policy()
+
+
+def response(game_statuses=None):
+    result_sets = [{'name': 'Stats', 'headers': ['PTS'], 'rowSet': [[100]]}]
+    if game_statuses is not None:
+        result_sets.append({'name': 'GameHeader', 'headers': ['GAME_ID', 'GAME_STATUS_ID'],
+                            'rowSet': [['0021800001', status] for status in game_statuses]})
+    return NBAStatsResponse(response=json.dumps({'resultSets': result_sets}), status_code=200, url=None)
+
+
+def test_completed_season_is_kept_forever():
+    assert policy.get_ttl('LeagueGameLog', {'Season': '2015-16'}, response()) is None
+    assert policy.get_ttl('LeagueDashPtStats', {'SeasonYear': '2015'}, response()) is None
+
+
+def test_current_season_is_kept_briefly():
+    assert policy.get_ttl('LeagueGameLog', {'Season': '2018-19'}, response()) == 600
+    assert policy.get_ttl('PlayerCareerStats', {'PerMode': 'Totals'}, response()) == 600
+    assert policy.get_ttl('LeagueGameFinder', {'Season': 'ALL'}, response()) == 600
+
+
+def test_game_id_season():
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0021700807'}, response()) is None
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0029600807'}, response()) is None
+    # Without a status, a current season game may be in progress
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0021800807'}, response()) == 10
+
+
+def test_game_status():
+    assert policy.get_ttl('BoxScoreSummaryV2', {'GameID': '0021800001'}, response([3])) is None
+    assert policy.get_ttl('BoxScoreSummaryV2', {'GameID': '0021800001'}, response([2])) == 10
+    today = datetime.now().strftime('%m/%d/%Y')
+    assert policy.get_ttl('ScoreboardV2', {'GameDate': today}, response([3, 2])) == 10
+    assert policy.get_ttl('ScoreboardV2', {'GameDate': today}, response([3, 3])) is None
+
+
+def test_dates():
+    old_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    today = datetime.now().strftime('%m/%d/%Y')
+    assert policy.get_ttl('ScoreboardV2', {'GameDate': old_date}, response()) is None
+    assert policy.get_ttl('ScoreboardV2', {'GameDate': today}, response()) == 10
+    assert policy.get_ttl('TeamGameLog', {'DateFrom': old_date, 'DateTo': ''}, response()) == 600
+    assert policy.get_ttl('TeamGameLog', {'Season': '2015-16', 'DateTo': today}, response()) == 600
+
+
+def test_finished_current_season_box_score():
+    policy = get_policy()
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0021800001'}, response()) == 10
+    # The scoreboard, or box score summary, of the day had the game as over
+    assert policy.get_ttl('ScoreboardV2', {'GameDate': '2018-10-16'}, response([3])) is None
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0021800001'}, response()) is None
+    assert policy.get_ttl('BoxScoreTraditionalV2', {'GameID': '0021800002'}, response()) == 10
+
+
+def play_by_play(rows):
+    result_sets = [{'name': 'PlayByPlay', 'headers': ['GAME_ID', 'EVENTMSGTYPE', 'PERIOD', 'SCORE'], 'rowSet': rows}]
+    return NBAStatsResponse(response=json.dumps({'resultSets': result_sets}), status_code=200, url=None)
+
+
+def test_finished_current_season_play_by_play():
+    policy = get_policy()
+    rows = [['0021800001', 1, 4, '101 - 99'], ['0021800001', 13, 4, None]]
+    assert policy.get_ttl('PlayByPlayV2', {'GameID': '0021800001'}, play_by_play(rows)) is None
+    # Tied at the end of the 4th period, an overtime follows
+    rows = [['0021800001', 1, 4, '101 - 101'], ['0021800001', 13, 4, None]]
+    assert policy.get_ttl('PlayByPlayV2', {'GameID': '0021800001'}, play_by_play(rows)) == 10
+    assert policy.get_ttl('PlayByPlayV2', {'GameID': '0021800001'}, play_by_play(rows[:1])) == 10
@@ -0,0 +1,38 @@
+import pytest
+
+from nba_api.stats.library import data
+from tools.stats.static_data_generator.generator import generate_data_file
+
+
+class TestDataFile:
+    players = [[2544, 'James', 'LeBron', 'LeBron James'], [203081, 'Lillard', 'Damian', 'Damian Lillard'],
+               [1628983, 'Gilgeous-Alexander', 'Shai', 'Shai Gilgeous-Alexander']]
+    teams = [[1610612747, 'LAL', 'Lakers', 1948, 'Los Angeles', 'Los Angeles Lakers', 'California']]
+
+    def test_round_trip(self, tmpdir):
+        path = str(tmpdir.join('data.bin'))
+        generate_data_file(players=self.players, teams=self.teams, path=path)
+        tables = data.read_data_file(path)
+        assert list(tables['players']) == self.players
+        assert list(tables['teams']) == self.teams
+
+    def test_table(self, tmpdir):
+        path = str(tmpdir.join('data.bin'))
+        generate_data_file(players=self.players, teams=self.teams, path=path)
+        players = data.read_data_file(path)['players']
+        assert len(players) == 3
+        assert players[-1] == self.players[-1]
+        assert players[:2] == self.players[:2]
+        assert players.get_column(data.player_index_id) == [2544, 203081, 1628983]
+        with pytest.raises(IndexError):
+            players[3]
+
+    def test_invalid_file(self, tmpdir):
+        path = tmpdir.join('data.bin')
+        path.write_binary(b'not a data file')
+        with pytest.raises(Exception, match='InvalidDataFile'):
+            data.read_data_file(str(path))
+
+    def test_packaged_data(self):
+        assert [2544, 'James', 'LeBron', 'LeBron James'] in data.players
+        assert data.teams[0][data.team_index_abbreviation] == 'ATL'
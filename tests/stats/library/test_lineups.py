@@ -0,0 +1,74 @@
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.lineups import get_lineup_key, iter_data_set_lineups, iter_lineups
+
+
+headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'PERIOD', 'HOMEDESCRIPTION', 'NEUTRALDESCRIPTION',
+           'VISITORDESCRIPTION', 'PLAYER1_ID', 'PLAYER1_TEAM_ID', 'PLAYER2_ID', 'PLAYER2_TEAM_ID', 'PLAYER3_ID',
+           'PLAYER3_TEAM_ID']
+home = 1610612746
+visitor = 1610612756
+
+
+def row(event_num, event_msg_type, period=1, description=None, players=()):
+    player_values = []
+    for player_id, team_id in list(players) + [(0, None)] * (3 - len(players)):
+        player_values.extend([player_id, team_id])
+    return ['0021800001', event_num, event_msg_type, period, description, None, None] + player_values
+
+
+rows = [
+    row(1, 12),
+    row(2, 10, players=[(1, home), (11, visitor), (2, home)]),
+    row(3, 1, players=[(12, visitor), (13, visitor)]),
+    row(4, 2, players=[(3, home), (0, None), (14, visitor)]),
+    # A technical foul of a player on the bench is not a starter
+    row(5, 6, description='Leaf T.FOUL (P1.PN) (M.Lindsay)', players=[(9, home)]),
+    row(6, 8, players=[(15, visitor), (16, visitor)]),
+    row(7, 8, players=[(16, visitor), (17, visitor)]),
+    # Subbed in players are not starters
+    row(8, 1, players=[(17, visitor)]),
+    row(9, 4, players=[(visitor, None)]),
+    row(10, 5, players=[(4, home), (0, None), (13, visitor)]),
+    row(11, 1, players=[(5, home)]),
+    row(12, 13),
+    row(13, 12, period=2),
+    row(14, 8, period=2, players=[(1, home), (6, home)]),
+    row(15, 1, period=2, players=[(6, home)]),
+]
+
+
+def test_get_lineup_key():
+    assert get_lineup_key({1626157, 203083, 201142}) == '201142-203083-1626157'
+
+
+def test_iter_lineups():
+    lineups = list(iter_lineups(headers, rows))
+    assert [row_lineups[0] for row_lineups in lineups] == rows
+    starters = {home: '1-2-3-4-5', visitor: '11-12-13-14-15'}
+    assert lineups[0][1] == starters
+    assert lineups[4][1] == starters
+    # Lineups after each substitution
+    assert lineups[5][1] == {home: '1-2-3-4-5', visitor: '11-12-13-14-16'}
+    assert lineups[6][1] == {home: '1-2-3-4-5', visitor: '11-12-13-14-17'}
+    assert lineups[11][1] == lineups[6][1]
+    # The period ends before the starters are known
+    assert lineups[12][1] == {home: '1'}
+    assert lineups[13][1] == {home: '6'}
+
+
+def test_iter_data_set_lineups():
+    second_game = [['0021800002'] + row[1:] for row in rows]
+    data_sets = (data_set_class(data={'headers': headers, 'data': game_rows})
+                 for data_set_class, game_rows in ((Endpoint.DataSet, rows), (Endpoint.ColumnarDataSet, second_game)))
+    lineups = list(iter_data_set_lineups(data_sets))
+    assert [row_lineups[0] for row_lineups in lineups] == rows + second_game
+    assert [row_lineups[1] for row_lineups in lineups[15:]] == [row_lineups[1] for row_lineups in lineups[:15]]
+
+
+def test_iter_lineups_substitution_without_team():
+    # Substitutions without a PLAYER1_TEAM_ID keep the lineups, before and after the starters are known
+    substitution = row(0, 8, players=[(1, None), (7, home)])
+    lineups = list(iter_lineups(headers, [substitution] + rows[:7] + [substitution] + rows[7:]))
+    assert lineups[0][1] == {home: '1-2-3-4-5', visitor: '11-12-13-14-15'}
+    assert lineups[8][1] == lineups[7][1] == {home: '1-2-3-4-5', visitor: '11-12-13-14-17'}
+    assert None not in lineups[-1][1]
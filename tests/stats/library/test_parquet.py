@@ -0,0 +1,103 @@
+import pytest
+
+from nba_api.stats.endpoints._base import Endpoint
+
+pyarrow = pytest.importorskip('pyarrow')
+parquet = pytest.importorskip('pyarrow.parquet')
+
+from nba_api.stats.library.parquet import ParquetWriter  # noqa: E402
+
+headers = ['GAME_ID', 'PLAYER_ID', 'TEAM_ABBREVIATION', 'FG_PCT', 'COMMENT']
+data_types = {'PLAYER_ID': 'int', 'TEAM_ABBREVIATION': 'category', 'FG_PCT': 'float32'}
+
+
+def get_data_set(rows, columnar=False):
+    data_set_class = Endpoint.ColumnarDataSet if columnar else Endpoint.DataSet
+    return data_set_class(data={'headers': headers, 'data': rows}, data_types=data_types)
+
+
+class TestArrowTable:
+    rows = [['0021800001', 201939, 'GSW', 0.5, None], ['0021800001', 2544, 'LAL', None, 'DNP']]
+
+    @pytest.mark.parametrize('columnar', [False, True])
+    def test_get_arrow_table(self, columnar):
+        table = get_data_set(self.rows, columnar).get_arrow_table()
+        assert table.column_names == headers
+        assert table.column('GAME_ID').type == pyarrow.string()
+        assert table.column('PLAYER_ID').type == pyarrow.int64()
+        assert table.column('FG_PCT').type == pyarrow.float32()
+        assert pyarrow.types.is_dictionary(table.column('TEAM_ABBREVIATION').type)
+        assert table.column('TEAM_ABBREVIATION').to_pylist() == ['GSW', 'LAL']
+        assert table.column('COMMENT').to_pylist() == [None, 'DNP']
+
+    def test_opt_out(self):
+        table = get_data_set(self.rows).get_arrow_table(apply_data_types=False)
+        assert table.column('FG_PCT').type == pyarrow.float64()
+        assert table.column('TEAM_ABBREVIATION').type == pyarrow.string()
+
+
+class TestParquetWriter:
+    def test_row_groups(self, tmpdir):
+        where = str(tmpdir.join('players.parquet'))
+        with ParquetWriter(where) as writer:
+            writer.write(get_data_set([['0021800001', 201939, 'GSW', 0.5, 'DNP']]))
+            writer.write(get_data_set([['0021800002', 2544, 'LAL', 0.25, None], ['0021800002', 1, 'LAL', 0.1, None]], True))
+        assert writer.rows_written == 3
+        parquet_file = parquet.ParquetFile(where)
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.read().column('PLAYER_ID').to_pylist() == [201939, 2544, 1]
+
+    def test_null_columns_cast_to_schema(self, tmpdir):
+        where = str(tmpdir.join('players.parquet'))
+        with ParquetWriter(where) as writer:
+            writer.write(get_data_set([['0021800001', 201939, 'GSW', 0.5, 'DNP']]))
+            writer.write(get_data_set([['0021800002', 2544, 'LAL', 0.25, None]]))
+        assert parquet.read_table(where).column('COMMENT').to_pylist() == ['DNP', None]
+
+    def test_null_columns_in_first_write(self, tmpdir):
+        where = str(tmpdir.join('players.parquet'))
+        with ParquetWriter(where) as writer:
+            writer.write(get_data_set([['0021800001', None, 'GSW', None, None]]))
+            writer.write(get_data_set([['0021800002', 2544, 'LAL', 0.25, 'DNP']]))
+        table = parquet.read_table(where)
+        assert table.column('COMMENT').type == pyarrow.string()
+        assert table.column('COMMENT').to_pylist() == [None, 'DNP']
+        # Declared data types apply to null columns as well
+        assert table.column('PLAYER_ID').type == pyarrow.int64()
+        assert table.column('PLAYER_ID').to_pylist() == [None, 2544]
+
+    def test_numbers_without_data_type(self, tmpdir):
+        where = str(tmpdir.join('points.parquet'))
+        points_headers = ['PLAYER_ID', 'PTS']
+
+        def get_points(rows):
+            return Endpoint.DataSet(data={'headers': points_headers, 'data': rows}, data_types={'PLAYER_ID': 'int'})
+
+        with ParquetWriter(where) as writer:
+            writer.write(get_points([[201939, None]]))
+            writer.write(get_points([[2544, 20]]))
+            writer.write(get_points([[201142, 20.5]]))
+        table = parquet.read_table(where)
+        assert table.column('PTS').type == pyarrow.float64()
+        assert table.column('PTS').to_pylist() == [None, 20.0, 20.5]
+        assert table.column('PLAYER_ID').type == pyarrow.int64()
+        assert parquet.ParquetFile(where).num_row_groups == 3
+
+    def test_max_pending_rows(self, tmpdir):
+        where = str(tmpdir.join('players.parquet'))
+        writer = ParquetWriter(where, max_pending_rows=2)
+        writer.write(get_data_set([['0021800001', 201939, 'GSW', 0.5, None]]))
+        assert writer.rows_written == 0
+        writer.write(get_data_set([['0021800002', 2544, 'LAL', 0.25, None]]))
+        assert writer.rows_written == 2
+        assert writer.schema.field('COMMENT').type == pyarrow.string()
+        with pytest.raises(Exception, match='InvalidSchema'):
+            writer.write(pyarrow.table({name: [1] for name in headers}))
+        writer.close()
+
+    def test_invalid_schema(self, tmpdir):
+        writer = ParquetWriter(str(tmpdir.join('players.parquet')))
+        writer.write(get_data_set([['0021800001', 201939, 'GSW', 0.5, None]]))
+        with pytest.raises(Exception, match='InvalidSchema'):
+            writer.write(pyarrow.table({'PLAYER_ID': [1]}))
+        writer.close()
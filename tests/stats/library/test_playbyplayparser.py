@@ -0,0 +1,124 @@
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayparser import (Description, extract_events, extract_events_parallel, parse_data_set,
+                                                    parse_description, parse_row)
+
+
+headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'EVENTMSGACTIONTYPE', 'PERIOD', 'HOMEDESCRIPTION',
+           'NEUTRALDESCRIPTION', 'VISITORDESCRIPTION']
+rows = [
+    ['0021800001', 1, 12, 0, 1, None, 'Start of 1st Period', None],
+    ['0021800001', 2, 10, 0, 1, "Jump Ball Collins vs. O'Quinn: Tip to Leaf", None, None],
+    ['0021800001', 3, 1, 1, 1, None, None, "Evans 24' 3PT Jump Shot (3 PTS) (O'Quinn 1 AST)"],
+    ['0021800001', 4, 2, 1, 1, "MISS O'Quinn 17' Jump Shot", None, 'Collins BLOCK (1 BLK)'],
+    ['0021800001', 5, 4, 0, 1, None, None, 'Zubac REBOUND (Off:2 Def:4)'],
+    ['0021800001', 6, 5, 1, 1, 'G. Harrison Double Dribble Turnover (P1.T10)', None, 'Bradley STEAL (2 STL)'],
+    ['0021800001', 7, 6, 1, 1, 'Collison P.FOUL (P1.TN) (M.Lindsay)', None, None],
+]
+
+
+def test_parse_description():
+    event, groups = parse_description(1, "Evans 24' 3PT Jump Shot (3 PTS) (O'Quinn 1 AST)")
+    assert event == 'field_goal_made'
+    assert groups['player'] == 'Evans'
+    assert groups['player_ast'] == "O'Quinn"
+    assert groups['distance'] == 24
+    assert groups['points'] == 3
+    assert groups['assists'] == 1
+
+    assert parse_description(EventMsgType.FREE_THROW, 'MISS Prince Free Throw 1 of 2')[0] == 'free_throw_miss'
+    assert parse_description(3, 'Sumner Free Throw 2 of 2 (1 PTS)')[1]['points'] == 1
+    assert parse_description('4', 'Timberwolves Rebound') == ('rebound_team', {'team': 'Timberwolves'})
+    assert parse_description(9, 'TRAIL BLAZERS Timeout: Regular (Full 5 Short 0)')[1]['full'] == 5
+
+
+def test_parse_description_typed_groups():
+    event, groups = parse_description(5, 'G. Harrison Double Dribble Turnover (P1.T10)')
+    assert event == 'turnover_player'
+    assert groups['personal'] == 1
+    assert groups['team'] == 10
+
+    event, groups = parse_description(5, 'NUGGETS Turnover: Shot Clock (T#12)')
+    assert event == 'turnover_team'
+    assert groups['team'] == 'NUGGETS'
+    assert groups['turnovers'] == 12
+
+    # Foul team groups are not always numbers
+    event, groups = parse_description(6, 'Collison P.FOUL (P1.TN) (M.Lindsay)')
+    assert groups['personal'] == 1
+    assert groups['team'] == 'N'
+
+
+def test_parse_description_only_tries_event_patterns():
+    # A rebound description under the wrong EVENTMSGTYPE does not match
+    assert parse_description(1, 'Zubac REBOUND (Off:2 Def:4)') is None
+    assert parse_description(12, 'Start of 1st Period') is None
+    assert parse_description(8, None) is None
+
+
+def test_parse_row():
+    assert parse_row(2, "MISS O'Quinn 17' Jump Shot", 'Collins BLOCK (1 BLK)') == [
+        Description('home', 'field_goal_missed', {'player': "O'Quinn", 'distance': 17, 'field_goal_type': 'Jump Shot'}),
+        Description('visitor', 'block', {'player': 'Collins', 'blocks': 1}),
+    ]
+
+
+def test_parse_data_set():
+    events = list(parse_data_set(Endpoint.DataSet(data={'headers': headers, 'data': rows})))
+    assert [(event.event_num, event.side, event.event) for event in events] == [
+        (2, 'home', 'jump_ball'),
+        (3, 'visitor', 'field_goal_made'),
+        (4, 'home', 'field_goal_missed'),
+        (4, 'visitor', 'block'),
+        (5, 'visitor', 'rebound_player'),
+        (6, 'home', 'turnover_player'),
+        (6, 'visitor', 'steal'),
+        (7, 'home', 'foul'),
+    ]
+    assert events[0].game_id == '0021800001'
+    assert events[0].event_msg_type == 10
+    assert events[4].groups['offensive'] == 2
+
+
+def test_extract_events():
+    data_set = Endpoint.DataSet(data={'headers': headers, 'data': rows})
+    events = extract_events([data_set, Endpoint.ColumnarDataSet(data={'headers': headers, 'data': rows})])
+
+    # The same events as parsing row by row, once for each data set
+    parsed = {}
+    for event in parse_data_set(data_set):
+        parsed.setdefault(event.event, []).append([event.game_id, event.event_num, event.side] +
+                                                  list(event.groups.values()))
+    assert {event: data_set.get_dict()['data'] for event, data_set in events.items() if data_set.row_count} == \
+        {event: records * 2 for event, records in parsed.items()}
+
+    field_goals = events['field_goal_made']
+    assert field_goals.headers == ['GAME_ID', 'EVENTNUM', 'SIDE', 'PLAYER', 'DISTANCE', 'FIELD_GOAL_TYPE', 'POINTS',
+                                   'PLAYER_AST', 'ASSISTS']
+    assert field_goals.get_column('POINTS') == [3, 3]
+    assert events['timeout'].row_count == 0
+
+
+def test_extract_events_line_breaks_and_empty_groups():
+    data = {'headers': headers, 'data': [
+        ['0021800001', 1, 1, 1, 1, 'Evans Layup (2 PTS)', None, None],
+        ['0021800001', 2, 4, 0, 1, None, None, 'Zubac REBOUND (Off:2 Def:4)\n'],
+    ]}
+    events = extract_events([Endpoint.DataSet(data=data)])
+    assert events['field_goal_made'].get_column('PLAYER_AST') == [None]
+    assert events['field_goal_made'].get_column('DISTANCE') == [None]
+    assert events['rebound_player'].get_column('DEFENSIVE') == [4]
+
+
+def test_extract_events_parallel():
+    second_game = [['0021800002'] + row[1:] for row in rows]
+    data_sets = [
+        # Out of GAME_ID and EVENTNUM order
+        Endpoint.DataSet(data={'headers': headers, 'data': list(reversed(second_game))}),
+        Endpoint.ColumnarDataSet(data={'headers': headers, 'data': rows}),
+    ]
+    expected = extract_events([Endpoint.DataSet(data={'headers': headers, 'data': rows + second_game})])
+    for max_workers in (1, 2):
+        events = extract_events_parallel(data_sets, max_workers=max_workers, games_per_batch=1)
+        assert {event: data_set.get_dict() for event, data_set in events.items()} == \
+            {event: data_set.get_dict() for event, data_set in expected.items()}
@@ -0,0 +1,64 @@
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.possessions import Possession, iter_data_set_possessions, iter_possessions
+
+
+headers = ['GAME_ID', 'EVENTNUM', 'EVENTMSGTYPE', 'PERIOD', 'PCTIMESTRING', 'HOMEDESCRIPTION', 'NEUTRALDESCRIPTION',
+           'VISITORDESCRIPTION', 'PLAYER1_TEAM_ID']
+home = 1610612746
+visitor = 1610612756
+rows = [
+    ['0021800001', 1, 12, 1, '12:00', None, 'Start of 1st Period', None, None],
+    ['0021800001', 2, 10, 1, '12:00', "Jump Ball Collins vs. O'Quinn: Tip to Leaf", None, None, home],
+    ['0021800001', 3, 1, 1, '11:40', None, None, "Evans 24' 3PT Jump Shot (3 PTS) (O'Quinn 1 AST)", visitor],
+    ['0021800001', 4, 2, 1, '11:20', "MISS O'Quinn 17' Jump Shot", None, 'Collins BLOCK (1 BLK)', home],
+    ['0021800001', 5, 4, 1, '11:18', "O'Quinn REBOUND (Off:1 Def:0)", None, None, home],
+    ['0021800001', 6, 1, 1, '11:15', "O'Quinn Layup (2 PTS)", None, None, home],
+    ['0021800001', 7, 6, 1, '11:15', None, None, 'Collins S.FOUL (P1.T1) (M.Lindsay)', visitor],
+    ['0021800001', 8, 3, 1, '11:15', "O'Quinn Free Throw 1 of 1 (3 PTS)", None, None, home],
+    ['0021800001', 9, 5, 1, '11:00', None, None, 'Evans Bad Pass Turnover (P1.T1)', visitor],
+    ['0021800001', 10, 3, 1, '10:40', 'MISS Leaf Free Throw 1 of 2', None, None, home],
+    ['0021800001', 11, 4, 1, '10:40', 'Pelicans Rebound', None, None, None],
+    ['0021800001', 12, 3, 1, '10:40', 'Leaf Free Throw 2 of 2 (1 PTS)', None, None, home],
+    ['0021800001', 13, 2, 1, '10:20', None, None, "MISS Evans 26' 3PT Jump Shot", visitor],
+    ['0021800001', 14, 4, 1, '10:18', 'Leaf REBOUND (Off:0 Def:1)', None, None, home],
+    ['0021800001', 15, 1, 1, '10:00', 'Leaf Dunk (3 PTS)', None, None, home],
+    ['0021800001', 16, 13, 1, '10:00', None, 'End of 1st Period', None, None],
+]
+
+
+def test_iter_possessions():
+    assert list(iter_possessions(headers, rows)) == [
+        Possession('0021800001', 1, 1, 'visitor', visitor, 1, 3, '12:00', '11:40', 20, 3, 'field_goal'),
+        # The and-one free throw ends the possession instead of the made field goal
+        Possession('0021800001', 1, 2, 'home', home, 4, 8, '11:40', '11:15', 25, 3, 'free_throw'),
+        Possession('0021800001', 1, 3, 'visitor', visitor, 9, 9, '11:15', '11:00', 15, 0, 'turnover'),
+        # The team rebound of a missed first free throw is an offensive rebound
+        Possession('0021800001', 1, 4, 'home', home, 10, 12, '11:00', '10:40', 20, 1, 'free_throw'),
+        Possession('0021800001', 1, 5, 'visitor', visitor, 13, 14, '10:40', '10:18', 22, 0, 'defensive_rebound'),
+        # No possession is left for the visitors when the period ends on the made field goal
+        Possession('0021800001', 1, 6, 'home', home, 15, 15, '10:18', '10:00', 18, 2, 'field_goal'),
+    ]
+
+
+def test_missed_and_one():
+    # The possession goes on after a missed and-one free throw
+    possessions = list(iter_possessions(headers, rows[:7] + [
+        ['0021800001', 8, 3, 1, '11:15', "MISS O'Quinn Free Throw 1 of 1", None, None, home],
+        ['0021800001', 9, 4, 1, '11:13', "O'Quinn REBOUND (Off:2 Def:0)", None, None, home],
+        ['0021800001', 10, 1, 1, '11:05', "O'Quinn 25' 3PT Jump Shot (5 PTS)", None, None, home],
+    ]))
+    assert [(possession.end_event_num, possession.points, possession.end) for possession in possessions] == [
+        (3, 3, 'field_goal'), (10, 5, 'field_goal')]
+
+
+def test_iter_data_set_possessions():
+    second_game = [['0021800002'] + row[1:] for row in rows]
+    data_sets = (data_set_class(data={'headers': headers, 'data': game_rows})
+                 for data_set_class, game_rows in ((Endpoint.DataSet, rows), (Endpoint.ColumnarDataSet, second_game)))
+    possessions = list(iter_data_set_possessions(data_sets))
+    assert possessions[6:] == [possession._replace(game_id='0021800002') for possession in possessions[:6]]
+
+    # Without PLAYER1_TEAM_ID the offense team is unknown, and a possession left open ends at the last row
+    possessions = list(iter_data_set_possessions([Endpoint.DataSet(data={
+        'headers': headers[:-1], 'data': [row[:-1] for row in rows[:5]]})]))
+    assert possessions[-1] == Possession('0021800001', 1, 2, 'home', None, 4, 5, '11:40', '11:18', 22, 0, 'period_end')
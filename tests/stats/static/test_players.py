@@ -0,0 +1,23 @@
+from nba_api.stats.static import players
+
+lebron_james = {'id': 2544, 'full_name': 'LeBron James', 'first_name': 'LeBron', 'last_name': 'James'}
+
+
+class TestPlayers:
+    def test_find_player_by_id(self):
+        assert players.find_player_by_id(2544) == lebron_james
+        assert players.find_player_by_id('2544') == lebron_james
+        assert players.find_player_by_id(1) is None
+        assert players.find_player_by_id(None) is None
+
+    def test_find_players_by_ids(self):
+        found = players.find_players_by_ids([2544, 1, '2544'])
+        assert found == [lebron_james, None, lebron_james]
+        assert found[0] is found[2]
+
+    def test_find_players_by_exact_full_name(self):
+        assert players.find_players_by_exact_full_name('lebron JAMES') == [lebron_james]
+        assert players.find_players_by_exact_full_name('LeBron') == []
+
+    def test_find_players_by_full_name(self):
+        assert lebron_james in players.find_players_by_full_name('^lebron')
@@ -0,0 +1,51 @@
+from nba_api.stats.static import search
+
+
+def get_full_names(results):
+    return [result['full_name'] for result in results]
+
+
+class TestFold:
+    def test_fold(self):
+        assert search.fold('Nenê  Hilário') == 'nene hilario'
+        assert search.fold("Kareem Abdul-Jabbar") == 'kareem abdul jabbar'
+        assert search.fold("D'Angelo Russell") == 'd angelo russell'
+
+
+class TestNameIndex:
+    records = [{'full_name': 'Luka Dončić'}, {'full_name': 'Luke Kennard'}, {'full_name': 'Luka'}, {'full_name': 'Seth Curry'}]
+
+    def get_index(self):
+        return search.NameIndex(self.records, get_names=lambda record: [record['full_name']])
+
+    def test_ranking(self):
+        # Exact name, then name prefix, then token prefix
+        assert get_full_names(self.get_index().search('luka', fuzzy=False)) == ['Luka', 'Luka Dončić']
+        assert get_full_names(self.get_index().search('lu', fuzzy=False)) == ['Luka Dončić', 'Luke Kennard', 'Luka']
+        assert get_full_names(self.get_index().search('cur se', fuzzy=False)) == ['Seth Curry']
+
+    def test_accents(self):
+        assert get_full_names(self.get_index().search('doncic')) == ['Luka Dončić']
+
+    def test_fuzzy(self):
+        assert get_full_names(self.get_index().search('seth cury', fuzzy=False)) == []
+        assert get_full_names(self.get_index().search('seth cury')) == ['Seth Curry']
+
+    def test_limit(self):
+        assert len(self.get_index().search('lu', limit=1)) == 1
+        assert self.get_index().search('') == []
+
+    def test_results_are_copies(self):
+        index = self.get_index()
+        index.search('luka')[0]['full_name'] = 'Changed'
+        assert index.search('luka')[0]['full_name'] == 'Luka'
+
+
+class TestSearch:
+    def test_search_players(self):
+        assert get_full_names(search.search_players('lebrn jmes', limit=1)) == ['LeBron James']
+        assert search.search_players('lebron', limit=1)[0]['id'] == 2544
+
+    def test_search_teams(self):
+        assert get_full_names(search.search_teams('GSW', limit=1)) == ['Golden State Warriors']
+        assert get_full_names(search.search_teams('warriers', limit=1)) == ['Golden State Warriors']
@@ -0,0 +1,20 @@
+from nba_api.stats.static import teams
+
+
+class TestTeams:
+    def test_find_team_by_abbreviation(self):
+        assert teams.find_team_by_abbreviation('lal')['full_name'] == 'Los Angeles Lakers'
+        assert teams.find_team_by_abbreviation('XYZ') is None
+
+    def test_find_team_name_by_id(self):
+        assert teams.find_team_name_by_id('1610612744')['abbreviation'] == 'GSW'
+        assert teams.find_team_name_by_id(0) is None
+
+    def test_find_team_by_full_name(self):
+        assert teams.find_team_by_full_name('boston celtics')['id'] == 1610612738
+
+    def test_bulk_lookups(self):
+        found = teams.find_teams_by_ids([1610612744, 1610612747, 1610612744, None])
+        assert [team and team['abbreviation'] for team in found] == ['GSW', 'LAL', 'GSW', None]
+        assert found[0] is found[2]
+        assert [team['id'] for team in teams.find_teams_by_abbreviations(['BOS', 'bos'])] == [1610612738] * 2
@@ -65,3 +65,43 @@ def get_python_variable_name(parameter):
     variable_name = re.sub(r'([A-Z])(?!$|Nullable|Round|Defend$)', capital_letter_replacement, parameter)[1:].lower()
     variable_name = variable_name.replace('__', '_')
     return variable_name
+
+
+def get_record_name(data_set_name):
+    return data_set_name[:1].upper() + data_set_name[1:] + 'Row'
+
+
+# Ids that are strings with leading zeros or dashes, such as GAME_ID '0021800001' or GROUP_ID '-201939-2544-'
+string_id_suffixes = ('GAMEID', 'LEAGUEID', 'SEASONID', 'SERIESID', 'GROUPID')
+
+
+def get_data_type(header):
+    name = header.upper()
+    tokens = name.split('_')
+    if 'RANK' in tokens:
+        return None
+    if name.endswith('ID') and len(name) > 2 and not name.replace('_', '').endswith(string_id_suffixes):
+        return 'int'
+    if name.endswith('ABBREVIATION'):
+        return 'category'
+    if 'DATE' in name:
+        return 'datetime'
+    if 'PCT' in tokens or name.endswith('PCT'):
+        return 'float32'
+    return None
+
+
+def get_data_types(data_sets):
+    data_types = {}
+    for data_set_name, headers in data_sets.items():
+        data_set_types = {}
+        for header in headers:
+            # Skips the grouped headers of data sets such as ShotLocations
+            if not isinstance(header, str):
+                continue
+            data_type = get_data_type(header)
+            if data_type:
+                data_set_types[header] = data_type
+        if data_set_types:
+            data_types[data_set_name] = data_set_types
+    return data_types
@@ -1,10 +1,13 @@
+import keyword
 import os
 
 from .template import argument_template, no_default_argument_template
 from .template import parameter_template, data_set_template, imports_template
-from .template import file_template
+from .template import init_template, init_module_template, init_endpoint_class_template
+from .template import file_template, record_import_template, record_type_template, record_types_dict_template
+from .template import record_headers_template
 from tools.stats.endpoint_analysis.analysis import load_endpoint_file
-from tools.library.functions import get_python_variable_name
+from tools.library.functions import get_python_variable_name, get_data_types, get_record_name
 from tools.stats.library.mapping import parameter_variations, parameter_map
 
 
@@ -57,20 +60,44 @@ def get_endpoint_contents(endpoint, endpoint_analysis):
         arguments_list.insert(len(arguments_list), argument_template.format(python_variable=python_variable, default_value=default_value))
         parameters_list.insert(len(parameters_list), parameter_template.format(nba_parameter=prop, python_variable=python_variable))
 
+    record_type_lists = []
+    record_types_dict_lists = []
     for key_name in data_sets:
         variable_name = get_python_variable_name(key_name)
         data_set_lists.append(data_set_template.format(variable_name=variable_name, key_name=key_name))
+        headers = data_sets[key_name]
+        # Data sets with grouped headers, such as ShotLocations, have no flat row to describe
+        if not headers or not all(isinstance(header, str) for header in headers):
+            continue
+        record_name = get_record_name(key_name)
+        rename = ''
+        if not all(header.isidentifier() and not keyword.iskeyword(header) and not header.startswith('_')
+                   for header in headers) or len(set(headers)) != len(headers):
+            rename = ', rename=True'
+        record_type_lists.append(record_type_template.format(record_name=record_name, headers=headers, rename=rename))
+        if rename:
+            record_type_lists.append(record_headers_template.format(record_name=record_name, headers=tuple(headers)))
+        record_types_dict_lists.append(record_types_dict_template.format(key_name=key_name, record_name=record_name))
 
     arguments = ',\n'.join(arguments_list)
     parameters = ',\n'.join(parameters_list)
-    data_set_variables = '\n'.join(data_set_lists)
+    data_set_variables = ''
+    if data_set_lists:
+        data_set_variables = '\n' + '\n'.join(data_set_lists) + '\n'
+    record_import = ''
+    record_types = ''
+    if record_type_lists:
+        record_import = record_import_template
+        record_types = '\n\n' + '\n'.join(record_type_lists) + '\n'
     imports = ''
     if imports_list:
         imports = imports_template.format(imports_list=', '.join(imports_list))
 
     file_contents = file_template.format(imports=imports, endpoint=endpoint, endpoint_lowercase=endpoint.lower(),
-                                         data_sets=data_sets, arguments=arguments, parameters=parameters,
-                                         data_set_variables=data_set_variables)
+                                         data_sets=data_sets, data_types=get_data_types(data_sets),
+                                         record_import=record_import, record_types=record_types,
+                                         record_types_dict=', '.join(record_types_dict_lists), arguments=arguments,
+                                         parameters=parameters, data_set_variables=data_set_variables)
 
     return file_contents
 
@@ -85,9 +112,22 @@ def generate_endpoint_file(endpoint, file_contents):
     f.close()
 
 
+def get_init_contents(endpoints):
+    endpoints = sorted(endpoints)
+    modules = '\n'.join(init_module_template.format(endpoint_lowercase=endpoint.lower()) for endpoint in endpoints)
+    endpoint_classes = '\n'.join(
+        init_endpoint_class_template.format(endpoint=endpoint, endpoint_lowercase=endpoint.lower()) for endpoint in endpoints
+    )
+    return init_template.format(modules=modules, endpoint_classes=endpoint_classes)
+
+
 def generate_endpoint_files(endpoints_information=load_endpoint_file()):
+    endpoints = []
     for endpoint, endpoint_analysis in endpoints_information.items():
         if endpoint_analysis['status'] != 'success':
             continue
         file_contents = get_endpoint_contents(endpoint=endpoint, endpoint_analysis=endpoint_analysis)
         generate_endpoint_file(endpoint=endpoint, file_contents=file_contents)
+        endpoints.append(endpoint)
+    # The package __init__ lists every generated endpoint so they can be imported on demand.
+    generate_endpoint_file(endpoint='__init__', file_contents=get_init_contents(endpoints))
@@ -1,27 +1,30 @@
-file_template = '''from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.library.http import NBAStatsHTTP{imports}
-
+file_template = '''{record_import}from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.http import NBAStatsHTTP, AsyncNBAStatsHTTP{imports}
+{record_types}
 
 class {endpoint}(Endpoint):
     endpoint = '{endpoint_lowercase}'
     expected_data = {data_sets}
+    expected_data_types = {data_types}
+    record_types = {{{record_types_dict}}}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
-
+{data_set_variables}
     def __init__(self,
 {arguments},
                  proxy=None,
                  headers=None,
                  timeout=30,
+                 session=None,
                  get_request=True):
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
         self.timeout = timeout
+        self.session = session
         self.parameters = {{
 {parameters}
         }}
@@ -29,7 +32,17 @@ class {endpoint}(Endpoint):
             self.get_request()
     
     def get_request(self):
-        self.nba_response = NBAStatsHTTP().send_api_request(
+        self.nba_response = NBAStatsHTTP(session=self.session).send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    async def get_request_async(self, session=None):
+        self.nba_response = await AsyncNBAStatsHTTP(session=session).send_api_request(
             endpoint=self.endpoint,
             parameters=self.parameters,
             proxy=self.proxy,
@@ -37,14 +50,18 @@ class {endpoint}(Endpoint):
             timeout=self.timeout,
         )
         self.load_response()
-        
-    def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-{data_set_variables}
 '''
 
-data_set_template = '''        self.{variable_name} = Endpoint.DataSet(data=data_sets['{key_name}'])'''
+data_set_template = '''    {variable_name} = Endpoint.LazyDataSet('{key_name}')'''
+
+record_import_template = '''from collections import namedtuple\n\n'''
+
+record_type_template = '''{record_name} = namedtuple('{record_name}', {headers}{rename})'''
+
+# The headers of a record type with renamed fields, as its _fields no longer match them
+record_headers_template = '''{record_name}._headers = {headers}'''
+
+record_types_dict_template = '''\'{key_name}\': {record_name}'''
 
 imports_template = '''\nfrom nba_api.stats.library.parameters import {imports_list}'''
 
@@ -56,3 +73,41 @@ parameter_template = '''                '{nba_parameter}': {python_variable}'''
 
 argument_template = '''                 {python_variable}={default_value}'''
 no_default_argument_template = '''                 {python_variable}'''
+
+init_template = '''import importlib
+import sys
+
+__all__ = [
+{modules}
+]
+
+# Endpoint classes and the modules that define them. Modules are imported the first time one of their names is used.
+endpoint_classes = {{
+{endpoint_classes}
+}}
+
+
+def __getattr__(name):
+    if name in endpoint_classes:
+        value = getattr(importlib.import_module('.' + endpoint_classes[name], __name__), name)
+    elif name in __all__:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError('module {{!r}} has no attribute {{!r}}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(endpoint_classes) | set(__all__))
+
+
+# Module level __getattr__ needs Python 3.7, older versions import every endpoint up front.
+if sys.version_info < (3, 7):
+    for _name in endpoint_classes:
+        __getattr__(_name)
+'''
+
+init_module_template = "    '{endpoint_lowercase}',"
+
+init_endpoint_class_template = "    '{endpoint}': '{endpoint_lowercase}',"
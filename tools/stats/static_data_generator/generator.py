@@ -0,0 +1,64 @@
+import struct
+
+from nba_api.stats.library import data
+
+
+def get_data_file_contents(tables):
+    # tables maps a table name to its rows. Every column must hold only ints or only strings.
+    strings = []
+    string_indexes = {}
+    packed_tables = []
+    for name, rows in tables.items():
+        rows = [list(row) for row in rows]
+        column_count = len(rows[0]) if rows else 0
+        column_types = ''
+        packed_columns = []
+        for column_index in range(column_count):
+            values = [row[column_index] for row in rows]
+            if all(isinstance(value, int) for value in values):
+                column_types += 'q'
+                packed_columns.append(struct.pack('<{}q'.format(len(values)), *values))
+                continue
+            if not all(isinstance(value, str) and '\0' not in value for value in values):
+                raise Exception('InvalidArgument: Column {} of {} mixes types.'.format(column_index, name))
+            indexes = []
+            for value in values:
+                if value not in string_indexes:
+                    string_indexes[value] = len(strings)
+                    strings.append(value)
+                indexes.append(string_indexes[value])
+            column_types += 's'
+            packed_columns.append(struct.pack('<{}i'.format(len(indexes)), *indexes))
+        encoded_name = name.encode('utf-8')
+        packed_tables.append(struct.pack('<I', len(encoded_name)) + encoded_name
+                             + struct.pack('<II', len(rows), column_count) + column_types.encode('ascii')
+                             + b''.join(packed_columns))
+    encoded_strings = '\0'.join(strings).encode('utf-8')
+    header = data.data_file_magic + struct.pack('<III', data.data_file_version, len(strings), len(encoded_strings))
+    return header + encoded_strings + struct.pack('<I', len(packed_tables)) + b''.join(packed_tables)
+
+
+def generate_data_file(players, teams, path=data.data_file_path):
+    contents = get_data_file_contents({'players': players, 'teams': teams})
+    with open(path, 'wb') as f:
+        f.write(contents)
+
+
+def get_players_from_api():
+    from nba_api.stats.endpoints import commonallplayers
+    response = commonallplayers.CommonAllPlayers(is_only_current_season=0)
+    players = []
+    for player in response.common_all_players.get_records():
+        last_name, _, first_name = player.DISPLAY_LAST_COMMA_FIRST.partition(', ')
+        players.append([player.PERSON_ID, last_name, first_name, player.DISPLAY_FIRST_LAST])
+    return sorted(players, key=lambda player: (player[data.player_index_last_name], player[data.player_index_first_name]))
+
+
+def update_data_file(path=data.data_file_path):
+    # Adds the players that are new to stats.nba.com and keeps the teams as they are.
+    tables = data.read_data_file(path)
+    players = list(tables['players'])
+    known_ids = {player[data.player_index_id] for player in players}
+    players += [player for player in get_players_from_api() if player[data.player_index_id] not in known_ids]
+    players.sort(key=lambda player: (player[data.player_index_last_name], player[data.player_index_first_name]))
+    generate_data_file(players=players, teams=list(tables['teams']), path=path)